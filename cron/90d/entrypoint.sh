@@ -24,6 +24,17 @@ echo "✓ Environment exported to /etc/environment"
 crontab /etc/cron.d/usdclp-90d
 echo "✓ Crontab installed"
 
+# Start the warm model server; forecast jobs fall back to in-process runs
+# if it is not up
+case "${MODEL_SERVER_ENABLED:-true}" in
+    false|False|FALSE|0) ;;
+    *)
+        cd /app && PYTHONPATH=/app/src nohup python -m services.model_server.cli serve --preload 90 \
+            >> /var/log/model_server.log 2>&1 &
+        echo "✓ Model server started (logs at /var/log/model_server.log)"
+        ;;
+esac
+
 # Verify crontab
 echo ""
 echo "Loaded crontab:"
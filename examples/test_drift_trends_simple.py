@@ -8,6 +8,7 @@ This script tests the drift trend analysis system by:
 4. Analyzing drift trends
 """
 
+import shutil
 import sys
 from pathlib import Path
 
@@ -61,9 +62,9 @@ def test_drift_trends_simple():
     )
 
     # Clean previous test data
-    if test_storage_path.exists():
+    if trend_analyzer.log.root.exists():
         logger.info("Removing previous test data...")
-        test_storage_path.unlink()
+        shutil.rmtree(trend_analyzer.log.root)
 
     # Simulate drift detection over multiple time windows
     logger.info("\n2. Simulating drift detection over time...")
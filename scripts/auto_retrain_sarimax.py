@@ -27,6 +27,7 @@ from __future__ import annotations
 
 import argparse
 import json
+import os
 import sys
 import warnings
 from dataclasses import dataclass, asdict
@@ -176,7 +177,7 @@ def load_training_data(lookback_days: int = DATA_LOOKBACK_DAYS) -> Tuple[pd.Data
         # Load data using DataLoader
         settings = get_settings()
         loader = DataLoader(settings)
-        bundle = loader.load()
+        bundle = loader.load(max_age=settings.bundle_snapshot_max_age)
 
         # Extract USD/CLP series
         usdclp_series = bundle.usdclp_series
@@ -446,7 +447,7 @@ def compare_with_baseline(
         return comparison
 
 
-def retrain_horizon(horizon_days: int) -> RetrainingResult:
+def retrain_horizon(horizon_days: int, search_workers: int = 1) -> RetrainingResult:
     """
     Re-train SARIMAX model for a single horizon.
 
@@ -461,6 +462,7 @@ def retrain_horizon(horizon_days: int) -> RetrainingResult:
 
     Args:
         horizon_days: Forecast horizon (7, 15, 30, or 90)
+        search_workers: Worker processes for the SARIMAX order grid search
 
     Returns:
         RetrainingResult with complete training information
@@ -492,6 +494,7 @@ def retrain_horizon(horizon_days: int) -> RetrainingResult:
 
         # Step 2: Create forecaster with auto-ARIMA
         config = SARIMAXConfig.from_horizon(horizon_days)
+        config.search_n_jobs = search_workers
         forecaster = SARIMAXForecaster(config)
 
         logger.info(f"Configuration: {config.exog_vars}")
@@ -566,6 +569,9 @@ def retrain_horizon(horizon_days: int) -> RetrainingResult:
         forecaster.save_model(model_path, metadata=metadata)
         result.model_path = model_path
 
+        if forecaster.search_results is not None:
+            forecaster.search_results.to_csv(model_path / "order_search.csv", index=False)
+
         # Update baseline if improved
         if comparison['recommendation'] in ['DEPLOY_AS_BASELINE', 'DEPLOY_UPDATE_BASELINE']:
             baseline_metrics_path = model_path / "baseline_metrics.json"
@@ -736,6 +742,12 @@ def main():
         default=CV_N_SPLITS,
         help=f"Number of CV splits (default: {CV_N_SPLITS})"
     )
+    parser.add_argument(
+        '--search-workers',
+        type=int,
+        default=os.cpu_count() or 1,
+        help="Worker processes for the SARIMAX order grid search (default: CPU count)"
+    )
 
     args = parser.parse_args()
 
@@ -747,13 +759,14 @@ def main():
 
     logger.info(f"Training horizons: {horizons_to_train}")
     logger.info(f"Cross-validation splits: {args.cv_splits}")
+    logger.info(f"Order search workers: {args.search_workers}")
     logger.info(f"Data lookback: {DATA_LOOKBACK_DAYS} days")
 
     # Train all horizons
     results = []
     for horizon in horizons_to_train:
         try:
-            result = retrain_horizon(horizon)
+            result = retrain_horizon(horizon, search_workers=args.search_workers)
             results.append(result)
         except Exception as e:
             logger.error(f"Unexpected error for {horizon}d: {e}")
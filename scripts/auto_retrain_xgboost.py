@@ -8,12 +8,17 @@ This script automatically re-trains XGBoost models weekly for all forecast horiz
 Process:
 1. Load last 180 days of data from warehouse
 2. Engineer 50+ features using feature_engineer
-3. Optimize hyperparameters with Optuna (50 trials, 5-fold walk-forward validation)
+3. Optimize hyperparameters with Optuna (50 trials, 5-fold walk-forward validation,
+   per-fold pruning, optional parallel workers; resumable via a journal file)
 4. Train final model on full dataset with best hyperparameters
 5. Compare performance vs. baseline and update if improved
 6. Save model with metadata to /app/models/xgboost_{horizon}/
 7. Send performance alert email with results
 
+With --shared, steps 1-2 run once for all horizons (longest window, one
+feature matrix in shared memory) and steps 3-6 run per horizon in parallel
+worker processes.
+
 Schedule: Sundays 00:00 Chile time (via cron)
 
 Usage:
@@ -23,6 +28,9 @@ Usage:
     # Re-train specific horizon
     python scripts/auto_retrain_xgboost.py --horizon 7
 
+    # Re-train all horizons from one shared feature matrix, in parallel
+    python scripts/auto_retrain_xgboost.py --shared
+
     # Dry run (no model saving, no emails)
     python scripts/auto_retrain_xgboost.py --dry-run
 
@@ -39,7 +47,7 @@ Environment:
 
 Requirements:
     - xgboost>=2.0.0
-    - optuna>=3.0.0
+    - optuna>=3.1.0 (journal storage)
     - Data warehouse with 180+ days of history
     - Email configuration in settings
 
@@ -52,8 +60,10 @@ from __future__ import annotations
 import argparse
 import json
 import logging
+import os
 import sys
 import time
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple
@@ -61,7 +71,6 @@ from typing import Any, Dict, List, Optional, Tuple
 import numpy as np
 import optuna
 import pandas as pd
-from optuna.samplers import TPESampler
 
 # Set PYTHONPATH to /app/src for imports
 sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
@@ -75,13 +84,16 @@ from forex_core.alerts.model_performance_alerts import (
 )
 from forex_core.config import get_settings
 from forex_core.data.loader import DataLoader
-from forex_core.features.feature_engineer import engineer_features
+from forex_core.features.feature_engineer import engineer_features, select_horizon_features
 from forex_core.features.feature_selector import FeatureSelector
+from forex_core.features.feature_store import frame_fingerprint
+from forex_core.features.shared_frame import SharedFrame, SharedFrameHandle
 from forex_core.models.xgboost_forecaster import (
     ForecastMetrics,
     XGBoostConfig,
     XGBoostForecaster,
 )
+from forex_core.optimization.parallel_study import PRUNERS, run_study
 from forex_core.utils.logging import logger
 
 # Configure logging for production
@@ -118,6 +130,19 @@ MIN_TRAIN_SIZE = 252  # 1 year of trading days for statistical robustness (>4 sa
 # Model save directory
 MODELS_DIR = Path("/app/models")
 
+# Optuna studies are journaled here so an interrupted run resumes and
+# several worker processes can share one study
+OPTUNA_STORAGE_DIR = MODELS_DIR / "optuna"
+OPTUNA_N_WORKERS = 1
+OPTUNA_PRUNER = "median"
+
+# Shared mode engineers features once with this horizon's lag set, which
+# contains the lags of every other horizon (see select_horizon_features)
+SHARED_FEATURES_HORIZON = 7
+
+# Per-horizon baselines of the performance monitor
+BASELINE_DIR = Path("/app/data/baselines")
+
 
 def load_training_data(horizon: int = 7, days: Optional[int] = None) -> pd.DataFrame:
     """
@@ -143,7 +168,7 @@ def load_training_data(horizon: int = 7, days: Optional[int] = None) -> pd.DataF
     try:
         settings = get_settings()
         loader = DataLoader(settings)
-        bundle = loader.load()
+        bundle = loader.load(max_age=settings.bundle_snapshot_max_age)
 
         # Merge all required series into single DataFrame
         end_date = datetime.now()
@@ -226,17 +251,126 @@ def load_training_data(horizon: int = 7, days: Optional[int] = None) -> pd.DataF
         raise RuntimeError(f"Data loading failed: {e}") from e
 
 
+class XGBoostObjective:
+    """
+    Optuna objective: mean walk-forward RMSE of an XGBoost configuration.
+
+    The running mean RMSE is reported after every fold, so the study's pruner
+    can stop an unpromising trial after its first folds instead of training
+    all of them. Defined at module level (not as a closure) so it can be
+    pickled to worker processes.
+
+    Args:
+        features_df: Engineered (and selected) features plus the target
+        horizon: Forecast horizon in days
+        n_splits: Walk-forward folds per trial
+        n_jobs: XGBoost threads per trial (-1 = all cores)
+    """
+
+    def __init__(
+        self,
+        features_df: pd.DataFrame,
+        horizon: int,
+        n_splits: int = WALK_FORWARD_SPLITS,
+        n_jobs: int = -1,
+    ):
+        self.features_df = features_df
+        self.horizon = horizon
+        self.n_splits = n_splits
+        self.n_jobs = n_jobs
+
+    def __call__(self, trial: optuna.Trial) -> float:
+        """Optuna objective function: minimize RMSE."""
+
+        # Sample hyperparameters
+        params = {
+            "learning_rate": trial.suggest_float("learning_rate", 0.01, 0.3, log=True),
+            "max_depth": trial.suggest_int("max_depth", 3, 10),
+            "n_estimators": trial.suggest_int("n_estimators", 100, 1000, step=50),
+            "subsample": trial.suggest_float("subsample", 0.6, 1.0),
+            "colsample_bytree": trial.suggest_float("colsample_bytree", 0.6, 1.0),
+            "reg_alpha": trial.suggest_float("reg_alpha", 0, 10),
+            "reg_lambda": trial.suggest_float("reg_lambda", 0, 10),
+            "min_child_weight": trial.suggest_int("min_child_weight", 1, 7),
+            "gamma": trial.suggest_float("gamma", 0, 1),
+        }
+
+        # Create config with trial parameters
+        config = XGBoostConfig(horizon_days=self.horizon, n_jobs=self.n_jobs, **params)
+        forecaster = XGBoostForecaster(config)
+
+        def report_fold(step: int, metrics_so_far: List[ForecastMetrics]) -> None:
+            # Report intermediate value for pruning
+            trial.report(float(np.mean([m.rmse for m in metrics_so_far])), step=step)
+
+            # Prune unpromising trials
+            if trial.should_prune():
+                raise optuna.TrialPruned()
+
+        try:
+            # Walk-forward validation with selected features
+            metrics_list = forecaster.walk_forward_validation(
+                self.features_df,
+                target_col="usdclp",
+                n_splits=self.n_splits,
+                min_train_size=MIN_TRAIN_SIZE,
+                fold_callback=report_fold,
+            )
+
+            if not metrics_list:
+                logger.warning(f"Trial {trial.number}: No validation metrics (insufficient data)")
+                return float("inf")
+
+            # Calculate average RMSE across folds
+            return float(np.mean([m.rmse for m in metrics_list]))
+
+        except optuna.TrialPruned:
+            raise
+        except Exception as e:
+            logger.warning(f"Trial {trial.number} failed: {e}")
+            return float("inf")
+
+
+def default_study_name(
+    horizon: int,
+    when: Optional[datetime] = None,
+    fingerprint: Optional[str] = None,
+) -> str:
+    """
+    Study name for this week's retraining of a horizon.
+
+    Re-running within the same ISO week on the same training data resumes
+    the study; new data (a different fingerprint) or the next week's run
+    starts a fresh one, so stale best parameters are never reused.
+    """
+    year, week, _ = (when or datetime.now()).isocalendar()
+    name = f"xgboost_horizon_{horizon}d_{year}-W{week:02d}"
+    return f"{name}_{fingerprint[:8]}" if fingerprint else name
+
+
 def optimize_hyperparameters(
     data: pd.DataFrame,
     horizon: int,
     n_trials: int = OPTUNA_N_TRIALS,
     n_splits: int = WALK_FORWARD_SPLITS,
+    n_workers: int = OPTUNA_N_WORKERS,
+    storage: Optional[str] = None,
+    pruner: str = OPTUNA_PRUNER,
+    study_name: Optional[str] = None,
+    features_df: Optional[pd.DataFrame] = None,
+    n_jobs: Optional[int] = None,
 ) -> Tuple[Dict[str, Any], float, optuna.study.Study]:
     """
     Optimize XGBoost hyperparameters using Optuna with walk-forward validation.
 
     Uses Tree-structured Parzen Estimator (TPE) sampler for efficient search.
-    Objective: Minimize RMSE on validation set.
+    Objective: Minimize RMSE on validation set. Each trial reports its running
+    RMSE after every fold, so the pruner (median or Hyperband) stops bad
+    trials after their first folds.
+
+    With a persistent storage the study can run on several worker processes
+    and is resumed if the same study name is optimized again: finished
+    trials are kept and only the remaining ones are run.
 
     Search space (horizon-adapted):
     - learning_rate: [0.01, 0.3]
@@ -254,6 +388,14 @@ def optimize_hyperparameters(
         horizon: Forecast horizon in days
         n_trials: Number of Optuna trials (default 50)
         n_splits: Number of walk-forward validation splits (default 5)
+        n_workers: Worker processes sharing the study (requires storage)
+        storage: Journal file path or RDB URL; None for an in-memory study
+        pruner: "median", "hyperband" or "none"
+        study_name: Study to create or resume (default: this week's study
+            for this feature matrix)
+        features_df: Features already engineered for this horizon (skips
+            feature engineering, e.g. a view of the shared matrix)
+        n_jobs: XGBoost threads per trial (default: cores split between workers)
 
     Returns:
         Tuple of (best_params, best_rmse, study)
@@ -265,15 +407,17 @@ def optimize_hyperparameters(
     """
     logger.info(
         f"Starting hyperparameter optimization: {n_trials} trials, "
-        f"{n_splits}-fold walk-forward validation"
+        f"{n_splits}-fold walk-forward validation, {n_workers} worker(s), "
+        f"pruner={pruner}"
     )
 
     # Engineer features once
-    try:
-        features_df = engineer_features(data, horizon=horizon)
-    except Exception as e:
-        logger.error(f"Feature engineering failed: {e}")
-        raise
+    if features_df is None:
+        try:
+            features_df = engineer_features(data, horizon=horizon)
+        except Exception as e:
+            logger.error(f"Feature engineering failed: {e}")
+            raise
 
     # Feature selection step
     logger.info(f"Performing feature selection to reduce from {len(features_df.columns)-1} features...")
@@ -304,78 +448,31 @@ def optimize_hyperparameters(
         logger.warning(f"Feature selection failed: {e}. Using all features.")
         features_df_selected = features_df
 
-    def objective(trial: optuna.Trial) -> float:
-        """Optuna objective function: minimize RMSE."""
-
-        # Sample hyperparameters
-        params = {
-            "learning_rate": trial.suggest_float("learning_rate", 0.01, 0.3, log=True),
-            "max_depth": trial.suggest_int("max_depth", 3, 10),
-            "n_estimators": trial.suggest_int("n_estimators", 100, 1000, step=50),
-            "subsample": trial.suggest_float("subsample", 0.6, 1.0),
-            "colsample_bytree": trial.suggest_float("colsample_bytree", 0.6, 1.0),
-            "reg_alpha": trial.suggest_float("reg_alpha", 0, 10),
-            "reg_lambda": trial.suggest_float("reg_lambda", 0, 10),
-            "min_child_weight": trial.suggest_int("min_child_weight", 1, 7),
-            "gamma": trial.suggest_float("gamma", 0, 1),
-        }
-
-        # Create config with trial parameters
-        config = XGBoostConfig(horizon_days=horizon, **params)
-        forecaster = XGBoostForecaster(config)
-
-        try:
-            # Walk-forward validation with selected features
-            metrics_list = forecaster.walk_forward_validation(
-                features_df_selected,
-                target_col="usdclp",
-                n_splits=n_splits,
-                min_train_size=MIN_TRAIN_SIZE,
-            )
-
-            if not metrics_list:
-                logger.warning(f"Trial {trial.number}: No validation metrics (insufficient data)")
-                return float("inf")
-
-            # Calculate average RMSE across folds
-            avg_rmse = np.mean([m.rmse for m in metrics_list])
-
-            # Report intermediate value for pruning
-            trial.report(avg_rmse, step=0)
-
-            # Prune unpromising trials
-            if trial.should_prune():
-                raise optuna.TrialPruned()
-
-            return avg_rmse
-
-        except optuna.TrialPruned:
-            raise
-        except Exception as e:
-            logger.warning(f"Trial {trial.number} failed: {e}")
-            return float("inf")
-
-    # Create study with TPE sampler
-    study = optuna.create_study(
-        direction="minimize",
-        sampler=TPESampler(seed=42),
-        study_name=f"xgboost_horizon_{horizon}d",
-    )
+    # Split the cores between workers instead of oversubscribing them
+    if n_jobs is None:
+        n_jobs = -1 if n_workers <= 1 else max(1, (os.cpu_count() or 1) // n_workers)
+    objective = XGBoostObjective(features_df_selected, horizon, n_splits=n_splits, n_jobs=n_jobs)
 
     # Suppress Optuna logging noise
     optuna.logging.set_verbosity(optuna.logging.WARNING)
 
-    # Run optimization
+    # Run (or resume) optimization
     start_time = time.time()
-    study.optimize(
+    study = run_study(
+        study_name or default_study_name(horizon, fingerprint=frame_fingerprint(features_df_selected)),
         objective,
         n_trials=n_trials,
-        timeout=None,
-        show_progress_bar=True,
-        n_jobs=1,  # Sequential for reproducibility
+        storage=storage,
+        n_workers=n_workers,
+        pruner=pruner,
+        max_resource=n_splits,
+        seed=42,
     )
     elapsed = time.time() - start_time
 
+    pruned = len(study.get_trials(deepcopy=False, states=(optuna.trial.TrialState.PRUNED,)))
+    logger.info(f"Trials: {len(study.trials)} total, {pruned} pruned")
+
     best_params = study.best_params
     best_rmse = study.best_value
 
@@ -392,6 +489,8 @@ def train_final_model(
     data: pd.DataFrame,
     horizon: int,
     hyperparameters: Dict[str, Any],
+    features_df: Optional[pd.DataFrame] = None,
+    n_jobs: int = -1,
 ) -> Tuple[XGBoostForecaster, ForecastMetrics]:
     """
     Train final XGBoost model on full dataset with best hyperparameters.
@@ -402,6 +501,8 @@ def train_final_model(
         data: Full training data
         horizon: Forecast horizon in days
         hyperparameters: Best hyperparameters from Optuna
+        features_df: Features already engineered for this horizon
+        n_jobs: XGBoost threads (-1 = all cores)
 
     Returns:
         Tuple of (trained_forecaster, training_metrics)
@@ -413,7 +514,8 @@ def train_final_model(
 
     try:
         # Engineer features
-        features_df = engineer_features(data, horizon=horizon)
+        if features_df is None:
+            features_df = engineer_features(data, horizon=horizon)
 
         # Load and apply feature selector if it exists
         models_dir = MODELS_DIR / f"xgboost_{horizon}d"
@@ -436,7 +538,7 @@ def train_final_model(
             logger.info("No feature selector found, using all features")
 
         # Create config with best hyperparameters
-        config = XGBoostConfig(horizon_days=horizon, **hyperparameters)
+        config = XGBoostConfig(horizon_days=horizon, n_jobs=n_jobs, **hyperparameters)
         forecaster = XGBoostForecaster(config)
 
         # Train on full dataset (80/20 split)
@@ -683,11 +785,36 @@ def send_results_email(
         return False
 
 
+def retraining_failure_alert(horizon: int, error: Exception) -> ModelAlert:
+    """Critical alert for a horizon whose re-training failed."""
+    return ModelAlert(
+        alert_type=AlertType.RETRAINING_FAILURE,
+        severity=AlertSeverity.CRITICAL,
+        model_name=f"xgboost_{horizon}d",
+        horizon=f"{horizon}d",
+        message=f"Re-training FAILED: {str(error)}",
+        details={"error": str(error), "error_type": type(error).__name__},
+        recommendations=[
+            "CRITICAL: Continue using previous model version",
+            "Investigate failure cause in logs",
+            "Check data availability and quality",
+            "Verify hyperparameter search space",
+            "Notify ML team for manual review",
+        ],
+    )
+
+
 def retrain_horizon(
     horizon: int,
     monitor: ModelPerformanceMonitor,
     fast_mode: bool = False,
     dry_run: bool = False,
+    n_workers: int = OPTUNA_N_WORKERS,
+    storage: Optional[str] = None,
+    pruner: str = OPTUNA_PRUNER,
+    data: Optional[pd.DataFrame] = None,
+    features_df: Optional[pd.DataFrame] = None,
+    n_jobs: Optional[int] = None,
 ) -> Tuple[bool, List[ModelAlert]]:
     """
     Re-train XGBoost model for single horizon.
@@ -705,6 +832,14 @@ def retrain_horizon(
         monitor: ModelPerformanceMonitor for baseline comparison
         fast_mode: If True, use fewer Optuna trials (for testing)
         dry_run: If True, don't save models or update baselines
+        n_workers: Optuna worker processes
+        storage: Optuna storage ("memory", journal path or RDB URL);
+            default is a journal file per horizon in OPTUNA_STORAGE_DIR
+            (in-memory for dry runs)
+        pruner: Optuna pruner ("median", "hyperband" or "none")
+        data: Training data already loaded for this horizon's window
+        features_df: Features already engineered from ``data``
+        n_jobs: XGBoost threads (default: all cores split between workers)
 
     Returns:
         Tuple of (success, alerts)
@@ -728,7 +863,8 @@ def retrain_horizon(
     try:
         # Step 1: Load training data
         logger.info("Step 1/6: Loading training data")
-        data = load_training_data(horizon=horizon)
+        if data is None:
+            data = load_training_data(horizon=horizon)
 
         # Check data quality
         missing_pct = data.isna().sum().sum() / (len(data) * len(data.columns))
@@ -752,14 +888,26 @@ def retrain_horizon(
         # Step 2: Optimize hyperparameters
         logger.info("Step 2/6: Optimizing hyperparameters")
         n_trials = OPTUNA_N_TRIALS_FAST if fast_mode else OPTUNA_N_TRIALS
+        if storage is None:
+            # Dry runs leave no journal behind
+            storage = "memory" if dry_run else str(OPTUNA_STORAGE_DIR / f"xgboost_{horizon}d.journal")
         best_params, best_rmse, study = optimize_hyperparameters(
-            data, horizon, n_trials=n_trials
+            data,
+            horizon,
+            n_trials=n_trials,
+            n_workers=n_workers,
+            storage=storage,
+            pruner=pruner,
+            features_df=features_df,
+            n_jobs=n_jobs,
         )
         optimization_time = time.time() - start_time
 
         # Step 3: Train final model
         logger.info("Step 3/6: Training final model")
-        forecaster, metrics = train_final_model(data, horizon, best_params)
+        forecaster, metrics = train_final_model(
+            data, horizon, best_params, features_df=features_df, n_jobs=n_jobs or -1
+        )
 
         # Step 4: Compare with baseline
         logger.info("Step 4/6: Comparing with baseline")
@@ -849,25 +997,169 @@ def retrain_horizon(
         logger.error(f"Re-training failed for {model_name}: {e}", exc_info=True)
 
         # Generate failure alert
-        alerts.append(
-            ModelAlert(
-                alert_type=AlertType.RETRAINING_FAILURE,
-                severity=AlertSeverity.CRITICAL,
-                model_name=model_name,
-                horizon=horizon_str,
-                message=f"Re-training FAILED: {str(e)}",
-                details={"error": str(e), "error_type": type(e).__name__},
-                recommendations=[
-                    "CRITICAL: Continue using previous model version",
-                    "Investigate failure cause in logs",
-                    "Check data availability and quality",
-                    "Verify hyperparameter search space",
-                    "Notify ML team for manual review",
-                ],
+        alerts.append(retraining_failure_alert(horizon, e))
+
+        return False, alerts
+
+
+def create_monitor() -> ModelPerformanceMonitor:
+    """Performance monitor holding the per-horizon baselines."""
+    return ModelPerformanceMonitor(
+        baseline_dir=BASELINE_DIR,
+        degradation_warning_threshold=0.15,  # 15%
+        degradation_critical_threshold=0.30,  # 30%
+        directional_accuracy_threshold=0.55,  # 55%
+    )
+
+
+def training_window(
+    frame: pd.DataFrame,
+    days: int,
+    end: Optional[datetime] = None,
+) -> pd.DataFrame:
+    """Rows of ``frame`` within the last ``days`` calendar days before ``end`` (default: now)."""
+    start = (end or datetime.now()) - timedelta(days=days)
+    return frame.loc[frame.index >= start]
+
+
+def _retrain_shared_horizon(
+    horizon: int,
+    data: pd.DataFrame,
+    features: SharedFrameHandle,
+    loaded_at: datetime,
+    fast_mode: bool,
+    dry_run: bool,
+    n_workers: int,
+    storage: Optional[str],
+    pruner: str,
+    n_jobs: int,
+) -> Tuple[bool, List[ModelAlert]]:
+    """
+    Worker process: re-train one horizon from the shared feature matrix.
+
+    Slices the horizon's training window out of the shared matrix and drops
+    the lags the horizon does not use, then runs the usual retrain_horizon
+    steps on that view.
+    """
+    try:
+        window = TRAINING_WINDOWS.get(horizon, DEFAULT_TRAINING_WINDOW)
+        horizon_data = training_window(data, window, end=loaded_at)
+        if len(horizon_data) < MIN_TRAIN_SIZE:
+            raise ValueError(
+                f"Insufficient data: {len(horizon_data)} days (minimum {MIN_TRAIN_SIZE} required)"
             )
+
+        # Own copy: the shared view is read-only
+        horizon_features = select_horizon_features(
+            training_window(features.attach(), window, end=loaded_at), horizon
+        ).copy()
+        logger.info(
+            f"{horizon}d view of shared features: {len(horizon_features)} rows, "
+            f"{len(horizon_features.columns)} columns"
         )
+    except Exception as e:
+        logger.error(f"Preparing shared features failed for {horizon}d: {e}", exc_info=True)
+        return False, [retraining_failure_alert(horizon, e)]
+
+    return retrain_horizon(
+        horizon,
+        create_monitor(),
+        fast_mode=fast_mode,
+        dry_run=dry_run,
+        n_workers=n_workers,
+        storage=storage,
+        pruner=pruner,
+        data=horizon_data,
+        features_df=horizon_features,
+        n_jobs=n_jobs,
+    )
 
-        return False, alerts
+
+def retrain_horizons_shared(
+    horizons: List[int],
+    fast_mode: bool = False,
+    dry_run: bool = False,
+    n_workers: int = OPTUNA_N_WORKERS,
+    storage: Optional[str] = None,
+    pruner: str = OPTUNA_PRUNER,
+    horizon_workers: Optional[int] = None,
+) -> List[Tuple[bool, List[ModelAlert]]]:
+    """
+    Re-train several horizons from one load and one feature matrix.
+
+    The data is loaded once for the longest training window and features are
+    engineered once (with the lag set of SHARED_FEATURES_HORIZON, which
+    covers every horizon). The matrix is placed in shared memory and each
+    horizon is re-trained in its own worker process on a view of it: its
+    training window, minus the lags it does not use. Targets are derived per
+    horizon by the forecaster as before. Feature selection, the Optuna study
+    and baseline comparison stay per horizon.
+
+    Features near the start of a shorter window are computed from the longer
+    history instead of being dropped as warm-up rows, so a horizon trains on
+    slightly more rows than in single-horizon runs.
+
+    Args:
+        horizons: Horizons to re-train
+        fast_mode: If True, use fewer Optuna trials
+        dry_run: If True, don't save models or update baselines
+        n_workers: Optuna worker processes per horizon
+        storage: Optuna storage (default: journal file per horizon)
+        pruner: Optuna pruner ("median", "hyperband" or "none")
+        horizon_workers: Horizons trained concurrently (default: all)
+
+    Returns:
+        (success, alerts) per horizon, in the order of ``horizons``
+    """
+    horizon_workers = max(1, min(horizon_workers or len(horizons), len(horizons)))
+    # Split the cores between all concurrent trials
+    n_jobs = max(1, (os.cpu_count() or 1) // (horizon_workers * max(1, n_workers)))
+
+    logger.info(f"{'=' * 60}")
+    logger.info(
+        f"Shared re-training for {horizons}: {horizon_workers} horizon worker(s), "
+        f"{n_jobs} XGBoost thread(s) per trial"
+    )
+    logger.info(f"{'=' * 60}")
+
+    try:
+        loaded_at = datetime.now()
+        data = load_training_data(
+            days=max(TRAINING_WINDOWS.get(h, DEFAULT_TRAINING_WINDOW) for h in horizons)
+        )
+        features_df = engineer_features(data, horizon=SHARED_FEATURES_HORIZON)
+        shared = SharedFrame(features_df)
+    except Exception as e:
+        logger.error(f"Shared data preparation failed: {e}", exc_info=True)
+        return [(False, [retraining_failure_alert(h, e)]) for h in horizons]
+
+    results: List[Tuple[bool, List[ModelAlert]]] = []
+    with shared, ProcessPoolExecutor(max_workers=horizon_workers) as pool:
+        # The raw data (a few columns) is small enough to pickle per worker
+        futures = [
+            pool.submit(
+                _retrain_shared_horizon,
+                horizon,
+                data,
+                shared.handle,
+                loaded_at,
+                fast_mode,
+                dry_run,
+                n_workers,
+                storage,
+                pruner,
+                n_jobs,
+            )
+            for horizon in horizons
+        ]
+        for horizon, future in zip(horizons, futures):
+            try:
+                results.append(future.result())
+            except Exception as e:
+                logger.error(f"Worker for {horizon}d failed: {e}", exc_info=True)
+                results.append((False, [retraining_failure_alert(horizon, e)]))
+
+    return results
 
 
 def main():
@@ -878,6 +1170,11 @@ def main():
         --horizon: Specific horizon to retrain (7, 15, 30, or 90). If not specified, retrains all.
         --fast: Fast mode with fewer Optuna trials (for testing)
         --dry-run: Dry run mode (no saving, no emails)
+        --workers: Optuna worker processes per study
+        --storage: Optuna storage (default: journal file per horizon)
+        --pruner: Optuna pruner (median, hyperband, none)
+        --shared: Load and engineer once, re-train horizons in parallel workers
+        --horizon-workers: Horizons re-trained concurrently in shared mode
 
     Exit codes:
         0: Success (all horizons trained)
@@ -904,8 +1201,14 @@ Examples:
   # Dry run (no saving, no emails)
   python scripts/auto_retrain_xgboost.py --dry-run
 
-Scheduled via cron:
-  0 3 * * 0 cd /app && PYTHONPATH=/app/src python scripts/auto_retrain_xgboost.py
+  # 4 tuning workers with Hyperband pruning (re-running the same week resumes)
+  python scripts/auto_retrain_xgboost.py --workers 4 --pruner hyperband
+
+  # All horizons from one shared feature matrix, trained in parallel
+  python scripts/auto_retrain_xgboost.py --shared
+
+Scheduled via cron (7d container, one job for all horizons):
+  0 3 * * 0 cd /app && PYTHONPATH=/app/src python scripts/auto_retrain_xgboost.py --shared
   (Sunday 00:00 Chile = 03:00 UTC)
         """,
     )
@@ -926,6 +1229,40 @@ Scheduled via cron:
         action="store_true",
         help="Dry run: Generate models and emails but don't save or send",
     )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=OPTUNA_N_WORKERS,
+        help=f"Optuna worker processes sharing each study (default: {OPTUNA_N_WORKERS})",
+    )
+    parser.add_argument(
+        "--storage",
+        default=None,
+        help=(
+            "Optuna storage: 'memory', a journal file path or an RDB URL "
+            f"(default: {OPTUNA_STORAGE_DIR}/xgboost_<horizon>d.journal; memory with --dry-run)"
+        ),
+    )
+    parser.add_argument(
+        "--pruner",
+        choices=PRUNERS,
+        default=OPTUNA_PRUNER,
+        help=f"Optuna pruner for per-fold early stopping (default: {OPTUNA_PRUNER})",
+    )
+    parser.add_argument(
+        "--shared",
+        action="store_true",
+        help=(
+            "Load data and engineer features once for all horizons and re-train "
+            "them in parallel workers sharing the feature matrix"
+        ),
+    )
+    parser.add_argument(
+        "--horizon-workers",
+        type=int,
+        default=None,
+        help="Horizons re-trained concurrently with --shared (default: all)",
+    )
 
     args = parser.parse_args()
 
@@ -941,26 +1278,41 @@ Scheduled via cron:
     logger.info(f"Optuna trials: {OPTUNA_N_TRIALS_FAST if args.fast else OPTUNA_N_TRIALS}")
     logger.info(f"Training windows: {', '.join([f'{h}d:{TRAINING_WINDOWS[h]}' for h in horizons])}")
     logger.info(f"Walk-forward splits: {WALK_FORWARD_SPLITS}")
+    logger.info(f"Optuna workers: {args.workers}, pruner: {args.pruner}")
+    logger.info(f"Shared features: {args.shared}")
     logger.info("=" * 80)
 
-    # Initialize monitor
-    baseline_dir = Path("/app/data/baselines")
-    monitor = ModelPerformanceMonitor(
-        baseline_dir=baseline_dir,
-        degradation_warning_threshold=0.15,  # 15%
-        degradation_critical_threshold=0.30,  # 30%
-        directional_accuracy_threshold=0.55,  # 55%
-    )
-
     # Re-train each horizon
     all_alerts: List[ModelAlert] = []
     successes = 0
     failures = 0
 
-    for horizon in horizons:
-        success, alerts = retrain_horizon(
-            horizon, monitor, fast_mode=args.fast, dry_run=args.dry_run
+    if args.shared:
+        results = retrain_horizons_shared(
+            horizons,
+            fast_mode=args.fast,
+            dry_run=args.dry_run,
+            n_workers=args.workers,
+            storage=args.storage,
+            pruner=args.pruner,
+            horizon_workers=args.horizon_workers,
         )
+    else:
+        monitor = create_monitor()
+        results = [
+            retrain_horizon(
+                horizon,
+                monitor,
+                fast_mode=args.fast,
+                dry_run=args.dry_run,
+                n_workers=args.workers,
+                storage=args.storage,
+                pruner=args.pruner,
+            )
+            for horizon in horizons
+        ]
+
+    for success, alerts in results:
         all_alerts.extend(alerts)
 
         if success:
@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""
+Import-Time Budget Check.
+
+Imports each service CLI in a fresh interpreter under ``python -X
+importtime`` and fails if its cold start exceeds the budget or pulls in a
+heavy dependency (torch, matplotlib, statsmodels, ...) that should only be
+imported on demand.
+
+Usage:
+    python scripts/check_import_time.py
+    python scripts/check_import_time.py --budget-ms 800 --top 15
+    python scripts/check_import_time.py --module services.forecaster_7d.cli
+"""
+
+import sys
+from pathlib import Path
+from typing import List, Optional
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+import typer
+from rich.console import Console
+from rich.table import Table
+
+from forex_core.utils.import_time import (
+    DEFAULT_BUDGET_MS,
+    SERVICE_CLI_MODULES,
+    check_import,
+    measure_import,
+)
+
+app = typer.Typer(help="Import-time budget check")
+console = Console()
+
+
+@app.command()
+def check(
+    module: Optional[List[str]] = typer.Option(
+        None, "--module", "-m", help="Module to check (default: all service CLIs)"
+    ),
+    budget_ms: float = typer.Option(DEFAULT_BUDGET_MS, "--budget-ms", help="Import budget per module"),
+    repeat: int = typer.Option(3, "--repeat", "-r", help="Fresh interpreters per module (best is kept)"),
+    top: int = typer.Option(5, "--top", help="Heaviest packages to show per module"),
+):
+    """
+    Measure cold-start import time of the service CLIs.
+
+    Exits with code 1 if any module is over budget or imports a heavy
+    dependency at startup.
+    """
+    table = Table(title=f"Import time (budget {budget_ms:.0f}ms)")
+    table.add_column("Module", style="cyan")
+    table.add_column("Import", justify="right")
+    table.add_column("Heaviest packages", style="dim")
+
+    violations: List[str] = []
+    for name in module or SERVICE_CLI_MODULES:
+        profile = measure_import(name, repeat=repeat)
+        problems = check_import(profile, budget_ms=budget_ms)
+        violations.extend(problems)
+
+        style = "red" if problems else "green"
+        table.add_row(
+            name,
+            f"[{style}]{profile.total_ms:.0f}ms[/{style}]",
+            ", ".join(f"{pkg} {ms:.0f}ms" for pkg, ms in profile.heaviest(top)),
+        )
+
+    console.print(table)
+
+    if violations:
+        for violation in violations:
+            console.print(f"[red]✗ {violation}[/red]")
+        raise typer.Exit(code=1)
+
+    console.print("[green]✓ All imports within budget[/green]")
+
+
+if __name__ == "__main__":
+    app()
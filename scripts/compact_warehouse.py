@@ -0,0 +1,54 @@
+#!/usr/bin/env python3
+"""
+Warehouse Compaction CLI.
+
+Merge incremental delta files into year partitions. Only runs when
+WAREHOUSE_INCREMENTAL is enabled: compaction moves single-file series into
+the partitioned layout, which only incremental deployments expect.
+
+Usage:
+    python scripts/compact_warehouse.py
+    python scripts/compact_warehouse.py --series dxy_index
+"""
+
+import sys
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+import typer
+from rich.console import Console
+
+from forex_core.config import get_settings
+from forex_core.data.warehouse import Warehouse
+
+app = typer.Typer(help="Warehouse compaction CLI")
+console = Console()
+
+
+@app.command()
+def compact(
+    series: str = typer.Option(None, "--series", "-s", help="Single series to compact"),
+):
+    """
+    Compact warehouse deltas into year partitions.
+
+    Examples:
+        python scripts/compact_warehouse.py
+        python scripts/compact_warehouse.py --series usdclp_daily
+    """
+    warehouse = Warehouse(get_settings())
+    if not warehouse.incremental:
+        console.print(
+            "[red]✗ Warehouse is not in incremental mode "
+            "(set WAREHOUSE_INCREMENTAL=true to use compaction)[/red]"
+        )
+        raise typer.Exit(code=1)
+
+    count = warehouse.compact(series)
+    console.print(f"[green]✓ Compacted {count} series[/green] in {warehouse.base_dir}")
+
+
+if __name__ == "__main__":
+    app()
@@ -36,6 +36,7 @@ from loguru import logger
 
 from forex_core.config import get_settings
 from forex_core.mlops import PredictionTracker
+from forex_core.mlops.prediction_store import PredictionStore
 
 console = Console()
 
@@ -191,16 +192,15 @@ def main():
     # Load settings
     settings = get_settings()
 
-    # Load predictions directly from parquet
+    # Load predictions from the partitioned store
     console.print("[yellow]Loading prediction history...[/yellow]")
-    storage_path = settings.data_dir / "predictions" / "predictions.parquet"
+    store = PredictionStore.for_data_dir(settings.data_dir)
 
-    if not storage_path.exists():
-        console.print(f"[red]No prediction data found at {storage_path}![/red]")
+    if not store.exists():
+        console.print(f"[red]No prediction data found at {store.root}![/red]")
         return
 
-    # Read parquet file
-    df = pd.read_parquet(storage_path)
+    df = store.read()
 
     if df.empty:
         console.print("[red]Prediction file is empty![/red]")
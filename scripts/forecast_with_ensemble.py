@@ -212,7 +212,7 @@ def _convert_databundle_to_dataframe(loader: DataLoader, days: int) -> pd.DataFr
                                 and Chilean indicators if available
     """
     # Load the DataBundle
-    bundle = loader.load()
+    bundle = loader.load(max_age=loader.settings.bundle_snapshot_max_age)
 
     # Start with USDCLP as the base
     df = pd.DataFrame(index=bundle.usdclp_series.index)
@@ -425,6 +425,90 @@ def _load_data_fallback(horizon: int) -> pd.DataFrame:
 # FORECASTING
 # ============================================================================
 
+# Ensembles loaded by this process, keyed by horizon. A one-shot cron run
+# uses each entry once; the model server reuses them across requests.
+_ENSEMBLE_CACHE: Dict[int, Tuple[float, Dict[str, bool], EnsembleForecaster]] = {}
+
+
+def _model_stamp(model_path: Path) -> Optional[float]:
+    """Modification time of the saved ensemble (changes when it is re-saved)."""
+    for name in ("manifest.json", "ensemble_metadata.json"):
+        candidate = model_path / name
+        if candidate.exists():
+            return candidate.stat().st_mtime
+    return None
+
+
+def _model_status(forecaster: EnsembleForecaster) -> Dict[str, bool]:
+    return {
+        flag: getattr(forecaster, flag)
+        for flag in ("xgboost_fitted", "sarimax_fitted", "garch_fitted")
+    }
+
+
+def _cached_ensemble(horizon_days: int, model_path: Path) -> Optional[EnsembleForecaster]:
+    """
+    Resident ensemble for a horizon, if it still matches the files on disk.
+
+    predict() clears a component's fitted flag when that component fails, so
+    the flags captured at load time are restored before every reuse.
+    """
+    entry = _ENSEMBLE_CACHE.get(horizon_days)
+    if entry is None:
+        return None
+
+    stamp, status, forecaster = entry
+    if stamp is None or stamp != _model_stamp(model_path):
+        del _ENSEMBLE_CACHE[horizon_days]
+        return None
+
+    for flag, value in status.items():
+        setattr(forecaster, flag, value)
+    return forecaster
+
+
+def _cache_ensemble(horizon_days: int, model_path: Path, forecaster: EnsembleForecaster) -> None:
+    _ENSEMBLE_CACHE[horizon_days] = (
+        _model_stamp(model_path), _model_status(forecaster), forecaster
+    )
+
+
+def _is_cached(horizon_days: int, forecaster: EnsembleForecaster) -> bool:
+    entry = _ENSEMBLE_CACHE.get(horizon_days)
+    return entry is not None and entry[2] is forecaster
+
+
+def preload_ensemble(horizon_days: int) -> bool:
+    """
+    Load the saved ensemble for a horizon into the process-wide cache.
+
+    Returns:
+        True if a saved ensemble was found and loaded
+    """
+    from forex_core.models.sarimax_forecaster import SARIMAXConfig
+
+    model_path = MODELS_DIR / f"ensemble_{horizon_days}d"
+    if _cached_ensemble(horizon_days, model_path) is not None:
+        return True
+
+    sarimax_config = SARIMAXConfig.from_horizon(horizon_days)
+    sarimax_config.exog_vars = []
+    forecaster = EnsembleForecaster(horizon_days=horizon_days, sarimax_config=sarimax_config)
+    try:
+        forecaster.load_models(model_path)
+    except (FileNotFoundError, ValueError) as e:
+        logger.warning(f"No saved {horizon_days}d ensemble to preload: {e}")
+        return False
+
+    _cache_ensemble(horizon_days, model_path, forecaster)
+    return True
+
+
+def resident_ensembles() -> list:
+    """Horizons whose ensembles are currently cached."""
+    return sorted(_ENSEMBLE_CACHE)
+
+
 def generate_forecast(
     features_df: pd.DataFrame,
     exog_df: Optional[pd.DataFrame],
@@ -460,14 +544,16 @@ def generate_forecast(
     sarimax_config = SARIMAXConfig.from_horizon(horizon_days)
     sarimax_config.exog_vars = []  # Force univariate - no exogenous variables
 
-    forecaster = EnsembleForecaster(
-        horizon_days=horizon_days,
-        sarimax_config=sarimax_config,
-    )
-
     # Determine model path
     model_path = MODELS_DIR / f"ensemble_{horizon_days}d"
 
+    forecaster = None if train_models else _cached_ensemble(horizon_days, model_path)
+    if forecaster is None:
+        forecaster = EnsembleForecaster(
+            horizon_days=horizon_days,
+            sarimax_config=sarimax_config,
+        )
+
     # Train or load models
     # Note: SARIMAX is trained WITHOUT exogenous variables (univariate)
     # This is because we cannot forecast future values of copper, DXY, VIX, TPM
@@ -483,10 +569,14 @@ def generate_forecast(
         )
         logger.info(f"Training complete. Metrics: {metrics}")
     else:
-        # Try to load existing models
+        # Try to load existing models (kept resident when running in the model server)
         try:
-            forecaster.load_models(model_path)
-            logger.info("Loaded existing models")
+            if not _is_cached(horizon_days, forecaster):
+                forecaster.load_models(model_path)
+                _cache_ensemble(horizon_days, model_path, forecaster)
+                logger.info("Loaded existing models")
+            else:
+                logger.info("Using resident models")
         except FileNotFoundError:
             logger.warning("Models not found - training new models...")
             logger.info("SARIMAX will be univariate (no exogenous variables)")
@@ -765,67 +855,36 @@ def send_forecast_email(
 # MAIN WORKFLOW
 # ============================================================================
 
-def main():
+def run_forecast(
+    horizon_days: int,
+    train_models: bool = False,
+    no_email: bool = False,
+    test_email: bool = False,
+    verbose: bool = False,
+) -> int:
     """
-    Main workflow orchestrator.
+    Run the forecasting workflow in this process.
 
     Executes complete forecasting pipeline:
-    1. Parse arguments
-    2. Load and prepare data
-    3. Generate ensemble forecast
-    4. Detect market shocks
-    5. Save results
-    6. Send email (optional)
-    """
-    # Parse arguments
-    parser = argparse.ArgumentParser(
-        description="USD/CLP Ensemble Forecasting System",
-        formatter_class=argparse.RawDescriptionHelpFormatter,
-    )
-
-    parser.add_argument(
-        "--horizon",
-        type=int,
-        choices=[7, 15, 30, 90],
-        default=7,
-        help="Forecast horizon in days (default: 7)",
-    )
-
-    parser.add_argument(
-        "--train",
-        action="store_true",
-        help="Train new models (default: use existing)",
-    )
-
-    parser.add_argument(
-        "--no-email",
-        action="store_true",
-        help="Skip email delivery",
-    )
-
-    parser.add_argument(
-        "--test-email",
-        action="store_true",
-        help="Send email to test recipients only",
-    )
-
-    parser.add_argument(
-        "-v", "--verbose",
-        action="store_true",
-        help="Enable verbose logging",
-    )
+    1. Load and prepare data
+    2. Generate ensemble forecast
+    3. Detect market shocks
+    4. Save results
+    5. Send email (optional)
 
-    args = parser.parse_args()
-
-    # Configure logging
-    if args.verbose:
-        logger.add(sys.stderr, level="DEBUG")
-    else:
-        logger.add(sys.stderr, level="INFO")
+    Args:
+        horizon_days: Forecast horizon (7, 15, 30, 90)
+        train_models: Train new models instead of loading saved ones
+        no_email: Skip email delivery
+        test_email: Send email to test recipients only
+        verbose: Enable verbose logging
 
+    Returns:
+        Exit code: 0 success, 1 failure, 2 alert condition
+    """
     logger.info(
         f"\n{'='*60}\n"
-        f"USD/CLP Ensemble Forecast - {args.horizon} days\n"
+        f"USD/CLP Ensemble Forecast - {horizon_days} days\n"
         f"{'='*60}"
     )
 
@@ -833,8 +892,8 @@ def main():
         # Step 1: Load and prepare data
         logger.info("\n[1/5] Loading and preparing data...")
         features_df, exog_df = load_and_prepare_data(
-            horizon_days=args.horizon,
-            verbose=args.verbose,
+            horizon_days=horizon_days,
+            verbose=verbose,
         )
 
         # Check if we have sufficient data after feature engineering
@@ -849,9 +908,9 @@ def main():
         forecast, metrics = generate_forecast(
             features_df=features_df,
             exog_df=exog_df,
-            horizon_days=args.horizon,
-            train_models=args.train,
-            verbose=args.verbose,
+            horizon_days=horizon_days,
+            train_models=train_models,
+            verbose=verbose,
         )
 
         # Step 3: Detect market shocks
@@ -859,8 +918,8 @@ def main():
         market_analysis = detect_market_shocks(
             forecast=forecast,
             features_df=features_df,
-            horizon_days=args.horizon,
-            verbose=args.verbose,
+            horizon_days=horizon_days,
+            verbose=verbose,
         )
 
         # Step 4: Save results
@@ -869,17 +928,17 @@ def main():
             forecast=forecast,
             metrics=metrics,
             market_analysis=market_analysis,
-            horizon_days=args.horizon,
+            horizon_days=horizon_days,
         )
 
         # Step 5: Send email (optional)
-        if not args.no_email:
+        if not no_email:
             logger.info("\n[5/5] Sending forecast email...")
             email_sent = send_forecast_email(
                 forecast=forecast,
                 market_analysis=market_analysis,
-                horizon_days=args.horizon,
-                test_mode=args.test_email,
+                horizon_days=horizon_days,
+                test_mode=test_email,
             )
 
             if not email_sent:
@@ -892,7 +951,7 @@ def main():
             f"\n{'='*60}\n"
             f"FORECAST COMPLETE\n"
             f"{'='*60}\n"
-            f"Horizon: {args.horizon} days\n"
+            f"Horizon: {horizon_days} days\n"
             f"Current rate: {features_df['usdclp'].iloc[-1]:.2f} CLP\n"
             f"Forecast: {forecast.ensemble_forecast[-1]:.2f} CLP\n"
             f"Range: [{forecast.lower_2sigma[-1]:.2f}, {forecast.upper_2sigma[-1]:.2f}]\n"
@@ -903,16 +962,79 @@ def main():
 
         # Exit with appropriate code
         if market_analysis['should_alert']:
-            sys.exit(2)  # Alert condition
-        else:
-            sys.exit(0)  # Success
+            return 2  # Alert condition
+        return 0  # Success
 
     except Exception as e:
         logger.error(f"\n{'!'*60}")
         logger.error(f"FORECAST FAILED: {e}")
         logger.error(f"{'!'*60}")
         logger.exception("Full traceback:")
-        sys.exit(1)
+        return 1
+
+
+def main():
+    """
+    Main workflow orchestrator.
+
+    Parses arguments and runs the workflow in this process. Cron calls
+    ``services.model_server.cli forecast`` instead, which hands the same run
+    to the warm model server and only falls back to this path when no server
+    is listening.
+    """
+    # Parse arguments
+    parser = argparse.ArgumentParser(
+        description="USD/CLP Ensemble Forecasting System",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+
+    parser.add_argument(
+        "--horizon",
+        type=int,
+        choices=[7, 15, 30, 90],
+        default=7,
+        help="Forecast horizon in days (default: 7)",
+    )
+
+    parser.add_argument(
+        "--train",
+        action="store_true",
+        help="Train new models (default: use existing)",
+    )
+
+    parser.add_argument(
+        "--no-email",
+        action="store_true",
+        help="Skip email delivery",
+    )
+
+    parser.add_argument(
+        "--test-email",
+        action="store_true",
+        help="Send email to test recipients only",
+    )
+
+    parser.add_argument(
+        "-v", "--verbose",
+        action="store_true",
+        help="Enable verbose logging",
+    )
+
+    args = parser.parse_args()
+
+    # Configure logging
+    if args.verbose:
+        logger.add(sys.stderr, level="DEBUG")
+    else:
+        logger.add(sys.stderr, level="INFO")
+
+    sys.exit(run_forecast(
+        horizon_days=args.horizon,
+        train_models=args.train,
+        no_email=args.no_email,
+        test_email=args.test_email,
+        verbose=args.verbose,
+    ))
 
 
 if __name__ == "__main__":
@@ -72,14 +72,20 @@ def show(
         pred_table.add_column("Total", justify="right")
         pred_table.add_column("Last 7d", justify="right")
         pred_table.add_column("Last 30d", justify="right")
+        pred_table.add_column("RMSE 30d", justify="right")
+        pred_table.add_column("CI95 Cov.", justify="right")
         pred_table.add_column("Latest", style="dim")
 
         for row in pred_summary:
+            rmse = row.get("rmse_30d")
+            coverage = row.get("ci95_coverage")
             pred_table.add_row(
                 row["horizon"],
                 str(row["total"]),
                 str(row["last_7d"]),
                 str(row["last_30d"]),
+                f"{rmse:.2f}" if rmse is not None else "-",
+                f"{coverage:.1%}" if coverage is not None else "-",
                 row["latest_date"],
             )
 
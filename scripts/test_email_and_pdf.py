@@ -31,6 +31,8 @@ import matplotlib.pyplot as plt
 from matplotlib.figure import Figure
 from matplotlib.dates import DateFormatter, AutoDateLocator
 
+from forex_core.mlops.prediction_store import PredictionStore
+
 try:
     from weasyprint import HTML
     WEASYPRINT_AVAILABLE = True
@@ -56,12 +58,12 @@ def calculate_system_health(horizon: str, predictions_path: Path = None) -> dict
     }
 
     # Try to load predictions
-    if not predictions_path.exists():
+    store = PredictionStore.for_legacy_path(predictions_path)
+    if not store.exists():
         return health
 
     try:
-        df = pd.read_parquet(predictions_path)
-        df_horizon = df[df["horizon"] == horizon].copy()
+        df_horizon = store.read(horizon=horizon)
 
         if df_horizon.empty:
             return health
@@ -35,6 +35,8 @@ import pandas as pd
 from loguru import logger
 
 from forex_core.config import get_settings
+from forex_core.data.warehouse import Warehouse
+from forex_core.mlops.prediction_store import PredictionStore
 
 
 class CopperImpactTracker:
@@ -56,7 +58,7 @@ class CopperImpactTracker:
             data_dir: Directory containing predictions and historical data
         """
         self.data_dir = Path(data_dir)
-        self.predictions_path = self.data_dir / "predictions" / "predictions.parquet"
+        self.store = PredictionStore.for_data_dir(self.data_dir)
         self.output_dir = Path(__file__).parent.parent / "output"
         self.output_dir.mkdir(exist_ok=True)
 
@@ -68,13 +70,13 @@ class CopperImpactTracker:
         logger.info("CopperImpactTracker initialized")
 
     def load_predictions(self) -> pd.DataFrame:
-        """Load all predictions from parquet file."""
-        if not self.predictions_path.exists():
-            logger.warning(f"Predictions file not found: {self.predictions_path}")
+        """Load all predictions from the prediction store."""
+        if not self.store.exists():
+            logger.warning(f"Prediction store not found: {self.store.root}")
             return pd.DataFrame()
 
-        df = pd.read_parquet(self.predictions_path)
-        logger.info(f"Loaded {len(df)} predictions from {self.predictions_path}")
+        df = self.store.read()
+        logger.info(f"Loaded {len(df)} predictions from {self.store.root}")
         return df
 
     def split_pre_post_copper(
@@ -278,10 +280,11 @@ class CopperImpactTracker:
         Returns:
             Dictionary with copper data health metrics
         """
-        warehouse_path = self.data_dir / "warehouse" / "copper_hgf_usd_lb.parquet"
+        settings = get_settings().model_copy(update={"warehouse_dir": self.data_dir / "warehouse"})
+        copper = Warehouse(settings).load_series("copper_hgf_usd_lb")
 
-        if not warehouse_path.exists():
-            logger.warning(f"Copper warehouse file not found: {warehouse_path}")
+        if copper is None:
+            logger.warning(f"Copper series not found in warehouse: {settings.warehouse_dir}")
             return {
                 'copper_data_available': False,
                 'last_update': None,
@@ -290,7 +293,7 @@ class CopperImpactTracker:
             }
 
         # Load copper data
-        copper_df = pd.read_parquet(warehouse_path)
+        copper_df = copper.to_frame()
 
         # Get metadata
         last_update = copper_df.index.max() if not copper_df.empty else None
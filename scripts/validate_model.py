@@ -8,6 +8,7 @@ de forecasting en condiciones realistas.
 Usage:
     python scripts/validate_model.py --horizon 7 --mode expanding --folds 5
     python scripts/validate_model.py --horizon 15 --mode rolling --folds 3
+    python scripts/validate_model.py --horizon 90 --folds 12 --workers 4 --incremental
 """
 
 import sys
@@ -23,78 +24,81 @@ from loguru import logger
 from rich.console import Console
 from rich.table import Table
 
+from forex_core.config import get_settings
 from forex_core.data.loader import DataLoader
+from forex_core.data.warehouse import Warehouse
 from forex_core.mlops.validation import ValidationMode, WalkForwardValidator
 
 app = typer.Typer(help="Walk-Forward Validation Tool")
 console = Console()
 
 
+def naive_drift_forecaster(bundle, horizon):
+    """Simple naive forecaster for testing."""
+    from forex_core.data.models import ForecastPackage, ForecastPoint
+    from scipy import stats
+
+    import numpy as np
+
+    # Get last value
+    last_value = bundle.usdclp_series.iloc[-1]
+
+    # Simple drift based on recent trend
+    recent_values = bundle.usdclp_series.tail(30).values
+    drift = (recent_values[-1] - recent_values[0]) / len(recent_values)
+
+    # Estimate volatility from historical data (more realistic)
+    # Use log returns for volatility estimation
+    log_returns = np.log(recent_values[1:] / recent_values[:-1])
+    historical_vol = np.std(log_returns, ddof=1)  # Sample std dev
+
+    # t-distribution critical values (df=30)
+    df = 30
+    t_80 = stats.t.ppf(0.90, df=df)  # ≈1.310
+    t_95 = stats.t.ppf(0.975, df=df)  # ≈2.042
+
+    # Generate naive forecast
+    forecast_points = []
+    for i in range(horizon):
+        mean = last_value + drift * (i + 1)
+
+        # Forecast std dev grows with horizon (sqrt(h) rule)
+        # Convert log-return volatility to price volatility
+        # std_price ≈ price * vol_log * sqrt(horizon_days)
+        horizon_days = i + 1
+        std_dev = mean * historical_vol * np.sqrt(horizon_days)
+
+        ci80_width = std_dev * t_80  # 80% CI using t-distribution
+        ci95_width = std_dev * t_95  # 95% CI using t-distribution
+
+        point = ForecastPoint(
+            date=datetime.now() + timedelta(days=i + 1),
+            mean=mean,
+            ci80_low=mean - ci80_width,
+            ci80_high=mean + ci80_width,
+            ci95_low=mean - ci95_width,
+            ci95_high=mean + ci95_width,
+            std_dev=std_dev,
+        )
+        forecast_points.append(point)
+
+    return ForecastPackage(
+        series=forecast_points,
+        methodology="Naive drift forecaster (30d trend + historical vol, t-dist CIs)",
+        error_metrics={"rmse": 0.0, "mae": 0.0, "mape": 0.0},  # Placeholder
+        residual_vol=last_value * historical_vol,
+    )
+
+
 def create_simple_forecaster(horizon_days: int):
     """
     Create a simple forecaster function for validation.
 
     NOTE: In production, this should use the actual forecaster pipeline.
     For now, we'll use a simple naive forecast (last value + small drift).
+    Defined at module level so folds can run in worker processes.
     """
-
-    def forecaster_func(bundle, horizon):
-        """Simple naive forecaster for testing."""
-        from forex_core.data.models import ForecastPackage, ForecastPoint
-        from scipy import stats
-
-        import numpy as np
-
-        # Get last value
-        last_value = bundle.usdclp_series.iloc[-1]
-
-        # Simple drift based on recent trend
-        recent_values = bundle.usdclp_series.tail(30).values
-        drift = (recent_values[-1] - recent_values[0]) / len(recent_values)
-
-        # Estimate volatility from historical data (more realistic)
-        # Use log returns for volatility estimation
-        log_returns = np.log(recent_values[1:] / recent_values[:-1])
-        historical_vol = np.std(log_returns, ddof=1)  # Sample std dev
-
-        # t-distribution critical values (df=30)
-        df = 30
-        t_80 = stats.t.ppf(0.90, df=df)  # ≈1.310
-        t_95 = stats.t.ppf(0.975, df=df)  # ≈2.042
-
-        # Generate naive forecast
-        forecast_points = []
-        for i in range(horizon):
-            mean = last_value + drift * (i + 1)
-
-            # Forecast std dev grows with horizon (sqrt(h) rule)
-            # Convert log-return volatility to price volatility
-            # std_price ≈ price * vol_log * sqrt(horizon_days)
-            horizon_days = i + 1
-            std_dev = mean * historical_vol * np.sqrt(horizon_days)
-
-            ci80_width = std_dev * t_80  # 80% CI using t-distribution
-            ci95_width = std_dev * t_95  # 95% CI using t-distribution
-
-            point = ForecastPoint(
-                date=datetime.now() + timedelta(days=i + 1),
-                mean=mean,
-                ci80_low=mean - ci80_width,
-                ci80_high=mean + ci80_width,
-                ci95_low=mean - ci95_width,
-                ci95_high=mean + ci95_width,
-                std_dev=std_dev,
-            )
-            forecast_points.append(point)
-
-        return ForecastPackage(
-            series=forecast_points,
-            methodology="Naive drift forecaster (30d trend + historical vol, t-dist CIs)",
-            error_metrics={"rmse": 0.0, "mae": 0.0, "mape": 0.0},  # Placeholder
-            residual_vol=last_value * historical_vol,
-        )
-
-    return forecaster_func
+    return naive_drift_forecaster
 
 
 @app.command()
@@ -116,6 +120,14 @@ def validate(
     step_days: int = typer.Option(
         30, "--step-days", help="Step size between folds in days"
     ),
+    workers: int = typer.Option(
+        1, "--workers", "-w", help="Worker processes for running folds in parallel"
+    ),
+    incremental: bool = typer.Option(
+        False,
+        "--incremental",
+        help="Reuse folds from the latest saved report and only run new ones",
+    ),
     verbose: bool = typer.Option(False, "--verbose", "-v", help="Verbose logging"),
 ):
     """
@@ -130,7 +142,9 @@ def validate(
     console.print(f"Max folds: {folds}")
     console.print(f"Initial training: {initial_train} days")
     console.print(f"Test window: {test_days} days")
-    console.print(f"Step size: {step_days} days\n")
+    console.print(f"Step size: {step_days} days")
+    console.print(f"Workers: {workers}")
+    console.print(f"Incremental: {incremental}\n")
 
     # Configure logging
     if not verbose:
@@ -143,12 +157,8 @@ def validate(
         data_loader = DataLoader()
 
         # Try to load from warehouse first (faster)
-        warehouse_path = Path("data/warehouse/usdclp_daily.parquet")
-        if warehouse_path.exists():
-            import pandas as pd
-
-            df = pd.read_parquet(warehouse_path)
-            series = df["value"]
+        series = Warehouse(get_settings()).load_series("usdclp_daily")
+        if series is not None:
             console.print(f"✓ Loaded {len(series)} observations from warehouse")
         else:
             # Load fresh data
@@ -182,6 +192,7 @@ def validate(
         test_days=test_days,
         step_days=step_days,
         mode=validation_mode,
+        n_jobs=workers,
     )
     console.print("✓ Validator initialized")
 
@@ -190,7 +201,10 @@ def validate(
     console.print("This may take a few minutes...\n")
 
     try:
-        report = validator.validate(series, max_folds=folds)
+        if incremental:
+            report = validator.validate_incremental(series, max_folds=folds)
+        else:
+            report = validator.validate(series, max_folds=folds)
     except Exception as e:
         console.print(f"[red]✗ Validation failed: {e}[/red]")
         import traceback
@@ -235,6 +249,7 @@ def validate(
     fold_table.add_column("MAE", style="yellow")
     fold_table.add_column("MAPE", style="yellow")
     fold_table.add_column("CI95", style="green")
+    fold_table.add_column("Time", style="dim")
 
     for metrics in report.fold_metrics:
         fold_table.add_row(
@@ -245,6 +260,7 @@ def validate(
             f"{metrics.mae:.2f}",
             f"{metrics.mape:.2f}%",
             f"{metrics.ci95_coverage:.1%}",
+            f"{metrics.duration_seconds:.1f}s",
         )
 
     console.print(fold_table)
@@ -17,9 +17,10 @@ The Settings class uses Pydantic for validation and type safety.
 
 from __future__ import annotations
 
+from datetime import timedelta
 from functools import lru_cache
 from pathlib import Path
-from typing import Any, List, Optional
+from typing import Any, List, Literal, Optional
 
 from pydantic import EmailStr, Field, HttpUrl, field_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
@@ -91,6 +92,77 @@ class Settings(BaseSettings):
         description="Cache time-to-live in minutes",
     )
 
+    # Data loading
+    data_load_concurrent: bool = Field(
+        default=False,
+        alias="DATA_LOAD_CONCURRENT",
+        description="Fetch data providers concurrently in DataLoader.load()",
+    )
+    data_load_max_workers: int = Field(
+        default=8,
+        alias="DATA_LOAD_MAX_WORKERS",
+        description="Thread pool size for concurrent provider fetches",
+    )
+    bundle_snapshot_enabled: bool = Field(
+        default=True,
+        alias="BUNDLE_SNAPSHOT_ENABLED",
+        description="Publish a DataBundle snapshot after every network load",
+    )
+    bundle_snapshot_ttl_minutes: int = Field(
+        default=60,
+        alias="BUNDLE_SNAPSHOT_TTL_MINUTES",
+        description="Maximum age of a DataBundle snapshot reused instead of fetching",
+    )
+
+    delta_fetch_enabled: bool = Field(
+        default=True,
+        alias="DELTA_FETCH_ENABLED",
+        description="Fetch only data newer than the warehouse high-water mark",
+    )
+    warehouse_incremental: bool = Field(
+        default=False,
+        alias="WAREHOUSE_INCREMENTAL",
+        description="Store warehouse series as year partitions plus append-only deltas",
+    )
+    warehouse_compact_threshold: int = Field(
+        default=30,
+        alias="WAREHOUSE_COMPACT_THRESHOLD",
+        description="Number of warehouse delta files that triggers compaction",
+    )
+
+    feature_store_enabled: bool = Field(
+        default=True,
+        alias="FEATURE_STORE_ENABLED",
+        description="Cache engineered feature matrices keyed by input data fingerprint",
+    )
+    feature_store_max_entries: int = Field(
+        default=8,
+        alias="FEATURE_STORE_MAX_ENTRIES",
+        description="Feature matrices kept on disk per feature builder",
+    )
+
+    # Warm model server
+    model_server_enabled: bool = Field(
+        default=True,
+        alias="MODEL_SERVER_ENABLED",
+        description="Let CLIs and cron scripts delegate to a running model server",
+    )
+    model_server_host: str = Field(
+        default="127.0.0.1",
+        alias="MODEL_SERVER_HOST",
+        description="Interface the model server binds to (keep it on localhost)",
+    )
+    model_server_port: int = Field(
+        default=8765,
+        alias="MODEL_SERVER_PORT",
+        description="TCP port of the model server",
+    )
+    model_server_timeout_seconds: float = Field(
+        default=1800.0,
+        alias="MODEL_SERVER_TIMEOUT_SECONDS",
+        description="Client timeout for a single model server request",
+    )
+
     # API Keys
     fred_api_key: Optional[str] = Field(
         default=None,
@@ -200,6 +272,44 @@ class Settings(BaseSettings):
         alias="ENSEMBLE_WINDOW",
         description="Window size for ensemble model weighting",
     )
+    arima_search_workers: int = Field(
+        default=1,
+        alias="ARIMA_SEARCH_WORKERS",
+        description="Worker processes for the ARIMA order grid search (1 = sequential)",
+    )
+    arima_order_cache_enabled: bool = Field(
+        default=True,
+        alias="ARIMA_ORDER_CACHE_ENABLED",
+        description="Reuse the last selected ARIMA order per horizon until drift or expiry",
+    )
+    arima_order_cache_ttl_hours: int = Field(
+        default=168,
+        alias="ARIMA_ORDER_CACHE_TTL_HOURS",
+        description="Hours before a cached ARIMA order is re-searched",
+    )
+    forecast_parallel_models: bool = Field(
+        default=False,
+        alias="FORECAST_PARALLEL_MODELS",
+        description="Run enabled component models concurrently in ForecastEngine",
+    )
+    forecast_model_executor: Literal["thread", "process"] = Field(
+        default="thread",
+        alias="FORECAST_MODEL_EXECUTOR",
+        description="Pool type for concurrent component models (thread or process)",
+    )
+    forecast_model_timeout_seconds: float = Field(
+        default=300.0,
+        alias="FORECAST_MODEL_TIMEOUT_SECONDS",
+        description=(
+            "Latency budget per component model; slower models are dropped. "
+            "Only the process executor stops them, threads run to completion"
+        ),
+    )
+    rf_forecast_strategy: Literal["recursive", "direct"] = Field(
+        default="recursive",
+        alias="RF_FORECAST_STRATEGY",
+        description="Random Forest multi-step strategy: recursive or direct multi-output",
+    )
 
     # Drift detection configuration
     drift_baseline_window: int = Field(
@@ -272,6 +382,16 @@ class Settings(BaseSettings):
         """
         return str(self.http_proxy) if self.http_proxy else None
 
+    @property
+    def bundle_snapshot_max_age(self) -> timedelta:
+        """
+        Get DataBundle snapshot freshness TTL.
+
+        Returns:
+            Maximum snapshot age to pass as DataLoader.load(max_age=...).
+        """
+        return timedelta(minutes=self.bundle_snapshot_ttl_minutes)
+
     @property
     def tz(self) -> ZoneInfo:
         """
@@ -7,6 +7,7 @@ capabilities for forex forecasting. It includes:
 - Data providers: Multiple external API clients for financial and economic data
 - Warehouse: Time-series data storage and versioning with Parquet
 - Loader: Unified data loading and orchestration
+- Snapshots: Shared on-disk DataBundle cache with freshness TTL
 - Registry: Source tracking and citation management
 
 Providers:
@@ -44,6 +45,7 @@ from .models import (
     NewsHeadline,
 )
 from .registry import Source, SourceRegistry
+from .snapshot import BundleSnapshotStore
 from .warehouse import Warehouse
 
 __all__ = [
@@ -52,6 +54,7 @@ __all__ = [
     "DataBundle",
     # Storage and tracking
     "Warehouse",
+    "BundleSnapshotStore",
     "SourceRegistry",
     "Source",
     # Data models
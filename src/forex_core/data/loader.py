@@ -7,11 +7,12 @@ Handles data fetching, caching, error recovery, and source tracking.
 
 from __future__ import annotations
 
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import dataclass
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
-import httpx
 import pandas as pd
 from loguru import logger
 
@@ -31,9 +32,22 @@ from forex_core.data.providers import (
 from forex_core.data.providers.bcentral import BancoCentralProvider
 from forex_core.data.providers.china_indicators import ChinaPMIProvider
 from forex_core.data.providers.afp_flows import AFPFlowProvider
+from forex_core.data.providers.http_pool import close_http_pool, shared_client
 from forex_core.data.registry import SourceRegistry
+from forex_core.data.snapshot import BundleSnapshotStore
 from forex_core.data.warehouse import Warehouse
 
+MACRO_COUNTRIES = ("USD", "CAD", "CNY", "EUR")
+
+# Delta fetch: re-download this many days before the high-water mark to pick
+# up late revisions, and tolerate this much missing history at the start of
+# the window (weekends/holidays) before treating it as a gap.
+DELTA_FETCH_OVERLAP_DAYS = 5
+DELTA_FETCH_COVERAGE_SLACK_DAYS = 10
+# A stored gap longer than this many typical spacings (and the slack) is a hole
+DELTA_FETCH_GAP_FACTOR = 3
+WORLDBANK_GDP_URL = "https://api.worldbank.org/v2/country/CHL/indicator/NY.GDP.MKTP.KD.ZG"
+
 
 @dataclass
 class DataBundle:
@@ -58,6 +72,7 @@ class DataBundle:
         sources: Source registry for citations.
         usdclp_intraday: Optional intraday USD/CLP data (if available).
         copper_features: Optional derived copper features (volatility, RSI, etc.).
+        fetch_timings: Seconds spent in each provider fetch during load().
 
     Example:
         >>> from forex_core.data import DataLoader
@@ -91,6 +106,7 @@ class DataBundle:
     china_pmi: Optional[pd.Series] = None
     afp_flows: Optional[pd.Series] = None
     lme_inventory: Optional[pd.Series] = None
+    fetch_timings: Optional[Dict[str, float]] = None
 
 
 class DataLoader:
@@ -129,6 +145,7 @@ class DataLoader:
         self.sources = SourceRegistry()
         self.mindicador = MindicadorClient(self.settings)
         self.warehouse = Warehouse(self.settings)
+        self.snapshots = BundleSnapshotStore(self.settings)
         self.macro_calendar = MacroCalendarClient(self.settings)
         self.backup_calendar = BackupMacroCalendarClient(self.settings)
         self.federal_reserve = FederalReserveClient(self.settings)
@@ -165,8 +182,35 @@ class DataLoader:
         logger.info("AFP flows provider initialized")
 
         self._fed_indicator: Optional[Indicator] = None
+        self._prefetched: Dict[str, Tuple[Any, Optional[BaseException]]] = {}
+        self.timings: Dict[str, float] = {}
+
+    def close(self) -> None:
+        """
+        Close pooled HTTP connections opened by the providers.
+
+        Providers share process-wide keep-alive clients (see http_pool), so
+        long-running services should close the loader when shutting down.
+        The pool reopens connections on the next request if needed.
+
+        Example:
+            >>> with DataLoader() as loader:
+            ...     bundle = loader.load()
+        """
+        close_http_pool()
+
+    def __enter__(self) -> DataLoader:
+        return self
 
-    def load(self) -> DataBundle:
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def load(
+        self,
+        *,
+        concurrent: Optional[bool] = None,
+        max_age: Optional[timedelta] = None,
+    ) -> DataBundle:
         """
         Load complete dataset from all providers.
 
@@ -181,6 +225,21 @@ class DataLoader:
         8. NewsAPI (optional - news sentiment)
         9. World Bank (GDP data)
 
+        In concurrent mode every provider fetch is fanned out to a thread
+        pool first, and the bundle is then assembled sequentially from the
+        prefetched results. Failures are re-raised at the same point as in
+        sequential mode, so fallbacks and source IDs are unchanged.
+
+        If max_age is given and a snapshot younger than that exists (see
+        BundleSnapshotStore), it is returned without any network I/O. Every
+        network load publishes a new snapshot unless disabled in settings.
+
+        Args:
+            concurrent: Fetch providers in parallel. If None, uses
+                settings.data_load_concurrent.
+            max_age: Reuse a snapshot no older than this. If None, always
+                fetch from providers.
+
         Returns:
             DataBundle with all loaded data and source registry.
 
@@ -194,7 +253,21 @@ class DataLoader:
             >>> print(f"USD/CLP series: {len(bundle.usdclp_series)} days")
             >>> print(f"Upcoming events: {len(bundle.macro_events)}")
         """
-        logger.info("Starting data load orchestration")
+        if max_age is not None:
+            cached = self.snapshots.load(max_age)
+            if cached is not None:
+                self.sources = cached.sources
+                return cached
+
+        if concurrent is None:
+            concurrent = self.settings.data_load_concurrent
+        logger.info(f"Starting data load orchestration (concurrent={concurrent})")
+
+        started = time.perf_counter()
+        self.timings = {}
+        self._prefetched = {}
+        if concurrent:
+            self._prefetched = self._prefetch(self._provider_tasks())
 
         # Load Chilean indicators
         usdclp_series = self._usdclp_series()
@@ -219,7 +292,7 @@ class DataLoader:
         }
 
         # Load XE.com spot rate
-        xe_rate, xe_timestamp = self.xe.fetch_rate()
+        xe_rate, xe_timestamp = self._fetch("xe")
         xe_source = self.sources.add(
             category="Datos de mercado",
             name="XE.com Mid-Market USDCLP",
@@ -236,7 +309,7 @@ class DataLoader:
         )
 
         # Load market indices from Yahoo Finance
-        dxy_series = self.yahoo.fetch_series("DX=F", range_window="10y")
+        dxy_series = self._fetch("yahoo_dxy")
         dxy_series = self.warehouse.upsert_series("dxy_index", dxy_series)
         source_id_dxy = self.sources.add(
             category="Datos de mercado",
@@ -246,7 +319,7 @@ class DataLoader:
             note="Índice DXY (futuros ICE)",
         )
 
-        vix_series = self.yahoo.fetch_series("^VIX")
+        vix_series = self._fetch("yahoo_vix")
         vix_series = self.warehouse.upsert_series("vix_index", vix_series)
         self.sources.add(
             category="Datos de mercado",
@@ -256,7 +329,7 @@ class DataLoader:
             note="Índice de volatilidad implícita",
         )
 
-        eem_series = self.yahoo.fetch_series("EEM")
+        eem_series = self._fetch("yahoo_eem")
         eem_series = self.warehouse.upsert_series("eem_etf", eem_series)
         self.sources.add(
             category="Datos de mercado",
@@ -267,15 +340,14 @@ class DataLoader:
         )
 
         # Load Federal Reserve data
-        fed_dot_plot = self.federal_reserve.dot_plot_medians()
+        fed_dot_plot, projection_url, next_fomc = self._fetch("federal_reserve")
         source_id_dot = self.sources.add(
             category="Pronósticos institucionales",
             name="Federal Reserve SEP",
-            url=self.federal_reserve.latest_projection_links()[1],
+            url=projection_url,
             timestamp=datetime.utcnow(),
             note="Medianas dot-plot federal funds",
         )
-        next_fomc = self.federal_reserve.next_meeting()
         self.sources.add(
             category="Contexto macro",
             name="Federal Reserve FOMC calendar",
@@ -347,15 +419,134 @@ class DataLoader:
             lme_inventory=lme_inventory,
         )
 
+        self._prefetched = {}
+        bundle.fetch_timings = dict(self.timings)
+
+        if self.settings.bundle_snapshot_enabled:
+            try:
+                self.snapshots.save(bundle)
+            except Exception as exc:
+                logger.warning(f"Could not save DataBundle snapshot: {exc}")
+
+        slowest = sorted(self.timings.items(), key=lambda item: item[1], reverse=True)[:3]
         logger.info(
-            f"Data load complete: {len(self.sources)} sources, "
-            f"{len(macro_events)} events, {len(news)} news"
+            f"Data load complete in {time.perf_counter() - started:.1f}s: "
+            f"{len(self.sources)} sources, {len(macro_events)} events, {len(news)} news "
+            f"(slowest: {', '.join(f'{key}={secs:.1f}s' for key, secs in slowest)})"
         )
         return bundle
 
+    def _provider_tasks(self) -> Dict[str, Callable[[], Any]]:
+        """
+        Network-bound provider calls made by load(), keyed by fetch name.
+
+        Each task only talks to its provider; source registration and
+        warehouse writes stay in the sequential assembly step.
+        """
+        tasks: Dict[str, Callable[[], Any]] = {
+            "mindicador_latest": self.mindicador.get_latest,
+            "mindicador_dolar_6y": lambda: self._indicator_payloads("dolar", 6, "usdclp_daily"),
+            "mindicador_tpm_5y": lambda: self._indicator_payloads("tpm", 5, "tpm_chile"),
+            "mindicador_ipc_5y": lambda: self._indicator_payloads("ipc", 5, "ipc_chile"),
+            "xe": self.xe.fetch_rate,
+            "yahoo_dxy": lambda: self._yahoo_series("DX=F", "dxy_index", "10y"),
+            "yahoo_vix": lambda: self._yahoo_series("^VIX", "vix_index", "5y"),
+            "yahoo_eem": lambda: self._yahoo_series("EEM", "eem_etf", "5y"),
+            "federal_reserve": self._federal_reserve_payload,
+            "macro_calendar": lambda: self.macro_calendar.upcoming_events(
+                countries=MACRO_COUNTRIES, days=7, source_id=0
+            ),
+            "news": lambda: self.news_aggregator.fetch_latest(hours=48),
+            "worldbank": self._worldbank_payload,
+            "copper_series": lambda: self.copper_client.fetch_series(years=5),
+            "copper_latest": lambda: self.copper_client.get_latest_indicator(source_id=0),
+            "lme_inventory": self.copper_client.get_lme_inventory,
+            "afp_flows": self.afp_provider.get_net_international_flows,
+        }
+
+        start_date, end_date = self._chilean_window()
+        tasks["bcentral_trade_balance"] = lambda: self.bcentral.get_trade_balance(
+            start_date, end_date
+        )
+        tasks["bcentral_imacec_yoy"] = lambda: self.bcentral.get_imacec_yoy(
+            start_date, end_date
+        )
+        tasks["bcentral_current_account"] = lambda: self.bcentral.get_current_account(
+            start_date, end_date
+        )
+
+        if self.alpha_client:
+            tasks["alpha_intraday"] = self.alpha_client.fetch_intraday
+        if self.fred:
+            tasks["fred_fed_target"] = self._fed_target_frame
+        if self.china_pmi:
+            tasks["china_pmi"] = self.china_pmi.get_manufacturing_pmi
+        return tasks
+
+    def _prefetch(
+        self, tasks: Dict[str, Callable[[], Any]]
+    ) -> Dict[str, Tuple[Any, Optional[BaseException]]]:
+        """
+        Run provider tasks on a thread pool.
+
+        Exceptions are captured rather than raised so that the sequential
+        assembly step can apply the usual per-provider fallbacks.
+
+        Args:
+            tasks: Mapping of fetch name to zero-argument callable.
+
+        Returns:
+            Mapping of fetch name to (result, exception) pairs.
+        """
+        results: Dict[str, Tuple[Any, Optional[BaseException]]] = {}
+        workers = max(1, min(self.settings.data_load_max_workers, len(tasks)))
+        logger.info(f"Prefetching {len(tasks)} provider calls with {workers} workers")
+
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="loader") as pool:
+            futures = {
+                pool.submit(self._run_timed, key, func): key for key, func in tasks.items()
+            }
+            for future in as_completed(futures):
+                key = futures[future]
+                try:
+                    results[key] = (future.result(), None)
+                except Exception as exc:
+                    logger.debug(f"Prefetch {key} failed: {exc}")
+                    results[key] = (None, exc)
+        return results
+
+    def _run_timed(self, key: str, func: Callable[[], Any]) -> Any:
+        """Call a provider task and record its wall-clock time."""
+        started = time.perf_counter()
+        try:
+            return func()
+        finally:
+            self.timings[key] = time.perf_counter() - started
+
+    def _fetch(self, key: str, func: Optional[Callable[[], Any]] = None) -> Any:
+        """
+        Return a prefetched provider result, or fetch it now.
+
+        Args:
+            key: Fetch name from _provider_tasks().
+            func: Callable to use when the result was not prefetched.
+                Defaults to the matching entry in _provider_tasks().
+
+        Raises:
+            Exception: Whatever the provider raised, prefetched or not.
+        """
+        if key in self._prefetched:
+            result, error = self._prefetched[key]
+            if error is not None:
+                raise error
+            return result
+        if func is None:
+            func = self._provider_tasks()[key]
+        return self._run_timed(key, func)
+
     def _indicator_from_mindicador(self, code: str, label: str) -> Indicator:
         """Extract latest indicator from MindicadorCL."""
-        payload = self.mindicador.get_latest()
+        payload = self._fetch("mindicador_latest")
         indicator = payload.get(code)
         timestamp = datetime.fromisoformat(indicator["fecha"].replace("Z", "+00:00"))
         source_id = self.sources.add(
@@ -375,7 +566,7 @@ class DataLoader:
 
     def _usdclp_spot(self) -> Indicator:
         """Get current USD/CLP spot rate from MindicadorCL."""
-        payload = self.mindicador.get_latest()
+        payload = self._fetch("mindicador_latest")
         indicator = payload["dolar"]
         timestamp = datetime.fromisoformat(indicator["fecha"].replace("Z", "+00:00"))
         source_id = self.sources.add(
@@ -397,10 +588,13 @@ class DataLoader:
         self, code: str, *, alias: Optional[str] = None, years: int = 5
     ) -> pd.Series:
         """Load historical series for a MindicadorCL indicator."""
-        current_year = datetime.utcnow().year
+        name = alias or code
+        payloads = self._fetch(
+            f"mindicador_{code}_{years}y",
+            lambda: self._indicator_payloads(code, years, name),
+        )
         collected = []
-        for year in range(current_year - (years - 1), current_year + 1):
-            payload = self.mindicador.get_indicator(code, year)
+        for payload in payloads:
             entries = payload.get("serie", [])
             data = {
                 datetime.fromisoformat(item["fecha"].replace("Z", "+00:00")): item[
@@ -412,10 +606,99 @@ class DataLoader:
 
         full = pd.concat(collected).sort_index()
         full = full[~full.index.duplicated(keep="last")]
-        name = alias or code
         stored = self.warehouse.upsert_series(name, full)
         return stored
 
+    def _indicator_payloads(
+        self, code: str, years: int, store_name: Optional[str] = None
+    ) -> List[Dict]:
+        """
+        Fetch yearly MindicadorCL payloads for an indicator, oldest first.
+
+        If store_name is given and the warehouse already covers the window,
+        only the years from the high-water mark onwards are requested.
+        """
+        current_year = datetime.utcnow().year
+        first_year = current_year - (years - 1)
+        if store_name:
+            start = self._delta_start(store_name, datetime(first_year, 1, 1))
+            if start is not None:
+                first_year = max(first_year, start.year)
+        return [
+            self.mindicador.get_indicator(code, year)
+            for year in range(first_year, current_year + 1)
+        ]
+
+    def _yahoo_series(self, symbol: str, store_name: str, range_window: str) -> pd.Series:
+        """
+        Fetch a Yahoo Finance series, downloading only bars the warehouse lacks.
+
+        Falls back to the full range_window when the store is empty or
+        does not reach back to the start of the window.
+        """
+        start = self._delta_start(store_name, YahooClient.window_start(range_window))
+        if start is None:
+            return self.yahoo.fetch_series(symbol, range_window=range_window)
+        return self.yahoo.fetch_series(symbol, start=start)
+
+    def _delta_start(self, store_name: str, window_start: datetime) -> Optional[datetime]:
+        """
+        Start date for an incremental fetch of a warehouse series.
+
+        Coverage is checked over the whole window: at its start, and for
+        holes inside the stored history (a gap longer than
+        DELTA_FETCH_GAP_FACTOR typical spacings and
+        DELTA_FETCH_COVERAGE_SLACK_DAYS). A hole is re-fetched from its
+        start. Delta fetches rely on upsert_series returning the merged
+        stored history, so the fetched slice is never served on its own.
+
+        Args:
+            store_name: Warehouse series name.
+            window_start: First date the caller needs covered.
+
+        Returns:
+            High-water mark (or start of the first hole) minus
+            DELTA_FETCH_OVERLAP_DAYS, or None when a full backfill is
+            required (delta fetch disabled, empty store, or stored history
+            starting after window_start).
+        """
+        if not self.settings.delta_fetch_enabled:
+            return None
+
+        index = self.warehouse.stored_index(store_name)
+        if index is None:
+            logger.info(f"Delta fetch: {store_name} empty, full backfill")
+            return None
+
+        first, last = index[0], index[-1]
+        if first > pd.Timestamp(window_start) + timedelta(days=DELTA_FETCH_COVERAGE_SLACK_DAYS):
+            logger.info(
+                f"Delta fetch: {store_name} starts {first:%Y-%m-%d}, after window start "
+                f"{window_start:%Y-%m-%d}; full backfill"
+            )
+            return None
+
+        resume_from = last
+        in_window = index[index >= pd.Timestamp(window_start)]
+        if len(in_window) > 2:
+            spacing = in_window.to_series().diff().dropna()
+            max_gap = max(
+                timedelta(days=DELTA_FETCH_COVERAGE_SLACK_DAYS),
+                spacing.median() * DELTA_FETCH_GAP_FACTOR,
+            )
+            holes = spacing[spacing > max_gap]
+            if len(holes):
+                hole_end = holes.index[0]
+                resume_from = in_window[in_window.get_loc(hole_end) - 1]
+                logger.info(
+                    f"Delta fetch: {store_name} has a hole from {resume_from:%Y-%m-%d} "
+                    f"to {hole_end:%Y-%m-%d}; re-fetching from there"
+                )
+
+        start = resume_from.to_pydatetime() - timedelta(days=DELTA_FETCH_OVERLAP_DAYS)
+        logger.debug(f"Delta fetch: {store_name} from {start:%Y-%m-%d}")
+        return start
+
     def _usdclp_series(self) -> pd.Series:
         """Load 6 years of USD/CLP daily data."""
         return self._indicator_series("dolar", alias="usdclp_daily", years=6)
@@ -425,7 +708,7 @@ class DataLoader:
         if not self.alpha_client:
             return None
         try:
-            series = self.alpha_client.fetch_intraday()
+            series = self._fetch("alpha_intraday")
             stored = self.warehouse.upsert_series("usdclp_intraday_60min", series)
             return stored
         except Exception as exc:
@@ -441,11 +724,10 @@ class DataLoader:
             timestamp=datetime.utcnow(),
             note="Eventos macro próximos 7 días",
         )
-        events = self.macro_calendar.upcoming_events(
-            countries=("USD", "CAD", "CNY", "EUR"),
-            days=7,
-            source_id=source_id,
-        )
+        events = [
+            event.model_copy(update={"source_id": source_id})
+            for event in self._fetch("macro_calendar")
+        ]
 
         # Fallback to backup source if primary fails
         if not events:
@@ -458,7 +740,7 @@ class DataLoader:
                 note="Fuente secundaria calendario macro",
             )
             events = self.backup_calendar.upcoming_events(
-                countries=("USD", "CAD", "CNY", "EUR"),
+                countries=MACRO_COUNTRIES,
                 days=7,
                 source_id=backup_id,
             )
@@ -477,7 +759,7 @@ class DataLoader:
         This method is resilient and will never cause forecast failures.
         """
         try:
-            articles = self.news_aggregator.fetch_latest(hours=48)
+            articles = self._fetch("news")
             enriched: List[NewsHeadline] = []
             for article in articles:
                 source_id = self.sources.add(
@@ -508,9 +790,7 @@ class DataLoader:
         if not self.fred:
             return None
 
-        df = self.fred.get_series(
-            "DFEDTARU", observation_start=datetime.utcnow().date() - timedelta(days=60)
-        )
+        df = self._fetch("fred_fed_target")
         latest = float(df.iloc[-1, 0])
         source_id = self.sources.add(
             category="Datos de mercado",
@@ -529,6 +809,30 @@ class DataLoader:
         self._fed_indicator = indicator
         return indicator
 
+    def _fed_target_frame(self) -> pd.DataFrame:
+        """Fetch the last 60 days of the Fed Funds upper target from FRED."""
+        return self.fred.get_series(
+            "DFEDTARU", observation_start=datetime.utcnow().date() - timedelta(days=60)
+        )
+
+    def _federal_reserve_payload(self) -> Tuple[Dict[str, float], str, Optional[datetime]]:
+        """
+        Fetch dot plot, projection URL and next FOMC date.
+
+        Grouped into one task because the client caches the FOMC calendar
+        page and is not meant to be shared across threads.
+        """
+        dot_plot = self.federal_reserve.dot_plot_medians()
+        projection_url = self.federal_reserve.latest_projection_links()[1]
+        next_meeting = self.federal_reserve.next_meeting()
+        return dot_plot, projection_url, next_meeting
+
+    @staticmethod
+    def _chilean_window() -> Tuple[datetime, datetime]:
+        """Date range (2 years back to today) for Banco Central series."""
+        end_date = datetime.now()
+        return end_date - timedelta(days=365 * 2), end_date
+
     def load_chilean_indicators(self) -> Dict[str, pd.Series]:
         """
         Load all Chilean economic indicators.
@@ -541,14 +845,11 @@ class DataLoader:
         Returns:
             Dictionary with Chilean indicator series
         """
-        end_date = datetime.now()
-        start_date = end_date - timedelta(days=365 * 2)  # 2 years of data
-
         indicators = {}
 
         try:
             # Trade balance (monthly)
-            trade_balance = self.bcentral.get_trade_balance(start_date, end_date)
+            trade_balance = self._fetch("bcentral_trade_balance")
             if not trade_balance.empty:
                 stored = self.warehouse.upsert_series("chile_trade_balance", trade_balance)
                 indicators["trade_balance"] = stored
@@ -562,7 +863,7 @@ class DataLoader:
                 logger.info(f"Trade Balance: {len(trade_balance)} observations")
 
             # IMACEC YoY growth (monthly)
-            imacec = self.bcentral.get_imacec_yoy(start_date, end_date)
+            imacec = self._fetch("bcentral_imacec_yoy")
             if not imacec.empty:
                 stored = self.warehouse.upsert_series("chile_imacec_yoy", imacec)
                 indicators["imacec_yoy"] = stored
@@ -576,7 +877,7 @@ class DataLoader:
                 logger.info(f"IMACEC YoY: {len(imacec)} observations")
 
             # Current Account (quarterly)
-            current_account = self.bcentral.get_current_account(start_date, end_date)
+            current_account = self._fetch("bcentral_current_account")
             if not current_account.empty:
                 stored = self.warehouse.upsert_series("chile_current_account", current_account)
                 indicators["current_account"] = stored
@@ -608,7 +909,7 @@ class DataLoader:
 
         try:
             # Get manufacturing PMI
-            pmi = self.china_pmi.get_manufacturing_pmi()
+            pmi = self._fetch("china_pmi")
             if not pmi.empty:
                 stored = self.warehouse.upsert_series("china_pmi", pmi)
                 source_id = self.sources.add(
@@ -634,7 +935,7 @@ class DataLoader:
             AFP flows series or None if unavailable
         """
         try:
-            flows = self.afp_provider.get_net_international_flows()
+            flows = self._fetch("afp_flows")
             if not flows.empty:
                 stored = self.warehouse.upsert_series("afp_flows", flows)
                 source_id = self.sources.add(
@@ -660,7 +961,7 @@ class DataLoader:
             LME inventory series or None if unavailable
         """
         try:
-            inventory = self.copper_client.get_lme_inventory()
+            inventory = self._fetch("lme_inventory")
             if not inventory.empty:
                 stored = self.warehouse.upsert_series("lme_copper_inventory", inventory)
                 source_id = self.sources.add(
@@ -680,18 +981,10 @@ class DataLoader:
 
     def _worldbank_gdp(self) -> Optional[Indicator]:
         """Fetch latest Chilean GDP growth from World Bank API."""
-        url = "https://api.worldbank.org/v2/country/CHL/indicator/NY.GDP.MKTP.KD.ZG"
-        params = {"format": "json", "per_page": 5}
+        url = WORLDBANK_GDP_URL
 
         try:
-            response = httpx.get(
-                url,
-                params=params,
-                timeout=20,
-                proxy=self.settings.proxy,
-            )
-            response.raise_for_status()
-            data = response.json()
+            data = self._fetch("worldbank")
 
             if not isinstance(data, list) or len(data) < 2:
                 return None
@@ -720,6 +1013,16 @@ class DataLoader:
 
         return None
 
+    def _worldbank_payload(self) -> Any:
+        """Fetch raw World Bank GDP growth JSON for Chile."""
+        response = shared_client(WORLDBANK_GDP_URL, proxy=self.settings.proxy).get(
+            WORLDBANK_GDP_URL,
+            params={"format": "json", "per_page": 5},
+            timeout=20,
+        )
+        response.raise_for_status()
+        return response.json()
+
     def _load_copper_data(
         self,
     ) -> tuple[pd.Series, Indicator, Optional[Dict[str, pd.Series]]]:
@@ -745,7 +1048,7 @@ class DataLoader:
         try:
             # Fetch 5 years of copper price data
             logger.info("Loading copper prices with enhanced features")
-            copper_series_raw = self.copper_client.fetch_series(years=5)
+            copper_series_raw = self._fetch("copper_series")
 
             # Store in warehouse for caching
             copper_series = self.warehouse.upsert_series("copper_hgf_usd_lb", copper_series_raw)
@@ -760,7 +1063,9 @@ class DataLoader:
             )
 
             # Get latest copper indicator
-            copper_indicator = self.copper_client.get_latest_indicator(source_id=source_id)
+            copper_indicator = self._fetch("copper_latest").model_copy(
+                update={"source_id": source_id}
+            )
 
             # Compute derived features
             try:
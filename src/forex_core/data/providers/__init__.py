@@ -7,6 +7,7 @@ proper error handling.
 
 Available Providers:
     - BaseHTTPClient: Base class with retry logic and error handling
+    - HTTPClientPool: Process-wide keep-alive clients shared by all providers
     - MindicadorClient: Chilean Central Bank indicators
     - FredClient: Federal Reserve Economic Data
     - XeClient: XE.com forex rates
@@ -36,6 +37,7 @@ from .base import BaseHTTPClient
 from .copper_prices import CopperPricesClient
 from .federal_reserve import FederalReserveClient
 from .fred import FredClient
+from .http_pool import HTTPClientPool, close_http_pool, get_http_pool, shared_client
 from .macro_calendar import MacroCalendarClient
 from .macro_calendar_backup import BackupMacroCalendarClient
 from .mindicador import MindicadorClient
@@ -46,6 +48,10 @@ from .yahoo import YahooClient
 
 __all__ = [
     "BaseHTTPClient",
+    "HTTPClientPool",
+    "get_http_pool",
+    "shared_client",
+    "close_http_pool",
     "MindicadorClient",
     "FredClient",
     "XeClient",
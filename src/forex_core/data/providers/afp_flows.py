@@ -13,6 +13,8 @@ import httpx
 import pandas as pd
 from loguru import logger
 
+from .http_pool import shared_client
+
 
 class AFPFlowProvider:
     """
@@ -51,9 +53,13 @@ class AFPFlowProvider:
 
     def __init__(self):
         """Initialize AFP flow provider."""
-        self.client = httpx.Client(timeout=30.0)
         logger.info("AFPFlowProvider initialized")
 
+    @property
+    def client(self) -> httpx.Client:
+        """Pooled HTTP client (see http_pool); connections are shared process-wide."""
+        return shared_client(self.SP_BASE_URL)
+
     def get_net_international_flows(self, start_date: Optional[datetime] = None) -> pd.Series:
         """
         Fetch AFP net international investment flows.
@@ -340,9 +346,4 @@ class AFPFlowProvider:
         logger.info(f"Estimated USD/CLP impact from ${flow_millions_usd:.0f}M flow: "
                    f"{estimated_impact:+.1f} CLP")
 
-        return estimated_impact
-
-    def __del__(self):
-        """Clean up HTTP client on deletion."""
-        if hasattr(self, 'client'):
-            self.client.close()
\ No newline at end of file
+        return estimated_impact
\ No newline at end of file
@@ -12,12 +12,13 @@ from __future__ import annotations
 from datetime import datetime
 from typing import Optional
 
-import httpx
 import pandas as pd
 from loguru import logger
 
 from forex_core.config import Settings
 
+from .http_pool import shared_client
+
 
 class AlphaVantageClient:
     """
@@ -114,7 +115,7 @@ class AlphaVantageClient:
         logger.debug(
             f"Fetching Alpha Vantage intraday: {from_symbol}/{to_symbol} @ {interval}"
         )
-        response = httpx.get(self.BASE_URL, params=params, timeout=30)
+        response = shared_client(self.BASE_URL).get(self.BASE_URL, params=params, timeout=30)
         response.raise_for_status()
         data = response.json()
 
@@ -184,7 +185,7 @@ class AlphaVantageClient:
         }
 
         logger.debug(f"Fetching Alpha Vantage daily: {from_symbol}/{to_symbol}")
-        response = httpx.get(self.BASE_URL, params=params, timeout=30)
+        response = shared_client(self.BASE_URL).get(self.BASE_URL, params=params, timeout=30)
         response.raise_for_status()
         data = response.json()
 
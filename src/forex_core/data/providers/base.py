@@ -3,7 +3,8 @@ Base HTTP client with retry logic and error handling.
 
 This module provides the foundational HTTP client class used by all data providers.
 It includes automatic retry with exponential backoff, timeout handling, and
-proxy support.
+proxy support. Connections come from the process-wide pool in http_pool, so
+clients for the same origin share keep-alive connections.
 """
 
 from __future__ import annotations
@@ -15,6 +16,14 @@ import httpx
 from loguru import logger
 from tenacity import RetryError, retry, stop_after_attempt, wait_exponential
 
+from .http_pool import shared_client
+
+DEFAULT_HEADERS = {
+    "User-Agent": "forex-forecast-system/1.0 (+github.com/yourusername/forex-forecast-system)",
+    "Accept": "application/json, text/html;q=0.8",
+    "Accept-Language": "es-CL,es;q=0.9,en;q=0.8",
+}
+
 
 class BaseHTTPClient:
     """
@@ -25,13 +34,15 @@ class BaseHTTPClient:
 
     Attributes:
         base_url: Base URL for API endpoints.
-        _client: Internal httpx.Client instance.
+        timeout: Per-request timeout in seconds.
+        headers: Headers sent with every request.
+        proxy: Optional proxy URL.
 
     Example:
         >>> client = BaseHTTPClient(
         ...     "https://api.example.com",
         ...     timeout=30.0,
-        ...     proxy={"http://": "http://proxy:8080"}
+        ...     proxy="http://proxy:8080"
         ... )
         >>> data = client.fetch_json("/endpoint", params={"key": "value"})
         >>> client.close()
@@ -42,7 +53,7 @@ class BaseHTTPClient:
         base_url: str,
         *,
         timeout: float = 15.0,
-        proxy: Optional[Dict[str, str]] = None,
+        proxy: Optional[str] = None,
         headers: Optional[Dict[str, str]] = None,
     ) -> None:
         """
@@ -51,7 +62,7 @@ class BaseHTTPClient:
         Args:
             base_url: Base URL for all requests (trailing slash removed).
             timeout: Request timeout in seconds. Default: 15.0.
-            proxy: Optional proxy configuration dict.
+            proxy: Optional proxy URL.
             headers: Optional custom headers. If None, uses defaults.
 
         Example:
@@ -62,23 +73,30 @@ class BaseHTTPClient:
             ... )
         """
         self.base_url = str(base_url).rstrip("/")
-        self._client = httpx.Client(
-            base_url=self.base_url,
-            timeout=timeout,
-            headers=headers
-            or {
-                "User-Agent": "forex-forecast-system/1.0 (+github.com/yourusername/forex-forecast-system)",
-                "Accept": "application/json, text/html;q=0.8",
-                "Accept-Language": "es-CL,es;q=0.9,en;q=0.8",
-            },
-            proxy=proxy,
-        )
+        self.timeout = timeout
+        self.headers = headers or dict(DEFAULT_HEADERS)
+        self.proxy = proxy
+
+    @property
+    def _client(self) -> httpx.Client:
+        """Pooled httpx.Client for this client's origin."""
+        return shared_client(self.base_url, proxy=self.proxy)
+
+    def _url(self, url: str) -> str:
+        """Resolve a path against base_url; absolute URLs pass through."""
+        if url.startswith(("http://", "https://")):
+            return url
+        if not url:
+            return self.base_url
+        return f"{self.base_url}/{url.lstrip('/')}"
 
     def close(self) -> None:
         """
-        Close the HTTP client and release resources.
+        Release this client.
 
-        Should be called when done with the client, or use context manager.
+        Connections belong to the shared pool and stay open for other
+        providers; call forex_core.data.providers.http_pool.close_http_pool()
+        (or DataLoader.close()) to close them.
 
         Example:
             >>> client = BaseHTTPClient("https://api.example.com")
@@ -87,7 +105,6 @@ class BaseHTTPClient:
             ... finally:
             ...     client.close()
         """
-        self._client.close()
 
     @retry(
         wait=wait_exponential(multiplier=1, min=1, max=10),
@@ -104,6 +121,7 @@ class BaseHTTPClient:
         Args:
             url: URL path (relative to base_url) or absolute URL.
             **kwargs: Additional arguments passed to httpx.Client.get().
+                Headers are merged over the client's default headers.
 
         Returns:
             httpx.Response object with successful response.
@@ -118,7 +136,9 @@ class BaseHTTPClient:
             >>> print(response.status_code)
             200
         """
-        response = self._client.get(url, **kwargs)
+        headers = {**self.headers, **(kwargs.pop("headers", None) or {})}
+        kwargs.setdefault("timeout", self.timeout)
+        response = self._client.get(self._url(url), headers=headers, **kwargs)
         response.raise_for_status()
         return response
 
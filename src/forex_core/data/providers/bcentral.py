@@ -13,6 +13,8 @@ import httpx
 import pandas as pd
 from loguru import logger
 
+from .http_pool import shared_client
+
 
 class BancoCentralProvider:
     """
@@ -51,9 +53,13 @@ class BancoCentralProvider:
         """
         self.username = username or ""
         self.password = password or ""
-        self.client = httpx.Client(timeout=30.0)
         logger.info("BancoCentralProvider initialized")
 
+    @property
+    def client(self) -> httpx.Client:
+        """Pooled HTTP client (see http_pool); connections are shared process-wide."""
+        return shared_client(self.BASE_URL)
+
     def get_trade_balance(self, start_date: datetime, end_date: datetime) -> pd.Series:
         """
         Fetch Chilean trade balance (monthly).
@@ -286,9 +292,4 @@ class BancoCentralProvider:
                 logger.warning(f"Failed to load {desc}: {e}")
 
         logger.info(f"Loaded {len(indicators)} Chilean indicators from BCCh")
-        return indicators
-
-    def __del__(self):
-        """Clean up HTTP client on deletion."""
-        if hasattr(self, 'client'):
-            self.client.close()
\ No newline at end of file
+        return indicators
\ No newline at end of file
@@ -12,6 +12,8 @@ import httpx
 import pandas as pd
 from loguru import logger
 
+from .http_pool import shared_client
+
 
 class ChinaPMIProvider:
     """
@@ -48,11 +50,15 @@ class ChinaPMIProvider:
             fred_api_key: FRED API key for accessing data
         """
         self.fred_api_key = fred_api_key
-        self.client = httpx.Client(timeout=30.0)
 
         if not fred_api_key:
             logger.warning("No FRED API key provided. Some data may be unavailable.")
 
+    @property
+    def client(self) -> httpx.Client:
+        """Pooled HTTP client (see http_pool); connections are shared process-wide."""
+        return shared_client(self.FRED_BASE_URL)
+
     def get_manufacturing_pmi(self, start_date: Optional[datetime] = None) -> pd.Series:
         """
         Fetch China Manufacturing PMI from FRED.
@@ -321,9 +327,4 @@ class ChinaPMIProvider:
         k = 0.2
         probability = 1 / (1 + np.exp(-k * (latest_pmi - 50)))
 
-        return probability
-
-    def __del__(self):
-        """Clean up HTTP client on deletion."""
-        if hasattr(self, 'client'):
-            self.client.close()
\ No newline at end of file
+        return probability
\ No newline at end of file
@@ -30,7 +30,6 @@ from __future__ import annotations
 from datetime import datetime, timedelta
 from typing import Optional, Dict, Any
 
-import httpx
 import numpy as np
 import pandas as pd
 from loguru import logger
@@ -80,7 +79,6 @@ class CopperPricesClient:
         """
         self.settings = settings
         self.yahoo_client = YahooClient(settings)
-        self.http_client = httpx.Client(timeout=30.0)
 
         # Optional FRED backup
         self.fred_client: Optional[FredClient] = None
@@ -0,0 +1,222 @@
+"""
+Process-wide pooled HTTP transports shared by all data providers.
+
+Each provider used to open its own ``httpx.Client`` (or call ``httpx.get``
+for every request), paying a fresh TCP/TLS handshake per symbol. This
+module keeps one keep-alive client per origin (scheme + host + port) and
+proxy, so repeated Yahoo/FRED/Mindicador calls reuse open connections.
+
+HTTP/2 is negotiated when the optional ``h2`` package is installed
+(``pip install httpx[http2]``); otherwise clients fall back to HTTP/1.1.
+
+Example:
+    >>> from forex_core.data.providers.http_pool import shared_client
+    >>> client = shared_client("https://query1.finance.yahoo.com")
+    >>> response = client.get("https://query1.finance.yahoo.com/v8/finance/chart/^VIX")
+"""
+
+from __future__ import annotations
+
+import importlib.util
+import threading
+from typing import Dict, Optional, Tuple
+
+import httpx
+from loguru import logger
+
+# Connection limits per origin
+MAX_CONNECTIONS = 10
+MAX_KEEPALIVE_CONNECTIONS = 5
+KEEPALIVE_EXPIRY_SECONDS = 30.0
+DEFAULT_TIMEOUT_SECONDS = 30.0
+
+HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+_PoolKey = Tuple[str, Optional[str]]
+
+
+def _origin(url: str) -> str:
+    """Return scheme://host[:port] for a URL."""
+    parsed = httpx.URL(str(url))
+    port = f":{parsed.port}" if parsed.port else ""
+    return f"{parsed.scheme}://{parsed.host}{port}"
+
+
+class HTTPClientPool:
+    """
+    Thread-safe registry of keep-alive HTTP clients keyed by origin and proxy.
+
+    Clients are created lazily on first use and live until close() is
+    called. Per-request headers and timeouts should be passed to the
+    request methods, since a client is shared by every caller of the origin.
+
+    Attributes:
+        limits: Connection pool limits applied to every client.
+        http2: Whether clients negotiate HTTP/2.
+
+    Example:
+        >>> pool = HTTPClientPool()
+        >>> client = pool.client("https://api.stlouisfed.org/fred")
+        >>> client is pool.client("https://api.stlouisfed.org/other")
+        True
+        >>> pool.close()
+    """
+
+    def __init__(
+        self,
+        *,
+        max_connections: int = MAX_CONNECTIONS,
+        max_keepalive_connections: int = MAX_KEEPALIVE_CONNECTIONS,
+        keepalive_expiry: float = KEEPALIVE_EXPIRY_SECONDS,
+        http2: Optional[bool] = None,
+    ) -> None:
+        """
+        Initialize an empty pool.
+
+        Args:
+            max_connections: Maximum open connections per origin. Default: 10.
+            max_keepalive_connections: Maximum idle connections kept per origin. Default: 5.
+            keepalive_expiry: Seconds before an idle connection is dropped. Default: 30.
+            http2: Force HTTP/2 on or off. None enables it when h2 is installed.
+        """
+        self.limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry,
+        )
+        self.http2 = HTTP2_AVAILABLE if http2 is None else http2
+        self._clients: Dict[_PoolKey, httpx.Client] = {}
+        self._async_clients: Dict[_PoolKey, httpx.AsyncClient] = {}
+        self._lock = threading.Lock()
+
+    def client(self, url: str, *, proxy: Optional[str] = None) -> httpx.Client:
+        """
+        Get the shared synchronous client for a URL's origin.
+
+        Args:
+            url: Any URL on the target origin.
+            proxy: Optional proxy URL.
+
+        Returns:
+            Keep-alive httpx.Client shared by all callers of this origin.
+        """
+        key = (_origin(url), proxy)
+        with self._lock:
+            client = self._clients.get(key)
+            if client is None or client.is_closed:
+                client = httpx.Client(
+                    timeout=DEFAULT_TIMEOUT_SECONDS,
+                    limits=self.limits,
+                    http2=self.http2,
+                    proxy=proxy,
+                )
+                self._clients[key] = client
+                logger.debug(f"Opened pooled HTTP client for {key[0]} (http2={self.http2})")
+            return client
+
+    def async_client(self, url: str, *, proxy: Optional[str] = None) -> httpx.AsyncClient:
+        """
+        Get the shared asynchronous client for a URL's origin.
+
+        Args:
+            url: Any URL on the target origin.
+            proxy: Optional proxy URL.
+
+        Returns:
+            Keep-alive httpx.AsyncClient shared by all callers of this origin.
+        """
+        key = (_origin(url), proxy)
+        with self._lock:
+            client = self._async_clients.get(key)
+            if client is None or client.is_closed:
+                client = httpx.AsyncClient(
+                    timeout=DEFAULT_TIMEOUT_SECONDS,
+                    limits=self.limits,
+                    http2=self.http2,
+                    proxy=proxy,
+                )
+                self._async_clients[key] = client
+            return client
+
+    def close(self) -> None:
+        """
+        Close all synchronous clients and forget asynchronous ones.
+
+        Async clients must be closed with ``await aclose()`` from the event
+        loop that used them, so they are only dropped from the registry here.
+        """
+        with self._lock:
+            clients = list(self._clients.values())
+            self._clients.clear()
+            self._async_clients.clear()
+        for client in clients:
+            client.close()
+        if clients:
+            logger.debug(f"Closed {len(clients)} pooled HTTP clients")
+
+    async def aclose(self) -> None:
+        """Close all asynchronous clients, then the synchronous ones."""
+        with self._lock:
+            async_clients = list(self._async_clients.values())
+            self._async_clients.clear()
+        for client in async_clients:
+            await client.aclose()
+        self.close()
+
+    def __len__(self) -> int:
+        """Number of open synchronous clients."""
+        return len(self._clients)
+
+
+_pool: Optional[HTTPClientPool] = None
+_pool_lock = threading.Lock()
+
+
+def get_http_pool() -> HTTPClientPool:
+    """
+    Get the process-wide HTTP client pool, creating it on first use.
+
+    Returns:
+        Shared HTTPClientPool instance.
+    """
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = HTTPClientPool()
+        return _pool
+
+
+def shared_client(url: str, *, proxy: Optional[str] = None) -> httpx.Client:
+    """
+    Get the pooled synchronous client for a URL's origin.
+
+    Args:
+        url: Any URL on the target origin.
+        proxy: Optional proxy URL.
+
+    Returns:
+        Keep-alive httpx.Client from the process-wide pool.
+
+    Example:
+        >>> response = shared_client(url).get(url, params=params, timeout=20)
+    """
+    return get_http_pool().client(url, proxy=proxy)
+
+
+def close_http_pool() -> None:
+    """
+    Close every pooled client.
+
+    The pool stays usable; the next request reopens a client for its origin.
+    """
+    if _pool is not None:
+        _pool.close()
+
+
+__all__ = [
+    "HTTPClientPool",
+    "get_http_pool",
+    "shared_client",
+    "close_http_pool",
+    "HTTP2_AVAILABLE",
+]
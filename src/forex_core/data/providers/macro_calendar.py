@@ -16,6 +16,8 @@ from loguru import logger
 from forex_core.config import Settings
 from forex_core.data.models import MacroEvent
 
+from .http_pool import shared_client
+
 
 class MacroCalendarClient:
     """
@@ -63,14 +65,13 @@ class MacroCalendarClient:
         """
         try:
             logger.debug(f"Fetching macro calendar from {self.target_url}")
-            response = httpx.get(
+            response = shared_client(self.target_url, proxy=self.settings.proxy).get(
                 self.target_url,
                 headers={
                     "User-Agent": "forex-forecast-system/1.0",
                     "Accept": "application/json",
                 },
                 timeout=15,
-                proxy=self.settings.proxy,
             )
             response.raise_for_status()
             events = response.json()
@@ -16,6 +16,8 @@ from loguru import logger
 from forex_core.config import Settings
 from forex_core.data.models import MacroEvent
 
+from .http_pool import shared_client
+
 
 class BackupMacroCalendarClient:
     """
@@ -76,11 +78,10 @@ class BackupMacroCalendarClient:
         """
         try:
             logger.debug(f"Fetching backup calendar from {self.ALT_URL}")
-            response = httpx.get(
+            response = shared_client(self.ALT_URL, proxy=self.settings.proxy).get(
                 self.ALT_URL,
                 headers={"User-Agent": "forex-forecast-system/1.0"},
                 timeout=15,
-                proxy=self.settings.proxy,
             )
             response.raise_for_status()
         except httpx.HTTPError as exc:
@@ -18,6 +18,8 @@ from loguru import logger
 from forex_core.config import Settings
 from forex_core.data.models import NewsHeadline
 
+from .http_pool import shared_client
+
 
 class NewsDataIOClient:
     """
@@ -103,14 +105,13 @@ class NewsDataIOClient:
         logger.debug(f"Fetching NewsData.io: query='{search_query}', hours={hours}")
 
         try:
-            response = httpx.get(
+            response = shared_client(self.BASE_URL, proxy=self.settings.proxy).get(
                 self.BASE_URL,
                 params=params,
                 headers={
                     "User-Agent": "forex-forecast-system/1.0",
                 },
                 timeout=20,
-                proxy=self.settings.proxy,
             )
             response.raise_for_status()
             data = response.json()
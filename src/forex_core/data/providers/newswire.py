@@ -12,12 +12,13 @@ from __future__ import annotations
 from datetime import datetime, timedelta
 from typing import List, Optional
 
-import httpx
 from loguru import logger
 
 from forex_core.config import Settings
 from forex_core.data.models import NewsHeadline
 
+from .http_pool import shared_client
+
 
 class NewsApiClient:
     """
@@ -98,7 +99,7 @@ class NewsApiClient:
         }
 
         logger.debug(f"Fetching news: query='{params['q']}', hours={hours}")
-        response = httpx.get(
+        response = shared_client(self.BASE_URL, proxy=self.settings.proxy).get(
             self.BASE_URL,
             params=params,
             headers={
@@ -106,7 +107,6 @@ class NewsApiClient:
                 "User-Agent": "forex-forecast-system/1.0",
             },
             timeout=20,
-            proxy=self.settings.proxy,
         )
         response.raise_for_status()
         data = response.json()
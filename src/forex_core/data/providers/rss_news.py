@@ -15,11 +15,12 @@ from typing import List
 # Use defusedxml to prevent XXE (XML External Entity) attacks
 import defusedxml.ElementTree as ET
 
-import httpx
 from loguru import logger
 
 from forex_core.data.models import NewsHeadline
 
+from .http_pool import shared_client
+
 
 class RSSNewsClient:
     """
@@ -111,7 +112,7 @@ class RSSNewsClient:
             List of NewsHeadline objects.
         """
         try:
-            response = httpx.get(
+            response = shared_client(feed_url).get(
                 feed_url,
                 timeout=15,
                 headers={"User-Agent": "forex-forecast-system/1.0"},
@@ -13,14 +13,17 @@ No API key required.
 
 from __future__ import annotations
 
+import re
+from datetime import datetime, timedelta
 from typing import Optional
 
-import httpx
 import pandas as pd
 from loguru import logger
 
 from forex_core.config import Settings
 
+from .http_pool import shared_client
+
 
 class YahooClient:
     """
@@ -48,6 +51,8 @@ class YahooClient:
 
     BASE_URL = "https://query1.finance.yahoo.com/v8/finance/chart/{symbol}"
 
+    _RANGE_UNITS = {"d": 1, "wk": 7, "mo": 31, "y": 366}
+
     def __init__(self, settings: Settings) -> None:
         """
         Initialize Yahoo Finance client.
@@ -61,8 +66,47 @@ class YahooClient:
         """
         self.settings = settings
 
+    @classmethod
+    def window_start(cls, range_window: str, *, now: Optional[datetime] = None) -> datetime:
+        """
+        Approximate first date covered by a Yahoo range string.
+
+        Args:
+            range_window: Range string such as "5d", "6mo" or "10y".
+            now: Reference time. Default: current UTC time.
+
+        Returns:
+            Naive UTC datetime at the start of the window ("max" maps to
+            datetime.min).
+
+        Example:
+            >>> YahooClient.window_start("1y", now=datetime(2025, 11, 12))
+            datetime.datetime(2024, 11, 11, 0, 0)
+        """
+        now = now or datetime.utcnow()
+        if range_window == "ytd":
+            return datetime(now.year, 1, 1)
+        match = re.fullmatch(r"(\d+)(d|wk|mo|y)", range_window)
+        if not match:
+            return datetime.min
+        count, unit = int(match.group(1)), match.group(2)
+        return now - timedelta(days=count * cls._RANGE_UNITS[unit])
+
+    @staticmethod
+    def _epoch(value: datetime) -> int:
+        """Unix seconds for a datetime; naive values are treated as UTC."""
+        ts = pd.Timestamp(value)
+        if ts.tzinfo is None:
+            ts = ts.tz_localize("UTC")
+        return int(ts.timestamp())
+
     def fetch_series(
-        self, symbol: str, *, range_window: str = "5y"
+        self,
+        symbol: str,
+        *,
+        range_window: str = "5y",
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None,
     ) -> pd.Series:
         """
         Fetch historical price series for a symbol.
@@ -78,10 +122,15 @@ class YahooClient:
                 - "1y", "2y", "5y", "10y"
                 - "ytd", "max"
                 Default: "5y"
+            start: Optional start of an explicit window (period1). When set,
+                range_window is ignored, so incremental updates only download
+                bars since the last stored date.
+            end: Optional end of the explicit window (period2). Default: now.
 
         Returns:
             pandas Series with close prices. Index is timezone-aware datetime
             normalized to midnight in configured timezone. NaN values dropped.
+            Empty if the explicit window contains no bars.
 
         Raises:
             httpx.HTTPStatusError: If API request fails.
@@ -99,20 +148,32 @@ class YahooClient:
             VIX average: 18.45
         """
         url = self.BASE_URL.format(symbol=symbol)
-        params = {"range": range_window, "interval": "1d"}
-
-        logger.debug(f"Fetching Yahoo Finance: {symbol} ({range_window})")
-        response = httpx.get(
+        if start is not None:
+            end = end or datetime.utcnow()
+            params = {
+                "period1": self._epoch(start),
+                "period2": self._epoch(end),
+                "interval": "1d",
+            }
+            window = f"{start:%Y-%m-%d}..{end:%Y-%m-%d}"
+        else:
+            params = {"range": range_window, "interval": "1d"}
+            window = range_window
+
+        logger.debug(f"Fetching Yahoo Finance: {symbol} ({window})")
+        response = shared_client(url, proxy=self.settings.proxy).get(
             url,
             params=params,
             headers={"User-Agent": "Mozilla/5.0"},
             timeout=20,
-            proxy=self.settings.proxy,
         )
         response.raise_for_status()
 
         payload = response.json()
         result = payload["chart"]["result"][0]
+        if start is not None and not result.get("timestamp"):
+            logger.info(f"No new data points for {symbol} since {start:%Y-%m-%d}")
+            return pd.Series(dtype=float, name=symbol)
 
         timestamps = pd.to_datetime(result["timestamp"], unit="s")
         closes = result["indicators"]["quote"][0]["close"]
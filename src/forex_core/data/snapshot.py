@@ -0,0 +1,304 @@
+"""
+On-disk DataBundle snapshots shared across processes.
+
+Every forecaster service, retraining script and the prediction tracker
+builds its own DataLoader and hits the same upstream providers. A
+snapshot stores one fully loaded DataBundle so that any process within
+the freshness TTL can reuse it without network I/O.
+
+Layout (one directory per snapshot, never modified after publish):
+
+    <data_dir>/snapshots/
+        latest.json                       # pointer to newest snapshot
+        20251112T103000Z-1a2b3c4d/
+            manifest.json                 # indicators, events, news, sources, metadata
+            series/usdclp_series.parquet  # one Parquet file per series
+            ...
+
+Snapshots are written to a temporary directory and renamed into place,
+then ``latest.json`` is swapped with ``os.replace``, so readers never see
+a partially written snapshot.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import shutil
+import uuid
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Dict, Optional
+
+import pandas as pd
+from loguru import logger
+
+from forex_core.config import Settings
+from forex_core.data.models import Indicator, MacroEvent, NewsHeadline
+from forex_core.data.registry import SourceRegistry
+
+if TYPE_CHECKING:
+    from forex_core.data.loader import DataBundle
+
+SNAPSHOT_FORMAT_VERSION = 1
+
+# DataBundle fields stored as single Parquet series
+_SERIES_FIELDS = (
+    "usdclp_series",
+    "copper_series",
+    "tpm_series",
+    "inflation_series",
+    "dxy_series",
+    "vix_series",
+    "eem_series",
+    "usdclp_intraday",
+    "china_pmi",
+    "afp_flows",
+    "lme_inventory",
+)
+
+# DataBundle fields stored as dicts of Parquet series
+_SERIES_DICT_FIELDS = ("copper_features", "chilean_indicators")
+
+
+class BundleSnapshotStore:
+    """
+    Versioned, atomically published DataBundle snapshots.
+
+    Attributes:
+        settings: Application settings.
+        base_dir: Root directory for snapshots.
+        keep: Number of snapshots retained after each save.
+
+    Example:
+        >>> from datetime import timedelta
+        >>> store = BundleSnapshotStore(get_settings())
+        >>> store.save(bundle)
+        >>> cached = store.load(max_age=timedelta(hours=1))
+        >>> if cached is not None:
+        ...     print(f"USD/CLP: {cached.usdclp_series.iloc[-1]}")
+    """
+
+    POINTER_FILE = "latest.json"
+
+    def __init__(self, settings: Settings, *, keep: int = 3) -> None:
+        """
+        Initialize snapshot store.
+
+        Args:
+            settings: Application settings with data_dir path.
+            keep: Number of snapshots to retain. Default: 3.
+        """
+        self.settings = settings
+        self.base_dir = Path(settings.data_dir) / "snapshots"
+        self.base_dir.mkdir(parents=True, exist_ok=True)
+        self.keep = max(1, keep)
+
+    def save(self, bundle: DataBundle) -> Path:
+        """
+        Write a bundle as a new snapshot and publish it as latest.
+
+        Args:
+            bundle: Fully loaded DataBundle.
+
+        Returns:
+            Path to the published snapshot directory.
+        """
+        created_at = datetime.now(timezone.utc)
+        snapshot_id = f"{created_at:%Y%m%dT%H%M%SZ}-{uuid.uuid4().hex[:8]}"
+        tmp_dir = self.base_dir / f".tmp-{snapshot_id}"
+        series_dir = tmp_dir / "series"
+        series_dir.mkdir(parents=True)
+
+        try:
+            manifest: Dict[str, Any] = {
+                "format_version": SNAPSHOT_FORMAT_VERSION,
+                "snapshot_id": snapshot_id,
+                "created_at": created_at.isoformat(),
+                "series": {},
+                "series_dicts": {},
+            }
+
+            for field in _SERIES_FIELDS:
+                series = getattr(bundle, field)
+                if series is None:
+                    continue
+                manifest["series"][field] = self._write_series(series_dir, field, series)
+
+            for field in _SERIES_DICT_FIELDS:
+                mapping = getattr(bundle, field)
+                if mapping is None:
+                    continue
+                manifest["series_dicts"][field] = {
+                    key: self._write_series(series_dir, f"{field}__{key}", series)
+                    for key, series in mapping.items()
+                }
+
+            manifest.update(
+                indicators={
+                    key: indicator.model_dump(mode="json")
+                    for key, indicator in bundle.indicators.items()
+                },
+                macro_events=[event.model_dump(mode="json") for event in bundle.macro_events],
+                news=[article.model_dump(mode="json") for article in bundle.news],
+                fed_dot_plot=bundle.fed_dot_plot,
+                fed_dot_source_id=bundle.fed_dot_source_id,
+                next_fomc=bundle.next_fomc.isoformat() if bundle.next_fomc else None,
+                rate_differential=bundle.rate_differential,
+                fetch_timings=bundle.fetch_timings,
+                sources=[
+                    {
+                        "category": source.category,
+                        "name": source.name,
+                        "url": str(source.url),
+                        "timestamp": source.timestamp.isoformat(),
+                        "note": source.note,
+                    }
+                    for source in bundle.sources._sources
+                ],
+            )
+
+            with (tmp_dir / "manifest.json").open("w", encoding="utf-8") as f:
+                json.dump(manifest, f, ensure_ascii=False, indent=2)
+
+            final_dir = self.base_dir / snapshot_id
+            tmp_dir.rename(final_dir)
+        except Exception:
+            shutil.rmtree(tmp_dir, ignore_errors=True)
+            raise
+
+        self._publish(snapshot_id, created_at)
+        self._prune()
+        logger.info(f"Saved DataBundle snapshot {snapshot_id}")
+        return final_dir
+
+    def load(self, max_age: timedelta) -> Optional[DataBundle]:
+        """
+        Load the latest snapshot if it is younger than max_age.
+
+        Args:
+            max_age: Maximum acceptable snapshot age.
+
+        Returns:
+            Reconstructed DataBundle, or None if no fresh, readable
+            snapshot exists.
+        """
+        pointer = self._read_pointer()
+        if pointer is None:
+            return None
+
+        if pointer.get("format_version") != SNAPSHOT_FORMAT_VERSION:
+            logger.info("Ignoring snapshot with incompatible format version")
+            return None
+
+        age = datetime.now(timezone.utc) - datetime.fromisoformat(pointer["created_at"])
+        if age > max_age:
+            logger.debug(f"Latest snapshot is stale ({age} > {max_age})")
+            return None
+
+        snapshot_dir = self.base_dir / pointer["snapshot_id"]
+        try:
+            bundle = self._read_bundle(snapshot_dir)
+        except Exception as exc:
+            logger.warning(f"Could not read snapshot {pointer['snapshot_id']}: {exc}")
+            return None
+
+        logger.info(
+            f"Using DataBundle snapshot {pointer['snapshot_id']} "
+            f"(age {age.total_seconds() / 60:.1f} min)"
+        )
+        return bundle
+
+    def _write_series(self, series_dir: Path, key: str, series: pd.Series) -> Dict[str, Any]:
+        """Write one series to Parquet and return its manifest entry."""
+        filename = f"{key}.parquet"
+        series.to_frame(name="value").to_parquet(series_dir / filename)
+        name = series.name if isinstance(series.name, (str, int, float)) else None
+        return {"file": filename, "name": name}
+
+    @staticmethod
+    def _read_series(series_dir: Path, entry: Dict[str, Any]) -> pd.Series:
+        """Read a series written by _write_series."""
+        series = pd.read_parquet(series_dir / entry["file"])["value"]
+        series.name = entry.get("name")
+        return series
+
+    def _read_bundle(self, snapshot_dir: Path) -> DataBundle:
+        """Rebuild a DataBundle from a snapshot directory."""
+        from forex_core.data.loader import DataBundle
+
+        with (snapshot_dir / "manifest.json").open("r", encoding="utf-8") as f:
+            manifest = json.load(f)
+
+        series_dir = snapshot_dir / "series"
+        fields: Dict[str, Any] = {
+            field: self._read_series(series_dir, entry)
+            for field, entry in manifest["series"].items()
+        }
+        for field, entries in manifest["series_dicts"].items():
+            fields[field] = {
+                key: self._read_series(series_dir, entry) for key, entry in entries.items()
+            }
+
+        sources = SourceRegistry()
+        for source in manifest["sources"]:
+            sources.add(
+                category=source["category"],
+                name=source["name"],
+                url=source["url"],
+                timestamp=datetime.fromisoformat(source["timestamp"]),
+                note=source["note"],
+            )
+
+        next_fomc = manifest["next_fomc"]
+        return DataBundle(
+            indicators={
+                key: Indicator.model_validate(payload)
+                for key, payload in manifest["indicators"].items()
+            },
+            macro_events=[MacroEvent.model_validate(item) for item in manifest["macro_events"]],
+            news=[NewsHeadline.model_validate(item) for item in manifest["news"]],
+            fed_dot_plot=manifest["fed_dot_plot"],
+            fed_dot_source_id=manifest["fed_dot_source_id"],
+            next_fomc=datetime.fromisoformat(next_fomc) if next_fomc else None,
+            rate_differential=manifest["rate_differential"],
+            sources=sources,
+            fetch_timings=manifest.get("fetch_timings"),
+            **fields,
+        )
+
+    def _read_pointer(self) -> Optional[Dict[str, Any]]:
+        """Read latest.json, or None if missing or corrupt."""
+        path = self.base_dir / self.POINTER_FILE
+        if not path.exists():
+            return None
+        try:
+            with path.open("r", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, json.JSONDecodeError) as exc:
+            logger.warning(f"Unreadable snapshot pointer {path}: {exc}")
+            return None
+
+    def _publish(self, snapshot_id: str, created_at: datetime) -> None:
+        """Atomically point latest.json at a snapshot."""
+        pointer = {
+            "format_version": SNAPSHOT_FORMAT_VERSION,
+            "snapshot_id": snapshot_id,
+            "created_at": created_at.isoformat(),
+        }
+        tmp_path = self.base_dir / f".{self.POINTER_FILE}.{uuid.uuid4().hex[:8]}"
+        with tmp_path.open("w", encoding="utf-8") as f:
+            json.dump(pointer, f)
+        os.replace(tmp_path, self.base_dir / self.POINTER_FILE)
+
+    def _prune(self) -> None:
+        """Delete all but the newest `keep` snapshots."""
+        snapshots = sorted(
+            p for p in self.base_dir.iterdir() if p.is_dir() and not p.name.startswith(".")
+        )
+        for old in snapshots[: -self.keep]:
+            shutil.rmtree(old, ignore_errors=True)
+            logger.debug(f"Pruned snapshot {old.name}")
+
+
+__all__ = ["BundleSnapshotStore", "SNAPSHOT_FORMAT_VERSION"]
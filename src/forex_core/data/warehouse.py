@@ -6,17 +6,36 @@ Provides persistent storage for time-series data with automatic:
 - Timezone normalization
 - Parquet compression
 - Upsert semantics (merge new data with existing)
+
+Two storage layouts are supported:
+
+- Single file (default): ``<name>.parquet`` rewritten on every upsert.
+- Incremental: ``<name>/`` directory with compacted year partitions
+  (``year=2024.parquet``) plus small append-only delta files holding only
+  new or revised rows. Deltas are merged into the year partitions once
+  ``warehouse_compact_threshold`` of them accumulate, or on ``compact()``.
+
+``load_series`` always returns the merged view of both layouts, so a store
+can be switched to incremental mode without migration. Once a series has
+partitions or deltas, every write goes to the partitioned layout (even
+with incremental mode off), so the two layouts never hold competing
+copies of the same rows.
 """
 
 from __future__ import annotations
 
+import os
+import shutil
+import time
+import uuid
 from pathlib import Path
-from typing import Optional
+from typing import List, Optional, Tuple
 
 import pandas as pd
 from loguru import logger
 
 from forex_core.config import Settings
+from forex_core.utils.file_lock import FileLock
 
 
 class Warehouse:
@@ -25,11 +44,14 @@ class Warehouse:
 
     Stores and retrieves time-series data with automatic deduplication,
     timezone handling, and efficient Parquet compression. Each series
-    is stored in a separate file.
+    is stored in a separate file, or in a separate partitioned directory
+    in incremental mode.
 
     Attributes:
         settings: Application settings.
         base_dir: Root directory for warehouse files.
+        incremental: Write deltas instead of rewriting whole files.
+        compact_threshold: Delta count that triggers automatic compaction.
 
     Example:
         >>> from forex_core.config import get_settings
@@ -44,12 +66,14 @@ class Warehouse:
         >>> print(loaded.tail())
     """
 
-    def __init__(self, settings: Settings) -> None:
+    def __init__(self, settings: Settings, *, incremental: Optional[bool] = None) -> None:
         """
         Initialize warehouse.
 
         Args:
             settings: Application settings with warehouse_dir path.
+            incremental: Use the partitioned append-only layout. If None,
+                uses settings.warehouse_incremental.
 
         Example:
             >>> from forex_core.config import get_settings
@@ -58,7 +82,13 @@ class Warehouse:
         self.settings = settings
         self.base_dir = Path(settings.warehouse_dir)
         self.base_dir.mkdir(parents=True, exist_ok=True)
-        logger.debug(f"Warehouse initialized at {self.base_dir}")
+        self.incremental = (
+            settings.warehouse_incremental if incremental is None else incremental
+        )
+        self.compact_threshold = settings.warehouse_compact_threshold
+        logger.debug(
+            f"Warehouse initialized at {self.base_dir} (incremental={self.incremental})"
+        )
 
     def _path(self, name: str) -> Path:
         """
@@ -78,6 +108,60 @@ class Warehouse:
         safe_name = name.replace("/", "_")
         return self.base_dir / f"{safe_name}.parquet"
 
+    def _partition_dir(self, name: str) -> Path:
+        """Directory holding year partitions and deltas for a series."""
+        return self.base_dir / name.replace("/", "_")
+
+    def _delta_files(self, name: str) -> List[Path]:
+        """Delta files for a series, oldest first."""
+        directory = self._partition_dir(name)
+        if not directory.is_dir():
+            return []
+        return sorted(directory.glob("delta-*.parquet"))
+
+    def _partition_files(self, name: str) -> List[Path]:
+        """Compacted year partitions for a series, oldest first."""
+        directory = self._partition_dir(name)
+        if not directory.is_dir():
+            return []
+        return sorted(directory.glob("year=*.parquet"))
+
+    @staticmethod
+    def _read_value_file(path: Path) -> Optional[pd.Series]:
+        """Read a single-column warehouse file; None if it vanished mid-read."""
+        try:
+            df = pd.read_parquet(path)
+        except FileNotFoundError:
+            # Consumed by a concurrent compaction; its rows are in a partition now
+            return None
+        df.index = pd.to_datetime(df.index)
+        return df.iloc[:, 0]
+
+    def _is_partitioned(self, name: str) -> bool:
+        """Whether a series already has year partitions or deltas."""
+        return bool(self._partition_files(name) or self._delta_files(name))
+
+    def _storage_files(self, name: str) -> List[Path]:
+        """All files holding a series, in merge precedence order."""
+        paths = [self._path(name)] if self._path(name).exists() else []
+        return paths + self._partition_files(name) + self._delta_files(name)
+
+    def _read_merged(self, name: str) -> Optional[pd.Series]:
+        """
+        Merge legacy file, year partitions and deltas into one series.
+
+        Later files take precedence on duplicate timestamps.
+        """
+        paths = self._storage_files(name)
+        if not paths:
+            return None
+
+        parts = [part for part in map(self._read_value_file, paths) if part is not None]
+        if not parts:
+            return None
+        merged = pd.concat(parts) if len(parts) > 1 else parts[0]
+        return merged[~merged.index.duplicated(keep="last")].sort_index()
+
     def upsert_series(self, name: str, series: pd.Series) -> pd.Series:
         """
         Merge new data into warehouse and return combined series.
@@ -121,6 +205,17 @@ class Warehouse:
         if hasattr(series.index, "tz") and series.index.tz is not None:
             series = series.tz_convert("UTC").tz_localize(None)
 
+        if self.incremental:
+            return self._upsert_incremental(name, series)
+
+        if self._is_partitioned(name):
+            # Migrated by compact(): a new single file would hide the history
+            # in the partitions and lose to their older values on read
+            if self._path(name).exists():
+                self.compact(name)
+            logger.debug(f"{name} is partitioned; writing a delta instead of a single file")
+            return self._upsert_incremental(name, series)
+
         path = self._path(name)
 
         # Load existing data if present
@@ -145,6 +240,103 @@ class Warehouse:
 
         return combined
 
+    def _upsert_incremental(self, name: str, series: pd.Series) -> pd.Series:
+        """
+        Append only new or revised rows as a delta file.
+
+        Write cost scales with the number of changed rows rather than the
+        full history, and each writer creates its own uniquely named delta,
+        so concurrent upserts never overwrite each other.
+        """
+        series = series[~series.index.duplicated(keep="last")]
+        existing = self._read_merged(name)
+
+        if existing is None:
+            changed = series
+        else:
+            stored = existing.reindex(series.index)
+            changed = series[stored.isna() | (stored != series)]
+
+        if len(changed):
+            directory = self._partition_dir(name)
+            directory.mkdir(parents=True, exist_ok=True)
+            delta = directory / f"delta-{time.time_ns():020d}-{uuid.uuid4().hex[:8]}.parquet"
+            changed.sort_index().to_frame(name="value").to_parquet(delta)
+
+        if existing is None:
+            combined = changed.sort_index()
+        else:
+            combined = pd.concat([existing, changed])
+            combined = combined[~combined.index.duplicated(keep="last")].sort_index()
+
+        logger.info(
+            f"Warehouse append: {name} ({len(combined)} rows, "
+            f"{len(changed)} new/revised of {len(series)} received)"
+        )
+
+        if len(self._delta_files(name)) >= self.compact_threshold:
+            self.compact(name)
+
+        return combined
+
+    def compact(self, name: Optional[str] = None) -> int:
+        """
+        Merge delta files (and any legacy single file) into year partitions.
+
+        Only years touched by deltas are rewritten. Each partition is
+        replaced atomically, and deltas are removed only after their rows
+        are in a partition, so concurrent readers always see every row.
+
+        Args:
+            name: Series to compact. If None, compacts every series.
+
+        Returns:
+            Number of series compacted.
+
+        Example:
+            >>> warehouse.compact("dxy_index")
+            1
+        """
+        names = [name] if name else self.list_series()
+        compacted = 0
+
+        for series_name in names:
+            directory = self._partition_dir(series_name)
+            legacy = self._path(series_name)
+            with FileLock(directory.with_name(f".{directory.name}.compact.lock")):
+                deltas = self._delta_files(series_name)
+                if not deltas and not legacy.exists():
+                    continue
+
+                sources = ([legacy] if legacy.exists() else []) + deltas
+                parts = [p for p in map(self._read_value_file, sources) if p is not None]
+                if not parts:
+                    continue
+                incoming = pd.concat(parts)
+                incoming = incoming[~incoming.index.duplicated(keep="last")]
+
+                directory.mkdir(parents=True, exist_ok=True)
+                for year, rows in incoming.groupby(incoming.index.year):
+                    target = directory / f"year={year}.parquet"
+                    if target.exists():
+                        current = self._read_value_file(target)
+                        rows = pd.concat([current, rows])
+                        rows = rows[~rows.index.duplicated(keep="last")]
+                    tmp = directory / f".{target.name}.{uuid.uuid4().hex[:8]}"
+                    rows.sort_index().to_frame(name="value").to_parquet(tmp)
+                    os.replace(tmp, target)
+
+                for path in sources:
+                    path.unlink(missing_ok=True)
+
+            compacted += 1
+            logger.info(
+                f"Warehouse compaction: {series_name} "
+                f"({len(deltas)} deltas, {len(incoming)} rows merged)"
+            )
+
+        return compacted
+
     def load_series(self, name: str) -> Optional[pd.Series]:
         """
         Load time series from warehouse.
@@ -163,19 +355,84 @@ class Warehouse:
             >>> else:
             ...     print("Series not found")
         """
-        path = self._path(name)
-        if not path.exists():
+        logger.debug(f"Loading series from warehouse: {name}")
+        series = self._read_merged(name)
+        if series is None:
             logger.warning(f"Series not found in warehouse: {name}")
             return None
-
-        logger.debug(f"Loading series from warehouse: {name}")
-        df = pd.read_parquet(path)
-        df.index = pd.to_datetime(df.index)
-        series = df["value"].sort_index()
+        series.name = "value"
 
         logger.info(f"Loaded {name} from warehouse ({len(series)} rows)")
         return series
 
+    def stored_index(self, name: str) -> Optional[pd.DatetimeIndex]:
+        """
+        Sorted, unique timestamps of a series without loading values.
+
+        Only the Parquet index column is read, so this is cheap even for
+        long histories.
+
+        Args:
+            name: Series identifier.
+
+        Returns:
+            Stored timestamps, or None if the series is empty or missing.
+
+        Example:
+            >>> index = warehouse.stored_index("dxy_index")
+            >>> gaps = index.to_series().diff()
+        """
+        indexes = []
+        for path in self._storage_files(name):
+            try:
+                indexes.append(pd.to_datetime(pd.read_parquet(path, columns=[]).index))
+            except FileNotFoundError:
+                continue
+
+        indexes = [index for index in indexes if len(index)]
+        if not indexes:
+            return None
+        return pd.DatetimeIndex(indexes[0].append(indexes[1:])).unique().sort_values()
+
+    def time_range(self, name: str) -> Optional[Tuple[pd.Timestamp, pd.Timestamp]]:
+        """
+        Get first and last stored timestamps without loading values.
+
+        Only the Parquet index column is read, so this is cheap even for
+        long histories.
+
+        Args:
+            name: Series identifier.
+
+        Returns:
+            (first, last) timestamps, or None if the series is empty or missing.
+
+        Example:
+            >>> span = warehouse.time_range("dxy_index")
+            >>> if span:
+            ...     print(f"Stored {span[0]:%Y-%m-%d} to {span[1]:%Y-%m-%d}")
+        """
+        index = self.stored_index(name)
+        if index is None:
+            return None
+        return index[0], index[-1]
+
+    def last_timestamp(self, name: str) -> Optional[pd.Timestamp]:
+        """
+        Get the high-water mark (latest stored timestamp) of a series.
+
+        Args:
+            name: Series identifier.
+
+        Returns:
+            Latest timestamp, or None if the series is empty or missing.
+
+        Example:
+            >>> last = warehouse.last_timestamp("usdclp_daily")
+        """
+        span = self.time_range(name)
+        return span[1] if span else None
+
     def delete_series(self, name: str) -> bool:
         """
         Delete a series from the warehouse.
@@ -191,8 +448,10 @@ class Warehouse:
             ...     print("Deleted successfully")
         """
         path = self._path(name)
-        if path.exists():
-            path.unlink()
+        directory = self._partition_dir(name)
+        if path.exists() or directory.is_dir():
+            path.unlink(missing_ok=True)
+            shutil.rmtree(directory, ignore_errors=True)
             logger.info(f"Deleted warehouse series: {name}")
             return True
         logger.warning(f"Cannot delete, series not found: {name}")
@@ -203,7 +462,8 @@ class Warehouse:
         List all series stored in warehouse.
 
         Returns:
-            List of series names (without .parquet extension).
+            List of series names (without .parquet extension), covering
+            both single-file and partitioned series.
 
         Example:
             >>> all_series = warehouse.list_series()
@@ -211,9 +471,10 @@ class Warehouse:
             >>> for name in sorted(all_series):
             ...     print(f"  - {name}")
         """
-        series_names = [
-            p.stem for p in self.base_dir.glob("*.parquet")
-        ]
+        series_names = sorted(
+            {p.stem for p in self.base_dir.glob("*.parquet")}
+            | {p.name for p in self.base_dir.iterdir() if p.is_dir()}
+        )
         logger.debug(f"Warehouse contains {len(series_names)} series")
         return series_names
 
@@ -11,8 +11,18 @@ from forex_core.features.feature_engineer import (
     add_macro_features,
     add_technical_indicators,
     engineer_features,
+    select_horizon_features,
+    usdclp_lags,
     validate_features,
 )
+from forex_core.features.feature_store import (
+    FeatureSpec,
+    FeatureStore,
+    cached_features,
+    get_feature_store,
+)
+from forex_core.features.rolling_regression import rolling_ols, rolling_slope
+from forex_core.features.shared_frame import SharedFrame, SharedFrameHandle
 
 __all__ = [
     "engineer_features",
@@ -22,4 +32,14 @@ __all__ = [
     "add_macro_features",
     "add_derived_features",
     "validate_features",
+    "usdclp_lags",
+    "select_horizon_features",
+    "FeatureSpec",
+    "FeatureStore",
+    "cached_features",
+    "get_feature_store",
+    "rolling_ols",
+    "rolling_slope",
+    "SharedFrame",
+    "SharedFrameHandle",
 ]
@@ -34,18 +34,59 @@ Example:
 
 from __future__ import annotations
 
-from typing import Optional
+from typing import Optional, Tuple
 
 import numpy as np
 import pandas as pd
 from loguru import logger
 
+from forex_core.features.feature_store import FeatureSpec, cached_features
+from forex_core.features.rolling_regression import rolling_slope
+
+# Bump when engineer_features output changes to invalidate cached matrices
+FEATURE_VERSION = 2
+
+# USD/CLP lags for every horizon except 30d (see usdclp_lags)
+USDCLP_LAGS = (1, 2, 3, 5, 7, 14, 21, 30)
+
+
+def usdclp_lags(horizon: int) -> Tuple[int, ...]:
+    """
+    USD/CLP lags used for a forecast horizon.
+
+    The 30d horizon drops the 30-day lag to keep a safety margin between
+    the largest feature lag (21 days) and the target shift (30 days).
+    """
+    if horizon == 30:
+        return tuple(lag for lag in USDCLP_LAGS if lag < 30)
+    return USDCLP_LAGS
+
+
+def select_horizon_features(features: pd.DataFrame, horizon: int) -> pd.DataFrame:
+    """
+    Restrict a feature matrix to the columns of another horizon.
+
+    Only the USD/CLP lags depend on the horizon, so a matrix engineered
+    once with the full lag set (any horizon other than 30d) serves every
+    horizon: this drops the lags the target horizon does not use.
+
+    Example:
+        >>> features = engineer_features(df, horizon=7)
+        >>> features_30d = select_horizon_features(features, horizon=30)
+        >>> 'usdclp_lag30' in features_30d.columns
+        False
+    """
+    unused = [f'usdclp_lag{lag}' for lag in USDCLP_LAGS if lag not in usdclp_lags(horizon)]
+    return features.drop(columns=[col for col in unused if col in features.columns])
+
 
 def engineer_features(df: pd.DataFrame, horizon: int = 7) -> pd.DataFrame:
     """
     Generate all engineered features from raw data.
 
     Main orchestrator function that applies all feature engineering steps.
+    Results are served from the shared feature store when the same input
+    was processed before (see forex_core.features.feature_store).
 
     Args:
         df: Raw DataFrame with required columns:
@@ -79,14 +120,22 @@ def engineer_features(df: pd.DataFrame, horizon: int = 7) -> pd.DataFrame:
         ValueError: If required columns are missing
         ValueError: If data quality is too poor (>5% NaN after processing)
     """
-    logger.info(f"Starting feature engineering for {len(df)} rows, horizon={horizon}d")
-
     # Validate input
     required = ['usdclp', 'copper_price', 'dxy', 'vix', 'tpm', 'fed_funds']
     missing = [col for col in required if col not in df.columns]
     if missing:
         raise ValueError(f"Missing required columns: {missing}")
 
+    # Cumulative flows, 365-day z-scores and backward fills depend on the
+    # whole history, so cached matrices are reused but never tail-updated
+    spec = FeatureSpec("engineer_features", FEATURE_VERSION, params={"horizon": horizon})
+    return cached_features(spec, df, lambda data: _engineer_features(data, horizon))
+
+
+def _engineer_features(df: pd.DataFrame, horizon: int) -> pd.DataFrame:
+    """Uncached body of engineer_features."""
+    logger.info(f"Starting feature engineering for {len(df)} rows, horizon={horizon}d")
+
     # Ensure date index
     if 'date' in df.columns and not isinstance(df.index, pd.DatetimeIndex):
         df = df.set_index('date')
@@ -166,16 +215,12 @@ def add_lagged_features(df: pd.DataFrame, horizon: int = 7) -> pd.DataFrame:
     result = df.copy()
 
     # USD/CLP lags (most important)
-    # Base lags for most horizons
-    usdclp_lags = [1, 2, 3, 5, 7, 14, 21, 30]
-
-    # For 30d horizon, remove 30-day lag to prevent boundary issues
-    # This ensures a safety margin between max feature lag (21 days) and target shift (30 days)
+    # For 30d horizon the 30-day lag is removed to prevent boundary issues
+    lags = usdclp_lags(horizon)
     if horizon == 30:
-        usdclp_lags = [1, 2, 3, 5, 7, 14, 21]  # Max lag: 21 days
-        logger.info(f"30d horizon: Using max lag of 21 days (safety margin to prevent data leakage)")
+        logger.info(f"30d horizon: Using max lag of {max(lags)} days (safety margin to prevent data leakage)")
 
-    for lag in usdclp_lags:
+    for lag in lags:
         result[f'usdclp_lag{lag}'] = result['usdclp'].shift(lag)
 
     # Copper lags (strong correlation with USD/CLP)
@@ -702,15 +747,13 @@ def _calculate_trend(series: pd.Series, window: int = 30) -> pd.Series:
     Returns:
         Series of slopes
     """
-    def _slope(y):
-        if len(y) < 2:
-            return np.nan
-        x = np.arange(len(y))
-        # Simple linear regression: slope = cov(x,y) / var(x)
-        slope = np.cov(x, y)[0, 1] / np.var(x) if np.var(x) > 0 else 0
-        return slope
+    if window < 2:
+        return pd.Series(np.nan, index=series.index)
 
-    return series.rolling(window=window).apply(_slope, raw=True)
+    # Historically computed as np.cov(x, y)[0, 1] / np.var(x), which mixes
+    # ddof=1 and ddof=0; keep that window / (window - 1) scaling of the OLS
+    # slope so trained models see the same feature values.
+    return rolling_slope(series, window) * window / (window - 1)
 
 
 def _handle_missing_values(df: pd.DataFrame) -> pd.DataFrame:
@@ -764,6 +807,8 @@ def _handle_missing_values(df: pd.DataFrame) -> pd.DataFrame:
 __all__ = [
     'engineer_features',
     'add_lagged_features',
+    'usdclp_lags',
+    'select_horizon_features',
     'add_technical_indicators',
     'add_copper_features',
     'add_macro_features',
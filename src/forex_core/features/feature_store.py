@@ -0,0 +1,396 @@
+"""
+Shared cache of computed feature matrices.
+
+engineer_features, XGBoostForecaster, InterpretableForexEnsemble and
+DirectionalForecaster each rebuild lag, rolling, RSI, MACD and Bollinger
+columns from the same raw series on every training run, walk-forward fold
+and prediction. FeatureStore keeps the matrices they produce, keyed by
+
+- the feature spec (builder name, version and parameters), and
+- a fingerprint of the input frame (index, columns and values).
+
+Entries live in an in-process LRU and, when a root directory is given, as
+Parquet files that any process can read back memory-mapped:
+
+    <data_dir>/feature_store/
+        xgboost-v1-3f2a9c1e/
+            <fingerprint>.parquet
+
+When the input is an earlier cached input plus new rows at the end (the
+daily case), only the tail is rebuilt: the builder runs on the new rows
+plus ``spec.lookback`` rows of history, and the result is appended to the
+cached matrix. Specs whose features depend on the whole history (cumulative
+sums, backward fills) set ``lookback=None`` and are rebuilt in full on a
+miss.
+
+Example:
+    >>> spec = FeatureSpec("xgboost", version=1, params={"target_col": "close"}, lookback=600)
+    >>> features = cached_features(spec, data, lambda d: build(d, "close"))
+    >>> subset = get_feature_store().get(spec, data, build, columns=["lag_1d", "rsi_14d"])
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import threading
+import uuid
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+from loguru import logger
+
+_METADATA_KEY = b"forex_feature_store"
+# Prefix candidates checked per miss; the newest entries are the likely parents
+_PREFIX_CANDIDATES = 4
+
+FeatureBuilder = Callable[[pd.DataFrame], pd.DataFrame]
+
+
+@dataclass(frozen=True)
+class FeatureSpec:
+    """
+    Identity of a feature builder.
+
+    Attributes:
+        name: Builder name (e.g. "xgboost").
+        version: Bumped whenever the builder's output changes.
+        params: Builder arguments that change the output.
+        lookback: Rows of history needed to rebuild a new row exactly
+            (longest window, plus EWM warm-up). None disables tail updates.
+    """
+
+    name: str
+    version: int
+    params: Dict[str, Any] = field(default_factory=dict)
+    lookback: Optional[int] = None
+
+    @property
+    def key(self) -> str:
+        """Directory-safe key combining name, version and params."""
+        payload = json.dumps(self.params, sort_keys=True, default=str)
+        digest = hashlib.sha1(payload.encode("utf-8")).hexdigest()[:8]
+        return f"{self.name}-v{self.version}-{digest}"
+
+
+@dataclass
+class _Entry:
+    features: pd.DataFrame
+    fingerprint: str
+    n_rows: int
+
+
+class FeatureStore:
+    """
+    LRU plus optional Parquet cache of feature matrices.
+
+    Safe to share between threads (ForecastEngine runs models concurrently);
+    the in-memory LRU is guarded by a lock.
+
+    Attributes:
+        root: Directory for Parquet entries, or None for memory only.
+        max_memory_entries: Matrices kept in memory across all specs.
+        max_disk_entries: Parquet files kept per spec; oldest are pruned.
+
+    Example:
+        >>> store = FeatureStore(settings.data_dir / "feature_store")
+        >>> features = store.get(spec, data, builder)
+    """
+
+    def __init__(
+        self,
+        root: Optional[Path] = None,
+        max_memory_entries: int = 16,
+        max_disk_entries: int = 8,
+    ) -> None:
+        """
+        Initialize feature store.
+
+        Args:
+            root: Directory for Parquet entries. None keeps entries in memory only.
+            max_memory_entries: In-memory LRU capacity.
+            max_disk_entries: Parquet files retained per spec.
+        """
+        self.root = Path(root) if root is not None else None
+        self.max_memory_entries = max(1, max_memory_entries)
+        self.max_disk_entries = max(1, max_disk_entries)
+        self._memory: "OrderedDict[Tuple[str, str], _Entry]" = OrderedDict()
+        self._memory_lock = threading.Lock()
+
+    def get(
+        self,
+        spec: FeatureSpec,
+        data: pd.DataFrame,
+        build: FeatureBuilder,
+        columns: Optional[Sequence[str]] = None,
+    ) -> pd.DataFrame:
+        """
+        Return the feature matrix of ``data``, computing only what is missing.
+
+        Args:
+            spec: Builder identity.
+            data: Raw input frame passed to the builder.
+            build: Function mapping a raw frame to its feature matrix.
+            columns: Optional subset of feature columns to return.
+
+        Returns:
+            Feature matrix (or the requested columns of it).
+        """
+        try:
+            row_hashes = _row_hashes(data)
+        except TypeError as exc:
+            logger.debug(f"Input not hashable, bypassing feature store: {exc}")
+            return _select(build(data), columns)
+        fingerprint = _digest(data, row_hashes)
+
+        entry = self._lookup(spec, fingerprint, columns)
+        if entry is not None:
+            logger.debug(f"Feature store hit: {spec.key}/{fingerprint}")
+            return _select(entry.features, columns)
+
+        features = None
+        parent = self._find_parent(spec, data, row_hashes)
+        if parent is not None:
+            try:
+                features = self._extend(spec, data, parent, build)
+            except Exception as exc:
+                logger.warning(f"Tail feature update failed, rebuilding {spec.key}: {exc}")
+        if features is None:
+            features = build(data)
+
+        self._store(spec, _Entry(features, fingerprint, len(data)))
+        return _select(features, columns)
+
+    def clear(self) -> None:
+        """Drop in-memory entries (Parquet files are kept)."""
+        with self._memory_lock:
+            self._memory.clear()
+
+    def _lookup(
+        self,
+        spec: FeatureSpec,
+        fingerprint: str,
+        columns: Optional[Sequence[str]],
+    ) -> Optional[_Entry]:
+        key = (spec.key, fingerprint)
+        with self._memory_lock:
+            entry = self._memory.get(key)
+            if entry is not None:
+                self._memory.move_to_end(key)
+                return entry
+
+        path = self._path(spec, fingerprint)
+        if path is None or not path.exists():
+            return None
+        try:
+            meta = _read_metadata(path)
+            # Column subsets are served from disk without loading the full matrix
+            features = pd.read_parquet(path, columns=list(columns) if columns else None, memory_map=True)
+        except Exception as exc:
+            logger.warning(f"Unreadable feature store entry {path}: {exc}")
+            return None
+
+        entry = _Entry(features, fingerprint, meta["n_rows"])
+        if columns is None:
+            self._remember(key, entry)
+        return entry
+
+    def _find_parent(
+        self,
+        spec: FeatureSpec,
+        data: pd.DataFrame,
+        row_hashes: np.ndarray,
+    ) -> Optional[_Entry]:
+        """Find a cached entry whose input is a strict prefix of ``data``."""
+        if spec.lookback is None or not data.index.is_monotonic_increasing:
+            return None
+
+        with self._memory_lock:
+            candidates: List[Tuple[int, str, Optional[_Entry], Optional[Path]]] = [
+                (entry.n_rows, entry.fingerprint, entry, None)
+                for (key, _), entry in reversed(self._memory.items())
+                if key == spec.key
+            ][:_PREFIX_CANDIDATES]
+        for path in self._disk_entries(spec)[:_PREFIX_CANDIDATES]:
+            try:
+                meta = _read_metadata(path)
+            except Exception as exc:
+                logger.debug(f"Skipping unreadable feature store entry {path}: {exc}")
+                continue
+            candidates.append((meta["n_rows"], path.stem, None, path))
+
+        for n_rows, fingerprint, entry, path in candidates:
+            if not 0 < n_rows < len(data):
+                continue
+            if _digest(data, row_hashes[:n_rows]) != fingerprint:
+                continue
+            if entry is None:
+                try:
+                    entry = _Entry(pd.read_parquet(path, memory_map=True), fingerprint, n_rows)
+                except Exception as exc:
+                    logger.warning(f"Unreadable feature store entry {path}: {exc}")
+                    continue
+            return entry
+        return None
+
+    def _extend(
+        self,
+        spec: FeatureSpec,
+        data: pd.DataFrame,
+        parent: _Entry,
+        build: FeatureBuilder,
+    ) -> Optional[pd.DataFrame]:
+        """Build the rows after ``parent`` from a lookback window and append them."""
+        start = max(0, parent.n_rows - spec.lookback)
+        tail = build(data.iloc[start:])
+        if list(tail.columns) != list(parent.features.columns):
+            return None
+
+        last_cached = data.index[parent.n_rows - 1]
+        new_rows = tail.loc[tail.index > last_cached]
+        logger.debug(
+            f"Feature store tail update: {spec.key} +{len(new_rows)} rows "
+            f"(built on {len(data) - start} of {len(data)})"
+        )
+        return pd.concat([parent.features, new_rows])
+
+    def _store(self, spec: FeatureSpec, entry: _Entry) -> None:
+        self._remember((spec.key, entry.fingerprint), entry)
+
+        path = self._path(spec, entry.fingerprint)
+        if path is None:
+            return
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            table = pa.Table.from_pandas(entry.features)
+            metadata = dict(table.schema.metadata or {})
+            metadata[_METADATA_KEY] = json.dumps({"n_rows": entry.n_rows}).encode("utf-8")
+            tmp_path = path.with_name(f".{path.name}.{uuid.uuid4().hex[:8]}")
+            pq.write_table(table.replace_schema_metadata(metadata), tmp_path)
+            os.replace(tmp_path, path)
+            self._prune(spec)
+        except Exception as exc:
+            logger.warning(f"Could not persist feature store entry {path}: {exc}")
+
+    def _remember(self, key: Tuple[str, str], entry: _Entry) -> None:
+        with self._memory_lock:
+            self._memory[key] = entry
+            self._memory.move_to_end(key)
+            while len(self._memory) > self.max_memory_entries:
+                self._memory.popitem(last=False)
+
+    def _path(self, spec: FeatureSpec, fingerprint: str) -> Optional[Path]:
+        if self.root is None:
+            return None
+        return self.root / spec.key / f"{fingerprint}.parquet"
+
+    def _disk_entries(self, spec: FeatureSpec) -> List[Path]:
+        """Parquet entries of a spec, newest first."""
+        if self.root is None or not (self.root / spec.key).exists():
+            return []
+        paths = [p for p in (self.root / spec.key).glob("*.parquet") if not p.name.startswith(".")]
+        return sorted(paths, key=lambda p: p.stat().st_mtime_ns, reverse=True)
+
+    def _prune(self, spec: FeatureSpec) -> None:
+        for path in self._disk_entries(spec)[self.max_disk_entries:]:
+            path.unlink(missing_ok=True)
+
+
+def _row_hashes(data: pd.DataFrame) -> np.ndarray:
+    return pd.util.hash_pandas_object(data, index=True).to_numpy()
+
+
+def _digest(data: pd.DataFrame, row_hashes: np.ndarray) -> str:
+    """Fingerprint of the given rows plus the frame's column layout."""
+    hasher = hashlib.blake2b(digest_size=12)
+    hasher.update(json.dumps([str(c) for c in data.columns]).encode("utf-8"))
+    hasher.update(json.dumps([str(t) for t in data.dtypes]).encode("utf-8"))
+    hasher.update(np.ascontiguousarray(row_hashes).tobytes())
+    return hasher.hexdigest()
+
+
+def frame_fingerprint(data: pd.DataFrame) -> str:
+    """Content fingerprint of a frame: values, index, columns and dtypes."""
+    return _digest(data, _row_hashes(data))
+
+
+def _read_metadata(path: Path) -> Dict[str, Any]:
+    metadata = pq.read_schema(path).metadata or {}
+    return json.loads(metadata[_METADATA_KEY])
+
+
+def _select(features: pd.DataFrame, columns: Optional[Sequence[str]]) -> pd.DataFrame:
+    if columns is None:
+        return features.copy()
+    return features[list(columns)].copy()
+
+
+_FEATURE_STORE: Optional[FeatureStore] = None
+
+
+def get_feature_store() -> Optional[FeatureStore]:
+    """
+    Get the process-wide feature store configured in settings.
+
+    Returns:
+        FeatureStore under ``<data_dir>/feature_store``, or None when
+        FEATURE_STORE_ENABLED is false.
+    """
+    global _FEATURE_STORE
+    if _FEATURE_STORE is None:
+        from forex_core.config import get_settings
+
+        settings = get_settings()
+        if not settings.feature_store_enabled:
+            return None
+        _FEATURE_STORE = FeatureStore(
+            root=Path(settings.data_dir) / "feature_store",
+            max_disk_entries=settings.feature_store_max_entries,
+        )
+    return _FEATURE_STORE
+
+
+def cached_features(
+    spec: FeatureSpec,
+    data: pd.DataFrame,
+    build: FeatureBuilder,
+    columns: Optional[Sequence[str]] = None,
+) -> pd.DataFrame:
+    """
+    Build features through the shared store, or directly if it is disabled.
+
+    Args:
+        spec: Builder identity.
+        data: Raw input frame.
+        build: Function mapping a raw frame to its feature matrix.
+        columns: Optional subset of feature columns to return.
+
+    Returns:
+        Feature matrix.
+    """
+    try:
+        store = get_feature_store()
+    except Exception as exc:
+        logger.warning(f"Feature store unavailable, computing directly: {exc}")
+        store = None
+
+    if store is None:
+        features = build(data)
+        return features[list(columns)] if columns else features
+    return store.get(spec, data, build, columns=columns)
+
+
+__all__ = [
+    "FeatureSpec",
+    "FeatureStore",
+    "cached_features",
+    "frame_fingerprint",
+    "get_feature_store",
+]
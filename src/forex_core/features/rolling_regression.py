@@ -0,0 +1,81 @@
+"""
+Rolling ordinary least squares over a fixed window.
+
+Fits y = intercept + slope * x on every window of ``window`` consecutive
+observations, with x = 0..window-1 local to each window. Used by the trend
+features of engineer_features and the model-specific feature builders.
+
+The regressor is the same for every window, so the fit reduces to a dot
+product of each window with the centred x vector. The windows are strided
+numpy views (no copy, no per-window Python call), which keeps the result
+as accurate as np.polyfit while being orders of magnitude faster than
+``rolling().apply(np.polyfit)``.
+"""
+
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+from numpy.lib.stride_tricks import sliding_window_view
+
+
+def rolling_ols(series: pd.Series, window: int) -> pd.DataFrame:
+    """
+    Rolling OLS slope, intercept and R² of a series against time.
+
+    Windows that are incomplete or contain NaN yield NaN, matching
+    ``series.rolling(window).apply(...)`` with the default min_periods.
+    R² is NaN for constant windows, where it is undefined.
+
+    Args:
+        series: Series to regress (e.g. price)
+        window: Number of observations per regression (>= 2)
+
+    Returns:
+        DataFrame indexed like ``series`` with columns slope, intercept, r2.
+        The intercept is the fitted value at the first row of each window.
+
+    Raises:
+        ValueError: If window is smaller than 2
+    """
+    if window < 2:
+        raise ValueError(f"window must be >= 2, got {window}")
+
+    values = series.to_numpy(dtype=float)
+    n = len(values)
+    slope = np.full(n, np.nan)
+    intercept = np.full(n, np.nan)
+    r2 = np.full(n, np.nan)
+
+    if n >= window:
+        x_centred = np.arange(window, dtype=float) - (window - 1) / 2.0
+        sxx = window * (window ** 2 - 1) / 12.0
+
+        windows = sliding_window_view(values, window)
+        y_mean = windows.mean(axis=1)
+        window_slope = windows @ x_centred / sxx
+        sst = ((windows - y_mean[:, None]) ** 2).sum(axis=1)
+
+        slope[window - 1:] = window_slope
+        intercept[window - 1:] = y_mean - window_slope * (window - 1) / 2.0
+        with np.errstate(divide='ignore', invalid='ignore'):
+            r2[window - 1:] = np.where(sst > 0, window_slope ** 2 * sxx / sst, np.nan)
+
+    return pd.DataFrame(
+        {'slope': slope, 'intercept': intercept, 'r2': r2},
+        index=series.index,
+    )
+
+
+def rolling_slope(series: pd.Series, window: int) -> pd.Series:
+    """
+    Rolling OLS slope of a series against time.
+
+    Args:
+        series: Series to regress
+        window: Number of observations per regression (>= 2)
+
+    Returns:
+        Series of slopes indexed like ``series``
+    """
+    return rolling_ols(series, window)['slope'].rename(series.name)
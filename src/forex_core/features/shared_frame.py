@@ -0,0 +1,120 @@
+"""
+Share a numeric DataFrame with worker processes through shared memory.
+
+SharedFrame copies the frame's values once into a named shared-memory
+block. Its handle is small and picklable: workers receive the handle instead
+of their own pickled copy of the matrix and attach() a DataFrame backed by
+the same block. Values are stored as float64 and exposed read-only.
+
+Example:
+    >>> with SharedFrame(features) as shared:
+    ...     with ProcessPoolExecutor() as pool:
+    ...         results = list(pool.map(train, [shared.handle] * 4))
+    >>> # in the worker
+    >>> def train(handle):
+    ...     features = handle.attach()
+    ...     window = features.iloc[-365:].copy()
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from multiprocessing import shared_memory
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+from loguru import logger
+
+# Blocks attached by this process, kept mapped until the process exits
+_ATTACHED: Dict[str, shared_memory.SharedMemory] = {}
+
+
+@dataclass(frozen=True)
+class SharedFrameHandle:
+    """
+    Picklable reference to a DataFrame held in shared memory.
+
+    Attributes:
+        name: Shared-memory block name
+        shape: (rows, columns) of the values
+        index: Row index of the frame
+        columns: Column labels of the frame
+    """
+
+    name: str
+    shape: Tuple[int, int]
+    index: pd.Index
+    columns: List[str]
+
+    def attach(self) -> pd.DataFrame:
+        """
+        Read-only DataFrame over the shared block (no copy).
+
+        The block stays mapped in this process until it exits. Copy any
+        slice that has to be modified.
+        """
+        block = _ATTACHED.get(self.name)
+        if block is None:
+            block = shared_memory.SharedMemory(name=self.name)
+            _ATTACHED[self.name] = block
+
+        values = np.ndarray(self.shape, dtype=np.float64, buffer=block.buf)
+        values.flags.writeable = False
+        return pd.DataFrame(values, index=self.index, columns=self.columns, copy=False)
+
+
+class SharedFrame:
+    """
+    Owner of a shared-memory copy of a numeric DataFrame.
+
+    The owning process must close() the frame (or use it as a context
+    manager) after all workers finished; this releases the block's name.
+
+    Args:
+        frame: Numeric DataFrame to share
+
+    Raises:
+        ValueError: If the frame has non-numeric columns
+    """
+
+    def __init__(self, frame: pd.DataFrame):
+        try:
+            values = frame.to_numpy(dtype=np.float64)
+        except (TypeError, ValueError) as e:
+            raise ValueError(f"SharedFrame needs numeric columns: {e}") from e
+
+        self._block: Optional[shared_memory.SharedMemory] = shared_memory.SharedMemory(
+            create=True, size=max(values.nbytes, 1)
+        )
+        shared = np.ndarray(values.shape, dtype=np.float64, buffer=self._block.buf)
+        shared[:] = values
+        del shared  # The block cannot be closed while a view exists
+
+        self.handle = SharedFrameHandle(
+            name=self._block.name,
+            shape=values.shape,
+            index=frame.index,
+            columns=list(frame.columns),
+        )
+        logger.debug(
+            f"Shared {values.shape[0]}x{values.shape[1]} frame "
+            f"({values.nbytes / 1e6:.1f} MB) as {self._block.name}"
+        )
+
+    def close(self) -> None:
+        """Release the block (idempotent)."""
+        if self._block is None:
+            return
+        self._block.close()
+        self._block.unlink()
+        self._block = None
+
+    def __enter__(self) -> "SharedFrame":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+__all__ = ["SharedFrame", "SharedFrameHandle"]
@@ -14,37 +14,52 @@ Models are designed to work with both daily (7-day) and monthly (12-month)
 forecast horizons through parameterized resampling.
 """
 
-from .arima import fit_arima, forecast_arima, auto_select_arima_order
-from .garch import fit_garch, forecast_garch_volatility
-from .var import fit_var, forecast_var
-from .ensemble import (
-    ModelResult,
-    EnsembleArtifacts,
-    compute_weights,
-    combine_forecasts,
-)
-from .models import ForecastEngine
-from .metrics import calculate_rmse, calculate_mape, calculate_mae
+from ..utils.lazy import lazy_exports
 
-# Chronos imports are optional (requires additional dependencies)
-try:
-    from .chronos_model import (
-        forecast_chronos,
-        get_chronos_pipeline,
-        release_chronos_pipeline,
-    )
-    _CHRONOS_AVAILABLE = True
-except ImportError:
-    _CHRONOS_AVAILABLE = False
-    forecast_chronos = None
-    get_chronos_pipeline = None
-    release_chronos_pipeline = None
+# Submodules are imported on first access: chronos_model pulls in torch and
+# models pulls in statsmodels/arch/sklearn, which callers that only need one
+# helper (or nothing at all, like `cli info`) should not pay for.
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "fit_arima": ".arima",
+        "forecast_arima": ".arima",
+        "auto_select_arima_order": ".arima",
+        "select_arima_order": ".arima",
+        "ArimaOrderCache": ".arima",
+        "fit_garch": ".garch",
+        "forecast_garch_volatility": ".garch",
+        "fit_var": ".var",
+        "forecast_var": ".var",
+        "ModelResult": ".ensemble",
+        "EnsembleArtifacts": ".ensemble",
+        "compute_weights": ".ensemble",
+        "combine_forecasts": ".ensemble",
+        "ForecastEngine": ".models",
+        "calculate_rmse": ".metrics",
+        "calculate_mape": ".metrics",
+        "calculate_mae": ".metrics",
+        "forecast_chronos": ".chronos_model",
+        "get_chronos_pipeline": ".chronos_model",
+        "predict_chronos_batch": ".chronos_model",
+        "release_chronos_pipeline": ".chronos_model",
+    },
+    # Chronos requires additional dependencies; None when they are missing
+    optional=(
+        "forecast_chronos",
+        "get_chronos_pipeline",
+        "predict_chronos_batch",
+        "release_chronos_pipeline",
+    ),
+)
 
 __all__ = [
     # ARIMA
     "fit_arima",
     "forecast_arima",
     "auto_select_arima_order",
+    "select_arima_order",
+    "ArimaOrderCache",
     # GARCH
     "fit_garch",
     "forecast_garch_volatility",
@@ -54,6 +69,7 @@ __all__ = [
     # Chronos (optional)
     "forecast_chronos",
     "get_chronos_pipeline",
+    "predict_chronos_batch",
     "release_chronos_pipeline",
     # Ensemble
     "ModelResult",
@@ -8,7 +8,9 @@ combine three components:
 - MA (Moving Average): Uses past forecast errors
 
 This implementation includes:
-- Automatic order selection via AIC (Akaike Information Criterion)
+- Automatic order selection via AIC (Akaike Information Criterion), with
+  optional process-parallel search and warm-started fits
+- Persistent per-horizon order cache, re-searched on drift or expiry
 - Log-return transformation for price series
 - Integration with GARCH for volatility forecasting
 
@@ -20,19 +22,72 @@ Statistical properties:
 
 from __future__ import annotations
 
+import hashlib
+import json
 import math
-from typing import Tuple
+import os
+import uuid
+from concurrent.futures import Executor, ProcessPoolExecutor
+from dataclasses import asdict, dataclass
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
 
 import numpy as np
 import pandas as pd
 from statsmodels.tsa.arima.model import ARIMA, ARIMAResults
 
+from ..utils.file_lock import FileLock
+from ..utils.logging import get_logger
+
+logger = get_logger(__name__)
+
+Order = Tuple[int, int, int]
+
+# Number of leading observations hashed into a series fingerprint
+FINGERPRINT_HEAD = 32
+
+
+def _fit_candidate(
+    series: pd.Series,
+    order: Order,
+    start_params: Optional[Dict[str, float]] = None,
+) -> Tuple[Order, Optional[float], Optional[Dict[str, float]]]:
+    """
+    Fit one candidate order; runs inside worker processes.
+
+    Parameters missing from start_params (the new AR/MA lag of a larger
+    order) start at zero.
+
+    Returns:
+        Tuple of (order, aic, fitted params by name). aic and params are
+        None if the fit failed or produced a non-finite AIC.
+    """
+    try:
+        model = ARIMA(series, order=order)
+        if start_params:
+            start = np.array([start_params.get(name, 0.0) for name in model.param_names])
+            result = model.fit(start_params=start)
+        else:
+            result = model.fit()
+    except Exception:
+        # Skip orders that fail to converge
+        return order, None, None
+
+    aic = float(result.aic)
+    if not np.isfinite(aic):
+        return order, None, None
+    return order, aic, dict(zip(result.param_names, np.asarray(result.params, dtype=float)))
+
 
 def auto_select_arima_order(
     series: pd.Series,
     max_p: int = 2,
     max_q: int = 2,
-    d: int = 0
+    d: int = 0,
+    *,
+    n_jobs: int = 1,
+    warm_start: bool = True,
 ) -> Tuple[int, int, int]:
     """
     Automatically select ARIMA order (p, d, q) via grid search and AIC.
@@ -41,6 +96,11 @@ def auto_select_arima_order(
     fits each model, and selects the order with the lowest AIC (Akaike
     Information Criterion). AIC balances goodness-of-fit and model complexity.
 
+    Candidates are fitted in waves of equal p + q. With warm_start, each
+    candidate starts from the fitted parameters of its best neighbour in the
+    previous wave ((p-1, q) or (p, q-1)), which cuts optimizer iterations.
+    With n_jobs > 1, the candidates of each wave run on a process pool.
+
     AIC formula:
         AIC = 2k - 2ln(L)
         where k = number of parameters, L = likelihood
@@ -50,6 +110,8 @@ def auto_select_arima_order(
         max_p: Maximum AR order to test (default 2).
         max_q: Maximum MA order to test (default 2).
         d: Differencing order (default 0, typically 0 for log returns).
+        n_jobs: Worker processes for candidate fits (default 1, sequential).
+        warm_start: Start each fit from its neighbour's parameters (default True).
 
     Returns:
         Tuple of (p, d, q) representing the best ARIMA order.
@@ -69,8 +131,9 @@ def auto_select_arima_order(
     Performance considerations:
         - Grid search is O(max_p * max_q) - keep limits low for speed
         - Each model fit can take 0.1-1s depending on series length
-        - For production, consider caching or using pre-selected orders
-        - Parallel grid search could improve performance
+        - Use select_arima_order() to cache the winning order per horizon
+        - Process pools pay a startup cost; n_jobs > 1 pays off for long
+          series or larger grids
 
     Statistical warnings:
         - AIC minimization doesn't guarantee good out-of-sample performance
@@ -78,24 +141,250 @@ def auto_select_arima_order(
         - Check residuals for autocorrelation and heteroskedasticity
         - Consider using auto_arima from pmdarima for more robust selection
     """
+    grid = [(p, d, q) for p in range(0, max_p + 1) for q in range(0, max_q + 1)]
+    waves: Dict[int, List[Order]] = {}
+    for order in grid:
+        waves.setdefault(order[0] + order[2], []).append(order)
+
+    aics: Dict[Order, float] = {}
+    params: Dict[Order, Dict[str, float]] = {}
+    executor: Optional[Executor] = None
+    if n_jobs > 1:
+        executor = ProcessPoolExecutor(max_workers=min(n_jobs, len(grid)))
+
+    try:
+        for total in sorted(waves):
+            jobs = []
+            for order in waves[total]:
+                start = _neighbour_params(order, aics, params) if warm_start else None
+                jobs.append((order, start))
+
+            if executor is None:
+                fitted = [_fit_candidate(series, order, start) for order, start in jobs]
+            else:
+                futures = [
+                    executor.submit(_fit_candidate, series, order, start)
+                    for order, start in jobs
+                ]
+                fitted = [future.result() for future in futures]
+
+            for order, aic, fitted_params in fitted:
+                if aic is not None:
+                    aics[order] = aic
+                    params[order] = fitted_params
+    finally:
+        if executor is not None:
+            executor.shutdown()
+
     best_aic = math.inf
     best_order = (1, d, 1)  # Fallback
-
-    for p in range(0, max_p + 1):
-        for q in range(0, max_q + 1):
-            order = (p, d, q)
-            try:
-                model = ARIMA(series, order=order).fit()
-                if model.aic < best_aic:
-                    best_aic = model.aic
-                    best_order = order
-            except Exception:
-                # Skip orders that fail to converge
-                continue
+    for order in grid:  # grid order keeps the first minimum on ties
+        if order in aics and aics[order] < best_aic:
+            best_aic = aics[order]
+            best_order = order
 
     return best_order
 
 
+def _neighbour_params(
+    order: Order,
+    aics: Dict[Order, float],
+    params: Dict[Order, Dict[str, float]],
+) -> Optional[Dict[str, float]]:
+    """Fitted params of the lowest-AIC neighbour one lag smaller, if any."""
+    p, d, q = order
+    neighbours = [n for n in ((p - 1, d, q), (p, d, q - 1)) if n in aics]
+    if not neighbours:
+        return None
+    return params[min(neighbours, key=aics.__getitem__)]
+
+
+def series_fingerprint(series: pd.Series) -> str:
+    """
+    Fingerprint the history a cached ARIMA order was selected on.
+
+    Hashes the first timestamp and the leading observations, so appending
+    new data keeps the fingerprint while a different series, resampling
+    frequency or a revised history changes it.
+
+    Args:
+        series: Series passed to order selection.
+
+    Returns:
+        Hex digest identifying the series.
+    """
+    head = series.iloc[:FINGERPRINT_HEAD]
+    payload = f"{series.index[0] if len(series) else ''}|" + ",".join(
+        f"{value:.10g}" for value in head.to_numpy(dtype=float)
+    )
+    return hashlib.sha1(payload.encode("utf-8")).hexdigest()[:16]
+
+
+@dataclass
+class CachedOrder:
+    """
+    ARIMA order persisted by ArimaOrderCache.
+
+    Attributes:
+        order: Selected (p, d, q).
+        fingerprint: series_fingerprint() of the search input.
+        searched_at: UTC time of the grid search.
+        max_p: AR limit of the search grid.
+        max_q: MA limit of the search grid.
+    """
+
+    order: Order
+    fingerprint: str
+    searched_at: datetime
+    max_p: int
+    max_q: int
+
+
+class ArimaOrderCache:
+    """
+    JSON file of the winning ARIMA order per cache key (e.g. horizon).
+
+    Writes take a file lock and replace the file atomically, so concurrent
+    forecaster services can share one cache.
+
+    Example:
+        >>> cache = ArimaOrderCache(settings.data_dir / "arima_orders.json")
+        >>> order = select_arima_order(log_returns, cache=cache, cache_key="daily_7")
+    """
+
+    def __init__(self, path: Path | str) -> None:
+        """
+        Initialize cache.
+
+        Args:
+            path: JSON file holding cached orders.
+        """
+        self.path = Path(path)
+        self.lock_path = self.path.with_suffix(self.path.suffix + ".lock")
+
+    def get(self, key: str) -> Optional[CachedOrder]:
+        """Return the cached order for key, or None."""
+        entry = self._read().get(key)
+        if entry is None:
+            return None
+        try:
+            return CachedOrder(
+                order=tuple(entry["order"]),
+                fingerprint=entry["fingerprint"],
+                searched_at=datetime.fromisoformat(entry["searched_at"]),
+                max_p=entry["max_p"],
+                max_q=entry["max_q"],
+            )
+        except (KeyError, TypeError, ValueError):
+            logger.warning(f"Ignoring malformed ARIMA order cache entry '{key}'")
+            return None
+
+    def put(self, key: str, cached: CachedOrder) -> None:
+        """Store the order for key."""
+        with FileLock(self.lock_path, timeout=10.0):
+            entries = self._read()
+            entry = asdict(cached)
+            entry["order"] = list(cached.order)
+            entry["searched_at"] = cached.searched_at.isoformat()
+            entries[key] = entry
+
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.path.with_name(f".{self.path.name}.{uuid.uuid4().hex[:8]}")
+            with tmp_path.open("w", encoding="utf-8") as f:
+                json.dump(entries, f, indent=2)
+            os.replace(tmp_path, self.path)
+
+    def _read(self) -> Dict[str, dict]:
+        """Read all entries; a missing or corrupt file reads as empty."""
+        if not self.path.exists():
+            return {}
+        try:
+            with self.path.open("r", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, json.JSONDecodeError) as exc:
+            logger.warning(f"Unreadable ARIMA order cache {self.path}: {exc}")
+            return {}
+
+
+def select_arima_order(
+    series: pd.Series,
+    *,
+    cache: Optional[ArimaOrderCache] = None,
+    cache_key: Optional[str] = None,
+    max_age: timedelta = timedelta(days=7),
+    drift_detected: bool = False,
+    max_p: int = 2,
+    max_q: int = 2,
+    d: int = 0,
+    n_jobs: int = 1,
+) -> Tuple[int, int, int]:
+    """
+    Select an ARIMA order, reusing the cached order while it is still valid.
+
+    The cached order is reused unless drift was detected, the entry is
+    older than max_age, the series fingerprint changed, or the search grid
+    differs. Otherwise auto_select_arima_order() runs and the winner is
+    stored under cache_key.
+
+    Args:
+        series: Time series to model (typically log returns).
+        cache: Order cache. If None, always searches.
+        cache_key: Cache entry name, e.g. "daily_7".
+        max_age: Maximum age of a reusable cached order (default 7 days).
+        drift_detected: Force a new search because the data drifted.
+        max_p: Maximum AR order to test (default 2).
+        max_q: Maximum MA order to test (default 2).
+        d: Differencing order (default 0).
+        n_jobs: Worker processes for the grid search (default 1).
+
+    Returns:
+        Tuple of (p, d, q).
+
+    Example:
+        >>> order = select_arima_order(
+        ...     log_returns, cache=cache, cache_key="daily_7",
+        ...     drift_detected=report.drift_detected,
+        ... )
+    """
+    fingerprint = series_fingerprint(series)
+    now = datetime.now(timezone.utc)
+
+    if cache is not None and cache_key:
+        cached = cache.get(cache_key)
+        if cached is not None:
+            if drift_detected:
+                reason = "drift detected"
+            elif now - cached.searched_at > max_age:
+                reason = "cache expired"
+            elif cached.fingerprint != fingerprint:
+                reason = "series changed"
+            elif (cached.max_p, cached.max_q, cached.order[1]) != (max_p, max_q, d):
+                reason = "search grid changed"
+            else:
+                logger.debug(f"Using cached ARIMA{cached.order} for {cache_key}")
+                return cached.order
+            logger.info(f"Re-selecting ARIMA order for {cache_key}: {reason}")
+
+    order = auto_select_arima_order(series, max_p=max_p, max_q=max_q, d=d, n_jobs=n_jobs)
+
+    if cache is not None and cache_key:
+        try:
+            cache.put(
+                cache_key,
+                CachedOrder(
+                    order=order,
+                    fingerprint=fingerprint,
+                    searched_at=now,
+                    max_p=max_p,
+                    max_q=max_q,
+                ),
+            )
+        except Exception as exc:
+            logger.warning(f"Could not cache ARIMA order for {cache_key}: {exc}")
+
+    return order
+
+
 def fit_arima(series: pd.Series, order: Tuple[int, int, int]) -> ARIMAResults:
     """
     Fit an ARIMA model to a time series.
@@ -184,6 +473,10 @@ def forecast_arima(
 
 __all__ = [
     "auto_select_arima_order",
+    "select_arima_order",
+    "series_fingerprint",
+    "ArimaOrderCache",
+    "CachedOrder",
     "fit_arima",
     "forecast_arima",
 ]
@@ -10,6 +10,7 @@ Key features:
 - Probabilistic forecasts with confidence intervals
 - Memory-efficient singleton pattern for model loading
 - Pseudo-validation using historical data
+- Batched inference: many contexts per model call (see predict_chronos_batch)
 - Compatible with ForecastPackage interface
 
 Model specifications:
@@ -27,7 +28,7 @@ from __future__ import annotations
 
 import gc
 from datetime import datetime, timedelta
-from typing import TYPE_CHECKING, Optional
+from typing import TYPE_CHECKING, Optional, Sequence, Union
 
 import numpy as np
 import pandas as pd
@@ -49,6 +50,8 @@ _MODEL_VARIANTS = [
     "amazon/chronos-bolt-small",  # Preferred: more efficient
     "amazon/chronos-t5-small",    # Fallback: stable and compatible
 ]
+# Contexts per pipeline.predict call; bounds peak memory of a batch
+DEFAULT_BATCH_SIZE = 16
 
 
 def get_chronos_pipeline(force_reload: bool = False) -> "ChronosPipeline":
@@ -153,6 +156,106 @@ def release_chronos_pipeline() -> None:
             torch.cuda.empty_cache()
 
 
+def _left_pad_batch(contexts: Sequence[np.ndarray]) -> torch.Tensor:
+    """
+    Stack contexts of different lengths into a [batch, length] tensor.
+
+    Shorter contexts are left-padded with NaN, which Chronos treats as
+    missing values and masks out of attention.
+    """
+    length = max(len(context) for context in contexts)
+    batch = torch.full((len(contexts), length), float("nan"), dtype=torch.float32)
+    for row, context in enumerate(contexts):
+        batch[row, length - len(context):] = torch.as_tensor(context, dtype=torch.float32)
+    return batch
+
+
+def predict_chronos_batch(
+    contexts: Sequence[Union[np.ndarray, pd.Series]],
+    prediction_length: Union[int, Sequence[int]],
+    num_samples: int = 100,
+    temperature: float = 1.0,
+    top_k: int = 50,
+    top_p: float = 1.0,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+) -> list[np.ndarray]:
+    """
+    Generate Chronos samples for many contexts with batched model calls.
+
+    Contexts are sorted by length, split into chunks of at most
+    ``batch_size`` and each chunk is left-padded into one tensor, so a
+    chunk costs a single ``pipeline.predict`` call. Each chunk is decoded
+    to its longest requested horizon; shorter requests are truncated,
+    which is equivalent because Chronos decodes autoregressively.
+
+    Args:
+        contexts: Historical windows (1-D arrays or Series), one per request.
+                  They may differ in length (context lengths, validation origins).
+        prediction_length: Horizon for all requests, or one horizon per request.
+        num_samples: Number of probabilistic samples per request.
+        temperature: Sampling temperature.
+        top_k: Top-K sampling parameter.
+        top_p: Nucleus sampling parameter.
+        batch_size: Maximum contexts per model call (default: 16).
+
+    Returns:
+        One array of shape [num_samples, horizon] per context, in input order.
+
+    Raises:
+        ValueError: If prediction_length does not match the number of contexts.
+
+    Example:
+        >>> samples = predict_chronos_batch(
+        ...     [series.values[-180:], series.values[-210:-30]],
+        ...     prediction_length=[7, 7],
+        ... )
+        >>> forecast_mean = samples[0].mean(axis=0)
+    """
+    if not contexts:
+        return []
+
+    arrays = [np.asarray(context, dtype=np.float32) for context in contexts]
+    if isinstance(prediction_length, int):
+        horizons = [prediction_length] * len(arrays)
+    else:
+        horizons = list(prediction_length)
+    if len(horizons) != len(arrays):
+        raise ValueError(
+            f"Got {len(horizons)} prediction lengths for {len(arrays)} contexts"
+        )
+
+    batch_size = max(1, batch_size)
+    # Group similar lengths together to keep padding small
+    order = sorted(range(len(arrays)), key=lambda i: len(arrays[i]))
+    results: list[Optional[np.ndarray]] = [None] * len(arrays)
+
+    pipeline = get_chronos_pipeline()
+    start_time = datetime.now()
+    n_calls = 0
+
+    for start in range(0, len(order), batch_size):
+        chunk = order[start:start + batch_size]
+        samples = pipeline.predict(
+            context=_left_pad_batch([arrays[i] for i in chunk]),
+            prediction_length=max(horizons[i] for i in chunk),
+            num_samples=num_samples,
+            temperature=temperature,
+            top_k=top_k,
+            top_p=top_p,
+        )
+        n_calls += 1
+        samples = np.asarray(samples, dtype=np.float64)
+        for row, index in enumerate(chunk):
+            results[index] = samples[row, :, :horizons[index]]
+
+    elapsed = (datetime.now() - start_time).total_seconds()
+    logger.debug(
+        f"Chronos batch: {len(arrays)} contexts in {n_calls} call(s), {elapsed:.2f}s"
+    )
+
+    return results
+
+
 def forecast_chronos(
     series: pd.Series,
     steps: int,
@@ -241,22 +344,24 @@ def forecast_chronos(
     context_length = min(context_length, len(series))
     context_series = series.iloc[-context_length:]
 
-    try:
-        # Load pipeline (singleton, cached)
-        pipeline = get_chronos_pipeline()
+    # Pseudo-validation context is forecast in the same model call
+    validation = None
+    if validate and len(series) >= validation_window + steps:
+        validation = _validation_split(series, steps, context_length, validation_window)
 
-        # Convert to tensor format
-        context_tensor = torch.tensor(
-            context_series.values, dtype=torch.float32
-        ).unsqueeze(0)
+    try:
+        contexts = [context_series.values]
+        horizons = [steps]
+        if validation is not None:
+            contexts.append(validation[0])
+            horizons.append(len(validation[1]))
 
-        # Generate forecast samples
         logger.debug("Generating Chronos forecast samples...")
         start_time = datetime.now()
 
-        forecast_samples = pipeline.predict(
-            context=context_tensor,
-            prediction_length=steps,
+        batch_samples = predict_chronos_batch(
+            contexts,
+            prediction_length=horizons,
             num_samples=num_samples,
             temperature=temperature,
             top_k=top_k,
@@ -266,8 +371,8 @@ def forecast_chronos(
         elapsed = (datetime.now() - start_time).total_seconds()
         logger.info(f"Chronos inference completed in {elapsed:.2f}s")
 
-        # Extract samples as numpy array [num_samples, steps]
-        samples = forecast_samples[0].numpy()
+        # Samples as numpy array [num_samples, steps]
+        samples = batch_samples[0]
 
         # Compute statistics
         mean_forecast = samples.mean(axis=0)
@@ -283,17 +388,8 @@ def forecast_chronos(
 
         # Pseudo-validation on recent history
         pseudo_rmse = None
-        if validate and len(series) >= validation_window + steps:
-            pseudo_rmse = _pseudo_validate(
-                series,
-                steps=steps,
-                context_length=context_length,
-                num_samples=num_samples,
-                validation_window=validation_window,
-                temperature=temperature,
-                top_k=top_k,
-                top_p=top_p,
-            )
+        if validation is not None:
+            pseudo_rmse = _validation_rmse(batch_samples[1], validation[1])
             logger.info(f"Chronos pseudo-validation RMSE: {pseudo_rmse:.4f}")
 
         # Build metadata
@@ -439,6 +535,46 @@ def _build_forecast_points(
     return points
 
 
+def _validation_split(
+    series: pd.Series,
+    steps: int,
+    context_length: int,
+    validation_window: int,
+) -> Optional[tuple[np.ndarray, np.ndarray]]:
+    """
+    Build the pseudo-validation context and its held-out actuals.
+
+    Args:
+        series: Full historical series.
+        steps: Forecast horizon.
+        context_length: Context length for forecasting.
+        validation_window: Number of recent points for validation.
+
+    Returns:
+        (context, actuals) tuple, or None if there is not enough history.
+    """
+    split_point = len(series) - validation_window
+    train_series = series.iloc[:split_point]
+    test_actual = series.iloc[split_point : split_point + steps].values
+
+    if len(train_series) < context_length:
+        logger.warning(
+            f"Insufficient data for validation "
+            f"(need {context_length}, have {len(train_series)})"
+        )
+        return None
+
+    return train_series.iloc[-context_length:].values, test_actual
+
+
+def _validation_rmse(samples: np.ndarray, test_actual: np.ndarray) -> float:
+    """RMSE of the sample mean against actuals on the overlapping portion."""
+    mean_forecast = samples.mean(axis=0)
+    min_len = min(len(mean_forecast), len(test_actual))
+    rmse = np.sqrt(np.mean((mean_forecast[:min_len] - test_actual[:min_len]) ** 2))
+    return float(rmse)
+
+
 def _pseudo_validate(
     series: pd.Series,
     steps: int,
@@ -458,6 +594,9 @@ def _pseudo_validate(
     3. Compare forecast to actual held-out values
     4. Compute RMSE as validation metric
 
+    forecast_chronos() batches this forecast with the main one; this
+    standalone version costs a separate model call.
+
     Args:
         series: Full historical series.
         steps: Forecast horizon.
@@ -475,44 +614,22 @@ def _pseudo_validate(
         - This is a pseudo-validation (not true out-of-sample)
         - Provides rough estimate of model performance
         - More robust than in-sample metrics
-        - Computational cost: ~2x inference time
     """
     try:
-        # Split: use data up to (len - validation_window) for context
-        split_point = len(series) - validation_window
-        train_series = series.iloc[:split_point]
-        test_actual = series.iloc[split_point : split_point + steps].values
-
-        if len(train_series) < context_length:
-            logger.warning(
-                f"Insufficient data for validation "
-                f"(need {context_length}, have {len(train_series)})"
-            )
+        validation = _validation_split(series, steps, context_length, validation_window)
+        if validation is None:
             return np.nan
 
-        # Generate forecast
-        pipeline = get_chronos_pipeline()
-        context = train_series.iloc[-context_length:]
-        context_tensor = torch.tensor(context.values, dtype=torch.float32).unsqueeze(0)
-
-        forecast_samples = pipeline.predict(
-            context=context_tensor,
-            prediction_length=min(steps, len(test_actual)),
+        context, test_actual = validation
+        [samples] = predict_chronos_batch(
+            [context],
+            prediction_length=len(test_actual),
             num_samples=num_samples,
             temperature=temperature,
             top_k=top_k,
             top_p=top_p,
         )
-
-        # Extract mean forecast
-        samples = forecast_samples[0].numpy()
-        mean_forecast = samples.mean(axis=0)
-
-        # Compute RMSE on overlapping portion
-        min_len = min(len(mean_forecast), len(test_actual))
-        rmse = np.sqrt(np.mean((mean_forecast[:min_len] - test_actual[:min_len]) ** 2))
-
-        return float(rmse)
+        return _validation_rmse(samples, test_actual)
 
     except Exception as exc:
         logger.warning(f"Pseudo-validation failed: {exc}")
@@ -521,6 +638,8 @@ def _pseudo_validate(
 
 __all__ = [
     "forecast_chronos",
+    "predict_chronos_batch",
+    "DEFAULT_BATCH_SIZE",
     "get_chronos_pipeline",
     "release_chronos_pipeline",
 ]
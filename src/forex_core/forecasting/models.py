@@ -5,6 +5,7 @@ This module provides the ForecastEngine class which orchestrates:
 - Model selection (ARIMA+GARCH, VAR, Random Forest)
 - Horizon-aware resampling (daily for 7d, monthly for 12m)
 - Ensemble combination with inverse RMSE weighting
+- Optional concurrent execution of component models with latency budgets
 - Metrics logging and artifact tracking
 
 The engine supports both short-term (7-day) and long-term (12-month)
@@ -14,9 +15,17 @@ forecasting through parameterized frequency handling.
 from __future__ import annotations
 
 import json
-from datetime import datetime
+import time
+from concurrent.futures import (
+    Executor,
+    Future,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+    wait,
+)
+from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Dict, Tuple, TYPE_CHECKING, Literal
+from typing import Callable, Dict, Tuple, TYPE_CHECKING, Literal
 
 import numpy as np
 import pandas as pd
@@ -24,7 +33,13 @@ import psutil
 from sklearn.ensemble import RandomForestRegressor
 from sklearn.preprocessing import StandardScaler
 
-from .arima import auto_select_arima_order, fit_arima, forecast_arima
+from .arima import (
+    ArimaOrderCache,
+    auto_select_arima_order,
+    fit_arima,
+    forecast_arima,
+    select_arima_order,
+)
 from .garch import fit_garch, forecast_garch_volatility
 from .var import fit_var, forecast_var, var_price_reconstruction
 from .ensemble import ModelResult, EnsembleArtifacts, compute_weights, combine_forecasts
@@ -100,7 +115,7 @@ class ForecastEngine:
 
         This method:
         1. Resamples data based on horizon (daily/monthly)
-        2. Fits enabled models
+        2. Fits enabled models (concurrently if config.forecast_parallel_models)
         3. Computes ensemble weights (inverse RMSE)
         4. Combines forecasts
         5. Logs metrics and returns artifacts
@@ -123,35 +138,11 @@ class ForecastEngine:
         usdclp_series = self._resample_series(bundle.usdclp_series)
 
         # Fit models
-        results: Dict[str, ModelResult] = {}
-
-        if self.config.enable_arima:
-            try:
-                results["arima_garch"] = self._run_arima_garch(
-                    usdclp_series, self.steps
-                )
-            except Exception as exc:
-                logger.warning(f"ARIMA+GARCH failed: {exc}")
-
-        if self.config.enable_var:
-            try:
-                results["var"] = self._run_var(bundle, usdclp_series, self.steps)
-            except Exception as exc:
-                logger.warning(f"VAR failed: {exc}")
-
-        if self.config.enable_rf:
-            try:
-                results["random_forest"] = self._run_random_forest(
-                    bundle, usdclp_series, self.steps
-                )
-            except Exception as exc:
-                logger.warning(f"Random Forest failed: {exc}")
-
-        if self.config.enable_chronos:
-            try:
-                results["chronos"] = self._run_chronos(usdclp_series, self.steps)
-            except Exception as exc:
-                logger.warning(f"Chronos failed: {exc}")
+        runners = self._model_runners(bundle, usdclp_series)
+        if getattr(self.config, "forecast_parallel_models", False) and len(runners) > 1:
+            results = self._run_models_concurrently(runners)
+        else:
+            results = self._run_models_sequentially(runners)
 
         if not results:
             raise RuntimeError("No models executed successfully.")
@@ -181,6 +172,98 @@ class ForecastEngine:
 
         return ensemble_package, artifacts
 
+    def _model_runners(
+        self,
+        bundle: DataBundle,
+        usdclp_series: pd.Series
+    ) -> Dict[str, Tuple[str, Callable[..., ModelResult], tuple]]:
+        """Enabled component models as name -> (label, method, args)."""
+        runners: Dict[str, Tuple[str, Callable[..., ModelResult], tuple]] = {}
+        if self.config.enable_arima:
+            runners["arima_garch"] = (
+                "ARIMA+GARCH", self._run_arima_garch, (usdclp_series, self.steps)
+            )
+        if self.config.enable_var:
+            runners["var"] = ("VAR", self._run_var, (bundle, usdclp_series, self.steps))
+        if self.config.enable_rf:
+            runners["random_forest"] = (
+                "Random Forest", self._run_random_forest, (bundle, usdclp_series, self.steps)
+            )
+        if self.config.enable_chronos:
+            runners["chronos"] = ("Chronos", self._run_chronos, (usdclp_series, self.steps))
+        return runners
+
+    def _run_models_sequentially(
+        self,
+        runners: Dict[str, Tuple[str, Callable[..., ModelResult], tuple]]
+    ) -> Dict[str, ModelResult]:
+        """Run component models one after another; failures are skipped."""
+        results: Dict[str, ModelResult] = {}
+        for name, (label, method, args) in runners.items():
+            try:
+                results[name] = method(*args)
+            except Exception as exc:
+                logger.warning(f"{label} failed: {exc}")
+        return results
+
+    def _run_models_concurrently(
+        self,
+        runners: Dict[str, Tuple[str, Callable[..., ModelResult], tuple]]
+    ) -> Dict[str, ModelResult]:
+        """
+        Run component models on a thread or process pool with a latency budget.
+
+        Every model is dispatched at once and gets the same budget
+        (config.forecast_model_timeout_seconds). Models that fail or are
+        still running when the budget expires are dropped from the
+        ensemble. Results keep the sequential order so weighting is
+        unchanged.
+
+        In thread mode the budget only limits how long the forecast waits:
+        a model past its budget keeps running in its thread, and interpreter
+        exit still waits for it. Only process mode
+        (config.forecast_model_executor="process") terminates stragglers.
+        """
+        timeout = getattr(self.config, "forecast_model_timeout_seconds", None)
+        use_processes = getattr(self.config, "forecast_model_executor", "thread") == "process"
+        pool_cls = ProcessPoolExecutor if use_processes else ThreadPoolExecutor
+        executor: Executor = pool_cls(max_workers=len(runners))
+
+        started = time.perf_counter()
+        futures: Dict[str, Future] = {
+            name: executor.submit(method, *args)
+            for name, (_, method, args) in runners.items()
+        }
+        _, pending = wait(futures.values(), timeout=timeout)
+
+        results: Dict[str, ModelResult] = {}
+        try:
+            for name, future in futures.items():
+                label = runners[name][0]
+                if future in pending:
+                    future.cancel()
+                    logger.warning(
+                        f"{label} exceeded its {timeout:.0f}s budget; "
+                        f"dropped from the ensemble"
+                    )
+                    continue
+                try:
+                    results[name] = future.result()
+                except Exception as exc:
+                    logger.warning(f"{label} failed: {exc}")
+        finally:
+            # Do not block on stragglers; their results are discarded
+            executor.shutdown(wait=not pending, cancel_futures=True)
+            if pending and use_processes:
+                for process in list(getattr(executor, "_processes", {}).values()):
+                    process.terminate()
+
+        logger.info(
+            f"Component models finished in {time.perf_counter() - started:.1f}s "
+            f"({len(results)}/{len(runners)} succeeded)"
+        )
+        return results
+
     def _resample_series(self, series: pd.Series) -> pd.Series:
         """Resample series based on horizon (daily/monthly)."""
         if self.horizon == "monthly":
@@ -203,8 +286,8 @@ class ForecastEngine:
         # Convert to log returns
         log_returns = np.log(series).diff().dropna()
 
-        # Auto-select ARIMA order
-        order = auto_select_arima_order(log_returns, max_p=2, max_q=2)
+        # Auto-select ARIMA order (cached per horizon when enabled)
+        order = self._select_arima_order(log_returns)
 
         # Fit ARIMA
         arima_model = fit_arima(log_returns, order)
@@ -246,6 +329,44 @@ class ForecastEngine:
             extras={"order_p": order[0], "order_q": order[2], "order_tuple": order},
         )
 
+    def _select_arima_order(self, log_returns: pd.Series) -> Tuple[int, int, int]:
+        """
+        Select the ARIMA order, reusing the cached order for this horizon.
+
+        The cached order is re-searched when drift is detected on the log
+        returns, when it expires, or when the series fingerprint changes.
+        """
+        n_jobs = getattr(self.config, "arima_search_workers", 1)
+        if not getattr(self.config, "arima_order_cache_enabled", False):
+            return auto_select_arima_order(log_returns, max_p=2, max_q=2, n_jobs=n_jobs)
+
+        cache = ArimaOrderCache(Path(self.config.data_dir) / "arima_orders.json")
+        return select_arima_order(
+            log_returns,
+            cache=cache,
+            cache_key=f"{self.horizon}_{self.steps}",
+            max_age=timedelta(hours=self.config.arima_order_cache_ttl_hours),
+            drift_detected=self._drift_detected(log_returns),
+            max_p=2,
+            max_q=2,
+            n_jobs=n_jobs,
+        )
+
+    def _drift_detected(self, series: pd.Series) -> bool:
+        """KS drift test on series using the configured drift windows."""
+        from ..mlops.monitoring import DataDriftDetector
+
+        try:
+            detector = DataDriftDetector(
+                baseline_window=getattr(self.config, "drift_baseline_window", 90),
+                test_window=getattr(self.config, "drift_test_window", 30),
+                alpha=getattr(self.config, "drift_alpha", 0.05),
+            )
+            return bool(detector.detect_drift(series)["drift_detected"])
+        except Exception as exc:
+            logger.warning(f"Drift check failed, re-selecting ARIMA order: {exc}")
+            return True
+
     def _run_var(
         self,
         bundle: DataBundle,
@@ -344,39 +465,28 @@ class ForecastEngine:
         mape = calculate_mape(target.tail(window), preds_in_sample[-window:])
 
         # Multi-step forecast
-        future_path = []
-        std_series = np.full(steps, resid.std())
-        current_df = df.copy()
-        current_target = target.copy()
-
-        # Determine time offset
-        if self.horizon == "monthly":
-            time_offset = pd.offsets.MonthEnd(1)
+        strategy = getattr(self.config, "rf_forecast_strategy", "recursive")
+        if strategy == "direct" and len(df) <= steps + 20:
+            logger.warning("Too little history for direct RF forecasting, using recursive")
+            strategy = "recursive"
+        if strategy == "direct":
+            future_path = self._direct_rf_path(features_scaled, target, steps)
         else:
-            time_offset = pd.Timedelta(days=1)
-
-        for _ in range(steps):
-            latest_features = self._next_feature_row(
-                current_df, current_target, feature_cols
+            future_path = self._recursive_rf_path(
+                model, scaler, df, target, feature_cols, steps
             )
-            scaled = scaler.transform(latest_features[feature_cols])
-            pred = float(model.predict(scaled)[0])
-            future_path.append(pred)
-
-            next_idx = current_target.index[-1] + time_offset
-            current_target = pd.concat([
-                current_target,
-                pd.Series([pred], index=[next_idx])
-            ])
-            latest_features.index = [next_idx]
-            current_df = pd.concat([current_df, latest_features[feature_cols]])
+        std_series = np.full(steps, resid.std())
 
         # Build points
         points = self._build_points(usdclp_series.index[-1], future_path, std_series)
 
         package = ForecastPackage(
             series=points,
-            methodology="RandomForest (lags USD/CLP + cobre + DXY + TPM)",
+            methodology=(
+                "RandomForest (lags USD/CLP + cobre + DXY + TPM)"
+                if strategy != "direct" else
+                "RandomForest directo multi-horizonte (lags USD/CLP + cobre + DXY + TPM)"
+            ),
             error_metrics={"RMSE": rmse, "MAPE": mape},
             residual_vol=float(resid.std()),
         )
@@ -386,8 +496,88 @@ class ForecastEngine:
             package=package,
             rmse=rmse,
             mape=mape,
-            extras={"estimators": 400},
+            extras={"estimators": 400, "strategy": strategy},
+        )
+
+    def _recursive_rf_path(
+        self,
+        model: RandomForestRegressor,
+        scaler: StandardScaler,
+        features: pd.DataFrame,
+        target: pd.Series,
+        feature_cols: list[str],
+        steps: int,
+        max_lag: int = 5
+    ) -> list[float]:
+        """
+        Recursive multi-step forecast on numpy ring buffers.
+
+        Produces the same path as iterating _next_feature_row(): each
+        prediction becomes usd_lag_1 of the next step, while copper, DXY
+        and TPM are held at their last observed values. Only the last
+        max_lag values are kept, so each step is O(features) instead of
+        re-concatenating the whole history.
+        """
+        size = max_lag + steps
+        usd = np.empty(size)
+        copper = np.empty(size)
+        dxy = np.empty(size)
+        usd[:max_lag] = target.to_numpy(dtype=float)[-max_lag:]
+        copper[:max_lag] = features["copper"].to_numpy(dtype=float)[-max_lag:]
+        dxy[:max_lag] = features["dxy"].to_numpy(dtype=float)[-max_lag:]
+        copper[max_lag:] = copper[max_lag - 1]
+        dxy[max_lag:] = dxy[max_lag - 1]
+        tpm = float(features["tpm"].iloc[-1])
+
+        # Map each feature column to (buffer, lag); lag 1 = latest value
+        sources = {"usdclp": (usd, 1), "copper": (copper, 1), "dxy": (dxy, 1)}
+        for lag in range(1, max_lag + 1):
+            sources[f"usd_lag_{lag}"] = (usd, lag)
+            sources[f"copper_lag_{lag}"] = (copper, lag)
+            sources[f"dxy_lag_{lag}"] = (dxy, lag)
+
+        mean = np.asarray(scaler.mean_, dtype=float)
+        scale = np.asarray(scaler.scale_, dtype=float)
+        row = np.zeros((1, len(feature_cols)))
+
+        path: list[float] = []
+        for step in range(steps):
+            end = max_lag + step  # buffers hold valid data in [0, end)
+            for col, name in enumerate(feature_cols):
+                if name == "tpm":
+                    row[0, col] = tpm
+                elif name in sources:
+                    buffer, lag = sources[name]
+                    row[0, col] = buffer[end - lag]
+            pred = float(model.predict((row - mean) / scale)[0])
+            usd[end] = pred
+            path.append(pred)
+        return path
+
+    def _direct_rf_path(
+        self,
+        features_scaled: np.ndarray,
+        target: pd.Series,
+        steps: int
+    ) -> list[float]:
+        """
+        Direct multi-step forecast with one multi-output Random Forest.
+
+        Trains on rows whose next `steps` targets are observed (column h is
+        the value h steps ahead) and predicts every horizon from the last
+        feature row in a single predict() call.
+        """
+        values = target.to_numpy(dtype=float)
+        n_rows = len(values) - steps
+        horizons = np.column_stack([values[h:h + n_rows] for h in range(1, steps + 1)])
+
+        model = RandomForestRegressor(
+            n_estimators=400,
+            random_state=42,
+            max_depth=10
         )
+        model.fit(features_scaled[:n_rows], horizons)
+        return [float(v) for v in model.predict(features_scaled[-1:])[0]]
 
     def _run_chronos(
         self,
@@ -2,117 +2,55 @@
 MLOps utilities for model monitoring and management.
 
 This package provides tools for production ML operations:
-- Data drift detection
+- Data drift detection (batch and streaming)
 - Model performance monitoring
 - Statistical tests for distribution changes
 - Prediction tracking and out-of-sample evaluation
 - System readiness validation for feature rollout
 """
 
-from .monitoring import (
-    DataDriftDetector,
-    DriftReport,
-    DriftSeverity,
-    DriftTestResult,
-)
-
-# Try to import optional components
-_all_exports = [
-    "DataDriftDetector",
-    "DriftReport",
-    "DriftSeverity",
-    "DriftTestResult",
-]
-
-# MLflow integration (optional)
-try:
-    from .mlflow_config import MLflowConfig, is_mlflow_available
-    _all_exports.extend(["MLflowConfig", "is_mlflow_available"])
-except ImportError:
-    pass
-
-try:
-    from .tracking import PredictionTracker
-    _all_exports.append("PredictionTracker")
-except ImportError:
-    pass
-
-try:
-    from .readiness import (
-        ChronosReadinessChecker,
-        ReadinessReport,
-        ReadinessLevel,
-    )
-    _all_exports.extend([
-        "ChronosReadinessChecker",
-        "ReadinessReport",
-        "ReadinessLevel",
-    ])
-except ImportError:
-    pass
-
-try:
-    from .drift_trends import (
-        DriftTrendAnalyzer,
-        DriftTrendReport,
-        DriftTrend,
-    )
-    _all_exports.extend([
-        "DriftTrendAnalyzer",
-        "DriftTrendReport",
-        "DriftTrend",
-    ])
-except ImportError:
-    pass
-
-try:
-    from .validation import (
-        WalkForwardValidator,
-        ValidationReport,
-        ValidationMetrics,
-        ValidationMode,
-    )
-    _all_exports.extend([
-        "WalkForwardValidator",
-        "ValidationReport",
-        "ValidationMetrics",
-        "ValidationMode",
-    ])
-except ImportError:
-    pass
-
-try:
-    from .regime_detector import (
-        MarketRegimeDetector,
-        MarketRegime,
-        RegimeReport,
-        RegimeSignals,
-    )
-    _all_exports.extend([
-        "MarketRegimeDetector",
-        "MarketRegime",
-        "RegimeReport",
-        "RegimeSignals",
-    ])
-except ImportError:
-    pass
-
-try:
-    from .performance_monitor import (
-        PerformanceMonitor,
-        DegradationReport,
-        PerformanceStatus,
-        PerformanceMetrics,
-        PerformanceBaseline,
-    )
-    _all_exports.extend([
-        "PerformanceMonitor",
-        "DegradationReport",
-        "PerformanceStatus",
-        "PerformanceMetrics",
-        "PerformanceBaseline",
-    ])
-except ImportError:
-    pass
-
-__all__ = _all_exports
+from ..utils.lazy import lazy_exports
+
+# Exported name -> defining submodule. Submodules are imported on first
+# access: monitoring needs scipy, the prediction store and query layer need
+# pyarrow/duckdb, mlflow_config needs mlflow, and most callers only use one
+# of them. A missing optional dependency surfaces as ImportError when the
+# name is used.
+_EXPORTS = {
+    "DataDriftDetector": ".monitoring",
+    "DriftReport": ".monitoring",
+    "DriftSeverity": ".monitoring",
+    "DriftTestResult": ".monitoring",
+    "MLflowConfig": ".mlflow_config",
+    "is_mlflow_available": ".mlflow_config",
+    "StreamingDriftDetector": ".streaming_drift",
+    "PredictionStore": ".prediction_store",
+    "PredictionTracker": ".tracking",
+    "ErrorStats": ".rolling_metrics",
+    "RollingMetricsStore": ".rolling_metrics",
+    "MetricsQueryLayer": ".query_layer",
+    "DUCKDB_AVAILABLE": ".query_layer",
+    "ChronosReadinessChecker": ".readiness",
+    "ReadinessReport": ".readiness",
+    "ReadinessLevel": ".readiness",
+    "DriftTrendAnalyzer": ".drift_trends",
+    "DriftTrendReport": ".drift_trends",
+    "DriftTrend": ".drift_trends",
+    "WalkForwardValidator": ".validation",
+    "ValidationReport": ".validation",
+    "ValidationMetrics": ".validation",
+    "ValidationMode": ".validation",
+    "MarketRegimeDetector": ".regime_detector",
+    "MarketRegime": ".regime_detector",
+    "RegimeReport": ".regime_detector",
+    "RegimeSignals": ".regime_detector",
+    "PerformanceMonitor": ".performance_monitor",
+    "DegradationReport": ".performance_monitor",
+    "PerformanceStatus": ".performance_monitor",
+    "PerformanceMetrics": ".performance_monitor",
+    "PerformanceBaseline": ".performance_monitor",
+}
+
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
+
+__all__ = list(_EXPORTS)
@@ -22,7 +22,7 @@ from forex_core.mlops.event_detector import (
     EventSeverity,
     get_event_summary,
 )
-from forex_core.mlops.monitoring import DataDriftDetector
+from forex_core.mlops.streaming_drift import StreamingDriftDetector
 from forex_core.mlops.tracking import PredictionTracker
 
 
@@ -77,7 +77,8 @@ class AlertManager:
         # PredictionTracker uses storage_path, not data_dir
         # It will automatically use data_dir from settings if no path is provided
         self.tracker = PredictionTracker()
-        self.drift_detector = DataDriftDetector()
+        # Evaluations on the same (or a grown) series only consume new observations
+        self.drift_detector = StreamingDriftDetector()
         self.event_detector = EventDetector(
             tracker=self.tracker,
             drift_detector=self.drift_detector,
@@ -20,19 +20,49 @@ def get_prediction_summary() -> list[dict]:
     """
     Get summary of prediction tracking.
 
+    Counts, 30-day rolling RMSE and CI95 coverage are computed by the
+    DuckDB query layer when available; otherwise counts come from a
+    pandas scan of the prediction store.
+
     Returns:
         List of dicts with prediction stats per horizon.
     """
     from forex_core.config import get_settings
+    from forex_core.mlops.prediction_store import PredictionStore
+    from forex_core.mlops.query_layer import DUCKDB_AVAILABLE, MetricsQueryLayer
 
     settings = get_settings()
-    storage_path = settings.data_dir / "predictions" / "predictions.parquet"
+    store = PredictionStore.for_data_dir(settings.data_dir)
 
-    if not storage_path.exists():
+    if not store.exists():
         return []
 
     try:
-        df = pd.read_parquet(storage_path)
+        if DUCKDB_AVAILABLE:
+            layer = MetricsQueryLayer(store=store)
+            try:
+                counts = layer.query("prediction_summary")
+                rmse = layer.query("rolling_rmse", window_days=30)
+                coverage = layer.query("ci_coverage")
+            finally:
+                layer.close()
+
+            latest_rmse = rmse.groupby("horizon")["rmse"].last().to_dict()
+            coverage_by_horizon = coverage.set_index("horizon")["coverage"].to_dict()
+            return [
+                {
+                    "horizon": row.horizon,
+                    "total": int(row.total),
+                    "last_7d": int(row.last_7d),
+                    "last_30d": int(row.last_30d),
+                    "latest_date": row.latest_date.strftime("%Y-%m-%d"),
+                    "rmse_30d": latest_rmse.get(row.horizon),
+                    "ci95_coverage": coverage_by_horizon.get(row.horizon),
+                }
+                for row in counts.itertuples()
+            ]
+
+        df = store.read()
 
         summary = []
         for horizon in df["horizon"].unique():
@@ -52,6 +82,8 @@ def get_prediction_summary() -> list[dict]:
                     "last_7d": len(horizon_df[horizon_df["forecast_date"] >= cutoff_7d]),
                     "last_30d": len(horizon_df[horizon_df["forecast_date"] >= cutoff_30d]),
                     "latest_date": horizon_df["forecast_date"].max().strftime("%Y-%m-%d"),
+                    "rmse_30d": None,
+                    "ci95_coverage": None,
                 }
             )
 
@@ -75,41 +107,38 @@ def get_drift_summary() -> list[dict]:
     settings = get_settings()
     storage_path = settings.data_dir / "drift_history" / "drift_history.parquet"
 
-    if not storage_path.exists():
-        return []
-
     try:
-        analyzer = DriftTrendAnalyzer(storage_path=storage_path)
-        df = pd.read_parquet(storage_path)
-
-        summary = []
-        for horizon in df["horizon"].unique():
-            try:
-                trend_report = analyzer.analyze_trend(horizon, lookback_days=90)
-
-                # Determine status
-                if trend_report.requires_action():
-                    status = "⚠️ ACTION REQUIRED"
-                elif trend_report.trend.value == "worsening":
-                    status = "⚡ WORSENING"
-                elif trend_report.trend.value == "improving":
-                    status = "✓ IMPROVING"
-                else:
-                    status = "○ STABLE"
-
-                summary.append(
-                    {
-                        "horizon": horizon,
-                        "score": trend_report.current_score,
-                        "trend": trend_report.trend.value.upper(),
-                        "status": status,
-                    }
-                )
-
-            except Exception as e:
-                logger.warning(f"Failed to analyze drift for {horizon}: {e}")
-
-        return sorted(summary, key=lambda x: x["horizon"])
+        with DriftTrendAnalyzer(storage_path=storage_path) as analyzer:
+            horizons = analyzer.get_horizons()
+
+            summary = []
+            for horizon in horizons:
+                try:
+                    trend_report = analyzer.analyze_trend(horizon, lookback_days=90)
+
+                    # Determine status
+                    if trend_report.requires_action():
+                        status = "⚠️ ACTION REQUIRED"
+                    elif trend_report.trend.value == "worsening":
+                        status = "⚡ WORSENING"
+                    elif trend_report.trend.value == "improving":
+                        status = "✓ IMPROVING"
+                    else:
+                        status = "○ STABLE"
+
+                    summary.append(
+                        {
+                            "horizon": horizon,
+                            "score": trend_report.current_score,
+                            "trend": trend_report.trend.value.upper(),
+                            "status": status,
+                        }
+                    )
+
+                except Exception as e:
+                    logger.warning(f"Failed to analyze drift for {horizon}: {e}")
+
+            return sorted(summary, key=lambda x: x["horizon"])
 
     except Exception as e:
         logger.error(f"Failed to get drift summary: {e}")
@@ -281,13 +310,13 @@ def get_drift_details(horizon: str, days: int) -> Optional[dict]:
     settings = get_settings()
     storage_path = settings.data_dir / "drift_history" / "drift_history.parquet"
 
-    if not storage_path.exists():
-        return None
-
     try:
-        analyzer = DriftTrendAnalyzer(storage_path=storage_path)
-        trend_report = analyzer.analyze_trend(horizon, lookback_days=days)
-        history = analyzer.get_drift_history(horizon, days=30)
+        with DriftTrendAnalyzer(storage_path=storage_path) as analyzer:
+            if not analyzer.log.exists():
+                return None
+
+            trend_report = analyzer.analyze_trend(horizon, lookback_days=days)
+            history = analyzer.get_drift_history(horizon, days=30)
 
         # Prepare history for plotting
         history_list = []
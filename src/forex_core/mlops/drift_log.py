@@ -0,0 +1,230 @@
+"""
+Append-only, partitioned log of drift scores.
+
+DriftTrendAnalyzer used to keep its history in one ``drift_history.parquet``
+that was read in full, extended by one row and rewritten on every forecast
+run for every horizon, so recording got slower as history grew. This log
+writes each batch of records as a new segment instead:
+
+    <data_dir>/drift_history/drift_history_log/
+        horizon=7d/month=2025-01/part-<ns>-<id>.parquet
+
+Segments of a (horizon, month) partition are merged into one file once
+``compact_threshold`` of them accumulate, which bounds both the cost of a
+write and the number of files a read opens. Reads prune partitions by
+horizon and month before opening any file, so a 90-day lookback touches
+at most four months per horizon regardless of how long the log is.
+
+A legacy ``drift_history.parquet`` is migrated into the log on first use.
+Segment writes, compaction and migration are shared with PredictionStore
+through ``forex_core.mlops.partitioned_table``.
+
+Example:
+    >>> log = DriftHistoryLog.for_legacy_path(Path("data/drift_history/drift_history.parquet"))
+    >>> log.append(pd.DataFrame([record]))
+    >>> recent = log.read(horizon="7d", since=pd.Timestamp.now() - pd.Timedelta(days=90))
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import List, Optional
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.dataset as ds
+
+from forex_core.mlops.partitioned_table import (
+    COMPACT_THRESHOLD,
+    PARTITION_SCHEMA,
+    PartitionedTable,
+    migrate_legacy,
+)
+
+DRIFT_COLUMNS = [
+    "timestamp",
+    "horizon",
+    "drift_detected",
+    "severity",
+    "drift_score",
+    "p_value",
+    "ks_statistic",
+    "baseline_mean",
+    "recent_mean",
+    "baseline_std",
+    "recent_std",
+    "ks_drift",
+    "t_drift",
+    "levene_drift",
+    "ljungbox_drift",
+]
+_BOOL_COLUMNS = ("drift_detected", "ks_drift", "t_drift", "levene_drift", "ljungbox_drift")
+_STRING_COLUMNS = ("horizon", "severity")
+
+
+def _column_type(column: str) -> pa.DataType:
+    if column == "timestamp":
+        return pa.timestamp("ns")
+    if column in _BOOL_COLUMNS:
+        return pa.bool_()
+    if column in _STRING_COLUMNS:
+        return pa.string()
+    return pa.float64()
+
+
+# Segment columns (horizon lives in the partition path) plus the partition columns
+_DATASET_SCHEMA = pa.schema(
+    [(column, _column_type(column)) for column in DRIFT_COLUMNS if column != "horizon"]
+    + list(zip(PARTITION_SCHEMA.names, PARTITION_SCHEMA.types))
+)
+
+
+class DriftHistoryLog:
+    """
+    Drift records partitioned by horizon and month, written as new segments.
+
+    Attributes:
+        root: Log directory.
+        legacy_path: Single-file history migrated on first use, if any.
+        compact_threshold: Segments per partition that trigger compaction.
+
+    Example:
+        >>> log = DriftHistoryLog(Path("data/drift_history/drift_history_log"))
+        >>> log.append(records)
+        >>> log.read(horizon="15d").tail()
+    """
+
+    def __init__(
+        self,
+        root: Path,
+        *,
+        legacy_path: Optional[Path] = None,
+        compact_threshold: int = COMPACT_THRESHOLD,
+    ) -> None:
+        """
+        Initialize drift history log.
+
+        Args:
+            root: Log directory. Created on first write.
+            legacy_path: Legacy drift_history.parquet to migrate, if any.
+            compact_threshold: Segments per partition that trigger
+                compaction. Default: 16.
+        """
+        self.root = Path(root)
+        self.legacy_path = Path(legacy_path) if legacy_path is not None else None
+        self.table = PartitionedTable(
+            self.root, "timestamp", _DATASET_SCHEMA, compact_threshold=compact_threshold
+        )
+        self.compact_threshold = self.table.compact_threshold
+
+    @classmethod
+    def for_legacy_path(cls, path: Path, **kwargs) -> "DriftHistoryLog":
+        """
+        Log that lives next to (and replaces) a single-file history.
+
+        Args:
+            path: Legacy Parquet path, e.g. data/drift_history/drift_history.parquet.
+            **kwargs: Passed to the constructor.
+
+        Returns:
+            DriftHistoryLog rooted at ``<path.parent>/<path.stem>_log``.
+        """
+        path = Path(path)
+        return cls(path.parent / f"{path.stem}_log", legacy_path=path, **kwargs)
+
+    def append(self, records: pd.DataFrame) -> int:
+        """
+        Append drift records.
+
+        Args:
+            records: Rows with DRIFT_COLUMNS.
+
+        Returns:
+            Number of rows written.
+        """
+        self._migrate_legacy()
+        return self._append(records)
+
+    def read(
+        self,
+        horizon: Optional[str] = None,
+        since: Optional[pd.Timestamp] = None,
+        until: Optional[pd.Timestamp] = None,
+    ) -> pd.DataFrame:
+        """
+        Read records in a time window, oldest first.
+
+        Args:
+            horizon: Only this horizon. None reads all.
+            since: Inclusive lower bound on timestamp.
+            until: Exclusive upper bound on timestamp.
+
+        Returns:
+            DataFrame with DRIFT_COLUMNS. A record seen twice (a scan racing
+            a compaction lists both the merged file and its inputs) is
+            returned once.
+        """
+        self._migrate_legacy()
+        df = self.table.read(DRIFT_COLUMNS, horizon, since, until).drop_duplicates()
+        return df.sort_values("timestamp", kind="stable").reset_index(drop=True)
+
+    def horizons(self) -> List[str]:
+        """Horizons with at least one record, sorted."""
+        self._migrate_legacy()
+        if not self.root.is_dir():
+            return []
+        return sorted(
+            path.name.split("=", 1)[1]
+            for path in self.root.glob("horizon=*")
+            if any(path.rglob("part-*.parquet"))
+        )
+
+    def exists(self) -> bool:
+        """True if any record has been logged."""
+        self._migrate_legacy()
+        return self.table.exists()
+
+    def dataset(self) -> ds.Dataset:
+        """
+        Arrow dataset over the log, for external scanners such as DuckDB.
+
+        Returns:
+            Hive-partitioned dataset with explicit schema (empty if
+            nothing has been logged).
+        """
+        self._migrate_legacy()
+        return self.table.dataset()
+
+    def compact(self) -> int:
+        """
+        Merge the segments of every partition into one file each.
+
+        Returns:
+            Number of partitions compacted.
+        """
+        self._migrate_legacy()
+        return self.table.compact()
+
+    def _append(self, records: pd.DataFrame) -> int:
+        """Write one new segment per touched (horizon, month) partition."""
+        if records.empty:
+            return 0
+
+        records = records[DRIFT_COLUMNS].copy()
+        records["timestamp"] = pd.to_datetime(records["timestamp"])
+        if getattr(records["timestamp"].dt, "tz", None) is not None:
+            records["timestamp"] = records["timestamp"].dt.tz_localize(None)
+        return self.table.append(records)
+
+    def _migrate_legacy(self) -> None:
+        """Move rows from a legacy single-file history into the log."""
+        migrate_legacy(self.legacy_path, self.root, self._ingest_legacy, "drift records")
+
+    def _ingest_legacy(self, df: pd.DataFrame) -> None:
+        for column in DRIFT_COLUMNS:
+            if column not in df.columns:
+                df[column] = None
+        self._append(df)
+
+
+__all__ = ["DriftHistoryLog", "DRIFT_COLUMNS"]
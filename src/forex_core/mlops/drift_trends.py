@@ -19,8 +19,9 @@ import pandas as pd
 from loguru import logger
 from scipy import stats
 
+from forex_core.mlops.drift_log import DriftHistoryLog
 from forex_core.mlops.monitoring import DataDriftDetector, DriftReport, DriftSeverity
-from forex_core.utils.file_lock import ParquetFileLock
+from forex_core.mlops.query_layer import DUCKDB_AVAILABLE, MetricsQueryLayer
 
 
 class DriftTrend(str, Enum):
@@ -76,20 +77,27 @@ class DriftTrendAnalyzer:
 
     Mantiene un histórico de reportes de drift y detecta patrones
     de empeoramiento o mejora que justifiquen re-entrenamiento.
+
+    Mantiene una conexión DuckDB abierta: llamar close() (o usarlo como
+    context manager) al terminar.
     """
 
     def __init__(
         self,
         storage_path: Optional[Path] = None,
         drift_detector: Optional[DataDriftDetector] = None,
+        queries: Optional[MetricsQueryLayer] = None,
     ):
         """
         Initialize drift trend analyzer.
 
         Args:
-            storage_path: Path para almacenar histórico de drift.
+            storage_path: Path del histórico de drift (legacy). El log
+                         append-only se crea en ``<parent>/<stem>_log``.
                          Por defecto: data/drift_history/drift_history.parquet
             drift_detector: Detector de drift a usar.
+            queries: Query layer compartido sobre el mismo log. Solo se
+                     cierra el layer creado por este analizador.
         """
         if storage_path is None:
             from forex_core.config import get_settings
@@ -100,9 +108,26 @@ class DriftTrendAnalyzer:
         self.storage_path = storage_path
         self.storage_path.parent.mkdir(parents=True, exist_ok=True)
 
+        self.log = DriftHistoryLog.for_legacy_path(self.storage_path)
+
         self.drift_detector = drift_detector or DataDriftDetector()
+        # History reads go through DuckDB (filter pushdown) when installed
+        self._owns_queries = queries is None and DUCKDB_AVAILABLE
+        self._queries = MetricsQueryLayer(drift_log=self.log) if self._owns_queries else queries
+
+        logger.info(f"DriftTrendAnalyzer initialized with storage: {self.log.root}")
+
+    def close(self) -> None:
+        """Cierra el query layer si lo creó este analizador (idempotente)."""
+        if self._owns_queries and self._queries is not None:
+            self._queries.close()
+            self._queries = None
+
+    def __enter__(self) -> "DriftTrendAnalyzer":
+        return self
 
-        logger.info(f"DriftTrendAnalyzer initialized with storage: {storage_path}")
+    def __exit__(self, *exc) -> None:
+        self.close()
 
     def record_drift(self, report: DriftReport, horizon: str) -> None:
         """
@@ -136,16 +161,8 @@ class DriftTrendAnalyzer:
             and report.tests["ljungbox_test"].drift_detected,
         }
 
-        # Load existing history or create new DataFrame
-        if self.storage_path.exists():
-            df = pd.read_parquet(self.storage_path)
-            df = pd.concat([df, pd.DataFrame([record])], ignore_index=True)
-        else:
-            df = pd.DataFrame([record])
-
-        # Save updated history (with file lock for process safety)
-        with ParquetFileLock(self.storage_path, timeout=30.0):
-            df.to_parquet(self.storage_path, index=False)
+        # Append-only: one new segment, independent of history length
+        self.log.append(pd.DataFrame([record]))
 
         logger.info(
             f"Drift recorded for {horizon}: score={drift_score:.1f}, "
@@ -236,21 +253,24 @@ class DriftTrendAnalyzer:
         Returns:
             DataFrame con histórico de drift.
         """
-        if not self.storage_path.exists():
+        if not self.log.exists():
             return pd.DataFrame()
 
-        df = pd.read_parquet(self.storage_path)
+        # Only the requested horizon/lookback partitions are read
+        since = datetime.now() - pd.Timedelta(days=days) if days else None
+        if self._queries is not None:
+            return self._queries.query("drift_history", horizon=horizon or None, since=since)
 
-        # Filter by horizon if specified
-        if horizon:
-            df = df[df["horizon"] == horizon].copy()
+        return self.log.read(horizon=horizon or None, since=since)
 
-        # Filter by days if specified
-        if days:
-            cutoff = datetime.now() - pd.Timedelta(days=days)
-            df = df[pd.to_datetime(df["timestamp"]) >= cutoff].copy()
+    def get_horizons(self) -> list[str]:
+        """
+        Horizontes con histórico de drift registrado.
 
-        return df.sort_values("timestamp").reset_index(drop=True)
+        Returns:
+            Lista ordenada de horizontes.
+        """
+        return self.log.horizons()
 
     def _calculate_drift_score(self, report: DriftReport) -> float:
         """
@@ -70,7 +70,7 @@ class EventDetector:
 
         Args:
             tracker: Prediction tracker para histórico
-            drift_detector: Detector de drift en datos
+            drift_detector: Detector de drift en datos (batch o StreamingDriftDetector)
             change_threshold: % mínimo de cambio para alertar
             volatility_threshold: Multiplicador de vol para alertar
         """
@@ -174,12 +174,16 @@ class EventDetector:
             report = self.drift_detector.generate_drift_report(series)
 
             if report.has_significant_drift():
+                ks_test = report.tests["ks_test"]
+                t_test = report.tests["t_test"]
+                levene_test = report.tests["levene_test"]
+
                 # Count significant drifts
                 drift_count = sum(
                     [
-                        report.ks_test.is_significant,
-                        report.t_test.is_significant,
-                        report.levene_test.is_significant,
+                        ks_test.is_significant,
+                        t_test.is_significant,
+                        levene_test.is_significant,
                     ]
                 )
 
@@ -188,11 +192,11 @@ class EventDetector:
                 )
 
                 drift_types = []
-                if report.ks_test.is_significant:
+                if ks_test.is_significant:
                     drift_types.append("distribución")
-                if report.t_test.is_significant:
+                if t_test.is_significant:
                     drift_types.append("media")
-                if report.levene_test.is_significant:
+                if levene_test.is_significant:
                     drift_types.append("varianza")
 
                 return DetectedEvent(
@@ -200,9 +204,9 @@ class EventDetector:
                     severity=severity,
                     description=f"Drift detectado en {', '.join(drift_types)}",
                     metrics={
-                        "ks_pvalue": report.ks_test.p_value,
-                        "t_pvalue": report.t_test.p_value,
-                        "levene_pvalue": report.levene_test.p_value,
+                        "ks_pvalue": ks_test.p_value,
+                        "t_pvalue": t_test.p_value,
+                        "levene_pvalue": levene_test.p_value,
                         "drift_count": drift_count,
                     },
                     timestamp=datetime.now(),
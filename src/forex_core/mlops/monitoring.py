@@ -242,9 +242,27 @@ class DataDriftDetector:
         if baseline is None or recent is None:
             return False
 
-        baseline_std = baseline.std()
-        recent_std = recent.std()
+        return self._is_volatility_regime_change(
+            baseline.std(), recent.std(), threshold_ratio
+        )
 
+    def _is_volatility_regime_change(
+        self,
+        baseline_std: float,
+        recent_std: float,
+        threshold_ratio: float = 1.5,
+    ) -> bool:
+        """
+        Compare window standard deviations against the regime threshold.
+
+        Args:
+            baseline_std: Standard deviation of the baseline window.
+            recent_std: Standard deviation of the recent window.
+            threshold_ratio: Ratio threshold for regime change.
+
+        Returns:
+            True if the volatility ratio is outside [1/threshold, threshold].
+        """
         if baseline_std == 0:
             logger.warning("Baseline standard deviation is zero")
             return False
@@ -504,6 +522,48 @@ class DataDriftDetector:
             "ljungbox_test": autocorr_change,
         }
 
+        return self._assemble_report(
+            tests_dict,
+            volatility_regime,
+            ks_statistic=ks_result["statistic"],
+            baseline_mean=float(baseline.mean()),
+            recent_mean=float(recent.mean()),
+            baseline_std=float(baseline.std()),
+            recent_std=float(recent.std()),
+            baseline_size=len(baseline),
+            recent_size=len(recent),
+        )
+
+    def _assemble_report(
+        self,
+        tests_dict: Dict[str, DriftTestResult],
+        volatility_regime: bool,
+        ks_statistic: float,
+        baseline_mean: float,
+        recent_mean: float,
+        baseline_std: float,
+        recent_std: float,
+        baseline_size: int,
+        recent_size: int,
+    ) -> DriftReport:
+        """
+        Aggregate individual test results into a DriftReport.
+
+        Args:
+            tests_dict: Results keyed by ks_test, t_test, levene_test and
+                ljungbox_test.
+            volatility_regime: Whether the volatility regime changed.
+            ks_statistic: KS statistic reported as the primary indicator.
+            baseline_mean: Mean of the baseline window.
+            recent_mean: Mean of the recent window.
+            baseline_std: Sample standard deviation of the baseline window.
+            recent_std: Sample standard deviation of the recent window.
+            baseline_size: Observations in the baseline window.
+            recent_size: Observations in the recent window.
+
+        Returns:
+            DriftReport with overall assessment and recommendation.
+        """
         # Overall drift detection (True if ANY test detected drift)
         drift_detected = (
             any(test.drift_detected for test in tests_dict.values())
@@ -524,13 +584,13 @@ class DataDriftDetector:
             drift_detected=drift_detected,
             severity=severity,
             p_value=min_p_value,
-            statistic=ks_result["statistic"],
-            baseline_mean=float(baseline.mean()),
-            recent_mean=float(recent.mean()),
-            baseline_std=float(baseline.std()),
-            recent_std=float(recent.std()),
-            baseline_size=len(baseline),
-            recent_size=len(recent),
+            statistic=ks_statistic,
+            baseline_mean=baseline_mean,
+            recent_mean=recent_mean,
+            baseline_std=baseline_std,
+            recent_std=recent_std,
+            baseline_size=baseline_size,
+            recent_size=recent_size,
             tests=tests_dict,
             recommendation=recommendation,
             timestamp=datetime.now(),
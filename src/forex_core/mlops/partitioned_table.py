@@ -0,0 +1,282 @@
+"""
+Append-only Parquet tables partitioned by horizon and month.
+
+PredictionStore and DriftHistoryLog share this storage scheme:
+
+    <root>/horizon=7d/month=2025-01/part-<ns>-<id>.parquet
+
+Rows are never rewritten in place. Every append publishes one new part
+file per touched partition (written to a dot-prefixed temp file, then
+renamed), and a partition is merged into a single file once
+``compact_threshold`` part files accumulate. The merged file is published
+before its inputs are removed, so a concurrent reader sees either the
+inputs, the merged file, or briefly both; a reader racing the removal
+gets FileNotFoundError and rescans.
+
+Example:
+    >>> table = PartitionedTable(root, "timestamp", schema)
+    >>> table.append(records)
+    >>> table.read(columns, horizon="7d", since=pd.Timestamp("2025-01-01"))
+"""
+
+from __future__ import annotations
+
+import os
+import time
+import uuid
+from pathlib import Path
+from typing import Callable, List, Optional, Sequence
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.dataset as ds
+import pyarrow.parquet as pq
+from loguru import logger
+
+from forex_core.utils.file_lock import FileLock
+
+COMPACT_THRESHOLD = 16
+READ_ATTEMPTS = 3
+
+PARTITION_SCHEMA = pa.schema([("horizon", pa.string()), ("month", pa.string())])
+_PARTITIONING = ds.partitioning(PARTITION_SCHEMA, flavor="hive")
+
+
+class PartitionedTable:
+    """
+    One Hive-partitioned table of immutable part files.
+
+    Attributes:
+        root: Table directory.
+        time_column: Timestamp column that assigns rows to a month.
+        schema: Dataset schema (file columns plus horizon and month).
+        compact_threshold: Part files per partition that trigger compaction.
+        merge: Applied to a partition's concatenated rows before they are
+            written back as one file (deduplication, sort order).
+
+    Example:
+        >>> table = PartitionedTable(root, "forecast_date", schema, compact_threshold=8)
+        >>> table.append(rows)
+        >>> table.compact()
+    """
+
+    def __init__(
+        self,
+        root: Path,
+        time_column: str,
+        schema: pa.Schema,
+        *,
+        compact_threshold: int = COMPACT_THRESHOLD,
+        merge: Optional[Callable[[pd.DataFrame], pd.DataFrame]] = None,
+    ) -> None:
+        """
+        Initialize partitioned table.
+
+        Args:
+            root: Table directory. Created on first write.
+            time_column: Naive datetime64 column used for the month partition.
+            schema: Dataset schema including the horizon and month fields.
+            compact_threshold: Part files per partition that trigger
+                compaction. Default: 16.
+            merge: Partition merge step. Default: sort by time_column.
+        """
+        self.root = Path(root)
+        self.time_column = time_column
+        self.schema = schema
+        self.compact_threshold = max(2, compact_threshold)
+        self.merge = merge or (lambda rows: rows.sort_values(time_column, kind="stable"))
+        self._file_schema = pa.schema(
+            [field for field in schema if field.name not in PARTITION_SCHEMA.names]
+        )
+
+    # ------------------------------------------------------------------
+    # Writes
+    # ------------------------------------------------------------------
+
+    def append(self, rows: pd.DataFrame) -> int:
+        """
+        Write one new part file per touched (horizon, month) partition.
+
+        Args:
+            rows: Rows with a horizon column and the file columns;
+                time_column must already be naive datetime64.
+
+        Returns:
+            Number of rows written.
+        """
+        if rows.empty:
+            return 0
+
+        months = rows[self.time_column].dt.strftime("%Y-%m")
+        for (horizon, month), group in rows.groupby([rows["horizon"], months], sort=False):
+            directory = self.partition_dir(horizon, month)
+            directory.mkdir(parents=True, exist_ok=True)
+            self.write_part(directory, group.drop(columns="horizon"))
+
+            if len(part_files(directory)) >= self.compact_threshold:
+                self.compact_partition(directory)
+
+        return len(rows)
+
+    def write_part(self, directory: Path, rows: pd.DataFrame, suffix: str = "") -> Path:
+        """Atomically publish a part file (readers ignore dot-prefixed temps)."""
+        name = f"part-{time.time_ns():020d}-{uuid.uuid4().hex[:8]}{suffix}.parquet"
+        tmp = directory / f".{name}"
+        table = pa.Table.from_pandas(rows, schema=self._file_schema, preserve_index=False)
+        pq.write_table(table, tmp)
+        os.replace(tmp, directory / name)
+        return directory / name
+
+    def compact(self) -> int:
+        """
+        Merge the part files of every partition into one file each.
+
+        Returns:
+            Number of partitions compacted.
+        """
+        compacted = 0
+        for directory in sorted(self.root.glob("horizon=*/month=*")):
+            if len(part_files(directory)) > 1:
+                self.compact_partition(directory)
+                compacted += 1
+        return compacted
+
+    def compact_partition(self, directory: Path) -> None:
+        """Replace a partition's part files with one merged file."""
+        with FileLock(directory.parent / f".{directory.name}.compact.lock"):
+            parts = part_files(directory)
+            if len(parts) < 2:
+                return
+            merged = pa.concat_tables(
+                [pq.read_table(path, schema=self._file_schema) for path in parts]
+            ).to_pandas()
+
+            self.write_part(directory, self.merge(merged), suffix="-compact")
+            for path in parts:
+                path.unlink(missing_ok=True)
+
+        logger.debug(f"Compacted {self.root.name} partition {directory.parent.name}/"
+                     f"{directory.name} ({len(parts)} files, {len(merged)} rows)")
+
+    # ------------------------------------------------------------------
+    # Reads
+    # ------------------------------------------------------------------
+
+    def dataset(self) -> ds.Dataset:
+        """Hive-partitioned dataset (empty if nothing has been written)."""
+        if not self.root.is_dir():
+            return ds.dataset(pa.Table.from_pylist([], schema=self.schema))
+        return ds.dataset(
+            self.root,
+            schema=self.schema,
+            format="parquet",
+            partitioning=_PARTITIONING,
+        )
+
+    def read(
+        self,
+        columns: Sequence[str],
+        horizon: Optional[str] = None,
+        since: Optional[pd.Timestamp] = None,
+        until: Optional[pd.Timestamp] = None,
+    ) -> pd.DataFrame:
+        """
+        Scan with partition and row-group pruning.
+
+        Args:
+            columns: Columns to read.
+            horizon: Only this horizon. None reads all.
+            since: Inclusive lower bound on time_column.
+            until: Exclusive upper bound on time_column.
+
+        Returns:
+            Matching rows in no particular order. Rows seen twice by a scan
+            racing a compaction are not removed here.
+        """
+        conditions = []
+        if horizon is not None:
+            conditions.append(ds.field("horizon") == horizon)
+        if since is not None:
+            since = _naive(since)
+            conditions.append(ds.field("month") >= month_of(since))
+            conditions.append(ds.field(self.time_column) >= pa.scalar(since, pa.timestamp("ns")))
+        if until is not None:
+            until = _naive(until)
+            conditions.append(ds.field("month") <= month_of(until))
+            conditions.append(ds.field(self.time_column) < pa.scalar(until, pa.timestamp("ns")))
+
+        expression = None
+        for condition in conditions:
+            expression = condition if expression is None else expression & condition
+
+        for attempt in range(READ_ATTEMPTS):
+            try:
+                return self.dataset().to_table(columns=list(columns), filter=expression).to_pandas()
+            except FileNotFoundError:
+                # A part file was removed by a concurrent compaction; rescan
+                if attempt == READ_ATTEMPTS - 1:
+                    raise
+
+    def exists(self) -> bool:
+        """True if any part file has been written."""
+        return self.root.is_dir() and any(self.root.rglob("part-*.parquet"))
+
+    def partition_dir(self, horizon: str, month: str) -> Path:
+        return self.root / f"horizon={horizon}" / f"month={month}"
+
+
+def migrate_legacy(
+    legacy_path: Optional[Path],
+    root: Path,
+    ingest: Callable[[pd.DataFrame], object],
+    description: str,
+) -> None:
+    """
+    Move rows of a legacy single Parquet file into a partitioned store.
+
+    Runs once: the legacy file is renamed to ``<name>.migrated`` afterwards,
+    and concurrent callers wait on a lock under ``root``.
+
+    Args:
+        legacy_path: Legacy file; nothing happens if it is None or missing.
+        root: Store directory holding the migration lock.
+        ingest: Appends the legacy rows to the store.
+        description: What the rows are, for the log message.
+    """
+    if legacy_path is None or not legacy_path.exists() or legacy_path.stat().st_size == 0:
+        return
+
+    root.mkdir(parents=True, exist_ok=True)
+    with FileLock(root / ".migrate.lock"):
+        if not legacy_path.exists():
+            return  # Migrated by another process while we waited
+
+        df = pd.read_parquet(legacy_path)
+        ingest(df)
+
+        os.replace(legacy_path, legacy_path.with_name(f"{legacy_path.name}.migrated"))
+        logger.info(f"Migrated {len(df)} {description} from {legacy_path} into {root}")
+
+
+def part_files(directory: Path) -> List[Path]:
+    """Published part files of a partition, oldest first."""
+    return sorted(directory.glob("part-*.parquet"))
+
+
+def month_of(timestamp: pd.Timestamp) -> str:
+    """Month partition value ("YYYY-MM") of a timestamp."""
+    return pd.Timestamp(timestamp).strftime("%Y-%m")
+
+
+def _naive(timestamp: pd.Timestamp) -> pd.Timestamp:
+    timestamp = pd.Timestamp(timestamp)
+    return timestamp.tz_localize(None) if timestamp.tzinfo is not None else timestamp
+
+
+__all__ = [
+    "PartitionedTable",
+    "PARTITION_SCHEMA",
+    "migrate_legacy",
+    "month_of",
+    "part_files",
+]
@@ -26,11 +26,14 @@ from enum import Enum
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 
-import numpy as np
 import pandas as pd
 from loguru import logger
 from scipy import stats
 
+from forex_core.mlops.prediction_store import PredictionStore
+from forex_core.mlops.query_layer import DUCKDB_AVAILABLE, MetricsQueryLayer
+from forex_core.mlops.rolling_metrics import ErrorStats, RollingMetricsStore
+
 
 class PerformanceStatus(str, Enum):
     """Performance status levels."""
@@ -120,16 +123,27 @@ class PerformanceMonitor:
     Monitors forecast accuracy metrics (RMSE, MAPE, MAE) and compares
     recent performance against historical baseline to detect degradation.
 
+    Metrics come from per-day sufficient statistics maintained by
+    RollingMetricsStore as actuals land, so a check costs the same no
+    matter how many predictions are stored. With ``incremental=False``
+    the statistics are computed from a scan of the prediction store.
+
     Args:
-        data_dir: Directory containing predictions parquet file.
+        data_dir: Directory containing the predictions store.
         baseline_days: Days of history for baseline (default: 60).
         recent_days: Days of recent data to check (default: 14).
         degradation_threshold: % degradation to trigger alert (default: 15%).
         significance_level: P-value threshold for statistical tests (default: 0.05).
+        incremental: Use the persisted rolling statistics (default: True).
+        queries: Shared query layer over the same store. The monitor only
+            closes a layer it created itself.
+
+    The monitor holds a DuckDB connection; close() it (or use it as a
+    context manager) when done.
 
     Example:
-        >>> monitor = PerformanceMonitor(data_dir=Path("data"))
-        >>> report = monitor.check_performance(horizon="7d")
+        >>> with PerformanceMonitor(data_dir=Path("data")) as monitor:
+        ...     report = monitor.check_performance(horizon="7d")
         >>>
         >>> if report.degradation_detected:
         ...     print(f"Status: {report.status.value}")
@@ -144,6 +158,8 @@ class PerformanceMonitor:
         recent_days: int = 14,
         degradation_threshold: float = 0.15,
         significance_level: float = 0.05,
+        incremental: bool = True,
+        queries: Optional[MetricsQueryLayer] = None,
     ):
         self.data_dir = data_dir
         self.baseline_days = baseline_days
@@ -151,13 +167,28 @@ class PerformanceMonitor:
         self.degradation_threshold = degradation_threshold
         self.significance_level = significance_level
 
-        self.predictions_path = data_dir / "predictions" / "predictions.parquet"
+        self.store = PredictionStore.for_data_dir(data_dir)
+        self._owns_queries = queries is None and DUCKDB_AVAILABLE
+        self.queries = MetricsQueryLayer(store=self.store) if self._owns_queries else queries
+        self.metrics = RollingMetricsStore(self.store) if incremental else None
 
         logger.info(
             f"PerformanceMonitor initialized: baseline={baseline_days}d, "
             f"recent={recent_days}d, threshold={degradation_threshold:.0%}"
         )
 
+    def close(self) -> None:
+        """Close the query layer if this monitor created it (idempotent)."""
+        if self._owns_queries and self.queries is not None:
+            self.queries.close()
+            self.queries = None
+
+    def __enter__(self) -> "PerformanceMonitor":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
     def check_performance(self, horizon: str) -> DegradationReport:
         """
         Check for performance degradation for a specific horizon.
@@ -175,34 +206,30 @@ class PerformanceMonitor:
         """
         logger.info(f"Checking performance for horizon: {horizon}")
 
-        # Load predictions with actuals
-        predictions = self._load_predictions_with_actuals(horizon)
+        baseline_stats, recent_stats = self._window_stats(horizon)
 
-        if len(predictions) == 0:
+        if baseline_stats.n == 0 and recent_stats.n == 0:
             logger.warning(f"No predictions with actuals for {horizon}")
             return self._create_no_data_report(horizon)
 
-        # Split into baseline and recent periods
-        baseline_df, recent_df = self._split_baseline_recent(predictions)
-
-        if len(baseline_df) < 10:
-            logger.warning(f"Insufficient baseline data for {horizon}: {len(baseline_df)} samples")
-            return self._create_insufficient_baseline_report(horizon, recent_df)
+        if baseline_stats.n < 10:
+            logger.warning(f"Insufficient baseline data for {horizon}: {baseline_stats.n} samples")
+            return self._create_insufficient_baseline_report(horizon, recent_stats)
 
-        if len(recent_df) < 5:
-            logger.warning(f"Insufficient recent data for {horizon}: {len(recent_df)} samples")
-            return self._create_insufficient_recent_report(horizon, baseline_df)
+        if recent_stats.n < 5:
+            logger.warning(f"Insufficient recent data for {horizon}: {recent_stats.n} samples")
+            return self._create_insufficient_recent_report(horizon, baseline_stats)
 
         # Calculate metrics
-        baseline_metrics = self._calculate_metrics(baseline_df)
-        recent_metrics = self._calculate_metrics(recent_df)
+        baseline_metrics = self._calculate_metrics(baseline_stats)
+        recent_metrics = self._calculate_metrics(recent_stats)
 
         # Build baselines
-        baselines = self._build_baselines(baseline_df, baseline_metrics)
+        baselines = self._build_baselines(baseline_stats, baseline_metrics)
 
         # Detect degradation
         degradation_pct, p_values = self._detect_degradation(
-            recent_df, baseline_df, recent_metrics, baselines
+            recent_stats, baseline_stats, recent_metrics, baselines
         )
 
         # Determine status
@@ -256,18 +283,31 @@ class PerformanceMonitor:
 
         return reports
 
+    def _window_stats(self, horizon: str) -> Tuple[ErrorStats, ErrorStats]:
+        """Error statistics of the baseline and recent windows."""
+        if self.metrics is None:
+            predictions = self._load_predictions_with_actuals(horizon)
+            baseline_df, recent_df = self._split_baseline_recent(predictions)
+            return ErrorStats.from_predictions(baseline_df), ErrorStats.from_predictions(recent_df)
+
+        # Day-granular windows: recent = last recent_days days including today
+        today = pd.Timestamp.now().normalize()
+        recent_start = today - timedelta(days=self.recent_days)
+        baseline_start = recent_start - timedelta(days=self.baseline_days)
+        return (
+            self.metrics.window(horizon, baseline_start, recent_start),
+            self.metrics.window(horizon, recent_start, today),
+        )
+
     def _load_predictions_with_actuals(self, horizon: str) -> pd.DataFrame:
         """Load predictions that have actual values."""
-        if not self.predictions_path.exists():
-            return pd.DataFrame()
-
-        df = pd.read_parquet(self.predictions_path)
-
-        # Filter by horizon
-        df = df[df["horizon"] == horizon]
-
-        # Only predictions with actuals
-        df = df[df["actual_value"].notna()]
+        # Only the horizon's partitions covering the baseline + recent windows
+        window_start = pd.Timestamp.now() - timedelta(days=self.baseline_days + self.recent_days)
+        if self.queries is not None:
+            return self.queries.query(
+                "predictions", horizon=horizon, since=window_start, has_actual=True
+            )
+        df = self.store.read(horizon=horizon, since=window_start, has_actual=True)
 
         # Sort by forecast date
         df = df.sort_values("forecast_date")
@@ -296,131 +336,88 @@ class PerformanceMonitor:
 
         return baseline_df, recent_df
 
-    def _calculate_metrics(self, df: pd.DataFrame) -> PerformanceMetrics:
-        """Calculate performance metrics from predictions."""
-        errors = df["actual_value"] - df["predicted_value"]
-        abs_errors = np.abs(errors)
-        pct_errors = abs_errors / np.abs(df["actual_value"])
-
-        rmse = np.sqrt(np.mean(errors**2))
-        mae = np.mean(abs_errors)
-        mape = np.mean(pct_errors) * 100  # Percentage
-
-        # CI95 coverage
-        in_ci = (df["actual_value"] >= df["ci95_low"]) & (df["actual_value"] <= df["ci95_high"])
-        ci95_coverage = in_ci.mean()
-
-        # Bias (mean error)
-        bias = np.mean(errors)
-
+    def _calculate_metrics(self, window: ErrorStats) -> PerformanceMetrics:
+        """Calculate performance metrics from a window's error statistics."""
         return PerformanceMetrics(
-            rmse=rmse,
-            mae=mae,
-            mape=mape,
-            ci95_coverage=ci95_coverage,
-            bias=bias,
-            n_predictions=len(df),
+            rmse=window.rmse,
+            mae=window.mae,
+            mape=window.mape,
+            ci95_coverage=window.ci95_coverage,
+            bias=window.bias,
+            n_predictions=window.n,
         )
 
     def _build_baselines(
-        self, baseline_df: pd.DataFrame, metrics: PerformanceMetrics
+        self, window: ErrorStats, metrics: PerformanceMetrics
     ) -> Dict[str, PerformanceBaseline]:
         """Build baseline statistics for each metric."""
-        # Calculate per-prediction errors for std calculation
-        errors = baseline_df["actual_value"] - baseline_df["predicted_value"]
-        abs_errors = np.abs(errors)
-        pct_errors = abs_errors / np.abs(baseline_df["actual_value"])
-
-        baselines = {
-            "rmse": PerformanceBaseline(
-                metric="rmse",
-                mean=metrics.rmse,
-                std=np.std(np.sqrt(errors**2)),  # Std of squared errors
-                n_samples=len(baseline_df),
-                period_start=baseline_df["forecast_date"].min().to_pydatetime(),
-                period_end=baseline_df["forecast_date"].max().to_pydatetime(),
-            ),
-            "mae": PerformanceBaseline(
-                metric="mae",
-                mean=metrics.mae,
-                std=np.std(abs_errors),
-                n_samples=len(baseline_df),
-                period_start=baseline_df["forecast_date"].min().to_pydatetime(),
-                period_end=baseline_df["forecast_date"].max().to_pydatetime(),
-            ),
-            "mape": PerformanceBaseline(
-                metric="mape",
-                mean=metrics.mape,
-                std=np.std(pct_errors) * 100,  # Percentage
-                n_samples=len(baseline_df),
-                period_start=baseline_df["forecast_date"].min().to_pydatetime(),
-                period_end=baseline_df["forecast_date"].max().to_pydatetime(),
-            ),
+        spreads = {
+            "rmse": window.abs_error_std,  # Spread of per-prediction |error|
+            "mae": window.abs_error_std,
+            "mape": window.ape_std,
         }
 
-        return baselines
+        return {
+            metric: PerformanceBaseline(
+                metric=metric,
+                mean=getattr(metrics, metric),
+                std=std,
+                n_samples=window.n,
+                period_start=window.start,
+                period_end=window.end,
+            )
+            for metric, std in spreads.items()
+        }
 
     def _detect_degradation(
         self,
-        recent_df: pd.DataFrame,
-        baseline_df: pd.DataFrame,
+        recent: ErrorStats,
+        baseline: ErrorStats,
         recent_metrics: PerformanceMetrics,
         baselines: Dict[str, PerformanceBaseline],
     ) -> Tuple[Dict[str, float], Dict[str, float]]:
         """
         Detect degradation using statistical tests.
 
+        Uses one-sided Welch t-tests on squared (RMSE), absolute (MAE) and
+        percentage (MAPE) errors, which only need each window's count, mean
+        and variance.
+
         Returns:
             Tuple of (degradation_pct, p_values) dictionaries.
         """
         degradation_pct = {}
         p_values = {}
 
-        # Calculate recent errors
-        recent_errors = recent_df["actual_value"] - recent_df["predicted_value"]
-        recent_abs_errors = np.abs(recent_errors)
-        recent_pct_errors = recent_abs_errors / np.abs(recent_df["actual_value"])
+        for metric in ("rmse", "mae", "mape"):
+            degradation_pct[metric] = (
+                (getattr(recent_metrics, metric) - baselines[metric].mean)
+                / baselines[metric].mean
+            ) * 100
 
-        # Baseline errors
-        baseline_errors = baseline_df["actual_value"] - baseline_df["predicted_value"]
-        baseline_abs_errors = np.abs(baseline_errors)
-        baseline_pct_errors = baseline_abs_errors / np.abs(baseline_df["actual_value"])
-
-        # RMSE degradation
-        degradation_pct["rmse"] = (
-            (recent_metrics.rmse - baselines["rmse"].mean) / baselines["rmse"].mean
-        ) * 100
-
-        # Mann-Whitney U test (non-parametric, robust to outliers)
-        _, p_rmse = stats.mannwhitneyu(
-            np.abs(recent_errors), np.abs(baseline_errors), alternative="greater"
+        _, p_sq = stats.ttest_ind_from_stats(
+            recent.sum_sq_error / recent.n, recent.sq_error_std, recent.n,
+            baseline.sum_sq_error / baseline.n, baseline.sq_error_std, baseline.n,
+            equal_var=False, alternative="greater",
         )
-        p_values["rmse"] = p_rmse
-
-        # MAE degradation
-        degradation_pct["mae"] = (
-            (recent_metrics.mae - baselines["mae"].mean) / baselines["mae"].mean
-        ) * 100
-
-        _, p_mae = stats.mannwhitneyu(
-            recent_abs_errors, baseline_abs_errors, alternative="greater"
+        _, p_abs = stats.ttest_ind_from_stats(
+            recent.mae, recent.abs_error_std, recent.n,
+            baseline.mae, baseline.abs_error_std, baseline.n,
+            equal_var=False, alternative="greater",
         )
-        p_values["mae"] = p_mae
-
-        # MAPE degradation
-        degradation_pct["mape"] = (
-            (recent_metrics.mape - baselines["mape"].mean) / baselines["mape"].mean
-        ) * 100
-
-        _, p_mape = stats.mannwhitneyu(
-            recent_pct_errors, baseline_pct_errors, alternative="greater"
+        _, p_mape = stats.ttest_ind_from_stats(
+            recent.mape, recent.ape_std, recent.n_ape,
+            baseline.mape, baseline.ape_std, baseline.n_ape,
+            equal_var=False, alternative="greater",
         )
-        p_values["mape"] = p_mape
+        p_values["rmse"] = float(p_sq)
+        p_values["mae"] = float(p_abs)
+        p_values["mape"] = float(p_mape)
 
         logger.debug(
-            f"Degradation: RMSE={degradation_pct['rmse']:+.1f}% (p={p_rmse:.3f}), "
-            f"MAE={degradation_pct['mae']:+.1f}% (p={p_mae:.3f}), "
-            f"MAPE={degradation_pct['mape']:+.1f}% (p={p_mape:.3f})"
+            f"Degradation: RMSE={degradation_pct['rmse']:+.1f}% (p={p_values['rmse']:.3f}), "
+            f"MAE={degradation_pct['mae']:+.1f}% (p={p_values['mae']:.3f}), "
+            f"MAPE={degradation_pct['mape']:+.1f}% (p={p_values['mape']:.3f})"
         )
 
         return degradation_pct, p_values
@@ -516,10 +513,10 @@ class PerformanceMonitor:
         )
 
     def _create_insufficient_baseline_report(
-        self, horizon: str, recent_df: pd.DataFrame
+        self, horizon: str, recent: ErrorStats
     ) -> DegradationReport:
         """Create report when baseline data insufficient."""
-        recent_metrics = self._calculate_metrics(recent_df) if len(recent_df) > 0 else PerformanceMetrics(0, 0, 0, 0, 0, 0)
+        recent_metrics = self._calculate_metrics(recent)
 
         return DegradationReport(
             horizon=horizon,
@@ -529,16 +526,15 @@ class PerformanceMonitor:
             baseline_metrics={},
             degradation_pct={},
             p_value={},
-            recommendation=f"Insufficient baseline data ({len(recent_df)} samples) - need {self.baseline_days} days of history.",
+            recommendation=f"Insufficient baseline data ({recent.n} samples) - need {self.baseline_days} days of history.",
             timestamp=datetime.now(),
         )
 
     def _create_insufficient_recent_report(
-        self, horizon: str, baseline_df: pd.DataFrame
+        self, horizon: str, baseline: ErrorStats
     ) -> DegradationReport:
         """Create report when recent data insufficient."""
-        baseline_metrics_calc = self._calculate_metrics(baseline_df)
-        baselines = self._build_baselines(baseline_df, baseline_metrics_calc)
+        baselines = self._build_baselines(baseline, self._calculate_metrics(baseline))
 
         return DegradationReport(
             horizon=horizon,
@@ -0,0 +1,383 @@
+"""
+Partitioned, append-only storage for forecasts and their realized actuals.
+
+PredictionTracker used to keep every forecast in one ``predictions.parquet``
+that was rewritten under a global lock on each log and actuals update, and
+every reader loaded it in full. This store splits the data into two
+Hive-partitioned tables:
+
+    <data_dir>/predictions/predictions_store/
+        forecasts/horizon=7d/month=2025-01/part-<ns>-<id>.parquet
+        actuals/horizon=7d/month=2025-01/part-<ns>-<id>.parquet
+
+Forecast rows are written once and never modified. Each actuals
+reconciliation appends rows keyed by (forecast_date, horizon, target_date);
+the newest row per key wins on read. Both tables are partitioned by horizon
+and forecast month, so writes touch only new files and reads prune
+partitions through pyarrow dataset filters before opening any file.
+
+Partitions are compacted into a single file once ``compact_threshold``
+part files accumulate. A legacy ``predictions.parquet`` is migrated into
+the store on first use. Part-file writes, compaction and migration are
+shared with DriftHistoryLog through ``forex_core.mlops.partitioned_table``.
+
+Example:
+    >>> store = PredictionStore.for_data_dir(Path("data"))
+    >>> recent = store.read(horizon="7d", since=pd.Timestamp("2025-01-01"))
+    >>> print(recent[["forecast_date", "predicted_mean", "actual_value"]])
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Iterable, Optional, Sequence
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.dataset as ds
+
+from forex_core.mlops.partitioned_table import (
+    COMPACT_THRESHOLD,
+    PARTITION_SCHEMA,
+    PartitionedTable,
+    migrate_legacy,
+    month_of,
+)
+from forex_core.utils.file_lock import FileLock
+
+KEY_COLUMNS = ["forecast_date", "horizon", "target_date"]
+FORECAST_COLUMNS = KEY_COLUMNS + ["predicted_mean", "ci95_low", "ci95_high", "logged_at"]
+ACTUAL_COLUMNS = KEY_COLUMNS + ["actual_value", "error", "abs_error", "pct_error", "updated_at"]
+# Column order of the merged view (matches the legacy predictions.parquet)
+VIEW_COLUMNS = [
+    "forecast_date",
+    "horizon",
+    "target_date",
+    "predicted_mean",
+    "ci95_low",
+    "ci95_high",
+    "actual_value",
+    "error",
+    "abs_error",
+    "pct_error",
+    "logged_at",
+    "updated_at",
+]
+_TIMESTAMP_COLUMNS = ("forecast_date", "target_date", "logged_at", "updated_at")
+
+
+def _table_schema(columns: Sequence[str]) -> pa.Schema:
+    """File columns (timestamps or floats) plus the partition columns."""
+    fields = [
+        (column, pa.timestamp("ns") if column in _TIMESTAMP_COLUMNS else pa.float64())
+        for column in columns
+        if column != "horizon"
+    ]
+    return pa.schema(fields + list(zip(PARTITION_SCHEMA.names, PARTITION_SCHEMA.types)))
+
+
+_SCHEMAS = {
+    "forecasts": _table_schema(FORECAST_COLUMNS),
+    "actuals": _table_schema(ACTUAL_COLUMNS),
+}
+
+
+class PredictionStore:
+    """
+    Append-only forecast and actuals tables partitioned by horizon and month.
+
+    Attributes:
+        root: Store directory containing ``forecasts/`` and ``actuals/``.
+        legacy_path: Single-file store migrated on first use, if any.
+        compact_threshold: Part files per partition that trigger compaction.
+
+    Example:
+        >>> store = PredictionStore(Path("data/predictions/predictions_store"))
+        >>> store.append_forecasts(new_forecasts)
+        >>> pending = store.read(has_actual=False)
+    """
+
+    def __init__(
+        self,
+        root: Path,
+        *,
+        legacy_path: Optional[Path] = None,
+        compact_threshold: int = COMPACT_THRESHOLD,
+    ) -> None:
+        """
+        Initialize prediction store.
+
+        Args:
+            root: Store directory. Created on first write.
+            legacy_path: Legacy predictions.parquet to migrate, if any.
+            compact_threshold: Part files per partition that trigger
+                compaction. Default: 16.
+        """
+        self.root = Path(root)
+        self.legacy_path = Path(legacy_path) if legacy_path is not None else None
+        self.tables = {
+            table: PartitionedTable(
+                self.root / table,
+                "forecast_date",
+                _SCHEMAS[table],
+                compact_threshold=compact_threshold,
+                merge=merge,
+            )
+            for table, merge in (("forecasts", _merge_forecasts), ("actuals", _merge_actuals))
+        }
+        self.compact_threshold = self.tables["forecasts"].compact_threshold
+
+    @classmethod
+    def for_legacy_path(cls, path: Path, **kwargs) -> "PredictionStore":
+        """
+        Store that lives next to (and replaces) a single-file store.
+
+        Args:
+            path: Legacy Parquet path, e.g. data/predictions/predictions.parquet.
+            **kwargs: Passed to the constructor.
+
+        Returns:
+            PredictionStore rooted at ``<path.parent>/<path.stem>_store``.
+        """
+        path = Path(path)
+        return cls(path.parent / f"{path.stem}_store", legacy_path=path, **kwargs)
+
+    @classmethod
+    def for_data_dir(cls, data_dir: Path, **kwargs) -> "PredictionStore":
+        """
+        Default store under a data directory.
+
+        Args:
+            data_dir: Application data directory.
+            **kwargs: Passed to the constructor.
+
+        Returns:
+            PredictionStore for ``<data_dir>/predictions/predictions.parquet``.
+        """
+        return cls.for_legacy_path(Path(data_dir) / "predictions" / "predictions.parquet", **kwargs)
+
+    # ------------------------------------------------------------------
+    # Writes
+    # ------------------------------------------------------------------
+
+    def append_forecasts(self, df: pd.DataFrame) -> int:
+        """
+        Append forecast rows.
+
+        Args:
+            df: Rows with FORECAST_COLUMNS.
+
+        Returns:
+            Number of rows written.
+        """
+        self._migrate_legacy()
+        return self._append("forecasts", df[FORECAST_COLUMNS])
+
+    def append_actuals(self, df: pd.DataFrame) -> int:
+        """
+        Append realized values for existing forecasts.
+
+        Args:
+            df: Rows with ACTUAL_COLUMNS. Later rows for the same key
+                supersede earlier ones.
+
+        Returns:
+            Number of rows written.
+        """
+        self._migrate_legacy()
+        return self._append("actuals", df[ACTUAL_COLUMNS])
+
+    def partition_lock(self, horizon: str, forecast_date: pd.Timestamp) -> FileLock:
+        """
+        Lock serializing writers of one forecasts partition.
+
+        Used for read-check-append sequences such as duplicate detection;
+        writers of other horizons or months are never blocked.
+        """
+        directory = self.tables["forecasts"].partition_dir(horizon, month_of(forecast_date))
+        directory.parent.mkdir(parents=True, exist_ok=True)
+        return FileLock(directory.parent / f".{directory.name}.lock")
+
+    def _append(self, table: str, df: pd.DataFrame) -> int:
+        """Write one new part file per touched (horizon, month) partition."""
+        if df.empty:
+            return 0
+        return self.tables[table].append(_normalize(df))
+
+    # ------------------------------------------------------------------
+    # Reads
+    # ------------------------------------------------------------------
+
+    def read(
+        self,
+        horizon: Optional[str] = None,
+        since: Optional[pd.Timestamp] = None,
+        until: Optional[pd.Timestamp] = None,
+        has_actual: Optional[bool] = None,
+    ) -> pd.DataFrame:
+        """
+        Read forecasts joined with their latest actuals.
+
+        Horizon and forecast-month filters are pushed down to partition
+        pruning; forecast_date bounds are pushed down to row-group filters.
+
+        Args:
+            horizon: Only this horizon ("7d", "15d", ...). None reads all.
+            since: Inclusive lower bound on forecast_date.
+            until: Exclusive upper bound on forecast_date.
+            has_actual: True for reconciled rows only, False for pending
+                rows only, None for both.
+
+        Returns:
+            DataFrame with VIEW_COLUMNS, one row per forecast.
+
+        Example:
+            >>> store.read(horizon="7d", has_actual=True).tail()
+        """
+        self._migrate_legacy()
+
+        forecasts = self._read_table("forecasts", FORECAST_COLUMNS, horizon, since, until)
+        if forecasts.empty:
+            return _empty_view()
+        forecasts = forecasts.drop_duplicates(KEY_COLUMNS, keep="first")
+
+        actuals = self._read_table("actuals", ACTUAL_COLUMNS, horizon, since, until)
+        actuals = actuals.sort_values("updated_at", kind="stable").drop_duplicates(
+            KEY_COLUMNS, keep="last"
+        )
+        view = forecasts.merge(actuals, on=KEY_COLUMNS, how="left")
+        view["updated_at"] = view["updated_at"].fillna(view["logged_at"])
+
+        if has_actual is True:
+            view = view[view["actual_value"].notna()]
+        elif has_actual is False:
+            view = view[view["actual_value"].isna()]
+
+        return view[VIEW_COLUMNS].reset_index(drop=True)
+
+    def read_actuals(
+        self,
+        horizon: Optional[str] = None,
+        since: Optional[pd.Timestamp] = None,
+    ) -> pd.DataFrame:
+        """
+        Read the latest actuals table without joining forecasts.
+
+        Args:
+            horizon: Only this horizon. None reads all.
+            since: Inclusive lower bound on forecast_date.
+
+        Returns:
+            DataFrame with ACTUAL_COLUMNS, one row per reconciled forecast.
+        """
+        self._migrate_legacy()
+        actuals = self._read_table("actuals", ACTUAL_COLUMNS, horizon, since, None)
+        actuals = actuals.sort_values("updated_at", kind="stable")
+        return actuals.drop_duplicates(KEY_COLUMNS, keep="last").reset_index(drop=True)
+
+    def exists(self) -> bool:
+        """True if any forecast has been stored."""
+        self._migrate_legacy()
+        return self.tables["forecasts"].exists()
+
+    def dataset(self, table: str) -> ds.Dataset:
+        """
+        Arrow dataset over one table, for external scanners such as DuckDB.
+
+        Args:
+            table: "forecasts" or "actuals".
+
+        Returns:
+            Hive-partitioned dataset with explicit schema (empty if the
+            table has not been written yet).
+        """
+        self._migrate_legacy()
+        return self.tables[table].dataset()
+
+    def _read_table(
+        self,
+        table: str,
+        columns: Sequence[str],
+        horizon: Optional[str],
+        since: Optional[pd.Timestamp],
+        until: Optional[pd.Timestamp],
+    ) -> pd.DataFrame:
+        """Scan one table with partition and row-group pruning."""
+        if not self.tables[table].root.is_dir():
+            return _empty_frame(columns)
+        return _normalize(self.tables[table].read(columns, horizon, since, until))
+
+    # ------------------------------------------------------------------
+    # Maintenance
+    # ------------------------------------------------------------------
+
+    def compact(self) -> int:
+        """
+        Merge part files of every partition into one file each.
+
+        Returns:
+            Number of partitions compacted.
+        """
+        self._migrate_legacy()
+        return sum(table.compact() for table in self.tables.values())
+
+    def _migrate_legacy(self) -> None:
+        """Move rows from a legacy single-file store into the partitions."""
+        migrate_legacy(self.legacy_path, self.root, self._ingest_legacy, "predictions")
+
+    def _ingest_legacy(self, df: pd.DataFrame) -> None:
+        if df.empty:
+            return
+        self._append("forecasts", df[FORECAST_COLUMNS])
+        reconciled = df[df["actual_value"].notna()]
+        self._append("actuals", reconciled[ACTUAL_COLUMNS])
+
+
+def _merge_forecasts(rows: pd.DataFrame) -> pd.DataFrame:
+    """Compaction step: first forecast per key wins."""
+    rows = rows.drop_duplicates(["forecast_date", "target_date"], keep="first")
+    return rows.sort_values("forecast_date")
+
+
+def _merge_actuals(rows: pd.DataFrame) -> pd.DataFrame:
+    """Compaction step: latest actual per key wins."""
+    rows = rows.sort_values("updated_at", kind="stable")
+    rows = rows.drop_duplicates(["forecast_date", "target_date"], keep="last")
+    return rows.sort_values("forecast_date")
+
+
+def _normalize(df: pd.DataFrame) -> pd.DataFrame:
+    """Coerce timestamp columns to naive datetime64[ns]."""
+    df = df.copy()
+    for column in _TIMESTAMP_COLUMNS:
+        if column in df.columns:
+            values = pd.to_datetime(df[column])
+            if values.dt.tz is not None:
+                values = values.dt.tz_localize(None)
+            df[column] = values.astype("datetime64[ns]")
+    if "horizon" in df.columns:
+        df["horizon"] = df["horizon"].astype(str)
+    return df
+
+
+def _empty_frame(columns: Iterable[str]) -> pd.DataFrame:
+    return pd.DataFrame({
+        column: pd.Series(
+            dtype="datetime64[ns]" if column in _TIMESTAMP_COLUMNS
+            else "object" if column == "horizon"
+            else "float64"
+        )
+        for column in columns
+    })
+
+
+def _empty_view() -> pd.DataFrame:
+    return _empty_frame(VIEW_COLUMNS)
+
+
+__all__ = [
+    "PredictionStore",
+    "FORECAST_COLUMNS",
+    "ACTUAL_COLUMNS",
+    "VIEW_COLUMNS",
+]
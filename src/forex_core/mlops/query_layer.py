@@ -0,0 +1,497 @@
+"""
+Embedded SQL query layer over predictions, drift history and the warehouse.
+
+Dashboards, the performance monitor and the drift analyzer used to load
+whole Parquet files into pandas and filter afterwards. This module runs
+named, parameterized DuckDB queries directly on the files instead:
+
+- ``forecasts`` / ``actuals``: the PredictionStore tables, scanned as
+  Arrow datasets so horizon/month partition pruning, column projection
+  and forecast_date row-group filters are pushed into the scan.
+- ``drift_history``: the DriftHistoryLog segments, pruned the same way
+  by horizon and month.
+- warehouse series: legacy file, year partitions and deltas of one
+  series, merged with the same precedence as ``Warehouse.load_series``.
+
+Queries are looked up by name in ``QUERIES``. Common filters (horizon,
+since, until) are compiled into the scan of each source only when given,
+so DuckDB can push them down; everything else is bound as a named
+parameter, never interpolated.
+
+Requires the optional ``duckdb`` package (``pip install duckdb``); check
+``DUCKDB_AVAILABLE`` before use.
+
+Example:
+    >>> from forex_core.mlops.query_layer import MetricsQueryLayer
+    >>> layer = MetricsQueryLayer.for_data_dir(Path("data"))
+    >>> layer.query("rolling_rmse", horizon="7d", window_days=30).tail()
+    >>> layer.query("ci_coverage", since=pd.Timestamp("2025-01-01"))
+"""
+
+from __future__ import annotations
+
+import threading
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+import pandas as pd
+import pyarrow.dataset as ds
+import pyarrow.parquet as pq
+from loguru import logger
+
+from forex_core.mlops.drift_log import DriftHistoryLog
+from forex_core.mlops.prediction_store import PredictionStore
+
+try:
+    import duckdb
+
+    DUCKDB_AVAILABLE = True
+except ImportError:
+    duckdb = None
+    DUCKDB_AVAILABLE = False
+
+_READ_ATTEMPTS = 3
+_DEFAULT_INDEX_COLUMN = "__index_level_0__"
+
+
+@dataclass(frozen=True)
+class NamedQuery:
+    """
+    A registered SQL query.
+
+    Attributes:
+        source: Source the query reads ("predictions", "drift_history" or
+            "warehouse"). It is exposed to the SQL as a CTE of that name.
+        sql: SELECT statement using ``$name`` parameters. It is appended
+            to the source CTE, so it must not open its own WITH clause.
+        defaults: Default values for the statement's own parameters.
+        description: One-line summary shown by ``MetricsQueryLayer.describe``.
+    """
+
+    source: str
+    sql: str
+    defaults: Dict[str, Any] = field(default_factory=dict)
+    description: str = ""
+
+
+# Latest row per key from each PredictionStore table, joined like PredictionStore.read()
+_PREDICTIONS_CTE = """
+_forecasts AS (
+    SELECT forecast_date, horizon, target_date, predicted_mean, ci95_low, ci95_high, logged_at
+    FROM forecasts
+    WHERE TRUE {scan}
+    QUALIFY row_number() OVER (
+        PARTITION BY forecast_date, horizon, target_date ORDER BY logged_at
+    ) = 1
+),
+_actuals AS (
+    SELECT forecast_date, horizon, target_date, actual_value, error, abs_error, pct_error, updated_at
+    FROM actuals
+    WHERE TRUE {scan}
+    QUALIFY row_number() OVER (
+        PARTITION BY forecast_date, horizon, target_date ORDER BY updated_at DESC
+    ) = 1
+),
+predictions AS (
+    SELECT
+        forecast_date, horizon, target_date,
+        predicted_mean, ci95_low, ci95_high,
+        actual_value, error, abs_error, pct_error,
+        logged_at, coalesce(updated_at, logged_at) AS updated_at
+    FROM _forecasts LEFT JOIN _actuals USING (forecast_date, horizon, target_date)
+)"""
+
+_DRIFT_CTE = """
+drift_history AS (
+    -- DISTINCT: a scan racing a compaction lists merged and input segments
+    SELECT DISTINCT * EXCLUDE (month) FROM drift_source WHERE TRUE {scan}
+)"""
+
+_WAREHOUSE_CTE = """
+warehouse AS (
+    SELECT ts AS timestamp, value
+    FROM (
+        SELECT CAST("{index}" AS TIMESTAMP) AS ts, value, list_position($files, filename) AS _rank
+        FROM read_parquet($files, filename = true, union_by_name = true)
+    )
+    WHERE TRUE {scan}
+    QUALIFY row_number() OVER (PARTITION BY ts ORDER BY _rank DESC) = 1
+)"""
+
+QUERIES: Dict[str, NamedQuery] = {
+    "predictions": NamedQuery(
+        source="predictions",
+        sql="""
+            SELECT * FROM predictions
+            WHERE $has_actual IS NULL OR (actual_value IS NOT NULL) = $has_actual
+            ORDER BY forecast_date, horizon, target_date
+        """,
+        defaults={"has_actual": None},
+        description="Forecasts joined with their latest actuals",
+    ),
+    "prediction_summary": NamedQuery(
+        source="predictions",
+        sql="""
+            SELECT
+                horizon,
+                count(*) AS total,
+                count(*) FILTER (WHERE forecast_date >= $now - INTERVAL 7 DAY) AS last_7d,
+                count(*) FILTER (WHERE forecast_date >= $now - INTERVAL 30 DAY) AS last_30d,
+                count(actual_value) AS with_actuals,
+                max(forecast_date) AS latest_date
+            FROM predictions
+            GROUP BY horizon
+            ORDER BY horizon
+        """,
+        defaults={"now": None},
+        description="Prediction counts and latest forecast per horizon",
+    ),
+    "rolling_rmse": NamedQuery(
+        source="predictions",
+        sql="""
+            SELECT
+                horizon,
+                day,
+                sqrt(sum(sse) OVER w / sum(n) OVER w) AS rmse,
+                sum(n) OVER w AS n
+            FROM (
+                SELECT
+                    horizon,
+                    CAST(forecast_date AS DATE) AS day,
+                    sum(error * error) AS sse,
+                    count(*) AS n
+                FROM predictions
+                WHERE actual_value IS NOT NULL
+                GROUP BY ALL
+            ) AS daily
+            WINDOW w AS (
+                PARTITION BY horizon ORDER BY day
+                RANGE BETWEEN to_days(CAST($window_days AS INTEGER) - 1) PRECEDING
+                AND CURRENT ROW
+            )
+            ORDER BY horizon, day
+        """,
+        defaults={"window_days": 30},
+        description="RMSE over a trailing window of forecast days, per horizon",
+    ),
+    "ci_coverage": NamedQuery(
+        source="predictions",
+        sql="""
+            SELECT
+                horizon,
+                count(*) AS n,
+                avg(CAST(actual_value BETWEEN ci95_low AND ci95_high AS DOUBLE)) AS coverage,
+                avg(ci95_high - ci95_low) AS mean_width,
+                avg(CAST(actual_value < ci95_low AS DOUBLE)) AS below_rate,
+                avg(CAST(actual_value > ci95_high AS DOUBLE)) AS above_rate
+            FROM predictions
+            WHERE actual_value IS NOT NULL
+            GROUP BY horizon
+            ORDER BY horizon
+        """,
+        description="Empirical 95% interval coverage per horizon",
+    ),
+    "drift_history": NamedQuery(
+        source="drift_history",
+        sql="SELECT * FROM drift_history ORDER BY timestamp",
+        description="Drift records, oldest first",
+    ),
+    "drift_horizons": NamedQuery(
+        source="drift_history",
+        sql="SELECT DISTINCT horizon FROM drift_history ORDER BY horizon",
+        description="Horizons with recorded drift",
+    ),
+    "drift_score_trend": NamedQuery(
+        source="drift_history",
+        sql="""
+            SELECT
+                horizon,
+                day,
+                drift_score,
+                drift_detected,
+                avg(drift_score) OVER w AS rolling_score
+            FROM (
+                SELECT
+                    horizon,
+                    CAST(timestamp AS DATE) AS day,
+                    avg(drift_score) AS drift_score,
+                    bool_or(drift_detected) AS drift_detected
+                FROM drift_history
+                GROUP BY ALL
+            ) AS daily
+            WINDOW w AS (
+                PARTITION BY horizon ORDER BY day
+                RANGE BETWEEN to_days(CAST($window_days AS INTEGER) - 1) PRECEDING
+                AND CURRENT ROW
+            )
+            ORDER BY horizon, day
+        """,
+        defaults={"window_days": 7},
+        description="Daily drift score and its trailing mean, per horizon",
+    ),
+    "warehouse_series": NamedQuery(
+        source="warehouse",
+        sql="SELECT * FROM warehouse ORDER BY timestamp",
+        description="One warehouse series with later files taking precedence",
+    ),
+}
+
+
+class MetricsQueryLayer:
+    """
+    Named DuckDB queries over the MLOps Parquet stores.
+
+    Sources are re-resolved on every query, so files written by other
+    processes (new prediction parts, compactions, drift records) are seen
+    without reopening the layer.
+
+    Attributes:
+        store: PredictionStore backing the ``predictions`` source.
+        drift_log: Drift history log backing the ``drift_history`` source.
+        warehouse_dir: Warehouse directory for ``warehouse_series``.
+
+    Example:
+        >>> with MetricsQueryLayer(store=PredictionStore.for_data_dir(Path("data"))) as layer:
+        ...     layer.query("predictions", horizon="7d", has_actual=True)
+    """
+
+    def __init__(
+        self,
+        store: Optional[PredictionStore] = None,
+        drift_log: Optional[DriftHistoryLog] = None,
+        warehouse_dir: Optional[Path] = None,
+    ) -> None:
+        """
+        Initialize query layer.
+
+        Args:
+            store: Prediction store. Required for "predictions" queries.
+            drift_log: Drift history log. Required for drift queries.
+            warehouse_dir: Warehouse directory. Required for warehouse queries.
+
+        Raises:
+            ImportError: If duckdb is not installed.
+        """
+        if not DUCKDB_AVAILABLE:
+            raise ImportError("duckdb is required for MetricsQueryLayer: pip install duckdb")
+
+        self.store = store
+        self.drift_log = drift_log
+        self.warehouse_dir = Path(warehouse_dir) if warehouse_dir is not None else None
+        self._conn = duckdb.connect(database=":memory:")
+        self._lock = threading.Lock()
+
+    @classmethod
+    def for_data_dir(
+        cls, data_dir: Path, warehouse_dir: Optional[Path] = None
+    ) -> "MetricsQueryLayer":
+        """
+        Layer over the default locations under a data directory.
+
+        Args:
+            data_dir: Application data directory.
+            warehouse_dir: Warehouse directory. Default: ``<data_dir>/warehouse``.
+
+        Returns:
+            MetricsQueryLayer for predictions, drift history and warehouse.
+        """
+        data_dir = Path(data_dir)
+        return cls(
+            store=PredictionStore.for_data_dir(data_dir),
+            drift_log=DriftHistoryLog.for_legacy_path(
+                data_dir / "drift_history" / "drift_history.parquet"
+            ),
+            warehouse_dir=warehouse_dir if warehouse_dir is not None else data_dir / "warehouse",
+        )
+
+    @staticmethod
+    def describe() -> Dict[str, str]:
+        """Registered query names with their descriptions."""
+        return {name: query.description for name, query in QUERIES.items()}
+
+    def query(
+        self,
+        name: str,
+        *,
+        horizon: Optional[str] = None,
+        since: Optional[pd.Timestamp] = None,
+        until: Optional[pd.Timestamp] = None,
+        series: Optional[str] = None,
+        **params: Any,
+    ) -> pd.DataFrame:
+        """
+        Run a named query.
+
+        Args:
+            name: Key of ``QUERIES``.
+            horizon: Only this horizon (predictions and drift sources).
+            since: Inclusive lower time bound (forecast_date, drift
+                timestamp or warehouse timestamp).
+            until: Exclusive upper time bound.
+            series: Warehouse series name (warehouse source only).
+            **params: Query-specific parameters, e.g. window_days.
+
+        Returns:
+            Query result as a DataFrame. Empty (no columns) when a
+            warehouse series does not exist.
+
+        Raises:
+            KeyError: If the query name is unknown.
+            ValueError: If a parameter is not accepted by the query or a
+                required source is not configured.
+
+        Example:
+            >>> layer.query("rolling_rmse", horizon="15d", window_days=14)
+        """
+        try:
+            named = QUERIES[name]
+        except KeyError:
+            raise KeyError(f"Unknown query '{name}'. Available: {sorted(QUERIES)}") from None
+
+        unknown = set(params) - set(named.defaults)
+        if unknown:
+            raise ValueError(f"Query '{name}' does not accept parameters: {sorted(unknown)}")
+        bound = {**named.defaults, **params}
+        if "now" in bound and bound["now"] is None:
+            bound["now"] = pd.Timestamp.now()
+
+        for attempt in range(_READ_ATTEMPTS):
+            with self._lock:
+                prepared = self._prepare(named.source, horizon, since, until, series)
+                if prepared is None:
+                    return pd.DataFrame()
+                cte, scan_params, relations = prepared
+                try:
+                    for relation_name, relation in relations.items():
+                        self._conn.register(relation_name, relation)
+                    result = self._conn.execute(
+                        f"WITH {cte}\n{named.sql}", {**scan_params, **bound}
+                    ).df()
+                    logger.debug(f"Query '{name}' returned {len(result)} rows")
+                    return result
+                except (duckdb.IOException, FileNotFoundError):
+                    # A part file was removed by a concurrent compaction; rescan
+                    if attempt == _READ_ATTEMPTS - 1:
+                        raise
+                finally:
+                    for relation_name in relations:
+                        self._conn.unregister(relation_name)
+
+    def close(self) -> None:
+        """Close the DuckDB connection (idempotent)."""
+        self._conn.close()
+
+    def __enter__(self) -> "MetricsQueryLayer":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    # ------------------------------------------------------------------
+    # Sources
+    # ------------------------------------------------------------------
+
+    def _prepare(
+        self,
+        source: str,
+        horizon: Optional[str],
+        since: Optional[pd.Timestamp],
+        until: Optional[pd.Timestamp],
+        series: Optional[str],
+    ) -> Optional[Tuple[str, Dict[str, Any], Dict[str, ds.Dataset]]]:
+        """
+        Build the CTE, scan parameters and Arrow relations for a source.
+
+        Returns:
+            (cte_sql, params, relations), or None if the source has no data.
+        """
+        if source == "predictions":
+            if self.store is None:
+                raise ValueError("Predictions queries require a PredictionStore")
+            scan, params = _scan_filters("forecast_date", horizon, since, until, partitioned=True)
+            relations = {
+                "forecasts": self.store.dataset("forecasts"),
+                "actuals": self.store.dataset("actuals"),
+            }
+            return _PREDICTIONS_CTE.format(scan=scan), params, relations
+
+        if source == "drift_history":
+            if self.drift_log is None:
+                raise ValueError("Drift queries require a DriftHistoryLog")
+            scan, params = _scan_filters("timestamp", horizon, since, until, partitioned=True)
+            relations = {"drift_source": self.drift_log.dataset()}
+            return _DRIFT_CTE.format(scan=scan), params, relations
+
+        if source == "warehouse":
+            if self.warehouse_dir is None or series is None:
+                raise ValueError("Warehouse queries require warehouse_dir and series")
+            files = self._warehouse_files(series)
+            if not files:
+                return None
+            scan, params = _scan_filters("ts", None, since, until)
+            params["files"] = [str(path) for path in files]
+            index = _index_column(files[0])
+            return _WAREHOUSE_CTE.format(scan=scan, index=index), params, {}
+
+        raise ValueError(f"Unknown query source '{source}'")
+
+    def _warehouse_files(self, series: str) -> List[Path]:
+        """Files of one series in Warehouse merge precedence order."""
+        safe_name = series.replace("/", "_")
+        legacy = self.warehouse_dir / f"{safe_name}.parquet"
+        directory = self.warehouse_dir / safe_name
+        files = [legacy] if legacy.exists() else []
+        if directory.is_dir():
+            files += sorted(directory.glob("year=*.parquet"))
+            files += sorted(directory.glob("delta-*.parquet"))
+        return files
+
+
+def _scan_filters(
+    time_column: str,
+    horizon: Optional[str],
+    since: Optional[pd.Timestamp],
+    until: Optional[pd.Timestamp],
+    partitioned: bool = False,
+) -> Tuple[str, Dict[str, Any]]:
+    """
+    Compile the common filters into a pushdown-friendly predicate.
+
+    Only filters that are set appear in the SQL, so DuckDB sees plain
+    comparisons it can push into the Parquet/Arrow scan. Partitioned
+    sources also get month bounds for directory pruning.
+    """
+    clauses: List[str] = []
+    params: Dict[str, Any] = {}
+    if horizon is not None:
+        clauses.append("horizon = $horizon")
+        params["horizon"] = horizon
+    if since is not None:
+        params["since"] = pd.Timestamp(since).tz_localize(None)
+        clauses.append(f"{time_column} >= $since")
+        if partitioned:
+            clauses.append("month >= $since_month")
+            params["since_month"] = params["since"].strftime("%Y-%m")
+    if until is not None:
+        params["until"] = pd.Timestamp(until).tz_localize(None)
+        clauses.append(f"{time_column} < $until")
+        if partitioned:
+            clauses.append("month <= $until_month")
+            params["until_month"] = params["until"].strftime("%Y-%m")
+    return "".join(f" AND {clause}" for clause in clauses), params
+
+
+def _index_column(path: Path) -> str:
+    """Name under which pandas stored the DatetimeIndex of a warehouse file."""
+    metadata = pq.read_schema(path).pandas_metadata or {}
+    index_columns = [c for c in metadata.get("index_columns", []) if isinstance(c, str)]
+    return index_columns[0] if index_columns else _DEFAULT_INDEX_COLUMN
+
+
+__all__ = [
+    "MetricsQueryLayer",
+    "NamedQuery",
+    "QUERIES",
+    "DUCKDB_AVAILABLE",
+]
@@ -188,9 +188,9 @@ class ChronosReadinessChecker:
     def _check_tracking_data(self) -> ReadinessCheck:
         """Verify prediction tracking has sufficient data."""
         try:
-            storage_path = self.data_dir / "predictions" / "predictions.parquet"
+            store = self.tracker.store
 
-            if not storage_path.exists():
+            if not store.exists():
                 return ReadinessCheck(
                     check_name="Prediction Tracking Data",
                     passed=False,
@@ -199,7 +199,7 @@ class ChronosReadinessChecker:
                     critical=True,
                 )
 
-            df = pd.read_parquet(storage_path)
+            df = store.read()
 
             # Count predictions per horizon
             horizon_counts = df.groupby("horizon").size()
@@ -239,9 +239,9 @@ class ChronosReadinessChecker:
     def _check_operation_time(self) -> ReadinessCheck:
         """Verify system has been operating for minimum time."""
         try:
-            storage_path = self.data_dir / "predictions" / "predictions.parquet"
+            store = self.tracker.store
 
-            if not storage_path.exists():
+            if not store.exists():
                 return ReadinessCheck(
                     check_name="Operation Time",
                     passed=False,
@@ -250,7 +250,7 @@ class ChronosReadinessChecker:
                     critical=True,
                 )
 
-            df = pd.read_parquet(storage_path)
+            df = store.read()
 
             if len(df) == 0:
                 return ReadinessCheck(
@@ -306,9 +306,9 @@ class ChronosReadinessChecker:
             # (presence of drift logs or metrics)
 
             # For now, simple check: has system logged predictions recently?
-            storage_path = self.data_dir / "predictions" / "predictions.parquet"
+            store = self.tracker.store
 
-            if not storage_path.exists():
+            if not store.exists():
                 return ReadinessCheck(
                     check_name="Drift Detection",
                     passed=False,
@@ -317,7 +317,7 @@ class ChronosReadinessChecker:
                     critical=False,
                 )
 
-            df = pd.read_parquet(storage_path)
+            df = store.read()
 
             # Check for recent predictions (last 7 days)
             recent_cutoff = datetime.now() - timedelta(days=7)
@@ -409,9 +409,9 @@ class ChronosReadinessChecker:
     def _check_performance_baseline(self) -> ReadinessCheck:
         """Check if we have performance baseline metrics."""
         try:
-            storage_path = self.data_dir / "predictions" / "predictions.parquet"
+            store = self.tracker.store
 
-            if not storage_path.exists():
+            if not store.exists():
                 return ReadinessCheck(
                     check_name="Performance Baseline",
                     passed=False,
@@ -420,7 +420,7 @@ class ChronosReadinessChecker:
                     critical=False,
                 )
 
-            df = pd.read_parquet(storage_path)
+            df = store.read()
 
             # Check if we have predictions with actual values
             with_actuals = df[df["actual_value"].notna()]
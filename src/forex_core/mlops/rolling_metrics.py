@@ -0,0 +1,378 @@
+"""
+Incremental rolling error metrics for forecast monitoring.
+
+PerformanceMonitor used to rescan every reconciled prediction of a horizon
+on each check. This module keeps running sufficient statistics instead:
+one row per (horizon, forecast day) with counts and sums of errors,
+squared errors (and their squares), absolute (percentage) errors and
+CI95 hits.
+
+    <data_dir>/predictions/predictions_store/metrics/daily_error_stats.parquet
+
+The table is updated only when new actuals land
+(``PredictionTracker.update_actuals``), so it grows by at most one row per
+horizon per day. Any window's RMSE, MAE, MAPE, coverage and bias is the
+sum of its day rows, which makes degradation checks independent of the
+number of stored predictions.
+
+Example:
+    >>> metrics = RollingMetricsStore(PredictionStore.for_data_dir(Path("data")))
+    >>> recent = metrics.window("7d", start=pd.Timestamp("2025-01-01"), end=pd.Timestamp("2025-01-15"))
+    >>> print(f"RMSE={recent.rmse:.2f} coverage={recent.ci95_coverage:.1%} n={recent.n}")
+"""
+
+from __future__ import annotations
+
+import os
+import uuid
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, Optional
+
+import numpy as np
+import pandas as pd
+from loguru import logger
+
+from forex_core.mlops.prediction_store import PredictionStore
+from forex_core.utils.file_lock import FileLock
+
+STAT_COLUMNS = [
+    "n",
+    "sum_error",
+    "sum_sq_error",
+    "sum_quad_error",
+    "sum_abs_error",
+    "sum_sq_abs_error",
+    "n_ape",
+    "sum_ape",
+    "sum_sq_ape",
+    "n_in_ci",
+]
+_KEY_COLUMNS = ["horizon", "day"]
+
+
+@dataclass
+class ErrorStats:
+    """
+    Sufficient statistics of forecast errors over a set of predictions.
+
+    Errors are predicted minus actual, so a positive bias means
+    over-prediction. Percentage errors are relative to |actual| and only
+    counted where the actual is non-zero.
+
+    Attributes:
+        n: Number of reconciled predictions.
+        sum_error: Sum of errors.
+        sum_sq_error: Sum of squared errors.
+        sum_quad_error: Sum of fourth powers of errors (spread of squared errors).
+        sum_abs_error: Sum of absolute errors.
+        sum_sq_abs_error: Sum of squared absolute errors (for their spread).
+        n_ape: Predictions with a defined percentage error.
+        sum_ape: Sum of absolute percentage errors (fractions).
+        sum_sq_ape: Sum of squared absolute percentage errors.
+        n_in_ci: Actuals inside the CI95 interval.
+        start: Earliest forecast day covered.
+        end: Latest forecast day covered.
+    """
+
+    n: int = 0
+    sum_error: float = 0.0
+    sum_sq_error: float = 0.0
+    sum_quad_error: float = 0.0
+    sum_abs_error: float = 0.0
+    sum_sq_abs_error: float = 0.0
+    n_ape: int = 0
+    sum_ape: float = 0.0
+    sum_sq_ape: float = 0.0
+    n_in_ci: int = 0
+    start: Optional[datetime] = None
+    end: Optional[datetime] = None
+
+    @classmethod
+    def from_predictions(cls, df: pd.DataFrame) -> "ErrorStats":
+        """
+        Aggregate reconciled predictions.
+
+        Args:
+            df: Rows with forecast_date, predicted_mean, actual_value,
+                ci95_low and ci95_high.
+
+        Returns:
+            ErrorStats over all rows.
+        """
+        daily = daily_error_stats(df.assign(horizon=""))
+        return cls.from_daily(daily)
+
+    @classmethod
+    def from_daily(cls, daily: pd.DataFrame) -> "ErrorStats":
+        """Sum day rows of a daily statistics table."""
+        if daily.empty:
+            return cls()
+        totals = daily[STAT_COLUMNS].sum()
+        return cls(
+            **{
+                column: int(totals[column]) if column.startswith("n") else float(totals[column])
+                for column in STAT_COLUMNS
+            },
+            start=daily["day"].min().to_pydatetime(),
+            end=daily["day"].max().to_pydatetime(),
+        )
+
+    @property
+    def rmse(self) -> float:
+        return float(np.sqrt(self.sum_sq_error / self.n)) if self.n else 0.0
+
+    @property
+    def mae(self) -> float:
+        return self.sum_abs_error / self.n if self.n else 0.0
+
+    @property
+    def mape(self) -> float:
+        """Mean absolute percentage error, in percent."""
+        return self.sum_ape / self.n_ape * 100 if self.n_ape else 0.0
+
+    @property
+    def ci95_coverage(self) -> float:
+        return self.n_in_ci / self.n if self.n else 0.0
+
+    @property
+    def bias(self) -> float:
+        return self.sum_error / self.n if self.n else 0.0
+
+    @property
+    def sq_error_std(self) -> float:
+        """Population standard deviation of squared errors."""
+        return _std(self.sum_sq_error, self.sum_quad_error, self.n)
+
+    @property
+    def abs_error_std(self) -> float:
+        """Population standard deviation of absolute errors."""
+        return _std(self.sum_abs_error, self.sum_sq_abs_error, self.n)
+
+    @property
+    def ape_std(self) -> float:
+        """Population standard deviation of percentage errors, in percent."""
+        return _std(self.sum_ape, self.sum_sq_ape, self.n_ape) * 100
+
+
+def daily_error_stats(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Reduce reconciled predictions to per-(horizon, day) statistics.
+
+    Args:
+        df: Rows with horizon, forecast_date, predicted_mean, actual_value,
+            ci95_low and ci95_high. Rows without an actual are ignored.
+
+    Returns:
+        DataFrame with horizon, day and STAT_COLUMNS.
+    """
+    df = df[df["actual_value"].notna()]
+    if df.empty:
+        return _empty_stats()
+
+    actual = df["actual_value"].to_numpy(dtype=float)
+    error = df["predicted_mean"].to_numpy(dtype=float) - actual
+    abs_error = np.abs(error)
+    has_ape = actual != 0
+    with np.errstate(divide="ignore", invalid="ignore"):
+        ape = np.where(has_ape, abs_error / np.abs(actual), 0.0)
+    in_ci = (actual >= df["ci95_low"].to_numpy()) & (actual <= df["ci95_high"].to_numpy())
+
+    rows = pd.DataFrame({
+        "horizon": df["horizon"].to_numpy(),
+        "day": pd.to_datetime(df["forecast_date"]).dt.normalize().to_numpy(),
+        "n": 1,
+        "sum_error": error,
+        "sum_sq_error": error**2,
+        "sum_quad_error": error**4,
+        "sum_abs_error": abs_error,
+        "sum_sq_abs_error": abs_error**2,
+        "n_ape": has_ape.astype(int),
+        "sum_ape": ape,
+        "sum_sq_ape": ape**2,
+        "n_in_ci": in_ci.astype(int),
+    })
+    return rows.groupby(_KEY_COLUMNS, as_index=False, sort=True)[STAT_COLUMNS].sum()
+
+
+class RollingMetricsStore:
+    """
+    Persisted per-day error statistics next to a PredictionStore.
+
+    Attributes:
+        store: Prediction store the statistics are derived from.
+        path: Parquet file holding the daily statistics.
+
+    Example:
+        >>> metrics = RollingMetricsStore(tracker.store)
+        >>> metrics.record(newly_reconciled)
+        >>> metrics.window("7d", start, end).rmse
+    """
+
+    def __init__(self, store: PredictionStore, path: Optional[Path] = None) -> None:
+        """
+        Initialize metrics store.
+
+        Args:
+            store: Prediction store used for (re)building the statistics.
+            path: Statistics file. Default: ``<store.root>/metrics/daily_error_stats.parquet``.
+        """
+        self.store = store
+        self.path = Path(path) if path is not None else (
+            store.root / "metrics" / "daily_error_stats.parquet"
+        )
+        self._cache: Optional[pd.DataFrame] = None
+        self._cache_mtime: Optional[int] = None
+
+    def exists(self) -> bool:
+        """True if statistics have been built."""
+        return self.path.exists()
+
+    def record(
+        self,
+        reconciled: pd.DataFrame,
+        append: Optional[Callable[[pd.DataFrame], object]] = None,
+    ) -> int:
+        """
+        Fold newly reconciled predictions into the statistics.
+
+        Call once per prediction. Pass the store write as ``append`` so it
+        runs under the statistics lock: a rebuild by another process then
+        sees either none of the rows or all of them already folded in,
+        never rows that are added again afterwards. If no (current)
+        statistics exist they are built from the whole store instead,
+        which then includes these rows.
+
+        Args:
+            reconciled: Rows with horizon, forecast_date, predicted_mean,
+                actual_value, ci95_low and ci95_high.
+            append: Writes ``reconciled`` to the prediction store. None if
+                the caller already did so under this store's lock.
+
+        Returns:
+            Number of predictions folded in.
+        """
+        with self._lock():
+            if append is not None:
+                append(reconciled)
+
+            if self._needs_rebuild():
+                self._rebuild()
+                return len(reconciled)
+
+            incoming = daily_error_stats(reconciled)
+            if incoming.empty:
+                return 0
+            merged = pd.concat([self._read(), incoming], ignore_index=True)
+            merged = merged.groupby(_KEY_COLUMNS, as_index=False, sort=True)[STAT_COLUMNS].sum()
+            self._write(merged)
+
+        logger.debug(f"Rolling metrics updated with {int(incoming['n'].sum())} predictions")
+        return int(incoming["n"].sum())
+
+    def rebuild(self) -> int:
+        """
+        Recompute the statistics from every reconciled prediction.
+
+        Returns:
+            Number of (horizon, day) rows written.
+        """
+        with self._lock():
+            return self._rebuild()
+
+    def invalidate(self) -> None:
+        """Drop the statistics so the next use rebuilds them."""
+        self.path.unlink(missing_ok=True)
+        self._cache = None
+
+    def daily(self, horizon: Optional[str] = None) -> pd.DataFrame:
+        """
+        Daily statistics, building them on first use.
+
+        Args:
+            horizon: Only this horizon. None returns all.
+
+        Returns:
+            DataFrame with horizon, day and STAT_COLUMNS.
+        """
+        if self._needs_rebuild():
+            self.rebuild()
+        daily = self._read()
+        if horizon is not None:
+            daily = daily[daily["horizon"] == horizon]
+        return daily
+
+    def window(self, horizon: str, start: pd.Timestamp, end: pd.Timestamp) -> ErrorStats:
+        """
+        Statistics of forecasts made on days in (start, end].
+
+        Args:
+            horizon: Forecast horizon.
+            start: Exclusive lower bound (normalized to a day).
+            end: Inclusive upper bound (normalized to a day).
+
+        Returns:
+            ErrorStats for the window; empty if there is no data.
+        """
+        daily = self.daily(horizon)
+        start, end = pd.Timestamp(start).normalize(), pd.Timestamp(end).normalize()
+        return ErrorStats.from_daily(daily[(daily["day"] > start) & (daily["day"] <= end)])
+
+    def _rebuild(self) -> int:
+        """Full-scan rebuild; caller holds the lock."""
+        daily = daily_error_stats(self.store.read(has_actual=True))
+        self._write(daily)
+        logger.info(f"Rebuilt rolling metrics: {len(daily)} horizon-days")
+        return len(daily)
+
+    def _needs_rebuild(self) -> bool:
+        """True if there are no statistics or they lack a STAT_COLUMNS column."""
+        if not self.path.exists():
+            return True
+        return not set(STAT_COLUMNS).issubset(self._read().columns)
+
+    def _read(self) -> pd.DataFrame:
+        """Statistics table, re-read only when the file changed."""
+        try:
+            mtime = self.path.stat().st_mtime_ns
+        except FileNotFoundError:
+            return _empty_stats()
+        if self._cache is None or mtime != self._cache_mtime:
+            self._cache = pd.read_parquet(self.path)
+            self._cache_mtime = mtime
+        return self._cache
+
+    def _write(self, daily: pd.DataFrame) -> None:
+        """Atomically replace the statistics file."""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.path.with_name(f".{self.path.name}.{uuid.uuid4().hex[:8]}")
+        daily.to_parquet(tmp, index=False)
+        os.replace(tmp, self.path)
+        self._cache = None
+
+    def _lock(self) -> FileLock:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        return FileLock(self.path.with_name(f".{self.path.name}.lock"))
+
+
+def _std(total: float, total_sq: float, n: int) -> float:
+    if not n:
+        return 0.0
+    mean = total / n
+    return float(np.sqrt(max(total_sq / n - mean * mean, 0.0)))
+
+
+def _empty_stats() -> pd.DataFrame:
+    frame = pd.DataFrame({column: pd.Series(dtype="float64") for column in STAT_COLUMNS})
+    frame.insert(0, "day", pd.Series(dtype="datetime64[ns]"))
+    frame.insert(0, "horizon", pd.Series(dtype="object"))
+    return frame
+
+
+__all__ = [
+    "ErrorStats",
+    "RollingMetricsStore",
+    "daily_error_stats",
+    "STAT_COLUMNS",
+]
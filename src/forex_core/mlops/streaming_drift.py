@@ -0,0 +1,470 @@
+"""
+Online drift detection over sliding windows.
+
+DataDriftDetector.generate_drift_report splits the whole series into
+baseline and recent windows and re-runs KS, Welch t, Levene and Ljung-Box
+from scratch on every call. StreamingDriftDetector keeps the two windows
+as running state instead and updates it one observation at a time:
+
+- Sorted buffers per window (KS statistic and Levene medians, no re-sort)
+- Sliding Welford accumulators per window (means and variances)
+- Sliding lagged-product sums of first differences (Ljung-Box autocorrelations)
+
+An observation enters the recent window; the oldest recent value moves
+into the baseline window and the oldest baseline value is dropped, so the
+windows are exactly the ones ``_split_windows`` would cut from the series.
+Updates cost O(max_lags) plus a bisect into each sorted buffer, and a
+report reads the accumulators rather than the series. The result is the
+same ``DriftReport`` the batch detector emits; KS p-values use the
+asymptotic distribution.
+
+Example:
+    >>> detector = StreamingDriftDetector(baseline_window=90, test_window=30)
+    >>> detector.extend(usdclp_series.iloc[:-1])
+    >>> detector.update(usdclp_series.iloc[-1])
+    >>> report = detector.report()
+    >>> if report.has_significant_drift():
+    ...     print(report.recommendation)
+"""
+
+from __future__ import annotations
+
+import bisect
+import math
+from collections import deque
+from itertools import islice
+from typing import Iterable, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+from loguru import logger
+from scipy import stats
+
+from forex_core.mlops.monitoring import (
+    DataDriftDetector,
+    DriftReport,
+    DriftTestResult,
+)
+
+
+class _SlidingMoments:
+    """Welford mean and variance accumulator supporting removals."""
+
+    def __init__(self) -> None:
+        self.n = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+
+    def add(self, x: float) -> None:
+        self.n += 1
+        delta = x - self.mean
+        self.mean += delta / self.n
+        self.m2 += delta * (x - self.mean)
+
+    def remove(self, x: float) -> None:
+        if self.n <= 1:
+            self.n, self.mean, self.m2 = 0, 0.0, 0.0
+            return
+        self.n -= 1
+        delta = x - self.mean
+        self.mean -= delta / self.n
+        self.m2 = max(self.m2 - delta * (x - self.mean), 0.0)
+
+    @property
+    def var(self) -> float:
+        """Sample variance (ddof=1), matching pandas."""
+        return self.m2 / (self.n - 1) if self.n > 1 else 0.0
+
+    @property
+    def std(self) -> float:
+        return math.sqrt(self.var)
+
+
+class _LaggedProducts:
+    """
+    Sliding window of first differences with lagged cross-product sums.
+
+    Keeps sum(d), sum(d^2) and sum(d_t * d_{t-k}) for k = 1..max_lag, which
+    is everything the sample autocorrelation function needs.
+    """
+
+    def __init__(self, max_lag: int) -> None:
+        self.max_lag = max_lag
+        self.values: deque = deque()
+        self.total = 0.0
+        self.sum_sq = 0.0
+        self.lagged = np.zeros(max_lag + 1)
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    def push(self, d: float) -> None:
+        for k in range(1, min(self.max_lag, len(self.values)) + 1):
+            self.lagged[k] += d * self.values[-k]
+        self.values.append(d)
+        self.total += d
+        self.sum_sq += d * d
+
+    def pop_front(self) -> None:
+        d = self.values.popleft()
+        for k in range(1, min(self.max_lag, len(self.values)) + 1):
+            self.lagged[k] -= d * self.values[k - 1]
+        self.total -= d
+        self.sum_sq -= d * d
+
+    def ljung_box(self, lags: int) -> Optional[Tuple[np.ndarray, np.ndarray]]:
+        """
+        Ljung-Box statistics and p-values for lags 1..lags.
+
+        Uses the same autocorrelation estimator as statsmodels'
+        ``acorr_ljungbox`` (demeaned, full-sample denominator).
+
+        Returns:
+            Tuple of (statistics, p_values), or None if the window is too
+            short or has no variance.
+        """
+        n = len(self.values)
+        if n <= lags:
+            return None
+        mean = self.total / n
+        denom = self.sum_sq - n * mean * mean
+        if denom <= 0:
+            return None
+
+        head = np.cumsum(list(islice(self.values, lags)))
+        tail = np.cumsum(list(islice(reversed(self.values), lags)))
+        k = np.arange(1, lags + 1)
+        # sum_{t>=k} (d_t - m)(d_{t-k} - m), expanded over the running sums
+        numerator = (
+            self.lagged[1 : lags + 1]
+            - mean * ((self.total - head) + (self.total - tail))
+            + (n - k) * mean * mean
+        )
+        acf = numerator / denom
+        q_stats = n * (n + 2) * np.cumsum(acf**2 / (n - k))
+        return q_stats, stats.chi2.sf(q_stats, k)
+
+
+class _Window:
+    """One sliding window: raw values, sorted buffer and running sums."""
+
+    def __init__(self, max_lag: int) -> None:
+        self.max_lag = max_lag
+        self.values: deque = deque()
+        self.ordered: list = []
+        self.rebuild()
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    def push(self, value: float) -> None:
+        if self.values:
+            self.diffs.push(value - self.values[-1])
+        self.values.append(value)
+        bisect.insort(self.ordered, value)
+        self.moments.add(value)
+
+    def pop_front(self) -> float:
+        value = self.values.popleft()
+        del self.ordered[bisect.bisect_left(self.ordered, value)]
+        self.moments.remove(value)
+        if len(self.diffs):
+            self.diffs.pop_front()
+        return value
+
+    def rebuild(self) -> None:
+        """Recompute running sums exactly from the buffered values."""
+        self.moments = _SlidingMoments()
+        self.diffs = _LaggedProducts(self.max_lag)
+        previous = None
+        for value in self.values:
+            self.moments.add(value)
+            if previous is not None:
+                self.diffs.push(value - previous)
+            previous = value
+
+
+class StreamingDriftDetector(DataDriftDetector):
+    """
+    Drift detector that maintains baseline and recent windows incrementally.
+
+    Feed observations with ``update``/``extend`` and read ``report()``, or
+    call ``generate_drift_report(series)`` on a growing series: only
+    observations indexed after the last one seen are consumed. Values
+    already consumed are not revisited, so call ``reset()`` after a
+    backfill or revision of history. NaN observations are skipped.
+
+    Args:
+        baseline_window: Number of observations in the baseline window.
+        test_window: Number of observations in the recent window.
+        alpha: Significance level for statistical tests.
+        lags: Ljung-Box lags, as in ``detect_autocorrelation_change``.
+        resync_every: Rebuild the running sums from the buffers after this
+            many updates to bound floating-point drift from removals.
+            Defaults to baseline_window + test_window.
+
+    Example:
+        >>> detector = StreamingDriftDetector()
+        >>> report = detector.generate_drift_report(bundle.usdclp_series)
+        >>> # later, with one more observation: only that value is processed
+        >>> report = detector.generate_drift_report(bundle.usdclp_series)
+    """
+
+    def __init__(
+        self,
+        baseline_window: int = 90,
+        test_window: int = 30,
+        alpha: float = 0.05,
+        lags: int = 10,
+        resync_every: Optional[int] = None,
+    ):
+        super().__init__(
+            baseline_window=baseline_window,
+            test_window=test_window,
+            alpha=alpha,
+        )
+        self.lags = lags
+        self.resync_every = resync_every or (baseline_window + test_window)
+        self.reset()
+
+    def reset(self) -> None:
+        """Drop all window state."""
+        self._baseline = _Window(self.lags)
+        self._recent = _Window(self.lags)
+        self._last_key = None
+        self._updates_since_resync = 0
+
+    @property
+    def is_ready(self) -> bool:
+        """Whether both windows are full."""
+        return (
+            len(self._baseline) == self.baseline_window
+            and len(self._recent) == self.test_window
+        )
+
+    def update(self, value: float) -> None:
+        """
+        Add one observation to the recent window.
+
+        Args:
+            value: New observation, later than every value seen so far.
+        """
+        value = float(value)
+        if math.isnan(value):
+            return
+
+        self._recent.push(value)
+        if len(self._recent) > self.test_window:
+            self._baseline.push(self._recent.pop_front())
+            if len(self._baseline) > self.baseline_window:
+                self._baseline.pop_front()
+
+        self._updates_since_resync += 1
+        if self._updates_since_resync >= self.resync_every:
+            self._baseline.rebuild()
+            self._recent.rebuild()
+            self._updates_since_resync = 0
+
+    def extend(self, values: Iterable[float]) -> None:
+        """Add observations in order."""
+        for value in values:
+            self.update(value)
+
+    def generate_drift_report(self, series: pd.Series) -> DriftReport:
+        """
+        Consume the new tail of ``series`` and report on the current windows.
+
+        Observations indexed after the last one consumed are fed through
+        ``update``. If the series does not continue what was seen (first
+        call, unsorted index, or history no longer overlapping), the state is
+        rebuilt from the last baseline_window + test_window observations.
+
+        Args:
+            series: Time series data (indexed by date).
+
+        Returns:
+            DriftReport for the current windows.
+        """
+        self._sync(series)
+        return self.report()
+
+    def report(self) -> DriftReport:
+        """
+        Build a DriftReport from the current window state.
+
+        Returns:
+            DriftReport equivalent to the batch detector on the same windows,
+            or an empty report while the windows are still filling.
+        """
+        if not self.is_ready:
+            logger.warning(
+                f"Insufficient data: need {self.baseline_window + self.test_window} "
+                f"points, have {len(self._baseline) + len(self._recent)}"
+            )
+            return self._create_empty_report()
+
+        baseline = np.asarray(self._baseline.ordered)
+        recent = np.asarray(self._recent.ordered)
+        b, r = self._baseline.moments, self._recent.moments
+
+        ks_statistic, ks_p_value = self._ks_test(baseline, recent)
+        tests_dict = {
+            "ks_test": DriftTestResult(
+                test_name="Kolmogorov-Smirnov Test",
+                statistic=ks_statistic,
+                p_value=ks_p_value,
+                drift_detected=ks_p_value < self.alpha,
+                description=f"Distribution change (p={ks_p_value:.4f})",
+            ),
+            "t_test": self._welch_t_test(b, r),
+            "levene_test": self._levene_test(baseline, recent, b, r),
+            "ljungbox_test": self._ljung_box_test(),
+        }
+
+        return self._assemble_report(
+            tests_dict,
+            self._is_volatility_regime_change(b.std, r.std),
+            ks_statistic=ks_statistic,
+            baseline_mean=b.mean,
+            recent_mean=r.mean,
+            baseline_std=b.std,
+            recent_std=r.std,
+            baseline_size=b.n,
+            recent_size=r.n,
+        )
+
+    def _sync(self, series: pd.Series) -> None:
+        """Feed the part of ``series`` not consumed yet."""
+        if len(series) == 0:
+            return
+
+        index = series.index
+        if (
+            self._last_key is not None
+            and index.is_monotonic_increasing
+            and index[0] <= self._last_key <= index[-1]
+        ):
+            new = series.iloc[index.searchsorted(self._last_key, side="right"):]
+        else:
+            self.reset()
+            new = series.iloc[-(self.baseline_window + self.test_window):]
+
+        if len(new):
+            self.extend(new.to_numpy(dtype=float))
+            self._last_key = index[-1]
+
+    @staticmethod
+    def _ks_test(baseline: np.ndarray, recent: np.ndarray) -> Tuple[float, float]:
+        """Two-sample KS statistic from sorted samples, asymptotic p-value."""
+        n1, n2 = len(baseline), len(recent)
+        pooled = np.concatenate([baseline, recent])
+        cdf1 = np.searchsorted(baseline, pooled, side="right") / n1
+        cdf2 = np.searchsorted(recent, pooled, side="right") / n2
+        statistic = float(np.max(np.abs(cdf1 - cdf2)))
+        effective_n = round(n1 * n2 / (n1 + n2))
+        p_value = float(np.clip(stats.kstwo.sf(statistic, effective_n), 0.0, 1.0))
+        return statistic, p_value
+
+    def _welch_t_test(self, b: _SlidingMoments, r: _SlidingMoments) -> DriftTestResult:
+        """Welch's t-test from window moments."""
+        se2_b, se2_r = b.var / b.n, r.var / r.n
+        se = math.sqrt(se2_b + se2_r)
+        if se == 0:
+            t_statistic, p_value = 0.0, 1.0
+        else:
+            t_statistic = (b.mean - r.mean) / se
+            dof = (se2_b + se2_r) ** 2 / (
+                se2_b**2 / (b.n - 1) + se2_r**2 / (r.n - 1)
+            )
+            p_value = float(2 * stats.t.sf(abs(t_statistic), dof))
+
+        mean_diff = r.mean - b.mean
+        direction = "increased" if mean_diff > 0 else "decreased"
+        return DriftTestResult(
+            test_name="T-test (Mean Shift)",
+            statistic=float(t_statistic),
+            p_value=p_value,
+            drift_detected=p_value < self.alpha,
+            description=(
+                f"Mean {direction} from {b.mean:.2f} to {r.mean:.2f} "
+                f"(diff={abs(mean_diff):.2f}, p={p_value:.4f})"
+            ),
+        )
+
+    def _levene_test(
+        self,
+        baseline: np.ndarray,
+        recent: np.ndarray,
+        b: _SlidingMoments,
+        r: _SlidingMoments,
+    ) -> DriftTestResult:
+        """Median-centred Levene test on the sorted buffers."""
+        z_b = np.abs(baseline - _sorted_median(baseline))
+        z_r = np.abs(recent - _sorted_median(recent))
+        n_total = len(z_b) + len(z_r)
+        zbar_b, zbar_r = z_b.mean(), z_r.mean()
+        zbar = (z_b.sum() + z_r.sum()) / n_total
+        between = len(z_b) * (zbar_b - zbar) ** 2 + len(z_r) * (zbar_r - zbar) ** 2
+        within = ((z_b - zbar_b) ** 2).sum() + ((z_r - zbar_r) ** 2).sum()
+        if within == 0:
+            levene_statistic, p_value = 0.0, 1.0
+        else:
+            levene_statistic = float((n_total - 2) * between / within)
+            p_value = float(stats.f.sf(levene_statistic, 1, n_total - 2))
+
+        var_ratio = r.var / b.var if b.var > 0 else np.inf
+        return DriftTestResult(
+            test_name="Levene Test (Variance Change)",
+            statistic=levene_statistic,
+            p_value=p_value,
+            drift_detected=p_value < self.alpha,
+            description=(
+                f"Variance ratio: {var_ratio:.2f} "
+                f"(baseline={b.std:.2f}, recent={r.std:.2f}, "
+                f"p={p_value:.4f})"
+            ),
+        )
+
+    def _ljung_box_test(self) -> DriftTestResult:
+        """Compare Ljung-Box autocorrelation of the two windows' differences."""
+        lags = self.lags
+        min_length = min(len(self._baseline), len(self._recent))
+        if min_length < lags + 1:
+            lags = max(1, min_length - 1)
+
+        lb_baseline = self._baseline.diffs.ljung_box(lags)
+        lb_recent = self._recent.diffs.ljung_box(lags)
+        if lb_baseline is None or lb_recent is None:
+            return DriftTestResult(
+                test_name="Ljung-Box Test (Autocorrelation)",
+                statistic=0.0,
+                p_value=1.0,
+                drift_detected=False,
+                description="Test failed: insufficient variation in differences",
+            )
+
+        p_value_baseline = float(lb_baseline[1].min())
+        p_value_recent = float(lb_recent[1].min())
+        drift_detected = (p_value_baseline < self.alpha) != (p_value_recent < self.alpha)
+
+        return DriftTestResult(
+            test_name="Ljung-Box Test (Autocorrelation)",
+            statistic=float(max(lb_baseline[0].max(), lb_recent[0].max())),
+            p_value=min(p_value_baseline, p_value_recent),
+            drift_detected=drift_detected,
+            description=(
+                f"Autocorrelation change: baseline_p={p_value_baseline:.4f}, "
+                f"recent_p={p_value_recent:.4f}"
+            ),
+        )
+
+
+def _sorted_median(values: np.ndarray) -> float:
+    """Median of an already sorted array."""
+    mid = len(values) // 2
+    if len(values) % 2:
+        return float(values[mid])
+    return float((values[mid - 1] + values[mid]) / 2)
+
+
+__all__ = ["StreamingDriftDetector"]
@@ -7,8 +7,9 @@ This module implements a production-grade tracking system that:
 3. Calculates out-of-sample performance metrics (RMSE, MAE, MAPE)
 4. Provides calibration diagnostics (CI coverage, directional accuracy)
 
-The system uses Parquet for efficient storage and supports concurrent writes
-from multiple forecasting services.
+The system stores forecasts and actuals in a partitioned, append-only
+Parquet store (see prediction_store.PredictionStore) and supports concurrent
+writes from multiple forecasting services.
 
 Example:
     >>> from forex_core.mlops.tracking import PredictionTracker
@@ -43,14 +44,21 @@ from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Dict, List, Optional
 
+import numpy as np
 import pandas as pd
-import pyarrow as pa
-import pyarrow.parquet as pq
 from loguru import logger
 
 from forex_core.config import get_settings
-from forex_core.data import DataLoader
-from forex_core.utils.file_lock import ParquetFileLock
+from forex_core.data import BundleSnapshotStore, DataLoader, Warehouse
+from forex_core.mlops.prediction_store import PredictionStore
+from forex_core.mlops.rolling_metrics import RollingMetricsStore
+
+# Warehouse name of the daily USD/CLP series written by DataLoader
+USDCLP_WAREHOUSE_SERIES = "usdclp_daily"
+# Max age of the last observation on or before a target date (weekends, holidays)
+ACTUALS_TOLERANCE_DAYS = 3
+# Recent window scanned first by get_latest_prediction()
+LATEST_PREDICTION_SCAN_DAYS = 62
 
 
 class PredictionTracker:
@@ -60,11 +68,16 @@ class PredictionTracker:
     Maintains a persistent Parquet database of predictions with actual outcomes,
     enabling calculation of true out-of-sample performance metrics.
 
+    Forecasts and actuals are appended to separate tables partitioned by
+    horizon and forecast month, so no write rewrites existing history.
+
     Attributes:
-        storage_path: Path to Parquet file storing predictions.
+        storage_path: Legacy single-file path; the store lives next to it
+            and migrates its rows on first use.
+        store: Partitioned PredictionStore holding forecasts and actuals.
         lock: Threading lock for concurrent write safety.
 
-    Schema:
+    Schema (merged view returned by store.read()):
         - forecast_date: When the prediction was made (datetime64[ns])
         - horizon: Forecast horizon ("7d", "15d", "30d", "90d")
         - target_date: Date being predicted (datetime64[ns])
@@ -84,8 +97,9 @@ class PredictionTracker:
         Initialize prediction tracker.
 
         Args:
-            storage_path: Custom path for Parquet storage.
-                         If None, uses default data/predictions/predictions.parquet.
+            storage_path: Custom legacy Parquet path. The partitioned store is
+                         created at ``<parent>/<stem>_store``. If None, uses
+                         default data/predictions/predictions.parquet.
         """
         if storage_path is None:
             settings = get_settings()
@@ -99,48 +113,11 @@ class PredictionTracker:
         # Thread safety lock
         self.lock = threading.Lock()
 
-        # Initialize storage if it doesn't exist
-        if not self.storage_path.exists():
-            self._initialize_storage()
-
-        logger.info(f"PredictionTracker initialized: {self.storage_path}")
-
-    def _initialize_storage(self) -> None:
-        """Create empty Parquet file with correct schema."""
-        schema = pa.schema([
-            ("forecast_date", pa.timestamp("ns")),
-            ("horizon", pa.string()),
-            ("target_date", pa.timestamp("ns")),
-            ("predicted_mean", pa.float64()),
-            ("ci95_low", pa.float64()),
-            ("ci95_high", pa.float64()),
-            ("actual_value", pa.float64()),  # Nullable
-            ("error", pa.float64()),  # Nullable
-            ("abs_error", pa.float64()),  # Nullable
-            ("pct_error", pa.float64()),  # Nullable
-            ("logged_at", pa.timestamp("ns")),
-            ("updated_at", pa.timestamp("ns")),
-        ])
-
-        # Create empty table
-        empty_df = pd.DataFrame({
-            "forecast_date": pd.Series(dtype="datetime64[ns]"),
-            "horizon": pd.Series(dtype="str"),
-            "target_date": pd.Series(dtype="datetime64[ns]"),
-            "predicted_mean": pd.Series(dtype="float64"),
-            "ci95_low": pd.Series(dtype="float64"),
-            "ci95_high": pd.Series(dtype="float64"),
-            "actual_value": pd.Series(dtype="float64"),
-            "error": pd.Series(dtype="float64"),
-            "abs_error": pd.Series(dtype="float64"),
-            "pct_error": pd.Series(dtype="float64"),
-            "logged_at": pd.Series(dtype="datetime64[ns]"),
-            "updated_at": pd.Series(dtype="datetime64[ns]"),
-        })
-
-        table = pa.Table.from_pandas(empty_df, schema=schema)
-        pq.write_table(table, self.storage_path)
-        logger.info(f"Initialized prediction storage: {self.storage_path}")
+        self.store = PredictionStore.for_legacy_path(self.storage_path)
+        # Per-day error statistics consumed by PerformanceMonitor
+        self.metrics = RollingMetricsStore(self.store)
+
+        logger.info(f"PredictionTracker initialized: {self.store.root}")
 
     def log_prediction(
         self,
@@ -192,7 +169,6 @@ class PredictionTracker:
 
         now = datetime.now()
 
-        # Create new record
         new_record = pd.DataFrame([{
             "forecast_date": forecast_date,
             "horizon": horizon,
@@ -200,46 +176,28 @@ class PredictionTracker:
             "predicted_mean": predicted_mean,
             "ci95_low": ci95_low,
             "ci95_high": ci95_high,
-            "actual_value": None,
-            "error": None,
-            "abs_error": None,
-            "pct_error": None,
             "logged_at": now,
-            "updated_at": now,
         }])
 
-        # Process-safe append using file lock
-        # Note: self.lock is kept for backward compatibility but ParquetFileLock
-        # provides true multi-process safety
+        # Process-safe append: the lock covers only this horizon/month
+        # partition, and the write adds a new file instead of rewriting history
         with self.lock:
             try:
-                # Acquire file lock for multi-process safety
-                with ParquetFileLock(self.storage_path, timeout=30.0):
-                    # Read existing data
-                    if self.storage_path.exists() and self.storage_path.stat().st_size > 0:
-                        existing_df = pd.read_parquet(self.storage_path)
-
-                        # Check for duplicate prediction
-                        duplicate_mask = (
-                            (existing_df["forecast_date"] == forecast_date) &
-                            (existing_df["horizon"] == horizon) &
-                            (existing_df["target_date"] == target_date)
+                with self.store.partition_lock(horizon, forecast_date):
+                    # Check for duplicate prediction
+                    existing_df = self.store.read(
+                        horizon=horizon,
+                        since=forecast_date,
+                        until=pd.Timestamp(forecast_date) + pd.Timedelta(1, "ns"),
+                    )
+                    if (existing_df["target_date"] == pd.Timestamp(target_date)).any():
+                        logger.warning(
+                            f"Duplicate prediction exists for forecast_date={forecast_date}, "
+                            f"horizon={horizon}, target_date={target_date}. Skipping."
                         )
+                        return
 
-                        if duplicate_mask.any():
-                            logger.warning(
-                                f"Duplicate prediction exists for forecast_date={forecast_date}, "
-                                f"horizon={horizon}, target_date={target_date}. Skipping."
-                            )
-                            return
-
-                        # Append new record
-                        combined_df = pd.concat([existing_df, new_record], ignore_index=True)
-                    else:
-                        combined_df = new_record
-
-                    # Write back to storage (inside lock)
-                    combined_df.to_parquet(self.storage_path, index=False)
+                    self.store.append_forecasts(new_record)
 
                     logger.info(
                         f"Logged prediction: horizon={horizon}, "
@@ -248,22 +206,30 @@ class PredictionTracker:
                     )
 
             except TimeoutError as e:
-                logger.error(f"Timeout acquiring file lock for {self.storage_path}: {e}")
+                logger.error(f"Timeout acquiring file lock for {self.store.root}: {e}")
                 raise IOError(f"Failed to acquire file lock: {e}") from e
             except Exception as e:
                 logger.error(f"Failed to log prediction: {e}")
                 raise IOError(f"Failed to write prediction: {e}") from e
 
-    def update_actuals(self, lookback_days: int = 365) -> int:
+    def update_actuals(
+        self,
+        lookback_days: int = 365,
+        usdclp_series: Optional[pd.Series] = None,
+    ) -> int:
         """
         Update actual values for predictions whose target dates have passed.
 
-        Fetches latest USD/CLP data and updates predictions that now have
-        realized values available. Only updates predictions within lookback window
-        to avoid processing very old data.
+        Matches every pending prediction to the last USD/CLP observation on
+        or before its target date (within ACTUALS_TOLERANCE_DAYS) with a
+        single as-of join, then computes error columns in bulk. Only updates
+        predictions within lookback window to avoid processing very old data.
 
         Args:
             lookback_days: How far back to look for predictions to update (default: 365).
+            usdclp_series: USD/CLP series to reconcile against. If None, it is
+                read from the warehouse or a DataBundle snapshot (see
+                _load_actuals_series).
 
         Returns:
             Number of predictions updated.
@@ -275,133 +241,161 @@ class PredictionTracker:
         """
         with self.lock:
             try:
-                # Read existing predictions
-                if not self.storage_path.exists() or self.storage_path.stat().st_size == 0:
-                    logger.info("No predictions to update")
-                    return 0
-
-                df = pd.read_parquet(self.storage_path)
-
-                if len(df) == 0:
-                    logger.info("No predictions to update")
-                    return 0
-
-                # Filter: predictions without actuals and within lookback window
+                # Read pending predictions within lookback window (partition-pruned)
                 cutoff_date = datetime.now() - timedelta(days=lookback_days)
-                mask_needs_update = (
-                    df["actual_value"].isna() &
-                    (df["target_date"] < pd.Timestamp.now()) &
-                    (df["forecast_date"] >= pd.Timestamp(cutoff_date))
-                )
+                pending = self.store.read(since=pd.Timestamp(cutoff_date), has_actual=False)
+                pending = pending[pending["target_date"] < pd.Timestamp.now()]
 
-                if not mask_needs_update.any():
+                if len(pending) == 0:
                     logger.info("No predictions need updating")
                     return 0
 
                 # Load actual data
-                logger.info("Fetching actual USD/CLP data...")
-                settings = get_settings()
-                loader = DataLoader(settings)
-                bundle = loader.load()
-                usdclp_series = bundle.usdclp_series
-
-                # Update each prediction
-                updates_count = 0
-                for idx in df[mask_needs_update].index:
-                    target_date = df.loc[idx, "target_date"]
-                    predicted_mean = df.loc[idx, "predicted_mean"]
-                    ci95_low = df.loc[idx, "ci95_low"]
-                    ci95_high = df.loc[idx, "ci95_high"]
-
-                    # Try to find actual value (match by date)
-                    try:
-                        # Convert target_date to date for matching
-                        target_date_only = pd.Timestamp(target_date).date()
-
-                        # Look for exact match in usdclp_series (index should be dates)
-                        if target_date_only in usdclp_series.index.date:
-                            actual_value = float(usdclp_series.loc[target_date_only])
-
-                            # Calculate errors
-                            error = predicted_mean - actual_value
-                            abs_error = abs(error)
-                            pct_error = error / actual_value if actual_value != 0 else None
-
-                            # Update record
-                            df.loc[idx, "actual_value"] = actual_value
-                            df.loc[idx, "error"] = error
-                            df.loc[idx, "abs_error"] = abs_error
-                            df.loc[idx, "pct_error"] = pct_error
-                            df.loc[idx, "updated_at"] = pd.Timestamp.now()
-
-                            updates_count += 1
-
-                            logger.debug(
-                                f"Updated: target={target_date_only}, "
-                                f"predicted={predicted_mean:.2f}, "
-                                f"actual={actual_value:.2f}, "
-                                f"error={error:.2f}"
-                            )
-                        else:
-                            # Try to find nearest date (within +/- 3 days)
-                            nearest_dates = [
-                                target_date_only + timedelta(days=d)
-                                for d in range(-3, 4)
-                            ]
-
-                            found = False
-                            for near_date in nearest_dates:
-                                if near_date in usdclp_series.index.date:
-                                    actual_value = float(usdclp_series.loc[near_date])
-
-                                    error = predicted_mean - actual_value
-                                    abs_error = abs(error)
-                                    pct_error = error / actual_value if actual_value != 0 else None
-
-                                    df.loc[idx, "actual_value"] = actual_value
-                                    df.loc[idx, "error"] = error
-                                    df.loc[idx, "abs_error"] = abs_error
-                                    df.loc[idx, "pct_error"] = pct_error
-                                    df.loc[idx, "updated_at"] = pd.Timestamp.now()
-
-                                    updates_count += 1
-                                    found = True
-
-                                    logger.debug(
-                                        f"Updated (nearest): target={target_date_only}, "
-                                        f"used={near_date}, predicted={predicted_mean:.2f}, "
-                                        f"actual={actual_value:.2f}"
-                                    )
-                                    break
-
-                            if not found:
-                                logger.debug(
-                                    f"No actual data available for target_date={target_date_only}"
-                                )
-
-                    except Exception as e:
-                        logger.warning(
-                            f"Failed to update prediction for target_date={target_date}: {e}"
-                        )
-                        continue
+                if usdclp_series is None:
+                    usdclp_series = self._load_actuals_series()
+
+                actuals = self._match_actuals(pending["target_date"], usdclp_series)
+                matched = pending.loc[actuals.notna()].copy()
+                updates_count = len(matched)
 
-                # Write updated data back (with file lock for process safety)
                 if updates_count > 0:
-                    with ParquetFileLock(self.storage_path, timeout=30.0):
-                        df.to_parquet(self.storage_path, index=False)
+                    actual_values = actuals[matched.index].to_numpy()
+                    errors = matched["predicted_mean"].to_numpy() - actual_values
+
+                    matched["actual_value"] = actual_values
+                    matched["error"] = errors
+                    matched["abs_error"] = np.abs(errors)
+                    with np.errstate(divide="ignore", invalid="ignore"):
+                        matched["pct_error"] = np.where(
+                            actual_values != 0, errors / actual_values, np.nan
+                        )
+                    matched["updated_at"] = pd.Timestamp.now()
+
+                    # Append-only: one new actuals file per touched partition
+                    self._append_actuals(matched)
                     logger.success(f"Updated {updates_count} predictions with actual values")
                 else:
                     logger.info("No predictions could be updated (data not yet available)")
 
+                unmatched = len(pending) - updates_count
+                if unmatched:
+                    logger.debug(f"No actual data available for {unmatched} predictions")
+
                 return updates_count
 
             except TimeoutError as e:
-                logger.error(f"Timeout acquiring file lock for {self.storage_path}: {e}")
+                logger.error(f"Timeout acquiring file lock for {self.store.root}: {e}")
                 return 0
             except Exception as e:
                 logger.error(f"Failed to update actuals: {e}")
                 return 0
 
+    def _append_actuals(self, reconciled: pd.DataFrame) -> None:
+        """
+        Store new actuals and fold them into the rolling metrics.
+
+        The store write happens under the metrics lock so that a concurrent
+        rebuild cannot count the rows before they are folded in again. If
+        the write succeeds but the fold fails, the statistics are dropped.
+        """
+        appended = False
+
+        def append(rows: pd.DataFrame) -> None:
+            nonlocal appended
+            self.store.append_actuals(rows)
+            appended = True
+
+        try:
+            self.metrics.record(reconciled, append=append)
+        except Exception as e:
+            if not appended:
+                raise
+            # Actuals are already stored; the next reader rebuilds the statistics
+            logger.warning(f"Failed to update rolling metrics, will rebuild: {e}")
+            self.metrics.invalidate()
+
+    @staticmethod
+    def _match_actuals(target_dates: pd.Series, usdclp_series: pd.Series) -> pd.Series:
+        """
+        As-of join target dates to the last observation on or before them.
+
+        Targets later than the last stored observation are left unmatched:
+        the series is not up to date for them yet, and filling them from an
+        earlier day would store a wrong actual permanently.
+
+        Args:
+            target_dates: Target dates indexed by prediction row.
+            usdclp_series: Observed USD/CLP values with a datetime index.
+
+        Returns:
+            Actual value per prediction row (same index as target_dates),
+            NaN where the target is after the last observation or no
+            observation lies within ACTUALS_TOLERANCE_DAYS before it.
+        """
+        observed = usdclp_series.dropna()
+        dates = pd.DatetimeIndex(observed.index)
+        if dates.tz is not None:
+            dates = dates.tz_localize(None)
+
+        right = (
+            pd.DataFrame({
+                "date": dates.normalize().astype("datetime64[ns]"),
+                "actual_value": observed.to_numpy(dtype="float64"),
+            })
+            .drop_duplicates("date", keep="last")
+            .sort_values("date")
+        )
+        left = (
+            pd.DataFrame({
+                "row": target_dates.index,
+                "date": pd.to_datetime(target_dates).dt.normalize().astype("datetime64[ns]").to_numpy(),
+            })
+            .sort_values("date")
+        )
+        if right.empty:
+            return pd.Series(float("nan"), index=target_dates.index)
+        left = left[left["date"] <= right["date"].iloc[-1]]
+
+        merged = pd.merge_asof(
+            left,
+            right,
+            on="date",
+            direction="backward",
+            tolerance=pd.Timedelta(days=ACTUALS_TOLERANCE_DAYS),
+        )
+        return pd.Series(
+            merged["actual_value"].to_numpy(), index=merged["row"].to_numpy()
+        ).reindex(target_dates.index)
+
+    @staticmethod
+    def _load_actuals_series() -> pd.Series:
+        """
+        Read the USD/CLP series without querying every data provider.
+
+        Prefers the warehouse series that DataLoader keeps up to date, then
+        a fresh DataBundle snapshot. A full DataLoader.load() only happens
+        when neither is available. Predictions whose targets are newer than
+        the stored data stay pending until the next run.
+
+        Returns:
+            USD/CLP daily series.
+        """
+        settings = get_settings()
+
+        stored = Warehouse(settings).load_series(USDCLP_WAREHOUSE_SERIES)
+        if stored is not None and not stored.empty:
+            logger.info("Using USD/CLP actuals from warehouse")
+            return stored
+
+        snapshot = BundleSnapshotStore(settings).load(max_age=settings.bundle_snapshot_max_age)
+        if snapshot is not None:
+            logger.info("Using USD/CLP actuals from DataBundle snapshot")
+            return snapshot.usdclp_series
+
+        logger.info("Fetching actual USD/CLP data...")
+        bundle = DataLoader(settings).load(max_age=settings.bundle_snapshot_max_age)
+        return bundle.usdclp_series
+
     def get_recent_performance(
         self,
         horizon: Optional[str] = None,
@@ -438,28 +432,17 @@ class PredictionTracker:
             >>> print(f"Sample: {perf['n_predictions']} predictions")
         """
         try:
-            # Read predictions
-            if not self.storage_path.exists() or self.storage_path.stat().st_size == 0:
-                logger.warning("No predictions available for performance calculation")
-                return self._empty_metrics()
-
-            df = pd.read_parquet(self.storage_path)
+            # Validate horizon if specified
+            if horizon is not None and horizon not in ["7d", "15d", "30d", "90d"]:
+                raise ValueError(f"Invalid horizon: {horizon}")
 
-            if len(df) == 0:
+            if not self.store.exists():
                 logger.warning("No predictions available for performance calculation")
                 return self._empty_metrics()
 
-            # Filter by recent forecasts
+            # Filter by recent forecasts (pushed down to partition pruning)
             cutoff_date = datetime.now() - timedelta(days=days)
-            recent_mask = df["forecast_date"] >= pd.Timestamp(cutoff_date)
-
-            # Filter by horizon if specified
-            if horizon is not None:
-                if horizon not in ["7d", "15d", "30d", "90d"]:
-                    raise ValueError(f"Invalid horizon: {horizon}")
-                recent_mask &= df["horizon"] == horizon
-
-            recent_df = df[recent_mask]
+            recent_df = self.store.read(horizon=horizon, since=pd.Timestamp(cutoff_date))
 
             if len(recent_df) == 0:
                 logger.info(f"No recent predictions found for horizon={horizon}, days={days}")
@@ -499,6 +482,9 @@ class PredictionTracker:
             # Need previous actual value to determine direction
             with_actuals = with_actuals.sort_values("target_date")
 
+            # Realized values of every horizon, for direction baselines
+            df = self.store.read_actuals()
+
             # Get previous actual for each prediction (shift by target_date)
             directional_correct = []
             for idx in with_actuals.index:
@@ -586,15 +572,13 @@ class PredictionTracker:
             >>> print(summary.groupby("horizon")["actual_value"].count())
         """
         try:
-            if not self.storage_path.exists() or self.storage_path.stat().st_size == 0:
+            if not self.store.exists():
                 logger.info("No predictions available")
                 return pd.DataFrame()
 
-            df = pd.read_parquet(self.storage_path)
-
             # Filter recent
             cutoff_date = datetime.now() - timedelta(days=days)
-            recent_df = df[df["forecast_date"] >= pd.Timestamp(cutoff_date)].copy()
+            recent_df = self.store.read(since=pd.Timestamp(cutoff_date))
 
             if len(recent_df) == 0:
                 logger.info(f"No predictions in last {days} days")
@@ -627,14 +611,15 @@ class PredictionTracker:
             ...     print(f"Latest 7d forecast: {latest['prediction']:.2f}")
         """
         try:
-            if not self.storage_path.exists() or self.storage_path.stat().st_size == 0:
+            if not self.store.exists():
                 logger.debug(f"No predictions available for {horizon}")
                 return None
 
-            df = pd.read_parquet(self.storage_path)
-
-            # Filter by horizon
-            horizon_df = df[df["horizon"] == horizon].copy()
+            # Recent partitions first; fall back to the full horizon history
+            recent_cutoff = pd.Timestamp.now() - timedelta(days=LATEST_PREDICTION_SCAN_DAYS)
+            horizon_df = self.store.read(horizon=horizon, since=recent_cutoff)
+            if len(horizon_df) == 0:
+                horizon_df = self.store.read(horizon=horizon)
 
             if len(horizon_df) == 0:
                 logger.debug(f"No predictions found for horizon {horizon}")
@@ -4,11 +4,18 @@ Walk-Forward Validation System for Forex Forecasting.
 Implementa validación walk-forward (time-series cross-validation) para
 evaluar performance de modelos en condiciones realistas, respetando
 el orden temporal de los datos.
+
+Los folds son independientes: con ``n_jobs > 1`` se ejecutan en un pool de
+procesos y el reporte los ordena por número de fold. ``validate_incremental``
+reutiliza los folds del último reporte guardado y sólo ejecuta los nuevos.
 """
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+import pickle
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, replace
 from datetime import datetime, timedelta
 from enum import Enum
 from pathlib import Path
@@ -21,6 +28,9 @@ from loguru import logger
 from forex_core.data.loader import DataBundle, DataLoader
 from forex_core.data.models import ForecastPackage
 
+# Per-fold arrays persisted next to the scalar metrics
+_ARRAY_COLUMNS = ("forecast_values", "actual_values", "ci95_low", "ci95_high")
+
 
 class ValidationMode(str, Enum):
     """Modo de validación walk-forward."""
@@ -51,6 +61,7 @@ class ValidationMetrics:
         actual_values: Valores reales.
         ci95_low: Límite inferior IC 95%.
         ci95_high: Límite superior IC 95%.
+        duration_seconds: Tiempo de ejecución del fold.
     """
 
     fold: int
@@ -69,6 +80,17 @@ class ValidationMetrics:
     actual_values: np.ndarray
     ci95_low: np.ndarray
     ci95_high: np.ndarray
+    duration_seconds: float = 0.0
+
+    @property
+    def key(self) -> tuple:
+        """Identifica el fold por sus fechas de train/test."""
+        return (
+            pd.Timestamp(self.train_start),
+            pd.Timestamp(self.train_end),
+            pd.Timestamp(self.test_start),
+            pd.Timestamp(self.test_end),
+        )
 
     def to_dict(self) -> dict:
         """Convert metrics to dictionary (excluding arrays)."""
@@ -85,6 +107,7 @@ class ValidationMetrics:
             "mape": self.mape,
             "ci95_coverage": self.ci95_coverage,
             "bias": self.bias,
+            "duration_seconds": self.duration_seconds,
         }
 
 
@@ -188,6 +211,7 @@ class WalkForwardValidator:
         step_days: int = 30,
         mode: ValidationMode = ValidationMode.EXPANDING,
         storage_path: Optional[Path] = None,
+        n_jobs: int = 1,
     ):
         """
         Initialize walk-forward validator.
@@ -200,6 +224,8 @@ class WalkForwardValidator:
             step_days: Días de avance entre folds.
             mode: Modo de validación (expanding/rolling).
             storage_path: Path para almacenar resultados.
+            n_jobs: Procesos para ejecutar folds en paralelo (1 = secuencial).
+                forecaster_func debe ser picklable (función a nivel de módulo).
         """
         self.forecaster_func = forecaster_func
         self.horizon_days = horizon_days
@@ -207,6 +233,7 @@ class WalkForwardValidator:
         self.test_days = test_days
         self.step_days = step_days
         self.mode = mode
+        self.n_jobs = max(1, n_jobs)
 
         if storage_path is None:
             from forex_core.config import get_settings
@@ -220,13 +247,14 @@ class WalkForwardValidator:
         logger.info(
             f"WalkForwardValidator initialized: horizon={horizon_days}d, "
             f"mode={mode.value}, initial_train={initial_train_days}d, "
-            f"test={test_days}d, step={step_days}d"
+            f"test={test_days}d, step={step_days}d, n_jobs={self.n_jobs}"
         )
 
     def validate(
         self,
         series: pd.Series,
         max_folds: Optional[int] = None,
+        previous_report: Optional[ValidationReport] = None,
     ) -> ValidationReport:
         """
         Ejecuta validación walk-forward en la serie.
@@ -234,9 +262,12 @@ class WalkForwardValidator:
         Args:
             series: Serie temporal a validar (USD/CLP).
             max_folds: Máximo número de folds (None = todos posibles).
+            previous_report: Reporte anterior del mismo forecaster. Los folds
+                con las mismas fechas de train/test se reutilizan sin
+                re-ejecutar el modelo.
 
         Returns:
-            ValidationReport con resultados completos.
+            ValidationReport con resultados completos, ordenado por fold.
         """
         logger.info(f"Starting walk-forward validation: {len(series)} observations")
         start_time = datetime.now()
@@ -249,28 +280,33 @@ class WalkForwardValidator:
             logger.error("No folds available for validation")
             return self._create_empty_report()
 
-        # Execute each fold
+        # Reuse folds already evaluated in the previous report
+        previous = {}
+        if previous_report is not None:
+            previous = {m.key: m for m in previous_report.fold_metrics}
+
         fold_metrics = []
+        pending = []
         for i, (train_idx, test_idx) in enumerate(folds, 1):
-            logger.info(f"Executing fold {i}/{len(folds)}...")
-
-            try:
-                metrics = self._execute_fold(
-                    fold=i,
-                    series=series,
-                    train_idx=train_idx,
-                    test_idx=test_idx,
-                )
-                fold_metrics.append(metrics)
+            key = (
+                series.index[train_idx[0]],
+                series.index[train_idx[-1]],
+                series.index[test_idx[0]],
+                series.index[test_idx[-1]],
+            )
+            if key in previous:
+                fold_metrics.append(replace(previous[key], fold=i))
+            else:
+                pending.append((i, train_idx, test_idx))
 
-                logger.info(
-                    f"Fold {i} complete: RMSE={metrics.rmse:.2f}, "
-                    f"MAE={metrics.mae:.2f}, MAPE={metrics.mape:.2f}%"
-                )
+        if previous:
+            logger.info(
+                f"Reusing {len(fold_metrics)} folds from previous report, "
+                f"executing {len(pending)} new"
+            )
 
-            except Exception as e:
-                logger.error(f"Fold {i} failed: {e}")
-                continue
+        fold_metrics.extend(self._execute_folds(series, pending, len(folds)))
+        fold_metrics.sort(key=lambda m: m.fold)
 
         if not fold_metrics:
             logger.error("All folds failed")
@@ -287,6 +323,94 @@ class WalkForwardValidator:
 
         return report
 
+    def validate_incremental(
+        self,
+        series: pd.Series,
+        max_folds: Optional[int] = None,
+    ) -> ValidationReport:
+        """
+        Valida sólo los folds agregados desde el último reporte guardado.
+
+        Asume que el forecaster y la historia ya validada no cambiaron;
+        ante un cambio de modelo usar ``validate`` sin reporte previo.
+
+        Args:
+            series: Serie temporal a validar (USD/CLP).
+            max_folds: Máximo número de folds (None = todos posibles).
+
+        Returns:
+            ValidationReport con folds reutilizados y nuevos.
+        """
+        return self.validate(
+            series,
+            max_folds=max_folds,
+            previous_report=self.load_latest_report(),
+        )
+
+    def _execute_folds(
+        self,
+        series: pd.Series,
+        pending: list[tuple[int, np.ndarray, np.ndarray]],
+        n_folds: int,
+    ) -> list[ValidationMetrics]:
+        """
+        Ejecuta folds secuencialmente o en un pool de procesos.
+
+        Un fold que falla se registra y se omite del reporte.
+        """
+        if not pending:
+            return []
+
+        n_jobs = min(self.n_jobs, len(pending))
+        if n_jobs > 1 and not self._is_picklable():
+            logger.warning(
+                "forecaster_func is not picklable, running folds sequentially"
+            )
+            n_jobs = 1
+
+        results = []
+        if n_jobs == 1:
+            for i, train_idx, test_idx in pending:
+                logger.info(f"Executing fold {i}/{n_folds}...")
+                try:
+                    results.append(self._execute_fold(i, series, train_idx, test_idx))
+                except Exception as e:
+                    logger.error(f"Fold {i} failed: {e}")
+                    continue
+                self._log_fold(results[-1])
+            return results
+
+        logger.info(f"Executing {len(pending)} folds on {n_jobs} processes")
+        with ProcessPoolExecutor(max_workers=n_jobs) as executor:
+            futures = [
+                (i, executor.submit(self._execute_fold, i, series, train_idx, test_idx))
+                for i, train_idx, test_idx in pending
+            ]
+            for i, future in futures:
+                try:
+                    results.append(future.result())
+                except Exception as e:
+                    logger.error(f"Fold {i} failed: {e}")
+                    continue
+                self._log_fold(results[-1])
+
+        return results
+
+    def _is_picklable(self) -> bool:
+        try:
+            pickle.dumps(self.forecaster_func)
+        except Exception:
+            return False
+        return True
+
+    @staticmethod
+    def _log_fold(metrics: ValidationMetrics) -> None:
+        logger.info(
+            f"Fold {metrics.fold} complete: RMSE={metrics.rmse:.2f}, "
+            f"MAE={metrics.mae:.2f}, MAPE={metrics.mape:.2f}%, "
+            f"time={metrics.duration_seconds:.1f}s"
+        )
+
     def _calculate_folds(
         self,
         series: pd.Series,
@@ -295,6 +419,10 @@ class WalkForwardValidator:
         """
         Calcula índices de train/test para cada fold.
 
+        Con max_folds se conservan los últimos N folds, así las corridas
+        incrementales avanzan con los datos nuevos en vez de repetir los
+        primeros folds de la serie.
+
         Returns:
             Lista de (train_indices, test_indices) para cada fold.
         """
@@ -323,9 +451,9 @@ class WalkForwardValidator:
             # Move to next fold
             current_test_start += self.step_days
 
-            # Check max_folds limit
-            if max_folds and len(folds) >= max_folds:
-                break
+        # Keep the most recent max_folds folds
+        if max_folds:
+            folds = folds[-max_folds:]
 
         return folds
 
@@ -348,6 +476,8 @@ class WalkForwardValidator:
         Returns:
             ValidationMetrics para este fold.
         """
+        fold_start = time.perf_counter()
+
         # Get train/test data
         train_series = series.iloc[train_idx]
         test_series = series.iloc[test_idx]
@@ -397,6 +527,7 @@ class WalkForwardValidator:
             actual_values=actual_values,
             ci95_low=ci95_low,
             ci95_high=ci95_high,
+            duration_seconds=time.perf_counter() - fold_start,
         )
 
     def _create_bundle(self, series: pd.Series) -> DataBundle:
@@ -528,15 +659,84 @@ class WalkForwardValidator:
         summary_path = self.storage_path / f"summary_{filename}"
         summary_df.to_parquet(summary_path, index=False)
 
-        # Save fold metrics
+        # Save fold metrics (with forecasts, so folds can be reused later)
         if fold_data:
             folds_df = pd.DataFrame(fold_data)
+            for column in _ARRAY_COLUMNS:
+                folds_df[column] = [
+                    np.asarray(getattr(m, column), dtype=float).tolist()
+                    for m in report.fold_metrics
+                ]
             folds_df.to_parquet(filepath, index=False)
 
         logger.info(f"Validation report saved to {filepath}")
 
         return filepath
 
+    def load_report(self, filepath: Path) -> Optional[ValidationReport]:
+        """
+        Carga un reporte guardado con ``save_report``.
+
+        Args:
+            filepath: Path al archivo de métricas por fold.
+
+        Returns:
+            ValidationReport, o None si falta el archivo de resumen.
+        """
+        summary_path = filepath.parent / f"summary_{filepath.name}"
+        if not filepath.exists() or not summary_path.exists():
+            return None
+
+        summary = pd.read_parquet(summary_path).iloc[0]
+        folds_df = pd.read_parquet(filepath)
+
+        fold_metrics = []
+        for row in folds_df.to_dict("records"):
+            arrays = {
+                column: np.asarray(row.get(column, []), dtype=float)
+                for column in _ARRAY_COLUMNS
+            }
+            fold_metrics.append(
+                ValidationMetrics(
+                    fold=int(row["fold"]),
+                    train_start=pd.Timestamp(row["train_start"]),
+                    train_end=pd.Timestamp(row["train_end"]),
+                    test_start=pd.Timestamp(row["test_start"]),
+                    test_end=pd.Timestamp(row["test_end"]),
+                    n_train=int(row["n_train"]),
+                    n_test=int(row["n_test"]),
+                    rmse=float(row["rmse"]),
+                    mae=float(row["mae"]),
+                    mape=float(row["mape"]),
+                    ci95_coverage=float(row["ci95_coverage"]),
+                    bias=float(row["bias"]),
+                    duration_seconds=float(row.get("duration_seconds", 0.0)),
+                    **arrays,
+                )
+            )
+
+        if not fold_metrics:
+            return None
+
+        report = self._create_report(fold_metrics, float(summary["duration_seconds"]))
+        return replace(report, timestamp=pd.Timestamp(summary["timestamp"]).to_pydatetime())
+
+    def load_latest_report(self) -> Optional[ValidationReport]:
+        """
+        Carga el último reporte guardado para este horizonte y modo.
+
+        Returns:
+            ValidationReport más reciente, o None si no hay ninguno.
+        """
+        pattern = f"validation_{self.horizon_days}d_{self.mode.value}_*.parquet"
+        # Default filenames embed a sortable timestamp
+        for filepath in sorted(self.storage_path.glob(pattern), reverse=True):
+            report = self.load_report(filepath)
+            if report is not None:
+                logger.info(f"Loaded previous validation report: {filepath.name}")
+                return report
+        return None
+
 
 __all__ = [
     "WalkForwardValidator",
@@ -0,0 +1,235 @@
+"""
+Compact, versioned on-disk format for trained forecasters.
+
+An artifact directory holds:
+- ``manifest.json``: format version, free-form metadata, one metadata
+  block per component (XGBoost, SARIMAX, GARCH, ...) and the name of the
+  generation directory holding the data files
+- ``gen-<ns>-<id>/arrays.bin``: every numeric array of every component,
+  concatenated as float64 and memory-mapped on read
+- ``gen-<ns>-<id>/<side files>``: files owned by a component (e.g. the
+  XGBoost UBJ booster)
+
+Reading the manifest is cheap; arrays are only paged in when a component
+asks for them, so forecasters can load components lazily. Data files are
+never rewritten: each save builds a new generation in a temporary
+directory, renames it into place and then replaces the manifest, so a
+reader that opened the previous manifest keeps reading matching files.
+The previous generation is kept for such readers; older ones are removed.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import shutil
+import time
+import uuid
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Optional, Set
+
+import numpy as np
+from sklearn.preprocessing import StandardScaler
+
+ARTIFACT_FORMAT_VERSION = 3
+MANIFEST_FILE = "manifest.json"
+PAYLOAD_FILE = "arrays.bin"
+_GENERATION_PREFIX = "gen-"
+
+
+class ArtifactWriter:
+    """
+    Collects component metadata and arrays, then writes them in one go.
+
+    Example:
+        >>> writer = ArtifactWriter(Path("models/ensemble_7d"))
+        >>> writer.add_array("garch/params", params)
+        >>> writer.add_component("garch", {"model_type": "EGARCH"})
+        >>> writer.write({"horizon_days": 7})
+    """
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self.path.mkdir(parents=True, exist_ok=True)
+        self._generation = f"{_GENERATION_PREFIX}{time.time_ns():020d}-{uuid.uuid4().hex[:8]}"
+        # Built under a temporary name; write() renames it into place
+        self._staging = self.path / f".{self._generation}.tmp"
+        self._staging.mkdir()
+        self._arrays: Dict[str, np.ndarray] = {}
+        self._components: Dict[str, Dict[str, Any]] = {}
+
+    def add_array(self, name: str, array: Any) -> None:
+        """Register a numeric array (stored as float64)."""
+        if name in self._arrays:
+            raise ValueError(f"Duplicate artifact array: {name}")
+        self._arrays[name] = np.ascontiguousarray(array, dtype=np.float64)
+
+    def add_component(self, name: str, metadata: Dict[str, Any]) -> None:
+        """Register the JSON metadata of a component."""
+        self._components[name] = metadata
+
+    def file_path(self, filename: str) -> Path:
+        """Path for a side file of this artifact's generation."""
+        return self._staging / filename
+
+    def write(self, metadata: Optional[Dict[str, Any]] = None) -> None:
+        """Publish the generation, then replace the manifest that points to it."""
+        index: Dict[str, Dict[str, Any]] = {}
+        offset = 0
+        with open(self._staging / PAYLOAD_FILE, "wb") as f:
+            for name, array in self._arrays.items():
+                f.write(array.tobytes())
+                index[name] = {"offset": offset, "shape": list(array.shape)}
+                offset += array.size
+
+        manifest = {
+            "format_version": ARTIFACT_FORMAT_VERSION,
+            "saved_at": datetime.now().isoformat(),
+            "generation": self._generation,
+            "metadata": metadata or {},
+            "components": self._components,
+            "arrays": index,
+        }
+        manifest_tmp = self.path / f".{MANIFEST_FILE}.{uuid.uuid4().hex[:8]}"
+        with open(manifest_tmp, "w") as f:
+            json.dump(manifest, f, indent=2)
+
+        previous = _current_generation(self.path)
+        os.replace(self._staging, self.path / self._generation)
+        os.replace(manifest_tmp, self.path / MANIFEST_FILE)
+        _prune_generations(self.path, keep={self._generation, previous})
+
+
+class ArtifactReader:
+    """
+    Read side of ArtifactWriter.
+
+    Only the manifest is parsed on construction; the payload is memory-mapped
+    on the first array access.
+
+    Raises:
+        FileNotFoundError: If the directory has no manifest
+        ValueError: If the artifact was written by a newer format version
+    """
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        manifest_path = self.path / MANIFEST_FILE
+        if not manifest_path.exists():
+            raise FileNotFoundError(f"Artifact manifest not found: {manifest_path}")
+
+        with open(manifest_path, "r") as f:
+            self.manifest: Dict[str, Any] = json.load(f)
+
+        version = self.manifest.get("format_version", 0)
+        if version > ARTIFACT_FORMAT_VERSION:
+            raise ValueError(
+                f"Artifact format {version} is newer than supported ({ARTIFACT_FORMAT_VERSION})"
+            )
+        # Format 2 kept the data files next to the manifest
+        self.directory = self.path / self.manifest.get("generation", "")
+        self._payload: Optional[np.memmap] = None
+
+    @staticmethod
+    def exists(path: Path) -> bool:
+        """Whether ``path`` contains a compact artifact."""
+        return (Path(path) / MANIFEST_FILE).exists()
+
+    @property
+    def metadata(self) -> Dict[str, Any]:
+        return self.manifest.get("metadata", {})
+
+    def has_component(self, name: str) -> bool:
+        return name in self.manifest.get("components", {})
+
+    def component(self, name: str) -> Dict[str, Any]:
+        """JSON metadata of a component."""
+        try:
+            return self.manifest["components"][name]
+        except KeyError:
+            raise KeyError(f"Component '{name}' not found in artifact {self.path}")
+
+    def file_path(self, filename: str) -> Path:
+        return self.directory / filename
+
+    def array(self, name: str) -> np.ndarray:
+        """Read-only, memory-mapped view of a stored array."""
+        entry = self.manifest["arrays"][name]
+        if self._payload is None:
+            self._payload = np.memmap(self.directory / PAYLOAD_FILE, dtype=np.float64, mode="r")
+        size = int(np.prod(entry["shape"], dtype=np.int64))
+        start = entry["offset"]
+        return self._payload[start:start + size].reshape(entry["shape"])
+
+
+def remove_artifact(path: Path) -> None:
+    """
+    Remove the compact artifact under ``path`` (manifest first).
+
+    Used when a legacy per-component layout is written to the same
+    directory, so loaders no longer pick the stale artifact.
+    """
+    path = Path(path)
+    (path / MANIFEST_FILE).unlink(missing_ok=True)
+    _prune_generations(path, keep=set())
+
+
+def _current_generation(path: Path) -> Optional[str]:
+    """Generation named by the manifest currently in ``path``, if any."""
+    try:
+        with open(path / MANIFEST_FILE, "r") as f:
+            return json.load(f).get("generation")
+    except (FileNotFoundError, ValueError):
+        return None
+
+
+def _prune_generations(path: Path, keep: Set[Optional[str]]) -> None:
+    for directory in path.glob(f"{_GENERATION_PREFIX}*"):
+        if directory.name not in keep and directory.is_dir():
+            shutil.rmtree(directory, ignore_errors=True)
+
+
+def save_scaler(writer: ArtifactWriter, name: str, scaler: StandardScaler) -> Dict[str, Any]:
+    """
+    Store a StandardScaler as arrays instead of a pickle.
+
+    Returns:
+        JSON metadata needed by load_scaler (empty dict for unfitted scalers)
+    """
+    if not hasattr(scaler, "scale_"):
+        return {}
+
+    meta: Dict[str, Any] = {
+        "with_mean": scaler.with_mean,
+        "with_std": scaler.with_std,
+        "n_features_in": int(scaler.n_features_in_),
+        "n_samples_seen": np.asarray(scaler.n_samples_seen_).tolist(),
+    }
+    for attr in ("mean_", "var_", "scale_"):
+        value = getattr(scaler, attr, None)
+        if value is not None:
+            writer.add_array(f"{name}/{attr}", value)
+            meta.setdefault("arrays", []).append(attr)
+    if hasattr(scaler, "feature_names_in_"):
+        meta["feature_names_in"] = [str(col) for col in scaler.feature_names_in_]
+    return meta
+
+
+def load_scaler(reader: ArtifactReader, name: str, meta: Dict[str, Any]) -> StandardScaler:
+    """Rebuild a StandardScaler stored by save_scaler."""
+    scaler = StandardScaler(with_mean=meta.get("with_mean", True), with_std=meta.get("with_std", True))
+    if not meta:
+        return scaler
+
+    for attr in meta.get("arrays", []):
+        setattr(scaler, attr, np.array(reader.array(f"{name}/{attr}")))
+    for attr in ("mean_", "var_", "scale_"):
+        if not hasattr(scaler, attr):
+            setattr(scaler, attr, None)
+    scaler.n_features_in_ = meta["n_features_in"]
+    n_samples_seen = meta["n_samples_seen"]
+    scaler.n_samples_seen_ = np.asarray(n_samples_seen) if isinstance(n_samples_seen, list) else n_samples_seen
+    if "feature_names_in" in meta:
+        scaler.feature_names_in_ = np.asarray(meta["feature_names_in"], dtype=object)
+    return scaler
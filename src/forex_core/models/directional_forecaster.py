@@ -25,6 +25,13 @@ from sklearn.ensemble import GradientBoostingClassifier, RandomForestClassifier
 from sklearn.metrics import accuracy_score, classification_report, confusion_matrix
 from sklearn.model_selection import TimeSeriesSplit
 
+from forex_core.features.feature_store import FeatureSpec, cached_features
+
+# Bump when add_directional_features output changes to invalidate cached matrices
+FEATURE_VERSION = 1
+# Longest window: 21-day momentum differenced once, ADX smoothing over 2 x 14 rows
+FEATURE_LOOKBACK = 100
+
 
 @dataclass
 class DirectionalForecast:
@@ -140,6 +147,25 @@ class DirectionalForecaster:
         Returns:
             DataFrame with additional directional features
         """
+        spec = FeatureSpec("directional", FEATURE_VERSION, lookback=FEATURE_LOOKBACK)
+        df = cached_features(spec, df, self._compute_directional_features)
+
+        # Store feature names for later use
+        self.directional_features = [
+            col for col in df.columns
+            if col not in ['usdclp', 'date'] and
+            any(indicator in col for indicator in [
+                'momentum', 'acceleration', 'trend', 'ma_', 'volatility',
+                'vol_adj', 'rsi', 'divergence', 'correlation', 'vix'
+            ])
+        ]
+
+        logger.info(f"Added {len(self.directional_features)} directional features")
+
+        return df
+
+    def _compute_directional_features(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Uncached body of add_directional_features."""
         df = df.copy()
 
         # Price momentum (multiple timeframes for better signal)
@@ -209,18 +235,6 @@ class DirectionalForecaster:
             df['vix_change_7d'] = df['vix'].pct_change(7)
             df['vix_level'] = df['vix']  # Absolute VIX level
 
-        # Store feature names for later use
-        self.directional_features = [
-            col for col in df.columns
-            if col not in ['usdclp', 'date'] and
-            any(indicator in col for indicator in [
-                'momentum', 'acceleration', 'trend', 'ma_', 'volatility',
-                'vol_adj', 'rsi', 'divergence', 'correlation', 'vix'
-            ])
-        ]
-
-        logger.info(f"Added {len(self.directional_features)} directional features")
-
         return df
 
     def create_direction_labels(
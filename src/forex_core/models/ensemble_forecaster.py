@@ -26,13 +26,14 @@ import warnings
 from dataclasses import dataclass, asdict
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple, Any
+from typing import Callable, Dict, List, Optional, Tuple, Any
 
 import numpy as np
 import pandas as pd
 from sklearn.metrics import mean_absolute_error, mean_squared_error
 
 # Import project models
+from forex_core.models.artifacts import ArtifactReader, ArtifactWriter, remove_artifact
 from forex_core.models.xgboost_forecaster import XGBoostForecaster, XGBoostConfig
 from forex_core.models.sarimax_forecaster import SARIMAXForecaster, SARIMAXConfig
 from forex_core.models.garch_volatility import GARCHVolatility, GARCHConfig
@@ -237,6 +238,9 @@ class EnsembleForecaster:
         self.horizon_days = horizon_days
         self.weights = weights or EnsembleWeights.from_horizon(horizon_days)
 
+        # Component loaders deferred by load_models() for compact artifacts
+        self._pending_loads: Dict[str, Callable[[], None]] = {}
+
         # Initialize individual models
         self.xgboost = XGBoostForecaster(
             xgboost_config or XGBoostConfig.from_horizon(horizon_days)
@@ -273,6 +277,48 @@ class EnsembleForecaster:
             f"Volatility: {self.weights.volatility_model})"
         )
 
+    @property
+    def xgboost(self) -> XGBoostForecaster:
+        self._materialize('xgboost')
+        return self._xgboost
+
+    @xgboost.setter
+    def xgboost(self, model: XGBoostForecaster) -> None:
+        self._pending_loads.pop('xgboost', None)
+        self._xgboost = model
+
+    @property
+    def sarimax(self) -> SARIMAXForecaster:
+        self._materialize('sarimax')
+        return self._sarimax
+
+    @sarimax.setter
+    def sarimax(self, model: SARIMAXForecaster) -> None:
+        self._pending_loads.pop('sarimax', None)
+        self._sarimax = model
+
+    @property
+    def garch(self) -> GARCHVolatility:
+        self._materialize('garch')
+        return self._garch
+
+    @garch.setter
+    def garch(self, model: GARCHVolatility) -> None:
+        self._pending_loads.pop('garch', None)
+        self._garch = model
+
+    def _materialize(self, name: str) -> None:
+        """Run the deferred artifact load of a component on first access."""
+        loader = self._pending_loads.pop(name, None)
+        if loader is None:
+            return
+        try:
+            loader()
+            logger.info(f"{name} component loaded")
+        except Exception as e:
+            logger.warning(f"Failed to load {name}: {str(e)}")
+            setattr(self, f"{name}_fitted", False)
+
     def train(
         self,
         data: pd.DataFrame,
@@ -316,32 +362,29 @@ class EnsembleForecaster:
             raise ValueError(f"Target column '{target_col}' not found")
 
         # IMPORTANT: Ensure 'value' column exists for adaptive window calculation
-        # Load RAW values from parquet (not processed/scaled) for trend detection
+        # Load RAW values from the warehouse (not processed/scaled) for trend detection
         # NOTE: We load ALL raw data here, not just training subset, because
         # adaptive window needs access to most recent values for trend detection
         if 'value' not in data.columns:
-            logger.info("Loading raw USD/CLP values from parquet for adaptive window")
+            logger.info("Loading raw USD/CLP values from warehouse for adaptive window")
             data = data.copy()  # Avoid modifying original
             try:
-                from pathlib import Path
-                parquet_path = Path("/app/data/warehouse/usdclp_daily.parquet")
-                if not parquet_path.exists():
-                    # Try local path
-                    parquet_path = Path("data/warehouse/usdclp_daily.parquet")
-
-                if parquet_path.exists():
-                    raw_df = pd.read_parquet(parquet_path)
+                from forex_core.config import get_settings
+                from forex_core.data.warehouse import Warehouse
+
+                raw_series = Warehouse(get_settings()).load_series("usdclp_daily")
+                if raw_series is not None and len(raw_series):
                     # Match dates and copy ALL raw values
-                    # Use common index (intersection of data and raw_df)
-                    common_idx = data.index.intersection(raw_df.index)
-                    data.loc[common_idx, 'value'] = raw_df.loc[common_idx, 'value']
+                    # Use common index (intersection of data and raw series)
+                    common_idx = data.index.intersection(raw_series.index)
+                    data.loc[common_idx, 'value'] = raw_series.loc[common_idx]
 
                     # CRITICAL: Also need to verify we got the latest values
-                    logger.info(f"Added raw 'value' column from parquet ({len(common_idx)} rows matched)")
-                    logger.info(f"Last date in data: {data.index[-1]}, Last raw value: {raw_df['value'].iloc[-1]:.2f}")
+                    logger.info(f"Added raw 'value' column from warehouse ({len(common_idx)} rows matched)")
+                    logger.info(f"Last date in data: {data.index[-1]}, Last raw value: {raw_series.iloc[-1]:.2f}")
                 else:
                     # Fallback: use target_col (may be processed)
-                    logger.warning(f"Parquet not found, using '{target_col}' for adaptive window (may affect accuracy)")
+                    logger.warning(f"usdclp_daily not in warehouse, using '{target_col}' for adaptive window (may affect accuracy)")
                     data['value'] = data[target_col]
             except Exception as e:
                 logger.warning(f"Failed to load raw values: {e}. Using '{target_col}' as fallback")
@@ -803,7 +846,12 @@ class EnsembleForecaster:
             test_size=len(y_true)
         )
 
-    def save_models(self, path: Path, metadata: Optional[Dict[str, Any]] = None) -> None:
+    def save_models(
+        self,
+        path: Path,
+        metadata: Optional[Dict[str, Any]] = None,
+        compact: bool = True
+    ) -> None:
         """
         Save all ensemble components to disk.
 
@@ -813,13 +861,28 @@ class EnsembleForecaster:
         - GARCH model (if fitted)
         - Ensemble metadata (weights, metrics, configuration)
 
+        By default components are written as one compact artifact (see
+        forex_core.models.artifacts): XGBoost as UBJ, scalers as arrays and
+        SARIMAX/GARCH reduced to parameters plus the state needed to forecast.
+        With ``compact=False`` the legacy per-component layout is written
+        and any compact artifact in ``path`` is removed, so loading picks the
+        new files.
+
         Args:
             path: Directory to save models
             metadata: Additional metadata to include
+            compact: Write the compact artifact format (default: True)
         """
         path = Path(path)
         path.mkdir(parents=True, exist_ok=True)
 
+        if compact:
+            self._save_artifact(path, metadata)
+            logger.info(f"Ensemble models saved to {path} (compact artifact)")
+            return
+
+        remove_artifact(path)
+
         # Save individual models
         if self.xgboost_fitted:
             xgb_path = path / "xgboost"
@@ -834,7 +897,20 @@ class EnsembleForecaster:
             self.garch.save_model(garch_path)
 
         # Save ensemble metadata
-        ensemble_meta = {
+        ensemble_meta = self._ensemble_metadata()
+
+        if metadata:
+            ensemble_meta.update(metadata)
+
+        meta_path = path / "ensemble_metadata.json"
+        with open(meta_path, 'w') as f:
+            json.dump(ensemble_meta, f, indent=2)
+
+        logger.info(f"Ensemble models saved to {path}")
+
+    def _ensemble_metadata(self) -> Dict[str, Any]:
+        """Ensemble-level metadata shared by both storage formats."""
+        return {
             'saved_at': datetime.now().isoformat(),
             'horizon_days': self.horizon_days,
             'weights': self.weights.to_dict(),
@@ -847,30 +923,45 @@ class EnsembleForecaster:
             'model_version': '1.0.0'
         }
 
-        if metadata:
-            ensemble_meta.update(metadata)
+    def _save_artifact(self, path: Path, metadata: Optional[Dict[str, Any]]) -> None:
+        """Write all fitted components into one compact artifact."""
+        writer = ArtifactWriter(path)
 
-        meta_path = path / "ensemble_metadata.json"
-        with open(meta_path, 'w') as f:
-            json.dump(ensemble_meta, f, indent=2)
+        if self.xgboost_fitted:
+            self.xgboost.save_artifact(writer, 'xgboost')
+        if self.sarimax_fitted:
+            self.sarimax.save_artifact(writer, 'sarimax')
+        if self.garch_fitted:
+            self.garch.save_artifact(writer, 'garch')
 
-        logger.info(f"Ensemble models saved to {path}")
+        ensemble_meta = self._ensemble_metadata()
+        if metadata:
+            ensemble_meta.update(metadata)
+        writer.write(ensemble_meta)
 
     def load_models(self, path: Path) -> None:
         """
         Load all ensemble components from disk.
 
+        Compact artifacts are detected by their manifest and loaded lazily,
+        one component at a time; the legacy layout is loaded eagerly.
+
         Args:
             path: Directory containing saved models
 
         Raises:
             FileNotFoundError: If path doesn't exist or missing critical files
+            ValueError: If neither XGBoost nor SARIMAX is available
         """
         path = Path(path)
 
         if not path.exists():
             raise FileNotFoundError(f"Model path not found: {path}")
 
+        if ArtifactReader.exists(path):
+            self._load_artifact(path)
+            return
+
         # Load ensemble metadata
         meta_path = path / "ensemble_metadata.json"
         if not meta_path.exists():
@@ -921,6 +1012,42 @@ class EnsembleForecaster:
         logger.info(f"Ensemble models loaded from {path}")
 
 
+    def _load_artifact(self, path: Path) -> None:
+        """
+        Load a compact artifact.
+
+        Only the manifest is read here. Each component is deserialized on its
+        first access, so a forecast that never touches a component never pays
+        for loading it.
+        """
+        reader = ArtifactReader(path)
+        meta = reader.metadata
+        self.horizon_days = meta['horizon_days']
+        self.weights = EnsembleWeights(**meta['weights'])
+        if meta.get('training_metrics'):
+            self.training_metrics = EnsembleMetrics(**meta['training_metrics'])
+
+        components = {
+            'xgboost': lambda: self._xgboost.load_artifact(reader, 'xgboost'),
+            'sarimax': lambda: self._sarimax.load_artifact(reader, 'sarimax'),
+            'garch': lambda: self._garch.load_artifact(reader, 'garch'),
+        }
+        for name, loader in components.items():
+            available = reader.has_component(name)
+            setattr(self, f"{name}_fitted", available)
+            if available:
+                self._pending_loads[name] = loader
+            else:
+                self._pending_loads.pop(name, None)
+
+        if not self.xgboost_fitted and not self.sarimax_fitted:
+            raise ValueError("No models could be loaded from the specified path")
+
+        logger.info(
+            f"Ensemble artifact opened from {path} "
+            f"(components: {', '.join(n for n in components if reader.has_component(n))})"
+        )
+
 # Example usage and testing
 if __name__ == "__main__":
     from pathlib import Path
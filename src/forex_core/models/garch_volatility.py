@@ -28,6 +28,7 @@ import pandas as pd
 from arch import arch_model
 from arch.univariate import ConstantMean, GARCH, EGARCH, Normal
 
+from forex_core.models.artifacts import ArtifactReader, ArtifactWriter
 # Import loguru logger from project utils
 from forex_core.utils.logging import logger
 
@@ -135,6 +136,77 @@ class VolatilityForecast:
         }
 
 
+
+@dataclass
+class GARCHForecastState:
+    """
+    Fitted parameters plus the recursion tail needed to forecast variance.
+
+    Replaces the pickled arch result (which embeds the whole residual series,
+    covariance matrices and the model spec) in compact artifacts. Variances
+    follow arch's analytic forecasts for zero-mean GARCH(p, q) and EGARCH(p, q)
+    with normal errors, in the scaled units the model was fitted on.
+    """
+
+    model_type: str
+    p: int
+    q: int
+    params: Dict[str, float]
+    residuals: np.ndarray  # Last max(p, q) scaled residuals, oldest first
+    variances: np.ndarray  # Matching conditional variances
+
+    @classmethod
+    def from_result(cls, result: Any, model_type: str, p: int, q: int) -> GARCHForecastState:
+        """Extract the state from a fitted arch result."""
+        n = max(p, q, 1)
+        return cls(
+            model_type=model_type,
+            p=p,
+            q=q,
+            params={name: float(value) for name, value in result.params.items()},
+            residuals=np.asarray(result.resid, dtype=float)[-n:],
+            variances=np.asarray(result.conditional_volatility, dtype=float)[-n:] ** 2,
+        )
+
+    def variance_path(self, horizon: int) -> np.ndarray:
+        """
+        Variance forecasts for steps 1..horizon.
+
+        Raises:
+            ValueError: For EGARCH with horizon > 1, which has no analytic
+                multi-step forecast (arch raises the same error)
+        """
+        omega = self.params['omega']
+        alpha = [self.params[f'alpha[{i}]'] for i in range(1, self.p + 1)]
+        beta = [self.params[f'beta[{j}]'] for j in range(1, self.q + 1)]
+
+        if self.model_type == "EGARCH":
+            if horizon > 1:
+                raise ValueError("Analytic forecasts not available for horizon > 1 when using EGARCH")
+            std_resid = self.residuals / np.sqrt(self.variances)
+            log_variance = (
+                omega
+                + sum(a * (abs(std_resid[-i]) - np.sqrt(2 / np.pi)) for i, a in enumerate(alpha, 1))
+                + sum(b * np.log(self.variances[-j]) for j, b in enumerate(beta, 1))
+            )
+            return np.array([np.exp(log_variance)])
+
+        squared = list(self.residuals ** 2)
+        variances = list(self.variances)
+        path = []
+        for _ in range(horizon):
+            value = (
+                omega
+                + sum(a * squared[-i] for i, a in enumerate(alpha, 1))
+                + sum(b * variances[-j] for j, b in enumerate(beta, 1))
+            )
+            path.append(value)
+            # Future squared shocks are replaced by their expectation
+            squared.append(value)
+            variances.append(value)
+        return np.array(path)
+
+
 class GARCHVolatility:
     """
     GARCH/EGARCH volatility forecaster for confidence interval estimation.
@@ -187,6 +259,9 @@ class GARCHVolatility:
         self.fitted_model = None
         self.historical_mean_vol: Optional[float] = None
         self.training_residuals: Optional[np.ndarray] = None
+        # Set instead of fitted_model when loaded from a compact artifact
+        self.forecast_state: Optional[GARCHForecastState] = None
+        self.fit_statistics: Optional[Dict[str, Any]] = None
 
         logger.info(
             f"Initialized {self.config.model_type} volatility model for {horizon_days}d horizon"
@@ -313,7 +388,7 @@ class GARCHVolatility:
         Raises:
             ValueError: If model not fitted or forecast fails
         """
-        if self.fitted_model is None:
+        if self.fitted_model is None and self.forecast_state is None:
             raise ValueError("Model not fitted. Call fit() first.")
 
         steps = steps or self.horizon_days
@@ -322,11 +397,12 @@ class GARCHVolatility:
         try:
             # Generate volatility forecast
             # Returns variance forecast, need to take sqrt
-            vol_forecast = self.fitted_model.forecast(horizon=steps, reindex=False)
-
-            # Extract variance forecast (last value in forecast path)
             # variance is in scaled units, convert back
-            variance = vol_forecast.variance.values[-1, -1]  # Last step
+            if self.fitted_model is not None:
+                vol_forecast = self.fitted_model.forecast(horizon=steps, reindex=False)
+                variance = vol_forecast.variance.values[-1, -1]  # Last step
+            else:
+                variance = self.forecast_state.variance_path(steps)[-1]
             volatility_scaled = np.sqrt(variance)
             volatility = volatility_scaled / self.config.vol_scaling
 
@@ -426,15 +502,17 @@ class GARCHVolatility:
             Dictionary with confidence intervals
         """
         if volatility is None:
-            if self.fitted_model is None:
-                raise ValueError("No volatility available. Provide volatility or call forecast_volatility()")
-
-            # Use last fitted conditional volatility
-            cond_vol = self.fitted_model.conditional_volatility
-            if isinstance(cond_vol, pd.Series):
-                fitted_vol = cond_vol.iloc[-1]
+            if self.fitted_model is not None:
+                # Use last fitted conditional volatility
+                cond_vol = self.fitted_model.conditional_volatility
+                if isinstance(cond_vol, pd.Series):
+                    fitted_vol = cond_vol.iloc[-1]
+                else:
+                    fitted_vol = cond_vol[-1]
+            elif self.forecast_state is not None:
+                fitted_vol = np.sqrt(self.forecast_state.variances[-1])
             else:
-                fitted_vol = cond_vol[-1]
+                raise ValueError("No volatility available. Provide volatility or call forecast_volatility()")
             volatility = fitted_vol / self.config.vol_scaling
 
         return {
@@ -531,23 +609,105 @@ class GARCHVolatility:
         Returns:
             Dictionary with diagnostic information
         """
-        if self.fitted_model is None:
+        if self.fitted_model is None and self.forecast_state is None:
             raise ValueError("Model not fitted. Call fit() first.")
 
+        if self.fitted_model is not None:
+            n_observations = len(self.training_residuals) if self.training_residuals is not None else 0
+            fit_statistics = self._fit_statistics()
+            parameters = {
+                name: float(value)
+                for name, value in self.fitted_model.params.items()
+            }
+        else:
+            n_observations = self.fit_statistics.get('n_observations', 0)
+            fit_statistics = {k: v for k, v in self.fit_statistics.items() if k != 'n_observations'}
+            parameters = dict(self.forecast_state.params)
+
         return {
             'model_type': self.config.model_type,
             'order': f"({self.config.p}, {self.config.q})",
             'horizon_days': self.horizon_days,
-            'n_observations': len(self.training_residuals) if self.training_residuals is not None else 0,
+            'n_observations': n_observations,
             'historical_mean_vol': float(self.historical_mean_vol) if self.historical_mean_vol else None,
-            'fit_statistics': {
-                'aic': float(self.fitted_model.aic),
-                'bic': float(self.fitted_model.bic),
-                'loglikelihood': float(self.fitted_model.loglikelihood),
-                'num_params': int(self.fitted_model.num_params)
-            },
-            'parameters': {
-                name: float(value)
-                for name, value in self.fitted_model.params.items()
-            }
+            'fit_statistics': fit_statistics,
+            'parameters': parameters
         }
+
+    def _fit_statistics(self) -> Dict[str, Any]:
+        """Information criteria of the fitted arch result."""
+        return {
+            'aic': float(self.fitted_model.aic),
+            'bic': float(self.fitted_model.bic),
+            'loglikelihood': float(self.fitted_model.loglikelihood),
+            'num_params': int(self.fitted_model.num_params)
+        }
+
+    def save_artifact(self, writer: ArtifactWriter, name: str = "garch") -> None:
+        """
+        Add the model to a compact artifact.
+
+        Only the fitted parameters and the recursion tail are kept; the
+        training residuals and the arch result object are dropped.
+
+        Args:
+            writer: Artifact being written
+            name: Component name inside the artifact
+        """
+        if self.fitted_model is None and self.forecast_state is None:
+            raise ValueError("No fitted model to save. Call fit() first.")
+
+        state = self.forecast_state or GARCHForecastState.from_result(
+            self.fitted_model, self.config.model_type, self.config.p, self.config.q
+        )
+        if self.fitted_model is not None:
+            fit_statistics = self._fit_statistics()
+            fit_statistics['n_observations'] = (
+                len(self.training_residuals) if self.training_residuals is not None else 0
+            )
+        else:
+            fit_statistics = self.fit_statistics
+
+        writer.add_array(f"{name}/params", list(state.params.values()))
+        writer.add_array(f"{name}/residuals", state.residuals)
+        writer.add_array(f"{name}/variances", state.variances)
+        writer.add_component(name, {
+            'horizon_days': self.horizon_days,
+            'config': self.config.to_dict(),
+            'param_names': list(state.params),
+            'historical_mean_vol': float(self.historical_mean_vol) if self.historical_mean_vol else None,
+            'fit_statistics': fit_statistics,
+        })
+
+    def load_artifact(self, reader: ArtifactReader, name: str = "garch") -> GARCHVolatility:
+        """
+        Load the model from a compact artifact written by save_artifact().
+
+        Args:
+            reader: Artifact to read from
+            name: Component name inside the artifact
+
+        Returns:
+            Self for method chaining
+        """
+        meta = reader.component(name)
+        self.config = GARCHConfig.from_dict(meta['config'])
+        self.horizon_days = meta['horizon_days']
+        self.historical_mean_vol = meta['historical_mean_vol']
+        self.fit_statistics = meta['fit_statistics']
+        self.fitted_model = None
+        self.model = None
+        self.training_residuals = None
+
+        params = reader.array(f"{name}/params")
+        self.forecast_state = GARCHForecastState(
+            model_type=self.config.model_type,
+            p=self.config.p,
+            q=self.config.q,
+            params={param: float(value) for param, value in zip(meta['param_names'], params)},
+            residuals=np.array(reader.array(f"{name}/residuals")),
+            variances=np.array(reader.array(f"{name}/variances")),
+        )
+
+        logger.info(f"Model loaded from artifact {reader.path} ({name})")
+        return self
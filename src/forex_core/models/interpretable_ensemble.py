@@ -24,11 +24,18 @@ from sklearn.metrics import mean_squared_error, mean_absolute_percentage_error
 from sklearn.model_selection import TimeSeriesSplit
 from sklearn.preprocessing import StandardScaler
 
+from forex_core.features.feature_store import FeatureSpec, cached_features
+
 # Logging
 import logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Incrementar cuando cambie la salida de create_features (invalida la caché)
+FEATURE_VERSION = 1
+# Ventana más larga: correlación de 60 días; EWM(26) converge en 400 filas
+FEATURE_LOOKBACK = 400
+
 
 @dataclass
 class ForecastConfig:
@@ -82,7 +89,14 @@ class InterpretableForexEnsemble:
         """
         Feature engineering interpretable y robusto.
         Cada feature tiene significado económico claro.
+        Se sirve desde el feature store compartido cuando el input ya fue procesado.
         """
+        spec = FeatureSpec("interpretable_ensemble", FEATURE_VERSION, lookback=FEATURE_LOOKBACK)
+        return cached_features(spec, data, self._compute_features)
+
+    @staticmethod
+    def _compute_features(data: pd.DataFrame) -> pd.DataFrame:
+        """Cálculo sin caché de create_features."""
         features = pd.DataFrame(index=data.index)
 
         # 1. Lag Features (Momentum y Mean Reversion)
@@ -3,7 +3,8 @@ SARIMAX Forecaster for USD/CLP Multi-Horizon Forecasting.
 
 This module implements a SARIMAX-based forecasting system with:
 - Seasonal ARIMA with exogenous variables
-- Auto-ARIMA for order selection using AIC/BIC
+- Auto-ARIMA for order selection using AIC/BIC (process-parallel grid
+  search with early abandonment when pmdarima is unavailable)
 - Multi-horizon support (7d, 15d, 30d, 90d)
 - Stationarity testing and handling
 - Seasonal pattern detection
@@ -26,7 +27,9 @@ from __future__ import annotations
 
 import json
 import pickle
+import time
 import warnings
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass, asdict
 from datetime import datetime, timedelta
 from pathlib import Path
@@ -39,6 +42,7 @@ from sklearn.metrics import mean_absolute_error, mean_squared_error
 from statsmodels.tsa.statespace.sarimax import SARIMAX, SARIMAXResults
 from statsmodels.tsa.stattools import adfuller, acf, pacf
 
+from forex_core.models.artifacts import ArtifactReader, ArtifactWriter
 # Import loguru logger from project utils
 from forex_core.utils.logging import logger
 
@@ -85,6 +89,12 @@ class SARIMAXConfig:
     max_D: int = 1
     max_Q: int = 2
 
+    # Grid search backend (used when pmdarima is unavailable)
+    search_n_jobs: int = 1  # Worker processes for candidate fits
+    search_maxiter: int = 100  # Optimizer iterations per candidate
+    search_screen_maxiter: int = 20  # Iterations of the partial screening fit
+    search_abandon_margin: Optional[float] = 10.0  # Criterion gap to abandon; None = fit all
+
     def __post_init__(self):
         if self.exog_vars is None:
             self.exog_vars = []
@@ -200,6 +210,59 @@ class ResidualDiagnostics:
     is_normal: bool
 
 
+def _fit_sarimax_candidate(
+    endog: pd.Series,
+    exog: Optional[pd.DataFrame],
+    order: Tuple[int, int, int],
+    seasonal_order: Tuple[int, int, int, int],
+    enforce_stationarity: bool,
+    enforce_invertibility: bool,
+    maxiter: int,
+    start_params: Optional[np.ndarray] = None,
+) -> Dict[str, Any]:
+    """
+    Fit one SARIMAX grid candidate (module-level so it can run in worker processes).
+
+    Returns:
+        Dict with order, seasonal_order, aic, bic, llf, params, converged,
+        fit_seconds and error (None on success).
+    """
+    started = time.perf_counter()
+    record: Dict[str, Any] = {
+        'order': order,
+        'seasonal_order': seasonal_order,
+        'aic': np.nan,
+        'bic': np.nan,
+        'llf': np.nan,
+        'params': None,
+        'converged': False,
+        'error': None,
+    }
+    try:
+        with warnings.catch_warnings():
+            warnings.simplefilter('ignore')
+            model = SARIMAX(
+                endog,
+                exog=exog,
+                order=order,
+                seasonal_order=seasonal_order,
+                enforce_stationarity=enforce_stationarity,
+                enforce_invertibility=enforce_invertibility
+            )
+            result = model.fit(disp=False, maxiter=maxiter, start_params=start_params)
+        record.update(
+            aic=float(result.aic),
+            bic=float(result.bic),
+            llf=float(result.llf),
+            params=np.asarray(result.params),
+            converged=bool((result.mle_retvals or {}).get('converged', False)),
+        )
+    except Exception as e:
+        record['error'] = str(e)
+    record['fit_seconds'] = time.perf_counter() - started
+    return record
+
+
 class SARIMAXForecaster:
     """
     SARIMAX-based multi-horizon forecaster for USD/CLP exchange rate.
@@ -237,6 +300,7 @@ class SARIMAXForecaster:
         self.exog_columns: List[str] = []
         self.target_mean: float = 0.0
         self.target_std: float = 1.0
+        self.search_results: Optional[pd.DataFrame] = None
 
         logger.info(f"Initialized SARIMAXForecaster for {config.horizon_days}-day horizon")
 
@@ -297,7 +361,20 @@ class SARIMAXForecaster:
         """
         Grid search for best SARIMAX order using AIC/BIC.
 
-        This is a fallback when pmdarima is not available.
+        This is a fallback when pmdarima is not available. The search runs in
+        two phases, each fanned out to `config.search_n_jobs` processes:
+
+        1. Screening: every candidate is fitted with `search_screen_maxiter`
+           optimizer iterations, giving a partial likelihood. Candidates
+           that converge within the screening budget are final.
+        2. Refinement: candidates are refined to `search_maxiter` iterations
+           (warm-started from the screening fit) in order of their partial
+           criterion. The best candidate is refined first and becomes the
+           incumbent. Candidates whose partial criterion is more than
+           `search_abandon_margin` worse than the incumbent are abandoned.
+
+        The per-candidate table (orders, AIC, BIC, log-likelihood, status,
+        fit time) is stored in `self.search_results`.
 
         Args:
             endog: Endogenous variable (target)
@@ -307,8 +384,8 @@ class SARIMAXForecaster:
             Tuple of ((p,d,q), (P,D,Q,s))
         """
         logger.info("Performing grid search for SARIMAX order selection...")
+        started = time.perf_counter()
 
-        best_metric = np.inf
         best_order = (self.config.p, self.config.d, self.config.q)
         best_seasonal = (self.config.P, self.config.D, self.config.Q, self.config.s)
 
@@ -322,43 +399,111 @@ class SARIMAXForecaster:
         P_range = range(0, min(2, self.config.max_P + 1))
         Q_range = range(0, min(2, self.config.max_Q + 1))
 
-        n_models = 0
-        for p in p_range:
-            for d in d_range:
-                for q in q_range:
-                    for P in P_range:
-                        for Q in Q_range:
-                            try:
-                                order = (p, d, q)
-                                seasonal_order = (P, self.config.D, Q, self.config.s)
-
-                                model = SARIMAX(
-                                    endog,
-                                    exog=exog,
-                                    order=order,
-                                    seasonal_order=seasonal_order,
-                                    enforce_stationarity=self.config.enforce_stationarity,
-                                    enforce_invertibility=self.config.enforce_invertibility
-                                )
-
-                                result = model.fit(disp=False, maxiter=100)
-
-                                # Select based on AIC or BIC
-                                metric = result.aic if self.config.selection_metric == 'aic' else result.bic
-
-                                if metric < best_metric:
-                                    best_metric = metric
-                                    best_order = order
-                                    best_seasonal = seasonal_order
-
-                                n_models += 1
-
-                            except Exception as e:
-                                # Skip orders that fail to converge
-                                continue
-
-        logger.info(f"Grid search tested {n_models} models. Best: ARIMA{best_order}x{best_seasonal}, "
-                   f"{self.config.selection_metric.upper()}={best_metric:.2f}")
+        candidates = [
+            ((p, d, q), (P, self.config.D, Q, self.config.s))
+            for p in p_range
+            for d in d_range
+            for q in q_range
+            for P in P_range
+            for Q in Q_range
+        ]
+
+        metric = self.config.selection_metric
+        margin = self.config.search_abandon_margin
+        screen_maxiter = min(self.config.search_screen_maxiter, self.config.search_maxiter)
+        screening = margin is not None and screen_maxiter < self.config.search_maxiter
+
+        n_jobs = max(1, min(self.config.search_n_jobs, len(candidates)))
+        executor = ProcessPoolExecutor(max_workers=n_jobs) if n_jobs > 1 else None
+
+        def run(jobs: List[Tuple[Tuple, Tuple, int, Optional[np.ndarray]]]) -> List[Dict[str, Any]]:
+            args = [
+                (endog, exog, order, seasonal, self.config.enforce_stationarity,
+                 self.config.enforce_invertibility, maxiter, start)
+                for order, seasonal, maxiter, start in jobs
+            ]
+            if executor is None:
+                return [_fit_sarimax_candidate(*a) for a in args]
+            return [f.result() for f in [executor.submit(_fit_sarimax_candidate, *a) for a in args]]
+
+        records: Dict[Tuple, Dict[str, Any]] = {}
+        try:
+            if not screening:
+                for record in run([(o, so, self.config.search_maxiter, None) for o, so in candidates]):
+                    record['status'] = 'fitted' if record['error'] is None else 'failed'
+                    records[(record['order'], record['seasonal_order'])] = record
+            else:
+                partial = []
+                for record in run([(o, so, screen_maxiter, None) for o, so in candidates]):
+                    if record['error'] is None and np.isfinite(record[metric]):
+                        partial.append(record)
+                    else:
+                        record['status'] = 'failed'
+                        records[(record['order'], record['seasonal_order'])] = record
+                partial.sort(key=lambda r: r[metric])
+
+                # Screening fits that already converged need no refinement
+                for record in partial:
+                    if record['converged']:
+                        record['status'] = 'fitted'
+                        records[(record['order'], record['seasonal_order'])] = record
+                converged = [r[metric] for r in partial if r['converged']]
+                partial = [r for r in partial if not r['converged']]
+
+                if partial:
+                    # Refine the most promising candidate first to set the incumbent
+                    leader = partial[0]
+                    refined = run([(leader['order'], leader['seasonal_order'],
+                                    self.config.search_maxiter, leader['params'])])
+                    incumbent = min(
+                        converged + [refined[0][metric] if refined[0]['error'] is None else leader[metric]]
+                    )
+                    refined[0]['status'] = 'fitted' if refined[0]['error'] is None else 'failed'
+                    records[(leader['order'], leader['seasonal_order'])] = refined[0]
+
+                    survivors = []
+                    for record in partial[1:]:
+                        if record[metric] > incumbent + margin:
+                            record['status'] = 'abandoned'
+                            records[(record['order'], record['seasonal_order'])] = record
+                        else:
+                            survivors.append(record)
+
+                    for record in run([(r['order'], r['seasonal_order'],
+                                        self.config.search_maxiter, r['params']) for r in survivors]):
+                        record['status'] = 'fitted' if record['error'] is None else 'failed'
+                        records[(record['order'], record['seasonal_order'])] = record
+        finally:
+            if executor is not None:
+                executor.shutdown()
+
+        # Select in grid order so ties resolve as in the sequential search
+        best_metric = np.inf
+        for key in candidates:
+            record = records[key]
+            if record['status'] == 'fitted' and record[metric] < best_metric:
+                best_metric = record[metric]
+                best_order, best_seasonal = key
+
+        self.search_results = pd.DataFrame([
+            {
+                'p': o[0], 'd': o[1], 'q': o[2],
+                'P': so[0], 'D': so[1], 'Q': so[2], 's': so[3],
+                'aic': records[(o, so)]['aic'],
+                'bic': records[(o, so)]['bic'],
+                'llf': records[(o, so)]['llf'],
+                'status': records[(o, so)]['status'],
+                'fit_seconds': records[(o, so)]['fit_seconds'],
+                'error': records[(o, so)]['error'],
+            }
+            for o, so in candidates
+        ])
+
+        counts = self.search_results['status'].value_counts().to_dict()
+        logger.info(f"Grid search evaluated {len(candidates)} candidates in "
+                   f"{time.perf_counter() - started:.1f}s with {n_jobs} worker(s) {counts}. "
+                   f"Best: ARIMA{best_order}x{best_seasonal}, "
+                   f"{metric.upper()}={best_metric:.2f}")
 
         return best_order, best_seasonal
 
@@ -900,6 +1045,109 @@ class SARIMAXForecaster:
 
         logger.info(f"Model loaded from {path}")
 
+    def save_artifact(self, writer: ArtifactWriter, name: str = "sarimax") -> None:
+        """
+        Add the model to a compact artifact.
+
+        Instead of pickling SARIMAXResults (training data, filter and smoother
+        matrices for every observation), only the fitted parameters, the last
+        observation and the Kalman filter's predicted state for it are kept.
+        Re-filtering that single observation from the stored state reproduces
+        the end-of-sample state exactly, so forecasts are unchanged.
+
+        Args:
+            writer: Artifact being written
+            name: Component name inside the artifact
+        """
+        if not self.is_fitted:
+            raise RuntimeError("Cannot save untrained model")
+
+        results = self.model
+        model = results.model
+        filter_results = results.filter_results
+
+        writer.add_array(f"{name}/params", np.asarray(results.params))
+        writer.add_array(f"{name}/endog", np.asarray(model.endog)[-1:])
+        writer.add_array(f"{name}/initial_state", filter_results.predicted_state[:, -2])
+        writer.add_array(f"{name}/initial_state_cov", filter_results.predicted_state_cov[:, :, -2])
+        if model.exog is not None:
+            writer.add_array(f"{name}/exog", np.asarray(model.exog)[-1:])
+
+        dates = results.data.dates
+        last_date = dates[-1].isoformat() if dates is not None and len(dates) > 0 else None
+        freq = getattr(dates, 'freqstr', None) if dates is not None else None
+
+        writer.add_component(name, {
+            'config': asdict(self.config),
+            'order': list(model.order),
+            'seasonal_order': list(model.seasonal_order),
+            'enforce_stationarity': model.enforce_stationarity,
+            'enforce_invertibility': model.enforce_invertibility,
+            'exog_names': list(model.exog_names) if model.exog is not None else None,
+            'last_date': last_date,
+            'freq': freq,
+            'nobs': int(results.nobs),
+            'aic': float(results.aic),
+            'bic': float(results.bic),
+            'selected_order': self.selected_order,
+            'seasonal_order_selected': self.seasonal_order,
+            'exog_columns': self.exog_columns,
+            'target_mean': float(self.target_mean),
+            'target_std': float(self.target_std),
+            'training_metrics': self.training_metrics.to_dict() if self.training_metrics else None,
+        })
+
+    def load_artifact(self, reader: ArtifactReader, name: str = "sarimax") -> None:
+        """
+        Load the model from a compact artifact written by save_artifact().
+
+        The restored results object only contains the last observation, so
+        in-sample diagnostics are not available; forecasts are identical.
+
+        Args:
+            reader: Artifact to read from
+            name: Component name inside the artifact
+        """
+        meta = reader.component(name)
+
+        index = None
+        if meta['last_date'] is not None:
+            index = pd.DatetimeIndex([pd.Timestamp(meta['last_date'])], freq=meta['freq'])
+        endog = pd.Series(np.array(reader.array(f"{name}/endog")).ravel(), index=index)
+        exog = None
+        if meta['exog_names'] is not None:
+            exog = pd.DataFrame(
+                np.array(reader.array(f"{name}/exog")), index=index, columns=meta['exog_names']
+            )
+
+        model = SARIMAX(
+            endog,
+            exog=exog,
+            order=tuple(meta['order']),
+            seasonal_order=tuple(meta['seasonal_order']),
+            enforce_stationarity=meta['enforce_stationarity'],
+            enforce_invertibility=meta['enforce_invertibility']
+        )
+        model.initialize_known(
+            np.array(reader.array(f"{name}/initial_state")),
+            np.array(reader.array(f"{name}/initial_state_cov")),
+        )
+        self.model = model.filter(np.array(reader.array(f"{name}/params")))
+
+        self.config = SARIMAXConfig(**meta['config'])
+        self.selected_order = tuple(meta['selected_order']) if meta['selected_order'] else None
+        self.seasonal_order = (
+            tuple(meta['seasonal_order_selected']) if meta['seasonal_order_selected'] else None
+        )
+        self.exog_columns = meta['exog_columns']
+        self.target_mean = meta['target_mean']
+        self.target_std = meta['target_std']
+        if meta.get('training_metrics'):
+            self.training_metrics = ForecastMetrics(**meta['training_metrics'])
+        self.is_fitted = True
+
+        logger.info(f"Model loaded from artifact {reader.path} ({name})")
+
 
 # Example usage and testing
 if __name__ == "__main__":
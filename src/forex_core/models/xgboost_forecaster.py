@@ -21,7 +21,7 @@ import warnings
 from dataclasses import dataclass, asdict
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple, Any
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 import numpy as np
 import pandas as pd
@@ -30,6 +30,9 @@ from sklearn.metrics import mean_absolute_error, mean_squared_error
 from sklearn.model_selection import TimeSeriesSplit
 from sklearn.preprocessing import StandardScaler
 
+from forex_core.features.feature_store import FeatureSpec, cached_features
+from forex_core.features.rolling_regression import rolling_slope
+from forex_core.models.artifacts import ArtifactReader, ArtifactWriter, load_scaler, save_scaler
 # Import loguru logger from project utils
 from forex_core.utils.logging import logger
 
@@ -44,6 +47,17 @@ except ImportError:
 warnings.filterwarnings('ignore', category=FutureWarning)
 warnings.filterwarnings('ignore', category=UserWarning)
 
+# Bump when _create_features output changes to invalidate cached matrices
+FEATURE_VERSION = 2
+# Longest window is 50 rows; 600 rows also let EWM(span=50) converge to ~1e-10
+FEATURE_LOOKBACK = 600
+# Rows needed to rebuild every non-EWM feature of the newest row exactly
+# (50-row windows, 30-row shifts, plus the leading diff/pct_change row)
+INCREMENTAL_TAIL_ROWS = 64
+# EWM spans used by _compute_features (ema_10d/20d/50d and the MACD legs)
+EMA_SPANS = (10, 12, 20, 26, 50)
+MACD_SIGNAL_SPAN = 9
+
 
 @dataclass
 class XGBoostConfig:
@@ -68,6 +82,9 @@ class XGBoostConfig:
     max_training_days: int = 730  # Maximum 2 years
     default_training_days: int = 365  # Default 1 year
 
+    # Incremental inference: predict() carries EWM state and rebuilds only the tail
+    incremental_features: bool = True
+
     @classmethod
     def from_horizon(cls, horizon_days: int) -> XGBoostConfig:
         """
@@ -160,6 +177,116 @@ class ForecastMetrics:
         return asdict(self)
 
 
+@dataclass
+class EWMFeatureState:
+    """
+    Exponential moving average state as of the last processed row.
+
+    The EWM features (ema_*, macd*) depend on the whole history, so they are
+    carried forward with their adjust=False recursion instead of being
+    recomputed. Every other feature only needs the last INCREMENTAL_TAIL_ROWS
+    rows, which makes daily inference O(window) instead of O(history).
+    """
+
+    timestamp: Any
+    last_value: float
+    ema: Dict[int, float]
+    macd_signal: float
+
+    @classmethod
+    def from_series(cls, series: pd.Series) -> Optional[EWMFeatureState]:
+        """Build the state from a full history, or None if it ends in NaN."""
+        if series.empty or pd.isna(series.iloc[-1]):
+            return None
+
+        ema = {
+            span: series.ewm(span=span, adjust=False).mean()
+            for span in EMA_SPANS
+        }
+        signal = (ema[12] - ema[26]).ewm(span=MACD_SIGNAL_SPAN, adjust=False).mean()
+        return cls(
+            timestamp=series.index[-1],
+            last_value=float(series.iloc[-1]),
+            ema={span: float(values.iloc[-1]) for span, values in ema.items()},
+            macd_signal=float(signal.iloc[-1]),
+        )
+
+    def advance(self, series: pd.Series) -> Optional[EWMFeatureState]:
+        """
+        Advance the state to the end of ``series``.
+
+        Returns None when the state cannot be continued exactly: the anchor row
+        is missing or was revised, or the new rows contain NaN.
+        """
+        if self.timestamp not in series.index:
+            return None
+        position = series.index.get_loc(self.timestamp)
+        if not isinstance(position, (int, np.integer)):
+            return None
+        if float(series.iloc[position]) != self.last_value:
+            return None
+
+        new_values = series.iloc[position + 1:].to_numpy(dtype=float)
+        if np.isnan(new_values).any():
+            return None
+
+        ema = dict(self.ema)
+        signal = self.macd_signal
+        signal_alpha = 2.0 / (MACD_SIGNAL_SPAN + 1)
+        for value in new_values:
+            for span in EMA_SPANS:
+                alpha = 2.0 / (span + 1)
+                ema[span] = (1 - alpha) * ema[span] + alpha * value
+            signal = (1 - signal_alpha) * signal + signal_alpha * (ema[12] - ema[26])
+
+        return EWMFeatureState(
+            timestamp=series.index[-1],
+            last_value=float(series.iloc[-1]),
+            ema=ema,
+            macd_signal=signal,
+        )
+
+    def features(self) -> Dict[str, float]:
+        """EWM feature values for the row at ``timestamp``."""
+        macd = self.ema[12] - self.ema[26]
+        return {
+            'ema_10d': self.ema[10],
+            'ema_20d': self.ema[20],
+            'ema_50d': self.ema[50],
+            'macd': macd,
+            'macd_signal': self.macd_signal,
+            'macd_histogram': macd - self.macd_signal,
+        }
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to a JSON-serializable dictionary."""
+        timestamp = self.timestamp
+        if isinstance(timestamp, pd.Timestamp):
+            timestamp = timestamp.isoformat()
+        elif isinstance(timestamp, np.integer):
+            timestamp = int(timestamp)
+        return {
+            'timestamp': timestamp,
+            'timestamp_is_datetime': isinstance(self.timestamp, pd.Timestamp),
+            'last_value': self.last_value,
+            'ema': {str(span): value for span, value in self.ema.items()},
+            'macd_signal': self.macd_signal,
+        }
+
+    @classmethod
+    def from_dict(cls, payload: Dict[str, Any]) -> EWMFeatureState:
+        """Inverse of to_dict()."""
+        timestamp = payload['timestamp']
+        if payload.get('timestamp_is_datetime'):
+            timestamp = pd.Timestamp(timestamp)
+        return cls(
+            timestamp=timestamp,
+            last_value=payload['last_value'],
+            ema={int(span): value for span, value in payload['ema'].items()},
+            macd_signal=payload['macd_signal'],
+        )
+
+
 class XGBoostForecaster:
     """
     XGBoost-based multi-horizon forecaster for USD/CLP exchange rate.
@@ -195,6 +322,7 @@ class XGBoostForecaster:
         self.is_fitted = False
         self.training_metrics: Optional[ForecastMetrics] = None
         self.explainer = None
+        self.ewm_state: Optional[EWMFeatureState] = None
 
         logger.info(f"Initialized XGBoostForecaster for {config.horizon_days}-day horizon")
 
@@ -216,24 +344,22 @@ class XGBoostForecaster:
         if not self.config.adaptive_window:
             return self.config.default_training_days
 
-        # CRITICAL: Load raw values directly from parquet for trend calculation
+        # CRITICAL: Load raw values from the warehouse for trend calculation
         # This avoids alignment issues with feature-engineered data
         try:
-            from pathlib import Path
-            parquet_path = Path("/app/data/warehouse/usdclp_daily.parquet")
-            if not parquet_path.exists():
-                parquet_path = Path("data/warehouse/usdclp_daily.parquet")
+            from forex_core.config import get_settings
+            from forex_core.data.warehouse import Warehouse
 
-            if parquet_path.exists():
-                raw_df = pd.read_parquet(parquet_path)
+            raw_series = Warehouse(get_settings()).load_series("usdclp_daily")
+            if raw_series is not None and len(raw_series):
                 # Use the FULL raw data for trend calculation
-                logger.info(f"Using raw parquet data for trend (last value: {raw_df['value'].iloc[-1]:.2f})")
-                trend_data = raw_df['value']
+                logger.info(f"Using raw warehouse data for trend (last value: {raw_series.iloc[-1]:.2f})")
+                trend_data = raw_series
             else:
-                logger.warning("Parquet not found, using processed data (may affect trend detection)")
+                logger.warning("usdclp_daily not in warehouse, using processed data (may affect trend detection)")
                 trend_data = data[target_col]
         except Exception as e:
-            logger.warning(f"Failed to load raw parquet: {e}. Using processed data")
+            logger.warning(f"Failed to load raw warehouse data: {e}. Using processed data")
             trend_data = data[target_col]
 
         # Calculate recent volatility (last 30 days)
@@ -317,6 +443,17 @@ class XGBoostForecaster:
         Returns:
             DataFrame with engineered features
         """
+        spec = FeatureSpec(
+            "xgboost",
+            FEATURE_VERSION,
+            params={"target_col": target_col},
+            lookback=FEATURE_LOOKBACK,
+        )
+        return cached_features(spec, data, lambda d: self._compute_features(d, target_col))
+
+    @staticmethod
+    def _compute_features(data: pd.DataFrame, target_col: str) -> pd.DataFrame:
+        """Uncached body of _create_features."""
         features = pd.DataFrame(index=data.index)
 
         # --- 1. Lagged Features (Past Values) ---
@@ -421,16 +558,7 @@ class XGBoostForecaster:
 
         # --- 15. Trend Features (Linear Regression Slope) ---
         for window in [10, 20, 50]:
-            def calc_slope(series):
-                if len(series) < 2 or series.isna().any():
-                    return 0
-                x = np.arange(len(series))
-                y = series.values
-                return np.polyfit(x, y, 1)[0]
-
-            features[f'trend_slope_{window}d'] = (
-                data[target_col].rolling(window).apply(calc_slope, raw=False)
-            )
+            features[f'trend_slope_{window}d'] = rolling_slope(data[target_col], window)
 
         return features
 
@@ -582,6 +710,10 @@ class XGBoostForecaster:
             self.training_metrics = metrics
             self.is_fitted = True
 
+            # EWM state at the end of the training window, seeded exactly like
+            # the training features, so the next predict() only advances it
+            self.ewm_state = EWMFeatureState.from_series(data[target_col])
+
             logger.info(f"Training complete. RMSE: {metrics.rmse:.2f}, MAE: {metrics.mae:.2f}, "
                        f"MAPE: {metrics.mape:.2f}%, Dir. Acc: {metrics.directional_accuracy:.1f}%")
 
@@ -620,10 +752,7 @@ class XGBoostForecaster:
                     if col in data.columns:
                         target_col = col
                         break
-            features = self._create_features(data, target_col=target_col)
-
-            # Use only the last complete row for prediction
-            X = features[self.feature_names].iloc[[-1]]
+            X = self._latest_features(data, target_col)[self.feature_names]
 
             # Handle any missing values (use forward fill then backward fill)
             if X.isna().any().any():
@@ -670,12 +799,49 @@ class XGBoostForecaster:
             logger.error(f"Prediction failed: {str(e)}")
             raise
 
+    def _latest_features(self, data: pd.DataFrame, target_col: str) -> pd.DataFrame:
+        """
+        Features of the last row of ``data``.
+
+        With incremental_features enabled and a usable EWM state, only the last
+        INCREMENTAL_TAIL_ROWS rows are recomputed and the EWM columns come from
+        the carried state. Otherwise the full history is featurized and the
+        state is rebuilt from it for the next call.
+
+        Args:
+            data: Input data for feature generation
+            target_col: Name of target column
+
+        Returns:
+            Single-row DataFrame with engineered features
+        """
+        series = data[target_col]
+        state = None
+        if self.config.incremental_features and self.ewm_state is not None:
+            state = self.ewm_state.advance(series)
+
+        if state is None:
+            features = self._create_features(data, target_col=target_col)
+            self.ewm_state = EWMFeatureState.from_series(series)
+            return features.iloc[[-1]]
+
+        latest = self._compute_features(
+            data.iloc[-INCREMENTAL_TAIL_ROWS:], target_col
+        ).iloc[[-1]].copy()
+        for name, value in state.features().items():
+            latest[name] = value
+        self.ewm_state = state
+        logger.debug(f"Incremental features: recomputed last {INCREMENTAL_TAIL_ROWS} rows, "
+                     f"EWM state advanced to {state.timestamp}")
+        return latest
+
     def walk_forward_validation(
         self,
         data: pd.DataFrame,
         target_col: str = 'close',
         n_splits: int = 5,
-        min_train_size: int = 252
+        min_train_size: int = 252,
+        fold_callback: Optional[Callable[[int, List[ForecastMetrics]], None]] = None,
     ) -> List[ForecastMetrics]:
         """
         Perform walk-forward validation for robust performance estimation.
@@ -687,6 +853,9 @@ class XGBoostForecaster:
             target_col: Target column name
             n_splits: Number of validation splits
             min_train_size: Minimum training samples (default: 1 year = 252 trading days)
+            fold_callback: Called after each evaluated fold with the 0-based
+                step and the metrics so far. Exceptions it raises (e.g.
+                optuna.TrialPruned) stop the validation early.
 
         Returns:
             List of metrics for each fold
@@ -753,6 +922,9 @@ class XGBoostForecaster:
             logger.info(f"Fold {fold}/{n_splits}: RMSE={fold_metrics.rmse:.2f}, "
                        f"MAE={fold_metrics.mae:.2f}, MAPE={fold_metrics.mape:.2f}%")
 
+            if fold_callback is not None:
+                fold_callback(len(metrics_list) - 1, metrics_list)
+
         # Summary statistics
         if metrics_list:
             avg_rmse = np.mean([m.rmse for m in metrics_list])
@@ -904,6 +1076,7 @@ class XGBoostForecaster:
             'feature_names': self.feature_names,
             'is_fitted': self.is_fitted,
             'training_metrics': self.training_metrics.to_dict() if self.training_metrics else None,
+            'ewm_state': self.ewm_state.to_dict() if self.ewm_state else None,
             'saved_at': datetime.now().isoformat(),
             'model_version': '1.0.0'
         }
@@ -950,9 +1123,65 @@ class XGBoostForecaster:
 
             if meta.get('training_metrics'):
                 self.training_metrics = ForecastMetrics(**meta['training_metrics'])
+            if meta.get('ewm_state'):
+                self.ewm_state = EWMFeatureState.from_dict(meta['ewm_state'])
 
         logger.info(f"Model loaded from {path}")
 
+    def save_artifact(self, writer: ArtifactWriter, name: str = "xgboost") -> None:
+        """
+        Add the model to a compact artifact.
+
+        The booster is written as UBJ, the scalers as arrays in the shared
+        payload and everything else as manifest metadata.
+
+        Args:
+            writer: Artifact being written
+            name: Component name inside the artifact
+        """
+        if not self.is_fitted:
+            raise RuntimeError("Cannot save untrained model")
+
+        booster_file = f"{name}.ubj"
+        self.model.save_model(writer.file_path(booster_file))
+
+        writer.add_component(name, {
+            'booster_file': booster_file,
+            'config': asdict(self.config),
+            'feature_names': self.feature_names,
+            'target_col': getattr(self, 'target_col', 'close'),
+            'feature_scaler': save_scaler(writer, f"{name}/feature_scaler", self.feature_scaler),
+            'target_scaler': save_scaler(writer, f"{name}/target_scaler", self.target_scaler),
+            'training_metrics': self.training_metrics.to_dict() if self.training_metrics else None,
+            'ewm_state': self.ewm_state.to_dict() if self.ewm_state else None,
+        })
+
+    def load_artifact(self, reader: ArtifactReader, name: str = "xgboost") -> None:
+        """
+        Load the model from a compact artifact written by save_artifact().
+
+        Args:
+            reader: Artifact to read from
+            name: Component name inside the artifact
+        """
+        meta = reader.component(name)
+
+        self.config = XGBoostConfig(**meta['config'])
+        self.model = xgb.XGBRegressor()
+        self.model.load_model(reader.file_path(meta['booster_file']))
+
+        self.feature_scaler = load_scaler(reader, f"{name}/feature_scaler", meta['feature_scaler'])
+        self.target_scaler = load_scaler(reader, f"{name}/target_scaler", meta['target_scaler'])
+        self.feature_names = meta['feature_names']
+        self.target_col = meta['target_col']
+        if meta.get('training_metrics'):
+            self.training_metrics = ForecastMetrics(**meta['training_metrics'])
+        if meta.get('ewm_state'):
+            self.ewm_state = EWMFeatureState.from_dict(meta['ewm_state'])
+        self.is_fitted = True
+
+        logger.info(f"Model loaded from artifact {reader.path} ({name})")
+
 
 # Example usage and testing
 if __name__ == "__main__":
@@ -394,18 +394,14 @@ class UnifiedEmailOrchestrator:
 
             # Initialize tracker
             predictions_path = self.data_dir / "predictions" / "predictions.parquet"
-
-            if not predictions_path.exists():
-                logger.warning(f"Predictions file not found: {predictions_path}")
-                return None
-
             tracker = PredictionTracker(storage_path=predictions_path)
 
-            # Load predictions for this horizon
-            df = pd.read_parquet(predictions_path)
+            if not tracker.store.exists():
+                logger.warning(f"Prediction store not found: {tracker.store.root}")
+                return None
 
-            # Filter by horizon
-            horizon_df = df[df["horizon"] == horizon].copy()
+            # Load predictions for this horizon (partition-pruned read)
+            horizon_df = tracker.store.read(horizon=horizon)
 
             if horizon_df.empty:
                 logger.warning(f"No predictions found for horizon {horizon}")
@@ -491,16 +487,17 @@ class UnifiedEmailOrchestrator:
         try:
             from ..mlops.readiness import ChronosReadinessChecker
             from ..mlops.performance_monitor import PerformanceMonitor
+            from ..mlops.prediction_store import PredictionStore
 
             # Initialize checkers
             readiness_checker = ChronosReadinessChecker(data_dir=self.data_dir)
-            performance_monitor = PerformanceMonitor(data_dir=self.data_dir)
 
             # Get readiness assessment
             readiness_report = readiness_checker.assess()
 
             # Get performance status for all horizons
-            performance_reports = performance_monitor.check_all_horizons()
+            with PerformanceMonitor(data_dir=self.data_dir) as performance_monitor:
+                performance_reports = performance_monitor.check_all_horizons()
 
             # Build performance status dict
             performance_status = {}
@@ -523,15 +520,14 @@ class UnifiedEmailOrchestrator:
                     performance_status[horizon] = "UNKNOWN"
 
             # Count recent predictions
-            predictions_path = self.data_dir / "predictions" / "predictions.parquet"
+            store = PredictionStore.for_data_dir(self.data_dir)
             recent_predictions = 0
 
-            if predictions_path.exists():
-                df = pd.read_parquet(predictions_path)
+            if store.exists():
                 # Count predictions in last 7 days
                 cutoff = pd.Timestamp.now() - pd.Timedelta(days=7)
-                recent_df = df[df["forecast_date"] > cutoff]
-                recent_predictions = len(recent_df)
+                recent_df = store.read(since=cutoff)
+                recent_predictions = int((recent_df["forecast_date"] > cutoff).sum())
 
             # Check drift detection (if available)
             drift_detected = False
@@ -13,12 +13,26 @@ Components:
     - ChronosOptimizer: Optimizes Chronos model hyperparameters
     - ConfigValidator: Validates new configs vs baseline
     - DeploymentManager: Safely deploys optimized configs
+    - run_study: Persistent, resumable Optuna studies with parallel workers
 """
 
-from .triggers import OptimizationTriggerManager, TriggerReport
-from .chronos_optimizer import ChronosHyperparameterOptimizer, OptimizedConfig
-from .validator import ConfigValidator, ValidationReport
-from .deployment import ConfigDeploymentManager, DeploymentReport
+from ..utils.lazy import lazy_exports
+
+# chronos_optimizer pulls in torch and parallel_study optuna; import each
+# component only when it is used
+__getattr__, __dir__ = lazy_exports(__name__, {
+    "OptimizationTriggerManager": ".triggers",
+    "TriggerReport": ".triggers",
+    "ChronosHyperparameterOptimizer": ".chronos_optimizer",
+    "OptimizedConfig": ".chronos_optimizer",
+    "ConfigValidator": ".validator",
+    "ValidationReport": ".validator",
+    "ConfigDeploymentManager": ".deployment",
+    "DeploymentReport": ".deployment",
+    "create_pruner": ".parallel_study",
+    "create_storage": ".parallel_study",
+    "run_study": ".parallel_study",
+})
 
 __all__ = [
     "OptimizationTriggerManager",
@@ -29,4 +43,7 @@ __all__ = [
     "ValidationReport",
     "ConfigDeploymentManager",
     "DeploymentReport",
+    "create_pruner",
+    "create_storage",
+    "run_study",
 ]
@@ -19,13 +19,13 @@ from __future__ import annotations
 from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
-from typing import Optional
+from typing import Optional, Sequence
 
 import numpy as np
 import pandas as pd
 from loguru import logger
 
-from ..forecasting.chronos_model import forecast_chronos
+from ..forecasting.chronos_model import DEFAULT_BATCH_SIZE, predict_chronos_batch
 from ..forecasting.metrics import calculate_rmse, calculate_mape, calculate_mae
 
 
@@ -40,6 +40,9 @@ CONTEXT_LENGTH_SEARCH_SPACE = {
 NUM_SAMPLES_SEARCH_SPACE = [50, 100, 200]
 TEMPERATURE_SEARCH_SPACE = [0.8, 1.0, 1.2]
 
+# (context_length, num_samples, temperature)
+CandidateConfig = tuple[int, int, float]
+
 
 @dataclass
 class OptimizedConfig:
@@ -102,6 +105,7 @@ class ChronosHyperparameterOptimizer:
         validation_window: Number of days to use for validation (default: 30).
         search_method: "grid" or "random" (default: "grid").
         max_iterations: Max iterations for random search (default: 20).
+        batch_size: Max contexts per Chronos model call (default: 16).
 
     Example:
         >>> optimizer = ChronosHyperparameterOptimizer(horizon="7d")
@@ -117,11 +121,13 @@ class ChronosHyperparameterOptimizer:
         validation_window: int = 30,
         search_method: str = "grid",
         max_iterations: int = 20,
+        batch_size: int = DEFAULT_BATCH_SIZE,
     ):
         self.horizon = horizon
         self.validation_window = validation_window
         self.search_method = search_method
         self.max_iterations = max_iterations
+        self.batch_size = batch_size
 
         # Extract horizon days
         self.horizon_days = self._parse_horizon(horizon)
@@ -177,7 +183,8 @@ class ChronosHyperparameterOptimizer:
         Exhaustive grid search over hyperparameter space.
 
         Complexity: O(|context| x |samples| x |temp|)
-        Example: 3 x 3 x 3 = 27 evaluations
+        Example: 3 x 3 x 3 = 27 evaluations, scored in one model call
+        per temperature (see _backtest_configs)
         """
         context_lengths = CONTEXT_LENGTH_SEARCH_SPACE.get(
             self.horizon, [180]
@@ -199,43 +206,42 @@ class ChronosHyperparameterOptimizer:
             f"Grid search: {total_combinations} combinations to evaluate"
         )
 
-        for context in context_lengths:
-            for num_samples in num_samples_options:
-                for temp in temperature_options:
-                    iterations += 1
-
-                    logger.debug(
-                        f"Evaluating [{iterations}/{total_combinations}]: "
-                        f"context={context}, samples={num_samples}, temp={temp}"
-                    )
-
-                    # Backtest this configuration
-                    rmse, mape, mae = self._backtest_config(
-                        series=series,
-                        context_length=context,
-                        num_samples=num_samples,
-                        temperature=temp,
-                    )
-
-                    # Update best if better
-                    if rmse < best_rmse:
-                        best_rmse = rmse
-                        best_config = OptimizedConfig(
-                            horizon=self.horizon,
-                            context_length=context,
-                            num_samples=num_samples,
-                            temperature=temp,
-                            validation_rmse=rmse,
-                            validation_mape=mape,
-                            validation_mae=mae,
-                            search_iterations=iterations,
-                            optimization_time_seconds=0,  # Will be set later
-                        )
-
-                        logger.info(
-                            f"New best: RMSE={rmse:.2f}, "
-                            f"config=(context={context}, samples={num_samples}, temp={temp})"
-                        )
+        configs = [
+            (context, num_samples, temp)
+            for context in context_lengths
+            for num_samples in num_samples_options
+            for temp in temperature_options
+        ]
+        scores = self._backtest_configs(series, configs)
+
+        for (context, num_samples, temp), (rmse, mape, mae) in zip(configs, scores):
+            iterations += 1
+
+            logger.debug(
+                f"Evaluated [{iterations}/{total_combinations}]: "
+                f"context={context}, samples={num_samples}, temp={temp}, "
+                f"RMSE={rmse:.2f}"
+            )
+
+            # Update best if better
+            if rmse < best_rmse:
+                best_rmse = rmse
+                best_config = OptimizedConfig(
+                    horizon=self.horizon,
+                    context_length=context,
+                    num_samples=num_samples,
+                    temperature=temp,
+                    validation_rmse=rmse,
+                    validation_mape=mape,
+                    validation_mae=mae,
+                    search_iterations=iterations,
+                    optimization_time_seconds=0,  # Will be set later
+                )
+
+                logger.info(
+                    f"New best: RMSE={rmse:.2f}, "
+                    f"config=(context={context}, samples={num_samples}, temp={temp})"
+                )
 
         if best_config is None:
             raise RuntimeError("Grid search failed to find any valid configuration")
@@ -259,23 +265,23 @@ class ChronosHyperparameterOptimizer:
 
         logger.info(f"Random search: {self.max_iterations} iterations")
 
-        for iteration in range(self.max_iterations):
+        configs = []
+        for _ in range(self.max_iterations):
             # Sample random config
-            context = np.random.choice(context_lengths)
-            num_samples = np.random.choice(num_samples_options)
-            temp = np.random.choice(temperature_options)
+            context = int(np.random.choice(context_lengths))
+            num_samples = int(np.random.choice(num_samples_options))
+            temp = float(np.random.choice(temperature_options))
+            configs.append((context, num_samples, temp))
 
-            logger.debug(
-                f"Evaluating [{iteration + 1}/{self.max_iterations}]: "
-                f"context={context}, samples={num_samples}, temp={temp}"
-            )
+        scores = self._backtest_configs(series, configs)
 
-            # Backtest
-            rmse, mape, mae = self._backtest_config(
-                series=series,
-                context_length=context,
-                num_samples=num_samples,
-                temperature=temp,
+        for iteration, ((context, num_samples, temp), (rmse, mape, mae)) in enumerate(
+            zip(configs, scores)
+        ):
+            logger.debug(
+                f"Evaluated [{iteration + 1}/{self.max_iterations}]: "
+                f"context={context}, samples={num_samples}, temp={temp}, "
+                f"RMSE={rmse:.2f}"
             )
 
             # Update best
@@ -313,61 +319,96 @@ class ChronosHyperparameterOptimizer:
         """
         Backtest a specific hyperparameter configuration.
 
+        Returns:
+            (rmse, mape, mae)
+        """
+        [score] = self._backtest_configs(
+            series, [(context_length, num_samples, temperature)]
+        )
+        return score
+
+    def _backtest_configs(
+        self,
+        series: pd.Series,
+        configs: Sequence[CandidateConfig],
+    ) -> list[tuple[float, float, float]]:
+        """
+        Backtest many hyperparameter configurations with batched inference.
+
         Uses walk-forward validation:
         1. Hold out last `validation_window` days
         2. Generate forecasts from (len - validation_window) point
         3. Compare forecasts to actuals
-        4. Return RMSE, MAPE, MAE
+        4. Return RMSE, MAPE, MAE per config
+
+        Sampling parameters are shared by every context in a Chronos call,
+        so configs are grouped by temperature. Each group runs one batched
+        call over its distinct context lengths, drawing the largest
+        num_samples in the group; smaller num_samples candidates score the
+        first n of those i.i.d. samples.
+
+        Args:
+            series: Historical USD/CLP series.
+            configs: (context_length, num_samples, temperature) candidates.
 
         Returns:
-            (rmse, mape, mae)
+            (rmse, mape, mae) per config, in input order. Failed or
+            infeasible configs score inf.
         """
-        try:
+        failed = (float("inf"), float("inf"), float("inf"))
+        scores: list[tuple[float, float, float]] = [failed] * len(configs)
+
+        if series.isnull().any():
+            series = series.ffill().bfill()
+
+        # Split: train up to (len - validation_window)
+        split_point = len(series) - self.validation_window
+        train_series = series.iloc[:split_point]
+        actual_values = series.iloc[split_point : split_point + self.horizon_days].values
+        if len(actual_values) == 0:
+            logger.warning("Empty validation window, nothing to backtest")
+            return scores
+
+        groups: dict[float, list[int]] = {}
+        for index, (context_length, _, temperature) in enumerate(configs):
             # Ensure enough data for context + validation
             min_required = context_length + self.validation_window
             if len(series) < min_required:
                 logger.warning(
                     f"Insufficient data: need {min_required}, have {len(series)}"
                 )
-                return float("inf"), float("inf"), float("inf")
-
-            # Split: train up to (len - validation_window)
-            split_point = len(series) - self.validation_window
-            train_series = series.iloc[:split_point]
-            actual_values = series.iloc[
-                split_point : split_point + self.horizon_days
-            ].values
-
-            # Generate forecast
-            forecast_package = forecast_chronos(
-                series=train_series,
-                steps=self.horizon_days,
-                context_length=context_length,
-                num_samples=num_samples,
-                temperature=temperature,
-                validate=False,  # Skip internal validation (we're doing it)
-            )
-
-            # Extract predictions
-            predicted_values = np.array(
-                [point.mean for point in forecast_package.series]
-            )
+                continue
+            groups.setdefault(temperature, []).append(index)
 
-            # Ensure same length
-            min_len = min(len(predicted_values), len(actual_values))
-            predicted_values = predicted_values[:min_len]
-            actual_values = actual_values[:min_len]
+        for temperature, indices in groups.items():
+            context_lengths = sorted({configs[i][0] for i in indices})
+            num_samples = max(configs[i][1] for i in indices)
 
-            # Calculate metrics
-            rmse = calculate_rmse(actual_values, predicted_values)
-            mape = calculate_mape(actual_values, predicted_values)
-            mae = calculate_mae(actual_values, predicted_values)
-
-            return rmse, mape, mae
+            try:
+                samples = predict_chronos_batch(
+                    [train_series.iloc[-length:].values for length in context_lengths],
+                    prediction_length=len(actual_values),
+                    num_samples=num_samples,
+                    temperature=temperature,
+                    batch_size=self.batch_size,
+                )
+            except Exception as e:
+                logger.error(f"Backtest failed (temperature={temperature}): {e}")
+                continue
+
+            by_context = dict(zip(context_lengths, samples))
+            for i in indices:
+                context_length, n, _ = configs[i]
+                predicted_values = by_context[context_length][:n].mean(axis=0)
+
+                # Calculate metrics
+                scores[i] = (
+                    calculate_rmse(actual_values, predicted_values),
+                    calculate_mape(actual_values, predicted_values),
+                    calculate_mae(actual_values, predicted_values),
+                )
 
-        except Exception as e:
-            logger.error(f"Backtest failed: {e}")
-            return float("inf"), float("inf"), float("inf")
+        return scores
 
     def _parse_horizon(self, horizon: str) -> int:
         """
@@ -0,0 +1,218 @@
+"""
+Persistent, parallel Optuna studies.
+
+A study stored in a local journal file (or an RDB URL) can be shared by
+several worker processes and resumed after an interruption: trials that
+already finished are kept and only the remaining ones are run.
+
+Storage specs accepted by create_storage():
+    None / "memory"                 in-memory (single process, no resume)
+    "sqlite:///path/studies.db"     any SQLAlchemy URL (RDBStorage)
+    "/path/studies.journal"         journal file (safe for multi-process)
+
+Example:
+    >>> study = run_study(
+    ...     "xgboost_7d_2026-W42",
+    ...     objective,                      # picklable callable(trial) -> float
+    ...     n_trials=50,
+    ...     storage="/app/models/optuna/xgboost_7d.journal",
+    ...     n_workers=4,
+    ...     pruner="median",
+    ...     max_resource=5,                 # steps reported per trial (folds)
+    ... )
+"""
+
+from __future__ import annotations
+
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Any, Callable, Optional
+
+import optuna
+from loguru import logger
+from optuna.pruners import BasePruner, HyperbandPruner, MedianPruner, NopPruner
+from optuna.samplers import TPESampler
+from optuna.study import MaxTrialsCallback
+from optuna.trial import TrialState
+
+PRUNERS = ("median", "hyperband", "none")
+
+# Trial states that count towards the trial budget (failed trials are retried)
+FINISHED_STATES = (TrialState.COMPLETE, TrialState.PRUNED)
+
+
+def create_storage(spec: Optional[str]) -> Optional[Any]:
+    """
+    Build an Optuna storage from a spec string.
+
+    Returns:
+        None for in-memory studies, an RDB URL string, or a JournalStorage
+    """
+    if spec is None or spec == "memory":
+        return None
+    if "://" in spec:
+        return spec
+
+    path = Path(spec)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    try:
+        from optuna.storages.journal import JournalFileBackend
+    except ImportError:  # optuna 3.1-3.x (JournalStorage needs >= 3.1)
+        from optuna.storages import JournalFileStorage as JournalFileBackend
+    return optuna.storages.JournalStorage(JournalFileBackend(str(path)))
+
+
+def create_pruner(
+    name: str,
+    max_resource: Optional[int] = None,
+    n_startup_trials: int = 5,
+) -> BasePruner:
+    """
+    Build a pruner for trials that report one intermediate value per step.
+
+    Args:
+        name: "median", "hyperband" or "none"
+        max_resource: Number of steps a full trial reports (e.g. folds)
+        n_startup_trials: Trials completed before the median pruner acts
+
+    Raises:
+        ValueError: For unknown pruner names
+    """
+    if name == "median":
+        # Never prune on the first step alone: one fold is too noisy
+        return MedianPruner(n_startup_trials=n_startup_trials, n_warmup_steps=1)
+    if name == "hyperband":
+        return HyperbandPruner(
+            min_resource=1,
+            max_resource=max_resource if max_resource is not None else "auto",
+            reduction_factor=3,
+        )
+    if name == "none":
+        return NopPruner()
+    raise ValueError(f"Unknown pruner '{name}'. Expected one of {PRUNERS}")
+
+
+def finished_trials(study: optuna.Study) -> int:
+    """Number of trials that count towards the budget."""
+    return len(study.get_trials(deepcopy=False, states=FINISHED_STATES))
+
+
+def _load_study(
+    study_name: str,
+    storage: Optional[str],
+    direction: str,
+    pruner: str,
+    max_resource: Optional[int],
+    seed: Optional[int],
+    constant_liar: bool,
+) -> optuna.Study:
+    return optuna.create_study(
+        study_name=study_name,
+        storage=create_storage(storage),
+        direction=direction,
+        sampler=TPESampler(seed=seed, constant_liar=constant_liar),
+        pruner=create_pruner(pruner, max_resource),
+        load_if_exists=True,
+    )
+
+
+def _optimize_worker(
+    study_name: str,
+    storage: str,
+    objective: Callable[[optuna.Trial], float],
+    n_trials: int,
+    direction: str,
+    pruner: str,
+    max_resource: Optional[int],
+    seed: Optional[int],
+) -> int:
+    """Worker process: attach to the shared study and run trials until the budget is met."""
+    optuna.logging.set_verbosity(optuna.logging.WARNING)
+    study = _load_study(study_name, storage, direction, pruner, max_resource, seed, constant_liar=True)
+    study.optimize(
+        objective,
+        n_trials=n_trials,
+        callbacks=[MaxTrialsCallback(n_trials, states=FINISHED_STATES)],
+    )
+    return finished_trials(study)
+
+
+def run_study(
+    study_name: str,
+    objective: Callable[[optuna.Trial], float],
+    n_trials: int,
+    storage: Optional[str] = None,
+    n_workers: int = 1,
+    pruner: str = "median",
+    max_resource: Optional[int] = None,
+    direction: str = "minimize",
+    seed: Optional[int] = 42,
+) -> optuna.Study:
+    """
+    Run (or resume) a study until it has ``n_trials`` finished trials.
+
+    With persistent storage, trials finished by an earlier run of the same
+    study are kept, so an interrupted run picks up where it stopped. With
+    more than one worker the trials run in separate processes sharing the
+    study through the storage; each worker samples with its own seed and
+    TPE's constant liar so concurrent trials do not duplicate each other.
+
+    Args:
+        study_name: Study name (same name + storage = resume)
+        objective: Objective; must be picklable when n_workers > 1
+        n_trials: Total finished (complete or pruned) trials wanted
+        storage: Storage spec (see module docstring); required for workers > 1
+        n_workers: Worker processes
+        pruner: "median", "hyperband" or "none"
+        max_resource: Steps reported per trial, for Hyperband
+        direction: "minimize" or "maximize"
+        seed: Sampler seed (worker i uses seed + i; offset on resume)
+
+    Returns:
+        The study, reloaded after all workers finished
+    """
+    if n_workers > 1 and storage in (None, "memory"):
+        logger.warning("In-memory studies cannot be shared between processes; using 1 worker")
+        n_workers = 1
+
+    study = _load_study(
+        study_name, storage, direction, pruner, max_resource, seed, constant_liar=n_workers > 1
+    )
+    done = finished_trials(study)
+    if done:
+        logger.info(f"Resuming study '{study_name}': {done}/{n_trials} trials already finished")
+    if done >= n_trials:
+        return study
+    if seed is not None and done:
+        # A resumed sampler must not replay the samples of the first run
+        seed += done
+        study.sampler = TPESampler(seed=seed, constant_liar=n_workers > 1)
+
+    if n_workers <= 1:
+        study.optimize(
+            objective,
+            n_trials=n_trials - done,
+            callbacks=[MaxTrialsCallback(n_trials, states=FINISHED_STATES)],
+        )
+        return study
+
+    logger.info(f"Running study '{study_name}' on {n_workers} workers ({n_trials - done} trials left)")
+    with ProcessPoolExecutor(max_workers=n_workers) as pool:
+        futures = [
+            pool.submit(
+                _optimize_worker,
+                study_name,
+                storage,
+                objective,
+                n_trials,
+                direction,
+                pruner,
+                max_resource,
+                None if seed is None else seed + worker,
+            )
+            for worker in range(n_workers)
+        ]
+        for future in futures:
+            future.result()
+
+    return _load_study(study_name, storage, direction, pruner, max_resource, seed, constant_liar=False)
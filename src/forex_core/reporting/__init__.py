@@ -6,8 +6,14 @@ Exports:
     - ReportBuilder: Build comprehensive PDF reports
 """
 
-from .builder import ReportBuilder
-from .charting import ChartGenerator
+from ..utils.lazy import lazy_exports
+
+# charting imports matplotlib/seaborn and builder probes weasyprint; defer
+# both until a report is actually built
+__getattr__, __dir__ = lazy_exports(__name__, {
+    "ChartGenerator": ".charting",
+    "ReportBuilder": ".builder",
+})
 
 __all__ = [
     "ChartGenerator",
@@ -1,19 +1,26 @@
 """Utility modules for forex_core."""
 
-from .helpers import (
-    chunk,
-    dump_json,
-    ensure_parent,
-    format_decimal,
-    load_json,
-    percent_change,
-    sanitize_filename,
-    timestamp_now,
-    to_markdown_table,
-    word_count,
-)
+from .lazy import lazy_exports
 from .logging import configure_logging, logger
 
+# helpers imports pandas; resolve it on first use so importing the logger
+# stays cheap
+__getattr__, __dir__ = lazy_exports(__name__, {
+    name: ".helpers"
+    for name in (
+        "chunk",
+        "dump_json",
+        "ensure_parent",
+        "format_decimal",
+        "load_json",
+        "percent_change",
+        "sanitize_filename",
+        "timestamp_now",
+        "to_markdown_table",
+        "word_count",
+    )
+})
+
 __all__ = [
     # Logging
     "configure_logging",
@@ -0,0 +1,207 @@
+"""
+Import-time profiling for cold-start budgets.
+
+Cron jobs and CLIs start a fresh interpreter on every run, so whatever their
+entry module imports is paid each time. measure_import() imports a module in
+a clean subprocess under ``python -X importtime`` and reports the wall time
+of the import plus the heaviest modules it pulled in; check_import() turns
+that into a pass/fail against a time budget and a list of modules that must
+stay lazy.
+
+Example:
+    >>> profile = measure_import("services.forecaster_7d.cli")
+    >>> profile.total_ms, profile.heaviest(3)
+    >>> check_import(profile, budget_ms=1000)  # [] when within budget
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import subprocess
+import sys
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+# Cold-start budget for a service CLI entry module
+DEFAULT_BUDGET_MS = 1000.0
+
+# Heavy dependencies that CLI entry modules must only import on demand
+HEAVY_MODULES = (
+    "torch",
+    "matplotlib",
+    "weasyprint",
+    "statsmodels",
+    "scipy",
+    "pandas",
+    "sklearn",
+    "xgboost",
+    "arch",
+)
+
+# Entry modules of the cron/CLI processes
+SERVICE_CLI_MODULES = (
+    "services.forecaster_7d.cli",
+    "services.forecaster_15d.cli",
+    "services.forecaster_30d.cli",
+    "services.forecaster_90d.cli",
+    "services.forecaster_12m.cli",
+    "services.model_server.cli",
+)
+
+SRC_DIR = Path(__file__).resolve().parents[2]
+
+# Prints the modules loaded by interpreter startup, then the import's wall time
+_PROBE = (
+    "import importlib, json, sys, time\n"
+    "preloaded = sorted(sys.modules)\n"
+    "start = time.perf_counter()\n"
+    "importlib.import_module(sys.argv[1])\n"
+    "elapsed = time.perf_counter() - start\n"
+    "print(json.dumps(preloaded))\n"
+    "print(elapsed)\n"
+)
+
+
+@dataclass
+class ImportProfile:
+    """
+    Result of importing one module in a fresh interpreter.
+
+    Attributes:
+        module: Imported module name
+        total_ms: Wall time of the import statement (best of the runs)
+        cumulative_ms: Cumulative import time per module imported by
+            ``module`` (interpreter startup excluded), from -X importtime
+    """
+
+    module: str
+    total_ms: float
+    cumulative_ms: Dict[str, float] = field(default_factory=dict)
+
+    def imported(self, name: str) -> bool:
+        """Whether ``name`` (or any of its submodules) was imported."""
+        return self.package_ms(name) is not None
+
+    def package_ms(self, name: str) -> Optional[float]:
+        """Import time of package ``name`` (its slowest entry), None if not imported."""
+        times = [
+            ms for module, ms in self.cumulative_ms.items()
+            if module == name or module.startswith(name + ".")
+        ]
+        return max(times) if times else None
+
+    def heaviest(self, n: int = 10) -> List[Tuple[str, float]]:
+        """Top-level packages by cumulative import time, slowest first."""
+        roots = {module.split(".")[0] for module in self.cumulative_ms}
+        times = [(root, self.package_ms(root)) for root in roots]
+        return sorted(times, key=lambda item: item[1], reverse=True)[:n]
+
+
+def parse_importtime(output: str) -> Dict[str, float]:
+    """
+    Parse ``-X importtime`` stderr into cumulative milliseconds per module.
+
+    Lines look like ``import time:  self [us] | cumulative | imported package``
+    with the package name indented by nesting depth. Non-matching lines
+    (warnings, tracebacks) are ignored. A module reported twice keeps its
+    largest time.
+    """
+    cumulative: Dict[str, float] = {}
+    for line in output.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        parts = line[len("import time:"):].split("|")
+        if len(parts) != 3:
+            continue
+        try:
+            cumulative_us = int(parts[1])
+        except ValueError:
+            continue  # Header line
+        module = parts[2].strip()
+        cumulative[module] = max(cumulative.get(module, 0.0), cumulative_us / 1000.0)
+    return cumulative
+
+
+def measure_import(
+    module: str,
+    repeat: int = 3,
+    python: Optional[str] = None,
+    src_dir: Path = SRC_DIR,
+) -> ImportProfile:
+    """
+    Import ``module`` in fresh interpreters and keep the fastest run.
+
+    The first run also warms the OS page cache and bytecode cache, so the
+    best of several runs is a stable measure of the import work itself.
+
+    Args:
+        module: Dotted module name to import
+        repeat: Number of fresh interpreters to run (>= 1)
+        python: Interpreter to use (defaults to the current one)
+        src_dir: Directory put first on PYTHONPATH
+
+    Returns:
+        ImportProfile of the fastest run
+
+    Raises:
+        RuntimeError: If the module fails to import
+    """
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(
+        p for p in (str(src_dir), env.get("PYTHONPATH", "")) if p
+    )
+    env.pop("PYTHONDONTWRITEBYTECODE", None)
+
+    best: Optional[ImportProfile] = None
+    for _ in range(max(1, repeat)):
+        result = subprocess.run(
+            [python or sys.executable, "-X", "importtime", "-c", _PROBE, module],
+            capture_output=True,
+            text=True,
+            env=env,
+        )
+        if result.returncode != 0:
+            raise RuntimeError(f"Importing {module} failed:\n{result.stderr[-2000:]}")
+
+        preloaded_line, elapsed_line = result.stdout.strip().splitlines()[-2:]
+        preloaded = set(json.loads(preloaded_line))
+        profile = ImportProfile(
+            module=module,
+            total_ms=float(elapsed_line) * 1000.0,
+            cumulative_ms={
+                name: ms
+                for name, ms in parse_importtime(result.stderr).items()
+                if name not in preloaded
+            },
+        )
+        if best is None or profile.total_ms < best.total_ms:
+            best = profile
+    return best
+
+
+def check_import(
+    profile: ImportProfile,
+    budget_ms: float = DEFAULT_BUDGET_MS,
+    forbidden: Iterable[str] = HEAVY_MODULES,
+) -> List[str]:
+    """
+    Compare an import profile against its budget.
+
+    Returns:
+        Human-readable violations; empty if the import is within budget and
+        none of the forbidden modules was imported
+    """
+    violations = []
+    if profile.total_ms > budget_ms:
+        slowest = ", ".join(f"{name} {ms:.0f}ms" for name, ms in profile.heaviest(5))
+        violations.append(
+            f"{profile.module}: import took {profile.total_ms:.0f}ms "
+            f"(budget {budget_ms:.0f}ms; slowest: {slowest})"
+        )
+    for name in forbidden:
+        ms = profile.package_ms(name)
+        if ms is not None:
+            violations.append(f"{profile.module}: imports {name} at startup ({ms:.0f}ms)")
+    return violations
@@ -0,0 +1,75 @@
+"""
+Lazy package exports.
+
+Package ``__init__`` modules re-export names from their submodules for
+convenience, but importing every submodule eagerly means ``import
+forex_core.forecasting`` pays for torch and ``import forex_core.utils``
+for pandas, even when the caller only wants one light function.
+
+lazy_exports() builds a module-level ``__getattr__`` (PEP 562) that imports
+the owning submodule on first attribute access and caches the result in the
+package namespace, so later lookups are plain dict hits.
+
+Example:
+    >>> # forex_core/reporting/__init__.py
+    >>> __getattr__, __dir__ = lazy_exports(__name__, {
+    ...     "ReportBuilder": ".builder",
+    ...     "ChartGenerator": ".charting",
+    ... })
+"""
+
+from __future__ import annotations
+
+import importlib
+import sys
+from typing import Any, Callable, Dict, Iterable, List, Tuple
+
+
+def lazy_exports(
+    package: str,
+    exports: Dict[str, str],
+    optional: Iterable[str] = (),
+) -> Tuple[Callable[[str], Any], Callable[[], List[str]]]:
+    """
+    Build ``__getattr__`` and ``__dir__`` for a package with lazy exports.
+
+    Args:
+        package: The package's ``__name__``
+        exports: Exported name -> relative submodule that defines it
+        optional: Names that resolve to None when their submodule cannot be
+            imported (missing optional dependency), instead of raising
+
+    Returns:
+        (__getattr__, __dir__) to assign at module level
+
+    Raises (from the returned __getattr__):
+        AttributeError: For names that are not exported
+        ImportError: If the submodule of a non-optional name cannot be
+            imported, exactly as the eager import would have
+    """
+    optional = frozenset(optional)
+    unknown = optional - exports.keys()
+    if unknown:
+        raise ValueError(f"Optional names without a submodule: {sorted(unknown)}")
+
+    def __getattr__(name: str) -> Any:
+        try:
+            submodule = exports[name]
+        except KeyError:
+            raise AttributeError(f"module '{package}' has no attribute '{name}'") from None
+
+        namespace = vars(sys.modules[package])
+        try:
+            value = getattr(importlib.import_module(submodule, package), name)
+        except ImportError:
+            if name not in optional:
+                raise
+            value = None
+
+        namespace[name] = value
+        return value
+
+    def __dir__() -> List[str]:
+        return sorted(set(vars(sys.modules[package])) | exports.keys())
+
+    return __getattr__, __dir__
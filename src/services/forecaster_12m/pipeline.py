@@ -81,7 +81,7 @@ def run_forecast_pipeline(
         # Step 1: Load data
         logger.info("Loading data from providers...")
         loader = DataLoader(settings)
-        bundle: DataBundle = loader.load()
+        bundle: DataBundle = loader.load(max_age=settings.bundle_snapshot_max_age)
         logger.info(
             f"Data loaded: {len(bundle.indicators)} indicators, "
             f"{len(bundle.sources)} sources"
@@ -15,11 +15,10 @@ from rich.console import Console
 from rich.table import Table
 
 from forex_core.config import get_settings
-from forex_core.data import DataLoader
 from forex_core.utils.logging import logger, configure_logging
 
+from ..model_server.client import request_or_none
 from .config import get_service_config
-from .pipeline import run_forecast_pipeline, validate_forecast
 
 app = typer.Typer(
     name="forecaster-90d",
@@ -87,10 +86,22 @@ def run(
     try:
         # Run pipeline
         with console.status("[yellow]Running forecast pipeline...[/yellow]"):
-            report_path = run_forecast_pipeline(
+            # Runs on the warm model server when one is listening
+            result = request_or_none(
+                "run",
+                service="forecaster_90d",
                 skip_email=skip_email,
-                output_dir=output_dir,
+                output_dir=str(output_dir.resolve()) if output_dir else None,
             )
+            if result is not None:
+                report_path = Path(result["report_path"])
+            else:
+                from .pipeline import run_forecast_pipeline
+
+                report_path = run_forecast_pipeline(
+                    skip_email=skip_email,
+                    output_dir=output_dir,
+                )
 
         # Success message
         console.print(f"\n[bold green]✓ Forecast completed successfully![/bold green]")
@@ -133,10 +144,14 @@ def validate(
     try:
         # Load data
         with console.status("[yellow]Loading data...[/yellow]"):
+            from forex_core.data import DataLoader
+
+            from .pipeline import validate_forecast
+
             settings = get_settings()
             service_config = get_service_config()
             loader = DataLoader(settings)
-            bundle = loader.load()
+            bundle = loader.load(max_age=settings.bundle_snapshot_max_age)
 
         console.print(
             f"[green]✓ Data loaded:[/green] {len(bundle.indicators)} indicators, "
@@ -0,0 +1,9 @@
+"""
+Warm model server.
+
+A long-lived local process that keeps pandas/statsmodels/xgboost/torch
+imported, the trained ensembles and the Chronos pipeline resident, and
+serves forecast, run and validate requests over localhost HTTP. The
+forecaster CLIs and cron scripts are thin clients that fall back to an
+in-process run when no server is listening.
+"""
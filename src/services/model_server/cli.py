@@ -0,0 +1,143 @@
+"""
+Command-line interface for the warm model server.
+
+    # Start the server (entrypoint.sh does this in the cron containers)
+    $ python -m services.model_server.cli serve --preload 7
+
+    # Thin client used by cron: runs on the server, or in-process if none
+    $ python -m services.model_server.cli forecast --horizon 7
+
+    $ python -m services.model_server.cli status
+"""
+
+from __future__ import annotations
+
+import json
+from typing import Optional
+
+import typer
+from rich.console import Console
+
+from forex_core.utils.logging import configure_logging, logger
+
+from .client import (
+    ModelServerClient,
+    ModelServerError,
+    ModelServerUnavailable,
+    request_or_none,
+)
+
+app = typer.Typer(
+    name="model-server",
+    help="Warm model server for the forecasting services",
+    add_completion=False,
+)
+console = Console()
+
+
+def _parse_horizons(value: str) -> list:
+    try:
+        return [int(h) for h in value.split(",") if h.strip()]
+    except ValueError:
+        raise typer.BadParameter(f"Expected comma-separated horizons in days, got '{value}'")
+
+
+@app.command()
+def serve(
+    host: Optional[str] = typer.Option(None, "--host", help="Interface to bind (default: MODEL_SERVER_HOST)"),
+    port: Optional[int] = typer.Option(None, "--port", "-p", help="Port to bind (default: MODEL_SERVER_PORT)"),
+    preload: str = typer.Option(
+        "",
+        "--preload",
+        help="Comma-separated ensemble horizons to load at startup (e.g. 7,15)",
+    ),
+    warm_chronos: bool = typer.Option(
+        False,
+        "--warm-chronos",
+        help="Load the Chronos pipeline at startup (if ENABLE_CHRONOS)",
+    ),
+    log_level: str = typer.Option("INFO", "--log-level", "-l", help="Logging level"),
+) -> None:
+    """Start the model server and block until interrupted."""
+    configure_logging(level=log_level)
+
+    from .handlers import warm_up
+    from .server import ModelServer
+
+    server = ModelServer(host=host, port=port)
+
+    try:
+        loaded = warm_up(horizons=_parse_horizons(preload), chronos=warm_chronos)
+        logger.info(f"Model server warmed up: {loaded}")
+    except Exception as e:
+        # A failed warm-up only costs the first request its cold start
+        logger.warning(f"Model server warm-up incomplete: {e}")
+
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        logger.info("Model server stopped")
+
+
+@app.command()
+def status() -> None:
+    """Show whether a server is running and what it holds in memory."""
+    client = ModelServerClient()
+    try:
+        health = client.health()
+    except ModelServerUnavailable:
+        console.print(f"[bold red]✗ No model server at {client.base_url}[/bold red]")
+        raise typer.Exit(code=1)
+
+    console.print(f"[bold green]✓ Model server at {client.base_url}[/bold green]")
+    console.print(json.dumps(health, indent=2))
+
+
+@app.command()
+def forecast(
+    horizon: int = typer.Option(7, "--horizon", help="Forecast horizon in days (7, 15, 30, 90)"),
+    train: bool = typer.Option(False, "--train", help="Train new models (default: use existing)"),
+    no_email: bool = typer.Option(False, "--no-email", help="Skip email delivery"),
+    test_email: bool = typer.Option(False, "--test-email", help="Send email to test recipients only"),
+    verbose: bool = typer.Option(False, "--verbose", "-v", help="Enable verbose logging"),
+    local: bool = typer.Option(False, "--local", help="Run in this process even if a server is running"),
+) -> None:
+    """
+    Run scripts/forecast_with_ensemble.py for one horizon.
+
+    Same options and exit codes as the script (0 success, 1 failure,
+    2 alert). The run happens on the model server when one is listening.
+    """
+    configure_logging(level="DEBUG" if verbose else "INFO")
+    if horizon not in (7, 15, 30, 90):
+        raise typer.BadParameter(f"Unsupported horizon {horizon}; expected 7, 15, 30 or 90")
+
+    params = dict(
+        horizon_days=horizon,
+        train_models=train,
+        no_email=no_email,
+        test_email=test_email,
+        verbose=verbose,
+    )
+
+    try:
+        result = None if local else request_or_none("forecast", **params)
+    except ModelServerError as e:
+        logger.error(f"Forecast failed on model server: {e}")
+        raise typer.Exit(code=1)
+
+    if result is None:
+        from .handlers import ensemble_forecast
+
+        result = ensemble_forecast(**params)
+
+    raise typer.Exit(code=int(result["exit_code"]))
+
+
+def main() -> None:
+    """Entry point for the CLI application."""
+    app()
+
+
+if __name__ == "__main__":
+    main()
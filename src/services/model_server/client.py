@@ -0,0 +1,160 @@
+"""
+Thin client for the warm model server.
+
+Only the standard library and forex_core.config are imported here, so a
+CLI that delegates to the server does not pay for pandas, statsmodels or
+torch at startup.
+
+Example:
+    >>> result = request_or_none("run", service="forecaster_7d", skip_email=True)
+    >>> if result is None:
+    ...     pass  # No server listening: run in-process instead
+"""
+
+from __future__ import annotations
+
+import json
+import socket
+import urllib.error
+import urllib.request
+from typing import Any, Dict, Optional
+
+from forex_core.config import get_settings
+from forex_core.utils.logging import logger
+
+# Connecting to localhost either succeeds or is refused immediately
+CONNECT_TIMEOUT_SECONDS = 2.0
+
+
+class ModelServerError(RuntimeError):
+    """The server was reached but the requested operation failed."""
+
+
+class ModelServerUnavailable(ConnectionError):
+    """No model server is listening at the configured address."""
+
+
+class ModelServerClient:
+    """
+    JSON-over-HTTP client for ModelServer.
+
+    Args:
+        host: Server host (defaults to MODEL_SERVER_HOST)
+        port: Server port (defaults to MODEL_SERVER_PORT)
+        timeout: Request timeout in seconds (defaults to MODEL_SERVER_TIMEOUT_SECONDS)
+    """
+
+    def __init__(
+        self,
+        host: Optional[str] = None,
+        port: Optional[int] = None,
+        timeout: Optional[float] = None,
+    ):
+        settings = get_settings()
+        self.host = host or settings.model_server_host
+        self.port = port or settings.model_server_port
+        self.timeout = timeout or settings.model_server_timeout_seconds
+
+    @property
+    def base_url(self) -> str:
+        return f"http://{self.host}:{self.port}"
+
+    def health(self) -> Dict[str, Any]:
+        """
+        Server status (uptime, requests served, resident ensembles).
+
+        Raises:
+            ModelServerUnavailable: If no server is listening
+        """
+        return self._send("GET", "/health", None, CONNECT_TIMEOUT_SECONDS)
+
+    def is_available(self) -> bool:
+        try:
+            self.health()
+            return True
+        except ModelServerUnavailable:
+            return False
+
+    def request(self, operation: str, **params: Any) -> Dict[str, Any]:
+        """
+        Run an operation on the server and return its result.
+
+        Raises:
+            ModelServerUnavailable: If no server is listening
+            ModelServerError: If the operation failed on the server or did
+                not answer within the timeout (it may still be running)
+        """
+        return self._send("POST", f"/v1/{operation}", params, self.timeout)
+
+    def _send(
+        self,
+        method: str,
+        path: str,
+        payload: Optional[Dict[str, Any]],
+        timeout: float,
+    ) -> Dict[str, Any]:
+        data = json.dumps(payload).encode("utf-8") if payload is not None else None
+        req = urllib.request.Request(
+            self.base_url + path,
+            data=data,
+            method=method,
+            headers={"Content-Type": "application/json"},
+        )
+        try:
+            with urllib.request.urlopen(req, timeout=timeout) as response:
+                body = json.loads(response.read().decode("utf-8"))
+        except urllib.error.HTTPError as e:
+            try:
+                body = json.loads(e.read().decode("utf-8"))
+            except ValueError:
+                body = {"error": str(e)}
+            raise ModelServerError(body.get("error", str(e))) from e
+        except urllib.error.URLError as e:
+            # Raised while connecting or sending: the request never reached the server
+            if isinstance(
+                e.reason,
+                (ConnectionRefusedError, socket.gaierror, socket.timeout, FileNotFoundError),
+            ):
+                raise ModelServerUnavailable(f"No model server at {self.base_url}") from e
+            raise ModelServerError(f"Model server request failed: {e.reason}") from e
+        except ConnectionRefusedError as e:
+            raise ModelServerUnavailable(f"No model server at {self.base_url}") from e
+        except socket.timeout as e:
+            # The server accepted the request and may still be running (or
+            # queueing) it; re-running it locally would duplicate its outputs
+            raise ModelServerError(
+                f"Model server at {self.base_url} did not answer within {timeout}s"
+            ) from e
+
+        return body.get("result", body)
+
+
+def request_or_none(operation: str, **params: Any) -> Optional[Dict[str, Any]]:
+    """
+    Delegate an operation to the model server if one is running.
+
+    Returns None when the server is disabled or not listening, so the caller
+    can run the work in-process. Failures of the operation itself, and
+    requests the server accepted but did not answer within
+    MODEL_SERVER_TIMEOUT_SECONDS, raise ModelServerError rather than
+    silently re-running the work locally.
+
+    Args:
+        operation: Operation name (forecast, run)
+        **params: JSON-serializable operation arguments
+
+    Returns:
+        Operation result, or None if no server handled the request
+    """
+    if not get_settings().model_server_enabled:
+        return None
+
+    client = ModelServerClient()
+    try:
+        result = client.request(operation, **params)
+    except ModelServerUnavailable:
+        logger.debug(f"No model server at {client.base_url}; running '{operation}' in-process")
+        return None
+
+    logger.info(f"'{operation}' served by model server at {client.base_url}")
+    return result
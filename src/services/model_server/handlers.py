@@ -0,0 +1,158 @@
+"""
+Operations executed by the model server.
+
+Each operation takes JSON-serializable keyword arguments and returns a
+JSON-serializable dict. The same functions back the in-process fallback of
+the thin clients, so a run behaves identically with or without a server.
+"""
+
+from __future__ import annotations
+
+import importlib
+import importlib.util
+import sys
+from pathlib import Path
+from types import ModuleType
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+from forex_core.config import get_settings
+from forex_core.utils.logging import logger
+
+# Forecaster services whose pipelines can be run through the server
+SERVICES = (
+    "forecaster_7d",
+    "forecaster_15d",
+    "forecaster_30d",
+    "forecaster_90d",
+    "forecaster_12m",
+)
+
+SCRIPTS_DIR = Path(__file__).resolve().parents[3] / "scripts"
+ENSEMBLE_SCRIPT = "forecast_with_ensemble"
+
+
+def _load_script(name: str) -> ModuleType:
+    """Import a script from scripts/ once and keep it resident."""
+    if name in sys.modules:
+        return sys.modules[name]
+
+    path = SCRIPTS_DIR / f"{name}.py"
+    spec = importlib.util.spec_from_file_location(name, path)
+    if spec is None or spec.loader is None:
+        raise FileNotFoundError(f"Script not found: {path}")
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    try:
+        spec.loader.exec_module(module)
+    except Exception:
+        del sys.modules[name]
+        raise
+    return module
+
+
+def _service_module(service: str, module: str) -> ModuleType:
+    if service not in SERVICES:
+        raise ValueError(f"Unknown service '{service}'. Expected one of {SERVICES}")
+    return importlib.import_module(f"services.{service}.{module}")
+
+
+def ensemble_forecast(
+    horizon_days: int,
+    train_models: bool = False,
+    no_email: bool = False,
+    test_email: bool = False,
+    verbose: bool = False,
+) -> Dict[str, Any]:
+    """
+    Run scripts/forecast_with_ensemble.py for one horizon.
+
+    Returns:
+        {"exit_code": 0 | 1 | 2} as the script would exit
+    """
+    script = _load_script(ENSEMBLE_SCRIPT)
+    exit_code = script.run_forecast(
+        horizon_days=horizon_days,
+        train_models=train_models,
+        no_email=no_email,
+        test_email=test_email,
+        verbose=verbose,
+    )
+    return {"exit_code": exit_code}
+
+
+def run_service(
+    service: str,
+    skip_email: bool = False,
+    output_dir: Optional[str] = None,
+) -> Dict[str, Any]:
+    """
+    Run a forecaster service pipeline (``services.<service>.pipeline``).
+
+    run_forecast_pipeline() overrides settings.output_dir on the shared
+    Settings singleton; it is restored afterwards so one request cannot leak
+    its output directory into the next.
+
+    Returns:
+        {"report_path": str}
+    """
+    pipeline = _service_module(service, "pipeline")
+    settings = get_settings()
+    original_output_dir = settings.output_dir
+    try:
+        report_path = pipeline.run_forecast_pipeline(
+            skip_email=skip_email,
+            output_dir=Path(output_dir) if output_dir else None,
+        )
+    finally:
+        settings.output_dir = original_output_dir
+    return {"report_path": str(report_path)}
+
+
+OPERATIONS: Dict[str, Callable[..., Dict[str, Any]]] = {
+    "forecast": ensemble_forecast,
+    "run": run_service,
+}
+
+
+def warm_up(horizons: Iterable[int] = (), chronos: bool = False) -> Dict[str, Any]:
+    """
+    Import heavy dependencies and load models before the first request.
+
+    Args:
+        horizons: Ensemble horizons to load into memory
+        chronos: Load the Chronos pipeline if Chronos is enabled
+
+    Returns:
+        Summary of what was loaded
+    """
+    script = _load_script(ENSEMBLE_SCRIPT)
+    for service in SERVICES:
+        try:
+            _service_module(service, "pipeline")
+        except Exception as e:
+            logger.warning(f"Could not import {service} pipeline: {e}")
+
+    loaded: List[int] = [h for h in horizons if script.preload_ensemble(h)]
+
+    chronos_loaded = False
+    if chronos and get_settings().enable_chronos:
+        from forex_core.forecasting.chronos_model import get_chronos_pipeline
+
+        get_chronos_pipeline()
+        chronos_loaded = True
+
+    return {"ensembles": loaded, "chronos": chronos_loaded}
+
+
+def resident_models() -> Dict[str, Any]:
+    """Models currently held in memory (for the health endpoint)."""
+    ensembles: List[int] = []
+    if ENSEMBLE_SCRIPT in sys.modules:
+        ensembles = sys.modules[ENSEMBLE_SCRIPT].resident_ensembles()
+
+    chronos = False
+    chronos_module = sys.modules.get("forex_core.forecasting.chronos_model")
+    if chronos_module is not None:
+        chronos = getattr(chronos_module, "_CHRONOS_PIPELINE", None) is not None
+
+    return {"ensembles": ensembles, "chronos": chronos}
@@ -0,0 +1,153 @@
+"""
+Long-lived process that keeps models and heavy imports resident.
+
+Each cron run used to start a fresh interpreter, re-import pandas,
+statsmodels and torch, and reload the ensemble and Chronos weights before
+doing a few seconds of actual work. The server pays that cost once; cron
+jobs become thin clients that POST a request and wait for the result.
+
+Protocol (JSON over HTTP, bound to localhost by default):
+    GET  /health          -> {"status": "ok", "pid", "uptime_seconds", ...}
+    POST /v1/<operation>  -> {"ok": true, "result": {...}}
+                             {"ok": false, "error": "..."} with status 4xx/5xx
+
+Operations run one at a time: the pipelines share the Settings singleton
+and write to the same output and model directories.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Callable, Dict, Optional
+
+from forex_core.config import get_settings
+from forex_core.utils.logging import logger
+
+from .handlers import OPERATIONS, resident_models
+
+Operation = Callable[..., Dict[str, Any]]
+
+
+class ModelServer:
+    """
+    HTTP front end for the model server operations.
+
+    Args:
+        host: Interface to bind (defaults to MODEL_SERVER_HOST)
+        port: Port to bind; 0 picks a free port (defaults to MODEL_SERVER_PORT)
+        operations: Operation registry (defaults to handlers.OPERATIONS)
+
+    Example:
+        >>> server = ModelServer()
+        >>> server.serve_forever()  # Blocks until shutdown()
+    """
+
+    def __init__(
+        self,
+        host: Optional[str] = None,
+        port: Optional[int] = None,
+        operations: Optional[Dict[str, Operation]] = None,
+    ):
+        settings = get_settings()
+        host = host or settings.model_server_host
+        port = settings.model_server_port if port is None else port
+
+        self.operations = OPERATIONS if operations is None else operations
+        self.started_at = time.monotonic()
+        self.requests_served = 0
+        self._lock = threading.Lock()
+        self._httpd = ThreadingHTTPServer((host, port), self._make_handler())
+        self._httpd.daemon_threads = True
+
+    @property
+    def address(self) -> tuple:
+        """(host, port) actually bound."""
+        return self._httpd.server_address[:2]
+
+    def serve_forever(self) -> None:
+        host, port = self.address
+        logger.info(f"Model server listening on http://{host}:{port}")
+        try:
+            self._httpd.serve_forever()
+        finally:
+            self._httpd.server_close()
+
+    def shutdown(self) -> None:
+        self._httpd.shutdown()
+
+    def health(self) -> Dict[str, Any]:
+        return {
+            "status": "ok",
+            "pid": os.getpid(),
+            "uptime_seconds": round(time.monotonic() - self.started_at, 1),
+            "requests_served": self.requests_served,
+            "operations": sorted(self.operations),
+            "resident": resident_models(),
+        }
+
+    def execute(self, operation: str, params: Dict[str, Any]) -> Dict[str, Any]:
+        """Run one registered operation under the server lock."""
+        with self._lock:
+            started = time.perf_counter()
+            logger.info(f"Model server: running '{operation}' {params}")
+            try:
+                return self.operations[operation](**params)
+            finally:
+                self.requests_served += 1
+                logger.info(
+                    f"Model server: '{operation}' finished in "
+                    f"{time.perf_counter() - started:.1f}s"
+                )
+
+    def _make_handler(self) -> type:
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self) -> None:
+                if self.path.rstrip("/") == "/health":
+                    self._reply(200, server.health())
+                else:
+                    self._reply(404, {"ok": False, "error": f"Unknown path {self.path}"})
+
+            def do_POST(self) -> None:
+                if not self.path.startswith("/v1/"):
+                    self._reply(404, {"ok": False, "error": f"Unknown path {self.path}"})
+                    return
+                operation = self.path[len("/v1/"):].strip("/")
+                if operation not in server.operations:
+                    self._reply(404, {"ok": False, "error": f"Unknown operation '{operation}'"})
+                    return
+
+                try:
+                    length = int(self.headers.get("Content-Length", 0))
+                    params = json.loads(self.rfile.read(length) or b"{}")
+                    if not isinstance(params, dict):
+                        raise ValueError("Request body must be a JSON object")
+                except ValueError as e:
+                    self._reply(400, {"ok": False, "error": f"Invalid request: {e}"})
+                    return
+
+                try:
+                    result = server.execute(operation, params)
+                except Exception as e:
+                    logger.exception(f"Model server: '{operation}' failed")
+                    self._reply(500, {"ok": False, "error": f"{type(e).__name__}: {e}"})
+                else:
+                    self._reply(200, {"ok": True, "result": result})
+
+            def _reply(self, status: int, body: Dict[str, Any]) -> None:
+                payload = json.dumps(body, default=str).encode("utf-8")
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(payload)))
+                self.end_headers()
+                self.wfile.write(payload)
+
+            def log_message(self, format: str, *args: Any) -> None:
+                logger.debug(f"Model server: {self.address_string()} {format % args}")
+
+        return Handler
@@ -10,7 +10,12 @@ import pandas as pd
 import pytest
 from datetime import datetime, timedelta
 
-from forex_core.mlops import DataDriftDetector, DriftReport, DriftSeverity
+from forex_core.mlops import (
+    DataDriftDetector,
+    DriftReport,
+    DriftSeverity,
+    StreamingDriftDetector,
+)
 
 
 class TestDataDriftDetector:
@@ -261,6 +266,102 @@ class TestDriftSeverity:
         assert len(set(s.value for s in severity_order)) == len(severity_order)
 
 
+class TestStreamingDriftDetector:
+    """Test suite for the online StreamingDriftDetector."""
+
+    @pytest.fixture
+    def random_walk(self):
+        """300 days of a USD/CLP-like random walk with a late mean shift."""
+        np.random.seed(7)
+        dates = pd.date_range(end=datetime.now(), periods=300, freq='D')
+        steps = np.random.normal(loc=0, scale=3, size=300)
+        steps[-30:] += 1.5
+        return pd.Series(950 + np.cumsum(steps), index=dates)
+
+    def test_matches_batch_report(self, random_walk):
+        """Sliding-window state yields the batch windows and test results."""
+        batch = DataDriftDetector().generate_drift_report(random_walk)
+        streaming = StreamingDriftDetector()
+        streaming.extend(random_walk.to_numpy())
+        report = streaming.report()
+
+        assert report.baseline_size == batch.baseline_size
+        assert report.recent_size == batch.recent_size
+        assert report.baseline_mean == pytest.approx(batch.baseline_mean)
+        assert report.recent_std == pytest.approx(batch.recent_std)
+        assert report.statistic == pytest.approx(batch.statistic)
+        assert report.tests.keys() == batch.tests.keys()
+        for name in ("t_test", "levene_test", "ljungbox_test"):
+            assert report.tests[name].statistic == pytest.approx(
+                batch.tests[name].statistic, rel=1e-6
+            )
+            assert report.tests[name].p_value == pytest.approx(
+                batch.tests[name].p_value, rel=1e-6, abs=1e-12
+            )
+            assert report.tests[name].drift_detected == batch.tests[name].drift_detected
+
+    def test_growing_series_consumes_only_new_points(self, random_walk):
+        """Repeated reports on a growing series equal a fresh detector's."""
+        streaming = StreamingDriftDetector()
+        streaming.generate_drift_report(random_walk.iloc[:200])
+        streaming.generate_drift_report(random_walk.iloc[:250])
+        incremental = streaming.generate_drift_report(random_walk)
+
+        fresh = StreamingDriftDetector().generate_drift_report(random_walk)
+
+        assert incremental.statistic == pytest.approx(fresh.statistic)
+        assert incremental.recent_mean == pytest.approx(fresh.recent_mean)
+        assert incremental.tests["ljungbox_test"].statistic == pytest.approx(
+            fresh.tests["ljungbox_test"].statistic
+        )
+
+    def test_resync_does_not_change_results(self, random_walk):
+        """Rebuilding running sums after every update gives the same report."""
+        default = StreamingDriftDetector()
+        default.extend(random_walk.to_numpy())
+        resynced = StreamingDriftDetector(resync_every=1)
+        resynced.extend(random_walk.to_numpy())
+
+        assert default.report().recent_std == pytest.approx(resynced.report().recent_std)
+        assert default.report().tests["t_test"].statistic == pytest.approx(
+            resynced.report().tests["t_test"].statistic
+        )
+
+    def test_mean_shift_detected(self):
+        """A shifted recent window is flagged like in batch mode."""
+        np.random.seed(42)
+        values = np.concatenate([
+            np.random.normal(loc=950, scale=10, size=90),
+            np.random.normal(loc=970, scale=10, size=30),
+        ])
+        detector = StreamingDriftDetector()
+        detector.extend(values)
+
+        report = detector.report()
+
+        assert report.drift_detected is True
+        assert report.tests["t_test"].drift_detected is True
+
+    def test_insufficient_data_returns_empty_report(self):
+        """Partially filled windows produce the batch empty report."""
+        detector = StreamingDriftDetector()
+        detector.extend(np.random.normal(loc=950, scale=10, size=50))
+
+        report = detector.report()
+
+        assert detector.is_ready is False
+        assert report.drift_detected is False
+        assert "Insufficient data" in report.recommendation
+
+    def test_nan_observations_are_skipped(self):
+        """NaNs do not enter the windows."""
+        detector = StreamingDriftDetector(baseline_window=5, test_window=3)
+        detector.extend([1.0, 2.0, np.nan, 3.0])
+
+        assert len(detector._recent) == 3
+        assert len(detector._baseline) == 0
+
+
 class TestEdgeCases:
     """Test edge cases and error handling."""
 
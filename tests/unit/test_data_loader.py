@@ -0,0 +1,238 @@
+"""
+Unit tests for DataLoader orchestration.
+
+Tests cover:
+- Concurrent provider prefetch
+- Error propagation from prefetched providers
+- Per-provider timings
+- Equivalence of sequential and concurrent bundles
+- DataBundle snapshot round-trip and freshness TTL
+- Delta fetch against the warehouse high-water mark
+"""
+
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict
+from unittest.mock import patch
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from forex_core.config.base import Settings
+from forex_core.data.loader import DataLoader
+from forex_core.data.models import Indicator, MacroEvent
+from forex_core.data.snapshot import BundleSnapshotStore
+
+
+@pytest.fixture
+def loader(test_settings: Settings, tmp_path) -> DataLoader:
+    """DataLoader writing its warehouse under tmp_path."""
+    settings = test_settings.model_copy(update={"warehouse_dir": tmp_path / "warehouse"})
+    return DataLoader(settings)
+
+
+def _fake_tasks() -> Dict[str, Any]:
+    """Canned provider results keyed like DataLoader._provider_tasks()."""
+    dates = pd.date_range(end="2025-11-12", periods=120, freq="D")
+    rng = np.random.default_rng(0)
+
+    def series(base: float) -> pd.Series:
+        return pd.Series(base + rng.normal(0, 1, len(dates)).cumsum(), index=dates)
+
+    latest = {
+        code: {"valor": value, "fecha": "2025-11-12T00:00:00.000Z", "unidad_medida": "Pesos"}
+        for code, value in (("dolar", 950.0), ("tpm", 5.0), ("ipc", 0.3))
+    }
+    results = {
+        "mindicador_latest": latest,
+        "xe": (951.0, datetime(2025, 11, 12, tzinfo=timezone.utc)),
+        "yahoo_dxy": series(104.0),
+        "yahoo_vix": series(18.0),
+        "yahoo_eem": series(40.0),
+        "federal_reserve": ({"2025": 4.5}, "https://www.federalreserve.gov/sep.htm", None),
+        "macro_calendar": [
+            MacroEvent(
+                title="CPI", country="USD", datetime=datetime(2025, 11, 13, tzinfo=timezone.utc),
+                impact="High", source_id=0,
+            )
+        ],
+        "news": [],
+        "worldbank": [{}, [{"value": 2.1, "date": "2024"}]],
+        "copper_series": series(4.0),
+        "copper_latest": Indicator(
+            name="Precio del cobre", value=4.1, unit="USD/lb",
+            timestamp=datetime(2025, 11, 12), source_id=0,
+        ),
+        "lme_inventory": pd.Series(dtype=float),
+        "afp_flows": pd.Series(dtype=float),
+        "bcentral_trade_balance": pd.Series(dtype=float),
+        "bcentral_imacec_yoy": pd.Series(dtype=float),
+        "bcentral_current_account": pd.Series(dtype=float),
+        "fred_fed_target": pd.DataFrame({"DFEDTARU": [4.5]}, index=[dates[-1]]),
+        "china_pmi": series(50.0),
+    }
+    return {key: (lambda value=value: value) for key, value in results.items()}
+
+
+def _fake_payloads(code: str, years: int):
+    return [
+        {"serie": [{"fecha": f"2025-01-{day:02d}T00:00:00.000Z", "valor": 900.0 + day}
+                   for day in range(1, 29)]}
+    ]
+
+
+@pytest.mark.unit
+class TestConcurrentPrefetch:
+    """Tests for the thread-pool fan-out."""
+
+    def test_prefetch_runs_in_parallel(self, loader: DataLoader):
+        """Wall-clock time tracks the slowest task, not the sum."""
+        tasks = {f"slow_{i}": (lambda i=i: time.sleep(0.2) or i) for i in range(4)}
+
+        started = time.perf_counter()
+        results = loader._prefetch(tasks)
+        elapsed = time.perf_counter() - started
+
+        assert elapsed < 0.6
+        assert {key: value for key, (value, _) in results.items()} == {
+            f"slow_{i}": i for i in range(4)
+        }
+        assert set(loader.timings) == set(tasks)
+        assert all(secs >= 0.2 for secs in loader.timings.values())
+
+    def test_prefetched_error_is_reraised(self, loader: DataLoader):
+        """Provider errors surface where the sequential path would raise them."""
+        def boom():
+            raise RuntimeError("provider down")
+
+        loader._prefetched = loader._prefetch({"xe": boom})
+
+        with pytest.raises(RuntimeError, match="provider down"):
+            loader._fetch("xe")
+        assert "xe" in loader.timings
+
+    def test_fetch_without_prefetch_is_timed(self, loader: DataLoader):
+        """Sequential fetches also record timings."""
+        assert loader._fetch("custom", lambda: 42) == 42
+        assert "custom" in loader.timings
+
+
+@pytest.mark.unit
+class TestLoadModes:
+    """Sequential and concurrent loads must build the same bundle."""
+
+    def test_concurrent_matches_sequential(self, loader: DataLoader):
+        with patch.object(DataLoader, "_provider_tasks", lambda self: _fake_tasks()), \
+                patch.object(DataLoader, "_indicator_payloads", lambda self, c, y, *_: _fake_payloads(c, y)):
+            sequential = loader.load(concurrent=False)
+            loader.sources = type(loader.sources)()
+            loader._fed_indicator = None
+            concurrent = loader.load(concurrent=True)
+
+        assert [s.name for s in concurrent.sources._sources] == [
+            s.name for s in sequential.sources._sources
+        ]
+        pd.testing.assert_series_equal(sequential.usdclp_series, concurrent.usdclp_series)
+        pd.testing.assert_series_equal(
+            sequential.dxy_series, concurrent.dxy_series, check_freq=False
+        )
+        assert sequential.indicators.keys() == concurrent.indicators.keys()
+        assert concurrent.indicators["copper"].source_id != 0
+        assert concurrent.macro_events[0].source_id != 0
+        assert concurrent.rate_differential == pytest.approx(0.5)
+        assert "yahoo_dxy" in concurrent.fetch_timings
+
+
+@pytest.mark.unit
+class TestBundleSnapshot:
+    """Tests for the shared on-disk DataBundle snapshot."""
+
+    def test_round_trip(self, test_settings: Settings, sample_data_bundle):
+        store = BundleSnapshotStore(test_settings)
+        store.save(sample_data_bundle)
+
+        restored = store.load(max_age=timedelta(minutes=5))
+
+        assert restored is not None
+        pd.testing.assert_series_equal(
+            restored.usdclp_series, sample_data_bundle.usdclp_series,
+            check_freq=False, check_names=False,
+        )
+        assert restored.indicators == sample_data_bundle.indicators
+        assert len(restored.sources) == len(sample_data_bundle.sources)
+
+    def test_stale_snapshot_ignored(self, test_settings: Settings, sample_data_bundle):
+        store = BundleSnapshotStore(test_settings)
+        store.save(sample_data_bundle)
+
+        assert store.load(max_age=timedelta(0)) is None
+
+    def test_prunes_old_snapshots(self, test_settings: Settings, sample_data_bundle):
+        store = BundleSnapshotStore(test_settings, keep=2)
+        for _ in range(4):
+            store.save(sample_data_bundle)
+
+        published = [p for p in store.base_dir.iterdir() if p.is_dir()]
+        assert len(published) == 2
+
+    def test_loader_reuses_fresh_snapshot(self, loader: DataLoader):
+        with patch.object(DataLoader, "_provider_tasks", lambda self: _fake_tasks()), \
+                patch.object(DataLoader, "_indicator_payloads", lambda self, c, y, *_: _fake_payloads(c, y)):
+            first = loader.load()
+
+        with patch.object(DataLoader, "_provider_tasks", side_effect=AssertionError("network")):
+            cached = loader.load(max_age=timedelta(hours=1))
+
+        pd.testing.assert_series_equal(
+            cached.dxy_series, first.dxy_series, check_freq=False, check_names=False
+        )
+        assert [s.name for s in cached.sources._sources] == [
+            s.name for s in first.sources._sources
+        ]
+
+
+@pytest.mark.unit
+class TestDeltaFetch:
+    """Providers request only data newer than the warehouse high-water mark."""
+
+    def _store(self, loader: DataLoader, name: str, start: str, end: str) -> None:
+        index = pd.date_range(start, end, freq="D")
+        loader.warehouse.upsert_series(name, pd.Series(1.0, index=index))
+
+    def test_empty_store_means_full_backfill(self, loader: DataLoader):
+        assert loader._delta_start("dxy_index", datetime(2016, 1, 1)) is None
+
+    def test_gap_at_window_start_means_full_backfill(self, loader: DataLoader):
+        self._store(loader, "dxy_index", "2024-01-01", "2025-11-10")
+        assert loader._delta_start("dxy_index", datetime(2016, 1, 1)) is None
+
+    def test_covered_store_starts_at_high_water_mark(self, loader: DataLoader):
+        self._store(loader, "dxy_index", "2016-01-01", "2025-11-10")
+        start = loader._delta_start("dxy_index", datetime(2016, 1, 3))
+        assert start == datetime(2025, 11, 5)
+
+    def test_interior_hole_is_refetched(self, loader: DataLoader):
+        self._store(loader, "dxy_index", "2016-01-01", "2024-06-30")
+        self._store(loader, "dxy_index", "2024-09-01", "2025-11-10")
+        start = loader._delta_start("dxy_index", datetime(2016, 1, 3))
+        assert start == datetime(2024, 6, 25)
+
+    def test_disabled_by_settings(self, loader: DataLoader):
+        self._store(loader, "dxy_index", "2016-01-01", "2025-11-10")
+        loader.settings = loader.settings.model_copy(update={"delta_fetch_enabled": False})
+        assert loader._delta_start("dxy_index", datetime(2016, 1, 3)) is None
+
+    def test_yahoo_uses_period_window(self, loader: DataLoader):
+        window_start = datetime.utcnow() - timedelta(days=30)
+        self._store(loader, "vix_index", f"{window_start:%Y-%m-%d}", "2099-01-01")
+        with patch.object(loader.yahoo, "fetch_series") as fetch:
+            loader._yahoo_series("^VIX", "vix_index", "5d")
+        assert fetch.call_args.kwargs["start"] == datetime(2098, 12, 27)
+
+    def test_mindicador_requests_only_recent_years(self, loader: DataLoader):
+        year = datetime.utcnow().year
+        self._store(loader, "usdclp_daily", f"{year - 5}-01-02", f"{year}-03-01")
+        with patch.object(loader.mindicador, "get_indicator", return_value={"serie": []}) as get:
+            loader._indicator_payloads("dolar", 6, "usdclp_daily")
+        assert [c.args[1] for c in get.call_args_list] == [year]
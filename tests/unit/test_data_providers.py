@@ -6,6 +6,7 @@ Tests cover:
 - XeClient: Forex spot rates
 - YahooClient: Market indices and ETFs
 - Provider base functionality
+- HTTPClientPool: Shared keep-alive connections
 """
 
 from datetime import datetime
@@ -16,6 +17,7 @@ import pytest
 import httpx
 
 from forex_core.data.providers import (
+    HTTPClientPool,
     MindicadorClient,
     XeClient,
     YahooClient,
@@ -136,7 +138,7 @@ class TestYahooClient:
         client = YahooClient(test_settings)
         assert client.settings == test_settings
 
-    @patch("httpx.get")
+    @patch("httpx.Client.get")
     def test_fetch_series_success(self, mock_get, test_settings: Settings):
         """Test fetching historical series from Yahoo Finance."""
         # Mock CSV response
@@ -155,7 +157,44 @@ class TestYahooClient:
         assert len(series) == 3
         assert series.iloc[0] == 104.5
 
-    @patch("httpx.get")
+    @patch("httpx.Client.get")
+    def test_fetch_series_explicit_window(self, mock_get, test_settings: Settings):
+        """Test that start/end request period1/period2 instead of a range."""
+        mock_response = Mock()
+        mock_response.json.return_value = {
+            "chart": {"result": [{
+                "timestamp": [1736179200, 1736265600],
+                "indicators": {"quote": [{"close": [108.1, 108.4]}]},
+            }]}
+        }
+        mock_get.return_value = mock_response
+
+        client = YahooClient(test_settings)
+        series = client.fetch_series(
+            "DX=F", start=datetime(2025, 1, 6), end=datetime(2025, 1, 8)
+        )
+
+        params = mock_get.call_args.kwargs["params"]
+        assert "range" not in params
+        assert params["period1"] == 1736121600
+        assert params["period2"] == 1736294400
+        assert series.tolist() == [108.1, 108.4]
+
+    @patch("httpx.Client.get")
+    def test_fetch_series_empty_window(self, mock_get, test_settings: Settings):
+        """Test that a window without bars yields an empty series."""
+        mock_response = Mock()
+        mock_response.json.return_value = {
+            "chart": {"result": [{"indicators": {"quote": [{}]}}]}
+        }
+        mock_get.return_value = mock_response
+
+        client = YahooClient(test_settings)
+        series = client.fetch_series("DX=F", start=datetime(2025, 1, 11))
+
+        assert series.empty
+
+    @patch("httpx.Client.get")
     def test_fetch_series_error_handling(self, mock_get, test_settings: Settings):
         """Test error handling when fetch fails."""
         mock_get.side_effect = httpx.HTTPError("Connection failed")
@@ -217,7 +256,7 @@ class TestProviderIntegration:
 
     def test_yahoo_returns_valid_series(self, test_settings: Settings):
         """Test that YahooClient returns valid pandas Series."""
-        with patch("httpx.get") as mock_get:
+        with patch("httpx.Client.get") as mock_get:
             mock_response = Mock()
             mock_response.text = "Date,Close\n2025-01-01,100.0"
             mock_response.raise_for_status = Mock()
@@ -230,3 +269,52 @@ class TestProviderIntegration:
             assert isinstance(series, pd.Series)
             assert len(series) > 0
             assert series.index.name == "Date" or isinstance(series.index, pd.DatetimeIndex)
+
+
+@pytest.mark.unit
+class TestHTTPClientPool:
+    """Tests for the shared keep-alive client pool."""
+
+    def test_clients_shared_per_origin(self):
+        pool = HTTPClientPool()
+        try:
+            client = pool.client("https://query1.finance.yahoo.com/v8/finance/chart/DX=F")
+            assert client is pool.client("https://query1.finance.yahoo.com/v8/finance/chart/^VIX")
+            assert client is not pool.client("https://api.stlouisfed.org/fred")
+            assert client is not pool.client(
+                "https://query1.finance.yahoo.com", proxy="http://proxy:8080"
+            )
+            assert len(pool) == 3
+        finally:
+            pool.close()
+
+    def test_close_reopens_on_demand(self):
+        pool = HTTPClientPool()
+        client = pool.client("https://mindicador.cl/api")
+        pool.close()
+
+        assert client.is_closed
+        assert len(pool) == 0
+        assert not pool.client("https://mindicador.cl/api").is_closed
+        pool.close()
+
+    def test_limits_are_bounded(self):
+        pool = HTTPClientPool(max_connections=4, max_keepalive_connections=2)
+        assert pool.limits.max_connections == 4
+        assert pool.limits.max_keepalive_connections == 2
+
+    def test_providers_share_pooled_client(self, test_settings: Settings):
+        mindicador = MindicadorClient(test_settings)
+        other = MindicadorClient(test_settings)
+        assert mindicador._client is other._client
+
+    def test_base_client_resolves_paths(self, test_settings: Settings):
+        client = MindicadorClient(test_settings)
+        with patch("httpx.Client.get") as mock_get:
+            client.get("/dolar/2025", headers={"X-Test": "1"})
+
+        url = mock_get.call_args.args[0]
+        headers = mock_get.call_args.kwargs["headers"]
+        assert url == f"{client.base_url}/dolar/2025"
+        assert headers["X-Test"] == "1"
+        assert "User-Agent" in headers
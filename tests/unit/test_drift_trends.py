@@ -0,0 +1,149 @@
+"""
+Unit tests for drift history storage and trend analysis.
+
+Tests cover:
+- Append-only segments and compaction of the drift log
+- Reads racing a compaction counting each record once
+- Lookback reads pruned by horizon and month
+- Migration of a legacy single-file history
+- DriftTrendAnalyzer recording and trend analysis on the log
+- Closing the analyzer's DuckDB query layer
+"""
+
+from datetime import datetime, timedelta
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from forex_core.mlops.drift_log import DRIFT_COLUMNS, DriftHistoryLog
+from forex_core.mlops.drift_trends import DriftTrendAnalyzer
+from forex_core.mlops.monitoring import DataDriftDetector
+from forex_core.mlops.query_layer import DUCKDB_AVAILABLE, MetricsQueryLayer
+
+
+def _records(start, days: int, horizon: str = "7d") -> pd.DataFrame:
+    timestamps = pd.date_range(start, periods=days, freq="D")
+    return pd.DataFrame({
+        "timestamp": timestamps,
+        "horizon": horizon,
+        "drift_detected": False,
+        "severity": "none",
+        "drift_score": np.arange(days, dtype=float),
+        "p_value": 0.5,
+        "ks_statistic": 0.1,
+        "baseline_mean": 950.0,
+        "recent_mean": 951.0,
+        "baseline_std": 5.0,
+        "recent_std": 5.0,
+        "ks_drift": False,
+        "t_drift": False,
+        "levene_drift": False,
+        "ljungbox_drift": False,
+    })
+
+
+@pytest.mark.unit
+class TestDriftHistoryLog:
+    """Tests for the partitioned append-only drift log."""
+
+    def test_append_writes_new_segments_only(self, tmp_path):
+        log = DriftHistoryLog(tmp_path / "log")
+        log.append(_records("2025-01-01", 1))
+        first = sorted(log.root.rglob("part-*.parquet"))
+        mtimes = {path: path.stat().st_mtime_ns for path in first}
+
+        log.append(_records("2025-01-02", 1))
+
+        assert all(path.stat().st_mtime_ns == mtimes[path] for path in first)
+        assert len(list(log.root.rglob("part-*.parquet"))) == 2
+        assert log.read()["drift_score"].tolist() == [0.0, 0.0]
+
+    def test_compaction_bounds_segments(self, tmp_path):
+        log = DriftHistoryLog(tmp_path / "log", compact_threshold=4)
+        for day in range(10):
+            log.append(_records(datetime(2025, 1, 1) + timedelta(days=day), 1))
+
+        segments = list((log.root / "horizon=7d" / "month=2025-01").glob("part-*.parquet"))
+        assert len(segments) < 4
+        assert len(log.read()) == 10
+
+    def test_read_skips_copies_of_a_racing_compaction(self, tmp_path):
+        log = DriftHistoryLog(tmp_path / "log")
+        log.append(_records("2025-01-01", 2))
+        log.append(_records("2025-01-03", 2))
+        directory = log.root / "horizon=7d" / "month=2025-01"
+
+        # Merged segment published, inputs not yet removed
+        merged = log.read().drop(columns="horizon")
+        log.table.write_part(directory, merged, suffix="-compact")
+
+        assert len(list(directory.glob("part-*.parquet"))) == 3
+        assert len(log.read()) == 4
+
+    def test_read_prunes_by_horizon_and_window(self, tmp_path):
+        log = DriftHistoryLog(tmp_path / "log")
+        log.append(pd.concat([_records("2025-01-01", 60), _records("2025-01-01", 60, "15d")]))
+
+        recent = log.read(horizon="15d", since=pd.Timestamp("2025-02-20"))
+
+        assert recent["horizon"].unique().tolist() == ["15d"]
+        assert recent["timestamp"].min() == pd.Timestamp("2025-02-20")
+        assert len(recent) == 10
+        assert log.horizons() == ["15d", "7d"]
+
+    def test_migrates_legacy_file(self, tmp_path):
+        legacy = tmp_path / "drift_history.parquet"
+        _records("2025-01-01", 3).to_parquet(legacy, index=False)
+
+        log = DriftHistoryLog.for_legacy_path(legacy)
+
+        assert log.exists()
+        assert not legacy.exists()
+        assert list(log.read().columns) == DRIFT_COLUMNS
+        assert len(log.read()) == 3
+
+
+@pytest.mark.unit
+class TestDriftTrendAnalyzer:
+    """Tests for recording and analyzing drift on the log."""
+
+    def test_record_and_analyze(self, tmp_path):
+        detector = DataDriftDetector(baseline_window=60, test_window=20)
+        analyzer = DriftTrendAnalyzer(
+            storage_path=tmp_path / "drift_history.parquet", drift_detector=detector
+        )
+        rng = np.random.default_rng(0)
+        series = pd.Series(
+            950 + rng.normal(0, 5, 120).cumsum(),
+            index=pd.date_range(end=datetime.now(), periods=120, freq="D"),
+        )
+
+        for _ in range(4):
+            analyzer.record_drift(detector.generate_drift_report(series), horizon="7d")
+
+        history = analyzer.get_drift_history("7d", days=30)
+        assert len(history) == 4
+        assert not (tmp_path / "drift_history.parquet").exists()
+        assert analyzer.get_horizons() == ["7d"]
+        assert analyzer.analyze_trend("7d").current_score == history["drift_score"].iloc[-1]
+
+    @pytest.mark.skipif(not DUCKDB_AVAILABLE, reason="duckdb not installed")
+    def test_close_releases_only_its_own_layer(self, tmp_path):
+        import duckdb
+
+        storage_path = tmp_path / "drift_history.parquet"
+        log = DriftHistoryLog.for_legacy_path(storage_path)
+        log.append(_records(datetime.now() - timedelta(days=2), 2))
+        shared = MetricsQueryLayer(drift_log=log)
+
+        with DriftTrendAnalyzer(storage_path=storage_path, queries=shared) as analyzer:
+            assert len(analyzer.get_drift_history("7d", days=30)) == 2
+        assert len(shared.query("drift_history", horizon="7d")) == 2
+        shared.close()
+
+        with DriftTrendAnalyzer(storage_path=storage_path) as analyzer:
+            owned = analyzer._queries
+        assert analyzer._queries is None
+        with pytest.raises(duckdb.Error):
+            owned.query("drift_history", horizon="7d")
@@ -0,0 +1,127 @@
+"""
+Unit tests for the shared feature store.
+
+Tests cover:
+- Cache hits for identical inputs, in memory and from Parquet
+- Tail-only rebuilds when the input grows by new rows
+- Column subsets and spec versioning
+- Concurrent use from several threads
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from forex_core.features.feature_store import FeatureSpec, FeatureStore
+
+
+def _raw(days: int) -> pd.DataFrame:
+    rng = np.random.default_rng(11)
+    index = pd.date_range("2024-01-01", periods=400, freq="D")
+    close = pd.Series(900 + np.cumsum(rng.normal(0, 3, 400)), index=index)
+    return pd.DataFrame({"close": close}).iloc[:days]
+
+
+def _build(data: pd.DataFrame) -> pd.DataFrame:
+    return pd.DataFrame({
+        "lag_1d": data["close"].shift(1),
+        "sma_20d": data["close"].rolling(20).mean(),
+        "ema_10d": data["close"].ewm(span=10, adjust=False).mean(),
+    }, index=data.index)
+
+
+class _CountingBuilder:
+    def __init__(self):
+        self.row_counts = []
+
+    def __call__(self, data: pd.DataFrame) -> pd.DataFrame:
+        self.row_counts.append(len(data))
+        return _build(data)
+
+
+SPEC = FeatureSpec("test", version=1, lookback=200)
+
+
+@pytest.mark.unit
+class TestFeatureStore:
+    """Tests for FeatureStore."""
+
+    def test_identical_input_is_served_from_cache(self):
+        store = FeatureStore()
+        builder = _CountingBuilder()
+
+        first = store.get(SPEC, _raw(300), builder)
+        second = store.get(SPEC, _raw(300), builder)
+
+        assert builder.row_counts == [300]
+        pd.testing.assert_frame_equal(first, second)
+
+    def test_grown_input_rebuilds_only_tail(self):
+        store = FeatureStore()
+        builder = _CountingBuilder()
+        store.get(SPEC, _raw(300), builder)
+
+        extended = store.get(SPEC, _raw(301), builder)
+
+        assert builder.row_counts == [300, 201]
+        pd.testing.assert_frame_equal(extended, _build(_raw(301)), rtol=1e-9, check_freq=False)
+
+    def test_without_lookback_rebuilds_fully(self):
+        store = FeatureStore()
+        builder = _CountingBuilder()
+        spec = FeatureSpec("test", version=1)
+        store.get(spec, _raw(300), builder)
+        store.get(spec, _raw(301), builder)
+
+        assert builder.row_counts == [300, 301]
+
+    def test_parquet_entries_shared_across_instances(self, tmp_path):
+        FeatureStore(tmp_path).get(SPEC, _raw(300), _build)
+        builder = _CountingBuilder()
+
+        subset = FeatureStore(tmp_path).get(SPEC, _raw(300), builder, columns=["sma_20d"])
+
+        assert builder.row_counts == []
+        assert list(subset.columns) == ["sma_20d"]
+        pd.testing.assert_series_equal(
+            subset["sma_20d"], _build(_raw(300))["sma_20d"], check_freq=False
+        )
+
+    def test_spec_version_invalidates(self):
+        store = FeatureStore()
+        builder = _CountingBuilder()
+        store.get(SPEC, _raw(300), builder)
+        store.get(FeatureSpec("test", version=2, lookback=200), _raw(300), builder)
+
+        assert builder.row_counts == [300, 300]
+
+    def test_revised_history_is_not_treated_as_prefix(self):
+        store = FeatureStore()
+        builder = _CountingBuilder()
+        store.get(SPEC, _raw(300), builder)
+
+        revised = _raw(301)
+        revised.iloc[10, 0] += 1.0
+        store.get(SPEC, revised, builder)
+
+        assert builder.row_counts == [300, 301]
+
+    def test_disk_entries_pruned(self, tmp_path):
+        store = FeatureStore(tmp_path, max_disk_entries=2)
+        for days in (100, 200, 300):
+            store.get(FeatureSpec("test", version=1), _raw(days), _build)
+
+        assert len(list(tmp_path.rglob("*.parquet"))) == 2
+
+    def test_concurrent_threads_share_lru(self):
+        store = FeatureStore(max_memory_entries=2)
+        sizes = [250 + i % 6 for i in range(48)]
+
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            results = list(pool.map(lambda days: store.get(SPEC, _raw(days), _build), sizes))
+
+        for days, features in zip(sizes, results):
+            pd.testing.assert_frame_equal(features, _build(_raw(days)), rtol=1e-9, check_freq=False)
+        assert len(store._memory) <= 2
@@ -3,18 +3,36 @@ Unit tests for forecasting models.
 
 Tests cover:
 - ARIMA forecasting
+- ARIMA order search (warm start, process pool, order cache)
+- SARIMAX grid search backend
+- Concurrent component model execution
+- Random Forest multi-step paths (ring buffer and direct)
+- Batched Chronos inference
 - Ensemble model combination
 - Forecast result validation
 - Confidence interval calculation
 """
 
-from datetime import datetime, timedelta
+import time
+from datetime import datetime, timedelta, timezone
+from unittest.mock import patch
 
 import numpy as np
 import pandas as pd
 import pytest
-
+from sklearn.ensemble import RandomForestRegressor
+from sklearn.preprocessing import StandardScaler
+
+from forex_core.forecasting.arima import (
+    ArimaOrderCache,
+    CachedOrder,
+    auto_select_arima_order,
+    select_arima_order,
+    series_fingerprint,
+)
+from forex_core.forecasting.ensemble import ModelResult
 from forex_core.forecasting.models import ForecastEngine
+from forex_core.models.sarimax_forecaster import SARIMAXConfig, SARIMAXForecaster
 from forex_core.data.models import ForecastPoint, ForecastPackage
 from forex_core.data.loader import DataBundle
 from forex_core.config.base import Settings
@@ -152,6 +170,319 @@ class TestForecastEngine:
         assert all(isinstance(p, ForecastPoint) for p in forecast.series)
 
 
+@pytest.fixture
+def arma_returns() -> pd.Series:
+    """Simulated ARMA(1,1) log returns."""
+    rng = np.random.default_rng(7)
+    shocks = rng.normal(0, 0.01, 400)
+    values = np.zeros(400)
+    for t in range(1, 400):
+        values[t] = 0.6 * values[t - 1] + shocks[t] + 0.3 * shocks[t - 1]
+    return pd.Series(values, index=pd.date_range("2024-01-01", periods=400, freq="D"))
+
+
+@pytest.mark.unit
+class TestArimaOrderSearch:
+    """Tests for the ARIMA order grid search and its cache."""
+
+    def test_warm_start_matches_cold_search(self, arma_returns: pd.Series):
+        cold = auto_select_arima_order(arma_returns, max_p=1, max_q=1, warm_start=False)
+        warm = auto_select_arima_order(arma_returns, max_p=1, max_q=1)
+        assert warm == cold
+
+    def test_process_pool_matches_sequential(self, arma_returns: pd.Series):
+        sequential = auto_select_arima_order(arma_returns, max_p=1, max_q=1)
+        parallel = auto_select_arima_order(arma_returns, max_p=1, max_q=1, n_jobs=2)
+        assert parallel == sequential
+
+    def test_fingerprint_stable_under_appends(self, arma_returns: pd.Series):
+        assert series_fingerprint(arma_returns.iloc[:-10]) == series_fingerprint(arma_returns)
+        assert series_fingerprint(arma_returns.iloc[10:]) != series_fingerprint(arma_returns)
+
+    def test_cached_order_reused(self, arma_returns: pd.Series, tmp_path):
+        cache = ArimaOrderCache(tmp_path / "arima_orders.json")
+        first = select_arima_order(arma_returns, cache=cache, cache_key="daily_7", max_p=1, max_q=1)
+
+        with patch("forex_core.forecasting.arima.auto_select_arima_order") as search:
+            again = select_arima_order(
+                arma_returns, cache=cache, cache_key="daily_7", max_p=1, max_q=1
+            )
+
+        search.assert_not_called()
+        assert again == first
+        assert cache.get("daily_7").order == first
+
+    @pytest.mark.parametrize("reason", ["drift", "expired", "fingerprint"])
+    def test_cached_order_invalidated(self, arma_returns: pd.Series, tmp_path, reason):
+        cache = ArimaOrderCache(tmp_path / "arima_orders.json")
+        searched_at = datetime.now(timezone.utc)
+        if reason == "expired":
+            searched_at -= timedelta(days=30)
+        cache.put("daily_7", CachedOrder(
+            order=(0, 0, 0),
+            fingerprint="stale" if reason == "fingerprint" else series_fingerprint(arma_returns),
+            searched_at=searched_at,
+            max_p=1,
+            max_q=1,
+        ))
+
+        with patch(
+            "forex_core.forecasting.arima.auto_select_arima_order", return_value=(1, 0, 1)
+        ) as search:
+            order = select_arima_order(
+                arma_returns, cache=cache, cache_key="daily_7",
+                drift_detected=reason == "drift", max_p=1, max_q=1,
+            )
+
+        search.assert_called_once()
+        assert order == (1, 0, 1)
+        assert cache.get("daily_7").order == (1, 0, 1)
+
+
+@pytest.mark.unit
+class TestSarimaxGridSearch:
+    """Tests for the SARIMAX order grid search backend."""
+
+    @staticmethod
+    def _forecaster(**overrides) -> SARIMAXForecaster:
+        config = SARIMAXConfig(
+            horizon_days=7, s=7, max_p=1, max_q=1, max_P=0, max_Q=0, **overrides
+        )
+        return SARIMAXForecaster(config)
+
+    def test_results_table(self, arma_returns: pd.Series):
+        forecaster = self._forecaster()
+        order, seasonal = forecaster._grid_search_order(arma_returns)
+
+        table = forecaster.search_results
+        assert len(table) == 4  # stationary series: d=0, p and q in {0, 1}
+        assert {"p", "d", "q", "P", "D", "Q", "s", "aic", "bic", "llf", "status"} <= set(table)
+        fitted = table[table["status"] == "fitted"]
+        best = fitted.loc[fitted["aic"].idxmin()]
+        assert order == (best["p"], best["d"], best["q"])
+        assert seasonal == (0, 0, 0, 7)
+
+    def test_parallel_matches_sequential(self, arma_returns: pd.Series):
+        sequential = self._forecaster()._grid_search_order(arma_returns)
+        parallel = self._forecaster(search_n_jobs=2)._grid_search_order(arma_returns)
+        assert parallel == sequential
+
+    def test_clearly_worse_candidates_abandoned(self, arma_returns: pd.Series):
+        forecaster = self._forecaster(search_screen_maxiter=1, search_abandon_margin=0.0)
+        forecaster._grid_search_order(arma_returns)
+
+        statuses = set(forecaster.search_results["status"])
+        assert "abandoned" in statuses
+        assert "fitted" in statuses
+
+    def test_abandonment_disabled(self, arma_returns: pd.Series):
+        forecaster = self._forecaster(search_abandon_margin=None)
+        forecaster._grid_search_order(arma_returns)
+        assert "abandoned" not in set(forecaster.search_results["status"])
+
+
+def _model_result(name: str) -> ModelResult:
+    package = ForecastPackage(series=[], methodology=name, error_metrics={}, residual_vol=1.0)
+    return ModelResult(name=name, package=package, rmse=1.0, mape=1.0, extras={})
+
+
+def _runner(name: str, delay: float = 0.0, error: bool = False):
+    def run():
+        time.sleep(delay)
+        if error:
+            raise RuntimeError(f"{name} broke")
+        return _model_result(name)
+    return (name.upper(), run, ())
+
+
+@pytest.mark.unit
+class TestConcurrentComponentModels:
+    """Tests for running component models on a pool with latency budgets."""
+
+    @pytest.fixture
+    def engine(self, test_settings: Settings) -> ForecastEngine:
+        settings = test_settings.model_copy(update={
+            "forecast_parallel_models": True,
+            "forecast_model_timeout_seconds": 0.5,
+        })
+        return ForecastEngine(settings, horizon="daily", steps=7)
+
+    def test_wall_clock_tracks_slowest_model(self, engine: ForecastEngine):
+        runners = {name: _runner(name, delay=0.2) for name in ("a", "b", "c")}
+
+        started = time.perf_counter()
+        results = engine._run_models_concurrently(runners)
+
+        assert time.perf_counter() - started < 0.45
+        assert list(results) == ["a", "b", "c"]
+
+    def test_slow_model_dropped(self, engine: ForecastEngine):
+        runners = {"fast": _runner("fast"), "slow": _runner("slow", delay=2.0)}
+
+        started = time.perf_counter()
+        results = engine._run_models_concurrently(runners)
+
+        assert time.perf_counter() - started < 1.5
+        assert list(results) == ["fast"]
+
+    def test_failed_model_skipped(self, engine: ForecastEngine):
+        runners = {"ok": _runner("ok"), "bad": _runner("bad", error=True)}
+        assert list(engine._run_models_concurrently(runners)) == ["ok"]
+
+    def test_forecast_uses_concurrent_mode(self, engine: ForecastEngine, sample_data_bundle):
+        runners = {"a": _runner("a"), "b": _runner("b")}
+        with patch.object(ForecastEngine, "_model_runners", return_value=runners), \
+                patch.object(
+                    ForecastEngine, "_run_models_concurrently",
+                    wraps=engine._run_models_concurrently,
+                ) as concurrent, \
+                patch("forex_core.forecasting.models.combine_forecasts"), \
+                patch("forex_core.forecasting.models.EnsembleArtifacts"), \
+                patch.object(ForecastEngine, "_log_metrics"):
+            engine.forecast(sample_data_bundle)
+
+        concurrent.assert_called_once()
+
+
+@pytest.mark.unit
+class TestRandomForestPaths:
+    """Tests for the Random Forest multi-step forecasting paths."""
+
+    @pytest.fixture
+    def fitted(self, test_settings: Settings, sample_data_bundle: DataBundle):
+        engine = ForecastEngine(test_settings, horizon="daily", steps=10)
+        df = engine._build_feature_frame(sample_data_bundle, sample_data_bundle.usdclp_series.index)
+        target = df.pop("target")
+        scaler = StandardScaler()
+        features_scaled = scaler.fit_transform(df)
+        model = RandomForestRegressor(n_estimators=20, random_state=42, max_depth=5)
+        model.fit(features_scaled, target)
+        return engine, model, scaler, df, target, features_scaled
+
+    @staticmethod
+    def _pandas_path(engine, model, scaler, df, target, steps):
+        """Reference implementation: the original concat-based recursion."""
+        feature_cols = df.columns.tolist()
+        current_df, current_target, path = df.copy(), target.copy(), []
+        for _ in range(steps):
+            row = engine._next_feature_row(current_df, current_target, feature_cols)
+            pred = float(model.predict(scaler.transform(row[feature_cols]))[0])
+            path.append(pred)
+            next_idx = current_target.index[-1] + pd.Timedelta(days=1)
+            current_target = pd.concat([current_target, pd.Series([pred], index=[next_idx])])
+            row.index = [next_idx]
+            current_df = pd.concat([current_df, row[feature_cols]])
+        return path
+
+    def test_ring_buffer_matches_pandas_path(self, fitted):
+        engine, model, scaler, df, target, _ = fitted
+        expected = self._pandas_path(engine, model, scaler, df, target, steps=10)
+
+        path = engine._recursive_rf_path(
+            model, scaler, df, target, df.columns.tolist(), steps=10
+        )
+
+        np.testing.assert_allclose(path, expected, rtol=0, atol=1e-9)
+
+    def test_direct_path_single_predict(self, fitted):
+        engine, _, _, _, target, features_scaled = fitted
+        with patch.object(
+            RandomForestRegressor, "predict", autospec=True,
+            side_effect=lambda self, X: np.tile(np.arange(10.0), (len(X), 1)),
+        ) as predict:
+            path = engine._direct_rf_path(features_scaled, target, steps=10)
+
+        assert predict.call_count == 1
+        assert path == list(np.arange(10.0))
+
+    def test_direct_strategy_setting(self, test_settings: Settings, sample_data_bundle: DataBundle):
+        settings = test_settings.model_copy(update={"rf_forecast_strategy": "direct"})
+        engine = ForecastEngine(settings, horizon="daily", steps=7)
+
+        result = engine._run_random_forest(
+            sample_data_bundle, sample_data_bundle.usdclp_series, steps=7
+        )
+
+        assert result.extras["strategy"] == "direct"
+        assert len(result.package.series) == 7
+
+
+class _FakeChronosPipeline:
+    """Records predict() calls; each sample repeats the context's last value."""
+
+    def __init__(self):
+        self.calls = []
+
+    def predict(self, context, prediction_length, num_samples, **kwargs):
+        self.calls.append((tuple(context.shape), prediction_length, num_samples))
+        last = context[:, -1].reshape(-1, 1, 1)
+        return last.expand(-1, num_samples, prediction_length).clone()
+
+
+@pytest.mark.unit
+class TestChronosBatching:
+    """Tests for batched Chronos inference."""
+
+    @pytest.fixture
+    def fake_pipeline(self):
+        pytest.importorskip("torch")
+        pipeline = _FakeChronosPipeline()
+        with patch(
+            "forex_core.forecasting.chronos_model.get_chronos_pipeline",
+            return_value=pipeline,
+        ):
+            yield pipeline
+
+    def test_padded_batch_in_input_order(self, fake_pipeline):
+        from forex_core.forecasting.chronos_model import predict_chronos_batch
+
+        contexts = [np.arange(1.0, 11.0), np.arange(1.0, 6.0), np.arange(1.0, 21.0)]
+        samples = predict_chronos_batch(
+            contexts, prediction_length=[3, 5, 2], num_samples=4, batch_size=8
+        )
+
+        assert fake_pipeline.calls == [((3, 20), 5, 4)]
+        assert [s.shape for s in samples] == [(4, 3), (4, 5), (4, 2)]
+        assert [s[0, 0] for s in samples] == [10.0, 5.0, 20.0]
+
+    def test_batch_size_bounds_chunk(self, fake_pipeline):
+        from forex_core.forecasting.chronos_model import predict_chronos_batch
+
+        contexts = [np.full(n, float(n)) for n in range(5, 10)]
+        samples = predict_chronos_batch(contexts, prediction_length=2, batch_size=2)
+
+        assert [call[0][0] for call in fake_pipeline.calls] == [2, 2, 1]
+        assert [s[0, 0] for s in samples] == [5.0, 6.0, 7.0, 8.0, 9.0]
+
+    def test_forecast_and_validation_share_call(self, fake_pipeline, sample_usdclp_series):
+        from forex_core.forecasting.chronos_model import forecast_chronos
+
+        package = forecast_chronos(
+            sample_usdclp_series, steps=7, context_length=60, num_samples=10
+        )
+
+        assert len(fake_pipeline.calls) == 1
+        assert fake_pipeline.calls[0][0] == (2, 60)
+        assert len(package.series) == 7
+        assert "pseudo_RMSE" in package.error_metrics
+
+    def test_optimizer_grid_batches_by_temperature(self, fake_pipeline, sample_usdclp_series):
+        from forex_core.optimization.chronos_optimizer import (
+            ChronosHyperparameterOptimizer,
+        )
+
+        optimizer = ChronosHyperparameterOptimizer(horizon="7d")
+        series = pd.concat([sample_usdclp_series] * 3, ignore_index=True)
+        series.index = pd.date_range(end="2025-11-12", periods=len(series), freq="D")
+
+        best = optimizer.optimize(series)
+
+        assert len(fake_pipeline.calls) == 3
+        assert {call[2] for call in fake_pipeline.calls} == {200}
+        assert best.search_iterations >= 1
+        assert np.isfinite(best.validation_rmse)
+
+
 @pytest.mark.unit
 class TestForecastMetrics:
     """Tests for forecast quality metrics."""
@@ -0,0 +1,83 @@
+"""
+Unit tests for import-time profiling and the cold-start budget.
+
+Tests cover:
+- Parsing of ``python -X importtime`` output
+- Budget and heavy-module checks
+- Service CLIs and lazy forex_core packages staying within budget
+"""
+
+import pytest
+
+from forex_core.utils.import_time import (
+    DEFAULT_BUDGET_MS,
+    HEAVY_MODULES,
+    SERVICE_CLI_MODULES,
+    ImportProfile,
+    check_import,
+    measure_import,
+    parse_importtime,
+)
+
+SAMPLE_OUTPUT = """\
+import time: self [us] | cumulative | imported package
+import time:       120 |        120 |   _io
+import time:       850 |       1300 |     pandas._libs
+import time:      2000 |       5000 |   pandas
+import time:       400 |       5400 | forex_core.utils
+Traceback (most recent call last):
+"""
+
+
+@pytest.mark.unit
+class TestImportTime:
+    """Tests for parse_importtime and check_import."""
+
+    def test_parse_importtime(self):
+        cumulative = parse_importtime(SAMPLE_OUTPUT)
+
+        assert cumulative == {
+            "_io": 0.12,
+            "pandas._libs": 1.3,
+            "pandas": 5.0,
+            "forex_core.utils": 5.4,
+        }
+
+    def test_profile_packages(self):
+        profile = ImportProfile("forex_core.utils", 6.0, parse_importtime(SAMPLE_OUTPUT))
+
+        assert profile.imported("pandas")
+        assert not profile.imported("pand")
+        assert profile.package_ms("pandas") == 5.0
+        assert profile.heaviest(2) == [("forex_core", 5.4), ("pandas", 5.0)]
+
+    def test_check_import(self):
+        profile = ImportProfile("forex_core.utils", 6.0, parse_importtime(SAMPLE_OUTPUT))
+
+        assert check_import(profile, budget_ms=10.0, forbidden=("torch",)) == []
+
+        violations = check_import(profile, budget_ms=1.0, forbidden=("pandas",))
+        assert len(violations) == 2
+        assert "budget 1ms" in violations[0]
+        assert "imports pandas" in violations[1]
+
+
+@pytest.mark.unit
+@pytest.mark.slow
+class TestImportBudget:
+    """Cold-start regression checks (fresh interpreter per module)."""
+
+    @pytest.mark.parametrize("module", SERVICE_CLI_MODULES)
+    def test_service_cli_within_budget(self, module):
+        profile = measure_import(module)
+
+        assert check_import(profile, budget_ms=DEFAULT_BUDGET_MS) == []
+
+    @pytest.mark.parametrize(
+        "module",
+        ["forex_core.forecasting", "forex_core.mlops", "forex_core.reporting", "forex_core.utils"],
+    )
+    def test_packages_import_lazily(self, module):
+        profile = measure_import(module, repeat=1)
+
+        assert check_import(profile, budget_ms=float("inf"), forbidden=HEAVY_MODULES) == []
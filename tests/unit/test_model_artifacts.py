@@ -0,0 +1,143 @@
+"""
+Unit tests for the compact model artifact format.
+
+Tests cover:
+- Manifest and memory-mapped payload round-trip
+- Re-saves never change files a reader of the previous manifest uses
+- Removing a compact artifact
+- StandardScaler stored as arrays
+- GARCH and SARIMAX forecasts unchanged after a compact save/load
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+from sklearn.preprocessing import StandardScaler
+
+from forex_core.models.artifacts import (
+    ArtifactReader,
+    ArtifactWriter,
+    load_scaler,
+    remove_artifact,
+    save_scaler,
+)
+
+
+def _write(path, value: float, side_text: str = "") -> None:
+    writer = ArtifactWriter(path)
+    writer.add_array("a/vector", np.full(4, value))
+    if side_text:
+        writer.file_path("side.txt").write_text(side_text)
+    writer.add_component("a", {"value": value})
+    writer.write()
+
+
+@pytest.mark.unit
+class TestArtifactFormat:
+    """Tests for ArtifactWriter and ArtifactReader."""
+
+    def test_round_trip(self, tmp_path):
+        writer = ArtifactWriter(tmp_path)
+        writer.add_array("a/vector", np.arange(5))
+        writer.add_array("a/matrix", np.eye(3))
+        writer.add_component("a", {"kind": "test"})
+        writer.write({"horizon_days": 7})
+
+        reader = ArtifactReader(tmp_path)
+
+        assert ArtifactReader.exists(tmp_path)
+        assert reader.metadata == {"horizon_days": 7}
+        assert reader.component("a") == {"kind": "test"}
+        np.testing.assert_array_equal(reader.array("a/vector"), np.arange(5))
+        np.testing.assert_array_equal(reader.array("a/matrix"), np.eye(3))
+        assert isinstance(reader.array("a/matrix"), np.memmap)
+
+    def test_resave_keeps_previous_generation_readable(self, tmp_path):
+        _write(tmp_path, 1.0, "first")
+        old = ArtifactReader(tmp_path)
+
+        _write(tmp_path, 2.0, "second")
+        new = ArtifactReader(tmp_path)
+
+        np.testing.assert_array_equal(old.array("a/vector"), np.full(4, 1.0))
+        assert old.file_path("side.txt").read_text() == "first"
+        np.testing.assert_array_equal(new.array("a/vector"), np.full(4, 2.0))
+        assert new.file_path("side.txt").read_text() == "second"
+
+    def test_older_generations_are_pruned(self, tmp_path):
+        for value in (1.0, 2.0, 3.0):
+            _write(tmp_path, value)
+
+        assert len(list(tmp_path.glob("gen-*"))) == 2
+        assert not list(tmp_path.glob(".gen-*"))
+        assert ArtifactReader(tmp_path).component("a") == {"value": 3.0}
+
+    def test_remove_artifact(self, tmp_path):
+        _write(tmp_path, 1.0)
+
+        remove_artifact(tmp_path)
+
+        assert not ArtifactReader.exists(tmp_path)
+        assert not list(tmp_path.glob("gen-*"))
+
+    def test_missing_manifest(self, tmp_path):
+        assert not ArtifactReader.exists(tmp_path)
+        with pytest.raises(FileNotFoundError):
+            ArtifactReader(tmp_path)
+
+    def test_scaler_round_trip(self, tmp_path):
+        X = pd.DataFrame(np.random.default_rng(1).normal(size=(50, 3)), columns=["a", "b", "c"])
+        scaler = StandardScaler().fit(X)
+
+        writer = ArtifactWriter(tmp_path)
+        meta = save_scaler(writer, "scaler", scaler)
+        writer.write()
+        restored = load_scaler(ArtifactReader(tmp_path), "scaler", meta)
+
+        np.testing.assert_allclose(restored.transform(X), scaler.transform(X))
+
+
+@pytest.mark.unit
+class TestCompactComponents:
+    """Forecasts must not change when components go through an artifact."""
+
+    def test_garch_forecast_matches_arch(self, tmp_path):
+        pytest.importorskip("arch")
+        from forex_core.models.garch_volatility import GARCHConfig, GARCHVolatility
+
+        residuals = np.random.default_rng(2).normal(0, 2, 400)
+        config = GARCHConfig(horizon_days=30, model_type="GARCH")
+        model = GARCHVolatility(horizon_days=30, config=config).fit(residuals)
+        expected = model.forecast_volatility(point_forecast=900.0, steps=30)
+
+        writer = ArtifactWriter(tmp_path)
+        model.save_artifact(writer)
+        writer.write()
+        restored = GARCHVolatility(horizon_days=30).load_artifact(ArtifactReader(tmp_path))
+        result = restored.forecast_volatility(point_forecast=900.0, steps=30)
+
+        assert result.volatility == pytest.approx(expected.volatility, rel=1e-8)
+        assert restored.get_diagnostics()["fit_statistics"]["aic"] == pytest.approx(
+            model.get_diagnostics()["fit_statistics"]["aic"]
+        )
+
+    def test_sarimax_forecast_matches_full_results(self, tmp_path):
+        pytest.importorskip("statsmodels")
+        from forex_core.models.sarimax_forecaster import SARIMAXConfig, SARIMAXForecaster
+
+        index = pd.date_range("2023-01-01", periods=300, freq="D")
+        close = 900 + np.cumsum(np.random.default_rng(3).normal(0, 3, 300))
+        data = pd.DataFrame({"close": close}, index=index)
+
+        model = SARIMAXForecaster(SARIMAXConfig(horizon_days=7))
+        model.train(data, auto_select_order=False)
+        expected = model.predict(steps=7, return_conf_int=True)
+
+        writer = ArtifactWriter(tmp_path)
+        model.save_artifact(writer)
+        writer.write()
+        restored = SARIMAXForecaster(SARIMAXConfig(horizon_days=7))
+        restored.load_artifact(ArtifactReader(tmp_path))
+        result = restored.predict(steps=7, return_conf_int=True)
+
+        pd.testing.assert_frame_equal(result, expected, rtol=1e-6)
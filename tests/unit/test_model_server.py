@@ -0,0 +1,123 @@
+"""
+Unit tests for the warm model server and its thin client.
+
+Tests cover:
+- Health endpoint and operation round-trip over HTTP
+- Operation failures surfaced as ModelServerError
+- Fallback signalling (ModelServerUnavailable / None) when no server listens
+- Timeouts of accepted requests surfaced as ModelServerError
+"""
+
+import socket
+import threading
+
+import pytest
+
+from forex_core.config import get_settings
+from services.model_server.client import (
+    ModelServerClient,
+    ModelServerError,
+    ModelServerUnavailable,
+    request_or_none,
+)
+from services.model_server.server import ModelServer
+
+
+def _echo(**params):
+    return {"echo": params}
+
+
+def _fail(**params):
+    raise ValueError("boom")
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+@pytest.fixture
+def server():
+    server = ModelServer(host="127.0.0.1", port=0, operations={"echo": _echo, "fail": _fail})
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    thread.join(timeout=5)
+
+
+@pytest.fixture
+def client(server):
+    host, port = server.address
+    return ModelServerClient(host=host, port=port, timeout=5)
+
+
+@pytest.mark.unit
+class TestModelServer:
+    """Tests for ModelServer and ModelServerClient."""
+
+    def test_health(self, client):
+        health = client.health()
+
+        assert health["status"] == "ok"
+        assert health["operations"] == ["echo", "fail"]
+        assert client.is_available()
+
+    def test_round_trip(self, server, client):
+        result = client.request("echo", horizon_days=7, no_email=True)
+
+        assert result == {"echo": {"horizon_days": 7, "no_email": True}}
+        assert server.requests_served == 1
+
+    def test_operation_error(self, client):
+        with pytest.raises(ModelServerError, match="boom"):
+            client.request("fail")
+
+    def test_unknown_operation(self, client):
+        with pytest.raises(ModelServerError, match="Unknown operation"):
+            client.request("missing")
+
+    def test_unavailable(self):
+        client = ModelServerClient(host="127.0.0.1", port=_free_port(), timeout=5)
+
+        assert not client.is_available()
+        with pytest.raises(ModelServerUnavailable):
+            client.request("echo")
+
+    def test_request_or_none_falls_back(self, monkeypatch):
+        settings = get_settings()
+        monkeypatch.setattr(settings, "model_server_enabled", True)
+        monkeypatch.setattr(settings, "model_server_port", _free_port())
+
+        assert request_or_none("echo") is None
+
+    def test_request_or_none_raises_on_timeout(self, monkeypatch):
+        settings = get_settings()
+        with socket.socket() as silent:  # Accepts connections, never answers
+            silent.bind(("127.0.0.1", 0))
+            silent.listen()
+            monkeypatch.setattr(settings, "model_server_enabled", True)
+            monkeypatch.setattr(settings, "model_server_host", "127.0.0.1")
+            monkeypatch.setattr(settings, "model_server_port", silent.getsockname()[1])
+            monkeypatch.setattr(settings, "model_server_timeout_seconds", 0.2)
+
+            with pytest.raises(ModelServerError, match="did not answer"):
+                request_or_none("echo")
+
+    def test_request_or_none_disabled(self, server, monkeypatch):
+        settings = get_settings()
+        monkeypatch.setattr(settings, "model_server_enabled", False)
+        monkeypatch.setattr(settings, "model_server_port", server.address[1])
+
+        assert request_or_none("echo") is None
+
+    def test_request_or_none_served(self, server, monkeypatch):
+        settings = get_settings()
+        monkeypatch.setattr(settings, "model_server_enabled", True)
+        monkeypatch.setattr(settings, "model_server_host", "127.0.0.1")
+        monkeypatch.setattr(settings, "model_server_port", server.address[1])
+
+        assert request_or_none("echo", service="forecaster_7d") == {
+            "echo": {"service": "forecaster_7d"}
+        }
@@ -0,0 +1,104 @@
+"""
+Unit tests for persistent, parallel Optuna studies.
+
+Tests cover:
+- Trial budget on in-memory and journal storage
+- Resuming a journaled study
+- Sharing one study between worker processes
+- Per-step pruning
+"""
+
+import optuna
+import pytest
+from optuna.trial import TrialState
+
+from forex_core.optimization.parallel_study import (
+    create_pruner,
+    create_storage,
+    finished_trials,
+    run_study,
+)
+
+optuna.logging.set_verbosity(optuna.logging.WARNING)
+
+
+def _quadratic(trial: optuna.Trial) -> float:
+    x = trial.suggest_float("x", -10, 10)
+    return (x - 2) ** 2
+
+
+def _stepwise(trial: optuna.Trial) -> float:
+    """Reports the same value at every step, like a per-fold running mean."""
+    x = trial.suggest_float("x", 0, 10)
+    for step in range(3):
+        trial.report(x, step)
+        if trial.should_prune():
+            raise optuna.TrialPruned()
+    return x
+
+
+@pytest.mark.unit
+class TestParallelStudy:
+    """Tests for run_study and its helpers."""
+
+    def test_in_memory(self):
+        study = run_study("memory_study", _quadratic, n_trials=8)
+
+        assert finished_trials(study) == 8
+        assert study.best_value < 10
+
+    def test_storage_specs(self, tmp_path):
+        assert create_storage(None) is None
+        assert create_storage("memory") is None
+        assert create_storage("sqlite:///studies.db") == "sqlite:///studies.db"
+        assert isinstance(
+            create_storage(str(tmp_path / "optuna" / "studies.journal")),
+            optuna.storages.JournalStorage,
+        )
+
+    def test_unknown_pruner(self):
+        with pytest.raises(ValueError, match="Unknown pruner"):
+            create_pruner("random")
+
+    def test_resume(self, tmp_path):
+        storage = str(tmp_path / "studies.journal")
+
+        first = run_study("resume_study", _quadratic, n_trials=3, storage=storage)
+        first_params = [t.params for t in first.trials]
+        resumed = run_study("resume_study", _quadratic, n_trials=6, storage=storage)
+
+        assert finished_trials(resumed) == 6
+        assert [t.params for t in resumed.trials[:3]] == first_params
+        # Resumed sampling does not replay the first run's samples
+        assert resumed.trials[3].params != first_params[0]
+
+        # Budget already met: nothing runs
+        again = run_study("resume_study", _quadratic, n_trials=4, storage=storage)
+        assert len(again.trials) == 6
+
+    def test_parallel_workers(self, tmp_path):
+        storage = str(tmp_path / "studies.journal")
+
+        study = run_study("parallel_study", _quadratic, n_trials=8, storage=storage, n_workers=2)
+
+        # Workers stop once the shared budget is met (at most one extra
+        # trial per concurrently running worker)
+        assert 8 <= finished_trials(study) <= 9
+
+    def test_in_memory_parallel_falls_back(self):
+        study = run_study("memory_parallel", _quadratic, n_trials=4, n_workers=4)
+
+        assert finished_trials(study) == 4
+
+    @pytest.mark.parametrize("pruner", ["median", "hyperband"])
+    def test_pruning(self, pruner):
+        study = run_study("pruned_study", _stepwise, n_trials=30, pruner=pruner, max_resource=3)
+
+        states = [t.state for t in study.trials]
+        assert TrialState.PRUNED in states
+        assert finished_trials(study) == 30
+
+    def test_no_pruning(self):
+        study = run_study("unpruned_study", _stepwise, n_trials=15, pruner="none")
+
+        assert all(t.state == TrialState.COMPLETE for t in study.trials)
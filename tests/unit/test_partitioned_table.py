@@ -0,0 +1,85 @@
+"""
+Unit tests for the shared partitioned Parquet table.
+
+Tests cover:
+- One part file per touched (horizon, month) partition
+- Compaction through the table's merge step
+- Pruned reads by horizon and time window
+- One-time migration of a legacy single file
+"""
+
+import pandas as pd
+import pyarrow as pa
+import pytest
+
+from forex_core.mlops.partitioned_table import (
+    PARTITION_SCHEMA,
+    PartitionedTable,
+    migrate_legacy,
+    part_files,
+)
+
+_SCHEMA = pa.schema(
+    [("timestamp", pa.timestamp("ns")), ("value", pa.float64())]
+    + list(zip(PARTITION_SCHEMA.names, PARTITION_SCHEMA.types))
+)
+
+
+def _rows(start: str, days: int, horizon: str = "7d", value: float = 1.0) -> pd.DataFrame:
+    return pd.DataFrame({
+        "timestamp": pd.date_range(start, periods=days, freq="D"),
+        "horizon": horizon,
+        "value": value,
+    })
+
+
+@pytest.mark.unit
+class TestPartitionedTable:
+    """Tests for PartitionedTable and migrate_legacy."""
+
+    def test_append_writes_one_part_per_partition(self, tmp_path):
+        table = PartitionedTable(tmp_path / "table", "timestamp", _SCHEMA)
+
+        table.append(pd.concat([_rows("2025-01-30", 4), _rows("2025-01-30", 1, "15d")]))
+
+        assert len(part_files(table.partition_dir("7d", "2025-01"))) == 1
+        assert len(part_files(table.partition_dir("7d", "2025-02"))) == 1
+        assert len(part_files(table.partition_dir("15d", "2025-01"))) == 1
+
+    def test_compaction_applies_merge(self, tmp_path):
+        def keep_last(rows):
+            return rows.drop_duplicates("timestamp", keep="last").sort_values("timestamp")
+
+        table = PartitionedTable(
+            tmp_path / "table", "timestamp", _SCHEMA, compact_threshold=3, merge=keep_last
+        )
+        for value in (1.0, 2.0, 3.0):
+            table.append(_rows("2025-01-01", 2, value=value))
+
+        directory = table.partition_dir("7d", "2025-01")
+        assert len(part_files(directory)) == 1
+        assert table.read(["timestamp", "value"])["value"].tolist() == [3.0, 3.0]
+
+    def test_read_prunes_by_horizon_and_window(self, tmp_path):
+        table = PartitionedTable(tmp_path / "table", "timestamp", _SCHEMA)
+        table.append(pd.concat([_rows("2025-01-01", 60), _rows("2025-01-01", 60, "15d")]))
+
+        recent = table.read(
+            ["timestamp", "horizon"], horizon="15d",
+            since=pd.Timestamp("2025-02-20"), until=pd.Timestamp("2025-02-25"),
+        )
+
+        assert recent["horizon"].unique().tolist() == ["15d"]
+        assert sorted(recent["timestamp"].dt.day.tolist()) == [20, 21, 22, 23, 24]
+
+    def test_migrate_legacy_runs_once(self, tmp_path):
+        legacy = tmp_path / "legacy.parquet"
+        _rows("2025-01-01", 3).to_parquet(legacy, index=False)
+        table = PartitionedTable(tmp_path / "table", "timestamp", _SCHEMA)
+
+        migrate_legacy(legacy, table.root, table.append, "rows")
+        migrate_legacy(legacy, table.root, table.append, "rows")
+
+        assert not legacy.exists()
+        assert legacy.with_name("legacy.parquet.migrated").exists()
+        assert len(table.read(["timestamp"])) == 3
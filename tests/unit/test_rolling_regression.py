@@ -0,0 +1,76 @@
+"""
+Unit tests for the rolling OLS kernel.
+
+Tests cover:
+- Equality with the per-window np.polyfit and np.cov implementations it replaces
+- Intercept and R² against per-window fits
+- NaN propagation for incomplete windows
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from forex_core.features.feature_engineer import _calculate_trend
+from forex_core.features.rolling_regression import rolling_ols, rolling_slope
+
+
+@pytest.fixture
+def prices() -> pd.Series:
+    rng = np.random.default_rng(7)
+    index = pd.date_range("2022-01-01", periods=600, freq="D")
+    return pd.Series(900 + np.cumsum(rng.normal(0, 3, 600)), index=index, name="close")
+
+
+@pytest.mark.unit
+class TestRollingOLS:
+    """Tests for rolling_ols and rolling_slope."""
+
+    @pytest.mark.parametrize("window", [10, 20, 50])
+    def test_slope_matches_polyfit(self, prices, window):
+        expected = prices.rolling(window).apply(
+            lambda y: np.polyfit(np.arange(len(y)), y, 1)[0], raw=True
+        )
+
+        pd.testing.assert_series_equal(rolling_slope(prices, window), expected, rtol=1e-9)
+
+    def test_calculate_trend_matches_legacy_cov_var_slope(self, prices):
+        def legacy_slope(y):
+            x = np.arange(len(y))
+            return np.cov(x, y)[0, 1] / np.var(x)
+
+        expected = prices.rolling(30).apply(legacy_slope, raw=True)
+
+        pd.testing.assert_series_equal(_calculate_trend(prices, 30), expected, rtol=1e-9)
+
+    def test_intercept_and_r2_match_per_window_fit(self, prices):
+        result = rolling_ols(prices, 20)
+
+        y = prices.iloc[-20:].to_numpy()
+        x = np.arange(20)
+        slope, intercept = np.polyfit(x, y, 1)
+        r2 = np.corrcoef(x, y)[0, 1] ** 2
+
+        assert result["slope"].iloc[-1] == pytest.approx(slope, rel=1e-9)
+        assert result["intercept"].iloc[-1] == pytest.approx(intercept, rel=1e-9)
+        assert result["r2"].iloc[-1] == pytest.approx(r2, rel=1e-9)
+
+    def test_incomplete_and_nan_windows_are_nan(self, prices):
+        prices = prices.copy()
+        prices.iloc[100] = np.nan
+
+        slope = rolling_slope(prices, 10)
+
+        assert slope.iloc[:9].isna().all()
+        assert slope.iloc[100:110].isna().all()
+        assert slope.iloc[[9, 99, 110]].notna().all()
+
+    def test_constant_window_has_undefined_r2(self):
+        result = rolling_ols(pd.Series(np.full(15, 900.0)), 10)
+
+        assert (result["slope"].iloc[9:] == 0).all()
+        assert result["r2"].isna().all()
+
+    def test_rejects_window_below_two(self, prices):
+        with pytest.raises(ValueError):
+            rolling_ols(prices, 1)
@@ -0,0 +1,95 @@
+"""
+Unit tests for cross-horizon feature sharing.
+
+Tests cover:
+- SharedFrame round trip in the same and in a worker process
+- Read-only views and release of the block
+- Per-horizon column views of a full-lag feature matrix
+"""
+
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from forex_core.features.feature_engineer import (
+    USDCLP_LAGS,
+    add_lagged_features,
+    select_horizon_features,
+    usdclp_lags,
+)
+from forex_core.features.shared_frame import SharedFrame, SharedFrameHandle
+
+
+def _frame() -> pd.DataFrame:
+    rng = np.random.default_rng(3)
+    index = pd.date_range("2024-01-01", periods=200, freq="D")
+    return pd.DataFrame({
+        "usdclp": 900 + np.cumsum(rng.normal(0, 3, 200)),
+        "copper_price": 4 + np.cumsum(rng.normal(0, 0.01, 200)),
+        "dxy": 104 + rng.normal(0, 0.5, 200),
+        "vix": 15 + rng.normal(0, 1, 200),
+    }, index=index)
+
+
+def _column_sums(handle: SharedFrameHandle) -> pd.Series:
+    return handle.attach().sum()
+
+
+@pytest.mark.unit
+class TestSharedFrame:
+    """Tests for SharedFrame and SharedFrameHandle."""
+
+    def test_attach_same_process(self):
+        frame = _frame()
+
+        with SharedFrame(frame) as shared:
+            attached = shared.handle.attach()
+
+            pd.testing.assert_frame_equal(attached, frame, check_freq=False)
+            with pytest.raises(ValueError):
+                attached.to_numpy()[0, 0] = 0.0
+
+    def test_attach_in_worker(self):
+        frame = _frame()
+
+        with SharedFrame(frame) as shared:
+            with ProcessPoolExecutor(max_workers=1) as pool:
+                sums = pool.submit(_column_sums, shared.handle).result()
+
+        pd.testing.assert_series_equal(sums, frame.sum())
+
+    def test_close_releases_block(self):
+        shared = SharedFrame(_frame())
+        name = shared.handle.name
+
+        shared.close()
+        shared.close()
+
+        with pytest.raises(FileNotFoundError):
+            shared_memory.SharedMemory(name=name)
+
+    def test_rejects_non_numeric(self):
+        with pytest.raises(ValueError, match="numeric"):
+            SharedFrame(pd.DataFrame({"label": ["a", "b"]}))
+
+
+@pytest.mark.unit
+class TestHorizonFeatures:
+    """Tests for usdclp_lags and select_horizon_features."""
+
+    def test_lags(self):
+        assert usdclp_lags(7) == USDCLP_LAGS
+        assert max(usdclp_lags(30)) == 21
+
+    @pytest.mark.parametrize("horizon", [7, 15, 30, 90])
+    def test_view_matches_horizon_columns(self, horizon):
+        full = add_lagged_features(_frame(), horizon=7)
+        expected = add_lagged_features(_frame(), horizon=horizon)
+
+        view = select_horizon_features(full, horizon)
+
+        assert list(view.columns) == list(expected.columns)
+        pd.testing.assert_frame_equal(view, expected)
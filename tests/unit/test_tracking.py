@@ -12,10 +12,14 @@ sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
 
 import tempfile
 from datetime import datetime, timedelta
+from unittest.mock import patch
 
+import numpy as np
 import pandas as pd
 import pytest
 
+from forex_core.mlops.drift_log import DriftHistoryLog
+from forex_core.mlops.query_layer import DUCKDB_AVAILABLE, MetricsQueryLayer
 from forex_core.mlops.tracking import PredictionTracker
 
 
@@ -441,5 +445,332 @@ class TestDataIntegrity:
         assert stored_metadata["params"]["p"] == 2
 
 
+
+def _log(tracker, target_date, predicted_mean=950.0):
+    tracker.log_prediction(
+        forecast_date=target_date - timedelta(days=7),
+        horizon="7d",
+        target_date=target_date,
+        predicted_mean=predicted_mean,
+        ci95_low=predicted_mean - 10,
+        ci95_high=predicted_mean + 10,
+    )
+
+
+@pytest.mark.unit
+class TestActualsReconciliation:
+    """Test vectorized as-of reconciliation of actual values."""
+
+    @pytest.fixture
+    def observed(self):
+        today = pd.Timestamp.now().normalize()
+        dates = pd.date_range(end=today - timedelta(days=10), periods=30, freq="B")
+        return pd.Series(900.0 + np.arange(len(dates)), index=dates)
+
+    def test_exact_and_previous_day_matches(self, tracker, observed):
+        friday = next(d for d in observed.index if d.dayofweek == 4)
+        _log(tracker, friday.to_pydatetime(), predicted_mean=1000.0)
+        _log(tracker, (friday + timedelta(days=1)).to_pydatetime())  # Saturday
+        _log(tracker, (observed.index[-1] + timedelta(days=5)).to_pydatetime())  # Too far
+
+        updated = tracker.update_actuals(usdclp_series=observed)
+
+        df = tracker.store.read().sort_values("target_date")
+        assert updated == 2
+        assert df["actual_value"].iloc[0] == observed[friday]
+        assert df["actual_value"].iloc[1] == observed[friday]
+        assert pd.isna(df["actual_value"].iloc[2])
+        assert df["error"].iloc[0] == pytest.approx(1000.0 - observed[friday])
+        assert df["abs_error"].iloc[0] == pytest.approx(abs(df["error"].iloc[0]))
+        assert df["pct_error"].iloc[0] == pytest.approx(
+            df["error"].iloc[0] / observed[friday]
+        )
+
+    def test_targets_after_last_observation_stay_pending(self, tracker, observed):
+        last = observed.index[-1]
+        _log(tracker, (last + timedelta(days=1)).to_pydatetime())
+        _log(tracker, (last + timedelta(days=2)).to_pydatetime())
+
+        assert tracker.update_actuals(usdclp_series=observed) == 0
+        assert tracker.store.read()["actual_value"].isna().all()
+
+    def test_tz_aware_series(self, tracker, observed):
+        target = observed.index[5]
+        _log(tracker, target.to_pydatetime())
+        aware = observed.tz_localize("UTC")
+
+        assert tracker.update_actuals(usdclp_series=aware) == 1
+
+    def test_bulk_reconciliation(self, tracker, observed):
+        targets = np.resize(observed.index.to_numpy(), 20_000)
+        now = pd.Timestamp.now()
+        df = pd.DataFrame({
+            "forecast_date": (
+                targets - np.timedelta64(7, "D") - np.arange(len(targets)) * np.timedelta64(1, "m")
+            ),
+            "horizon": "7d",
+            "target_date": targets,
+            "predicted_mean": 950.0,
+            "ci95_low": 940.0,
+            "ci95_high": 960.0,
+            "actual_value": np.nan,
+            "error": np.nan,
+            "abs_error": np.nan,
+            "pct_error": np.nan,
+            "logged_at": now,
+            "updated_at": now,
+        })
+        df.to_parquet(tracker.storage_path, index=False)
+
+        assert tracker.update_actuals(usdclp_series=observed) == len(df)
+        assert tracker.store.read()["actual_value"].notna().all()
+
+    def test_reads_warehouse_instead_of_providers(self, tracker, observed, test_settings, tmp_path):
+        from forex_core.data import Warehouse
+        from forex_core.data.loader import DataLoader
+
+        test_settings = test_settings.model_copy(update={"warehouse_dir": tmp_path / "warehouse"})
+        Warehouse(test_settings).upsert_series("usdclp_daily", observed)
+        _log(tracker, observed.index[3].to_pydatetime())
+
+        with patch("forex_core.mlops.tracking.get_settings", return_value=test_settings), \
+                patch.object(DataLoader, "load", side_effect=AssertionError("network")):
+            assert tracker.update_actuals() == 1
+
+
+@pytest.mark.unit
+class TestPartitionedPredictionStore:
+    """Test the append-only, horizon/month partitioned prediction store."""
+
+    def test_log_writes_new_files_only(self, tracker):
+        _log(tracker, datetime(2025, 1, 17))
+        first = sorted(tracker.store.root.rglob("part-*.parquet"))
+        mtimes = {path: path.stat().st_mtime_ns for path in first}
+
+        _log(tracker, datetime(2025, 1, 18))
+
+        assert all(path.stat().st_mtime_ns == mtimes[path] for path in first)
+        assert len(list(tracker.store.root.rglob("part-*.parquet"))) == 2
+        assert (tracker.store.root / "forecasts" / "horizon=7d" / "month=2025-01").is_dir()
+
+    def test_duplicate_prediction_skipped(self, tracker):
+        _log(tracker, datetime(2025, 1, 17))
+        _log(tracker, datetime(2025, 1, 17))
+
+        assert len(tracker.store.read()) == 1
+
+    def test_filtered_read_prunes_partitions(self, tracker):
+        _log(tracker, datetime(2025, 1, 17))
+        _log(tracker, datetime(2025, 3, 17))
+        tracker.log_prediction(
+            forecast_date=datetime(2025, 3, 10),
+            horizon="30d",
+            target_date=datetime(2025, 4, 9),
+            predicted_mean=950.0,
+            ci95_low=940.0,
+            ci95_high=960.0,
+        )
+
+        recent = tracker.store.read(horizon="7d", since=pd.Timestamp("2025-03-01"))
+
+        assert recent["target_date"].tolist() == [pd.Timestamp("2025-03-17")]
+
+    def test_latest_actual_wins_and_compaction(self, tracker):
+        _log(tracker, datetime(2025, 1, 17))
+        key = tracker.store.read()[["forecast_date", "horizon", "target_date"]]
+        for value in (900.0, 905.0):
+            actual = key.assign(
+                actual_value=value, error=950.0 - value, abs_error=abs(950.0 - value),
+                pct_error=(950.0 - value) / value, updated_at=pd.Timestamp.now(),
+            )
+            tracker.store.append_actuals(actual)
+
+        assert tracker.store.read()["actual_value"].tolist() == [905.0]
+        assert tracker.store.compact() == 1
+        assert tracker.store.read()["actual_value"].tolist() == [905.0]
+
+    def test_migrates_legacy_file(self, tmp_path):
+        legacy = tmp_path / "predictions.parquet"
+        now = pd.Timestamp.now()
+        pd.DataFrame({
+            "forecast_date": [pd.Timestamp("2025-01-10")] * 2,
+            "horizon": ["7d", "15d"],
+            "target_date": [pd.Timestamp("2025-01-17"), pd.Timestamp("2025-01-25")],
+            "predicted_mean": [950.0, 955.0],
+            "ci95_low": [940.0, 945.0],
+            "ci95_high": [960.0, 965.0],
+            "actual_value": [948.0, np.nan],
+            "error": [2.0, np.nan],
+            "abs_error": [2.0, np.nan],
+            "pct_error": [2.0 / 948.0, np.nan],
+            "logged_at": [now, now],
+            "updated_at": [now, now],
+        }).to_parquet(legacy, index=False)
+
+        tracker = PredictionTracker(storage_path=legacy)
+        df = tracker.store.read().sort_values("horizon")
+
+        assert not legacy.exists()
+        assert df["horizon"].tolist() == ["15d", "7d"]
+        assert df["actual_value"].isna().tolist() == [True, False]
+
+
+@pytest.mark.unit
+@pytest.mark.skipif(not DUCKDB_AVAILABLE, reason="duckdb not installed")
+class TestMetricsQueryLayer:
+    """Test named DuckDB queries over the prediction store and drift history."""
+
+    def _reconcile(self, tracker, actual_value):
+        key = tracker.store.read()[["forecast_date", "horizon", "target_date"]]
+        error = 950.0 - actual_value
+        tracker.store.append_actuals(key.assign(
+            actual_value=actual_value, error=error, abs_error=abs(error),
+            pct_error=error / actual_value, updated_at=pd.Timestamp.now(),
+        ))
+
+    def test_predictions_match_store_read(self, tracker):
+        for day in (10, 17, 24):
+            _log(tracker, datetime(2025, 1, day))
+        _log(tracker, datetime(2025, 3, 17))
+        self._reconcile(tracker, 945.0)
+        layer = MetricsQueryLayer(store=tracker.store)
+
+        result = layer.query("predictions", horizon="7d", since=pd.Timestamp("2025-01-05"),
+                             has_actual=True)
+        expected = tracker.store.read(horizon="7d", since=pd.Timestamp("2025-01-05"),
+                                      has_actual=True).sort_values("forecast_date")
+
+        pd.testing.assert_frame_equal(result, expected.reset_index(drop=True), check_dtype=False)
+
+    def test_rolling_rmse_and_coverage(self, tracker):
+        _log(tracker, datetime(2025, 1, 17))
+        _log(tracker, datetime(2025, 1, 18))
+        self._reconcile(tracker, 930.0)  # error 20, outside the +/-10 interval
+        layer = MetricsQueryLayer(store=tracker.store)
+
+        rmse = layer.query("rolling_rmse", window_days=7)
+        coverage = layer.query("ci_coverage")
+
+        assert rmse["rmse"].tolist() == [20.0, 20.0]
+        assert rmse["n"].tolist() == [1, 2]
+        assert coverage.loc[0, "coverage"] == 0.0
+        assert coverage.loc[0, "above_rate"] == 0.0
+        assert coverage.loc[0, "below_rate"] == 1.0
+
+    def test_drift_history_filters(self, tmp_path):
+        path = tmp_path / "drift_history.parquet"
+        layer = MetricsQueryLayer(drift_log=DriftHistoryLog.for_legacy_path(path))
+        assert layer.query("drift_history").empty
+
+        pd.DataFrame({
+            "timestamp": pd.date_range("2025-01-01", periods=6, freq="D"),
+            "horizon": ["7d", "15d"] * 3,
+            "drift_score": [10.0, 20.0, 30.0, 40.0, 50.0, 60.0],
+            "drift_detected": [False, True] * 3,
+        }).to_parquet(path, index=False)
+
+        history = layer.query("drift_history", horizon="7d", since=pd.Timestamp("2025-01-02"))
+        trend = layer.query("drift_score_trend", horizon="15d", window_days=3)
+
+        assert history["drift_score"].tolist() == [30.0, 50.0]
+        assert layer.query("drift_horizons")["horizon"].tolist() == ["15d", "7d"]
+        assert trend["rolling_score"].tolist() == [20.0, 30.0, 50.0]
+
+    def test_unknown_query_and_parameter(self, tracker):
+        layer = MetricsQueryLayer(store=tracker.store)
+
+        with pytest.raises(KeyError):
+            layer.query("missing")
+        with pytest.raises(ValueError):
+            layer.query("ci_coverage", window_days=3)
+
+
+@pytest.mark.unit
+class TestRollingMetrics:
+    """Test incrementally maintained error statistics and their consumers."""
+
+    @pytest.fixture
+    def data_tracker(self, tmp_path):
+        return PredictionTracker(storage_path=tmp_path / "predictions" / "predictions.parquet")
+
+    def _log_days(self, tracker, start, days, predicted_mean=950.0):
+        for offset in range(days):
+            forecast_date = start + timedelta(days=offset)
+            tracker.log_prediction(
+                forecast_date=forecast_date,
+                horizon="7d",
+                target_date=forecast_date + timedelta(days=7),
+                predicted_mean=predicted_mean + offset % 3,
+                ci95_low=predicted_mean - 5,
+                ci95_high=predicted_mean + 5,
+            )
+
+    def _actuals(self, start, days, value=948.0):
+        index = pd.date_range(start, periods=days, freq="D")
+        return pd.Series(value + np.arange(days) % 4, index=index)
+
+    def test_incremental_matches_rebuild(self, data_tracker):
+        start = datetime(2025, 1, 1)
+        self._log_days(data_tracker, start, 20)
+        data_tracker.update_actuals(usdclp_series=self._actuals("2025-01-08", 10), lookback_days=3650)
+        data_tracker.update_actuals(usdclp_series=self._actuals("2025-01-08", 25), lookback_days=3650)
+
+        incremental = data_tracker.metrics.daily().reset_index(drop=True)
+        data_tracker.metrics.rebuild()
+        rebuilt = data_tracker.metrics.daily().reset_index(drop=True)
+
+        pd.testing.assert_frame_equal(incremental, rebuilt, check_dtype=False)
+        assert int(rebuilt["n"].sum()) == 20
+
+    def test_window_matches_direct_computation(self, data_tracker):
+        self._log_days(data_tracker, datetime(2025, 1, 1), 20)
+        data_tracker.update_actuals(usdclp_series=self._actuals("2025-01-08", 25), lookback_days=3650)
+        df = data_tracker.store.read(has_actual=True)
+        errors = df["predicted_mean"] - df["actual_value"]
+
+        window = data_tracker.metrics.window("7d", pd.Timestamp("2024-12-31"), pd.Timestamp("2025-01-20"))
+
+        assert window.n == 20
+        assert window.rmse == pytest.approx(np.sqrt((errors**2).mean()))
+        assert window.mape == pytest.approx((errors.abs() / df["actual_value"]).mean() * 100)
+        assert window.bias == pytest.approx(errors.mean())
+        assert window.abs_error_std == pytest.approx(errors.abs().std(ddof=0))
+        assert window.sq_error_std == pytest.approx((errors**2).std(ddof=0))
+        in_ci = df["actual_value"].between(df["ci95_low"], df["ci95_high"])
+        assert window.ci95_coverage == pytest.approx(in_ci.mean())
+
+    def test_statistics_missing_a_column_are_rebuilt(self, data_tracker):
+        self._log_days(data_tracker, datetime(2025, 1, 1), 10)
+        data_tracker.update_actuals(usdclp_series=self._actuals("2025-01-08", 10), lookback_days=3650)
+        metrics = data_tracker.metrics
+        metrics.daily().drop(columns="sum_quad_error").to_parquet(metrics.path, index=False)
+
+        self._log_days(data_tracker, datetime(2025, 1, 11), 5)
+        data_tracker.update_actuals(usdclp_series=self._actuals("2025-01-08", 20), lookback_days=3650)
+
+        daily = metrics.daily()
+        assert "sum_quad_error" in daily.columns
+        assert int(daily["n"].sum()) == 15
+
+    def test_monitor_incremental_matches_full_scan(self, data_tracker, tmp_path):
+        from forex_core.mlops.performance_monitor import PerformanceMonitor, PerformanceStatus
+
+        today = pd.Timestamp.now().normalize()
+        self._log_days(data_tracker, (today - timedelta(days=70)).to_pydatetime(), 56)
+        self._log_days(data_tracker, (today - timedelta(days=13)).to_pydatetime(), 10,
+                       predicted_mean=990.0)
+        actuals = self._actuals(today - timedelta(days=70), 90)
+        data_tracker.update_actuals(usdclp_series=actuals, lookback_days=3650)
+
+        incremental = PerformanceMonitor(data_dir=tmp_path).check_performance("7d")
+        full_scan = PerformanceMonitor(data_dir=tmp_path, incremental=False).check_performance("7d")
+
+        assert incremental.recent_metrics.n_predictions == 7
+        assert full_scan.recent_metrics.n_predictions == 7
+        assert incremental.recent_metrics.rmse == pytest.approx(full_scan.recent_metrics.rmse)
+        assert incremental.degradation_detected
+        assert incremental.status in (PerformanceStatus.DEGRADED, PerformanceStatus.CRITICAL)
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
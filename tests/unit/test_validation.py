@@ -0,0 +1,129 @@
+"""
+Unit tests for walk-forward validation.
+
+Tests cover:
+- Process-parallel fold execution matching the sequential run
+- Deterministic fold ordering and per-fold timing
+- Incremental validation reusing folds of a saved report
+- max_folds keeping the most recent folds
+"""
+
+from datetime import timedelta
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from forex_core.data.models import ForecastPackage, ForecastPoint
+from forex_core.mlops.validation import ValidationMode, WalkForwardValidator
+
+
+def _last_value_forecaster(bundle, horizon: int) -> ForecastPackage:
+    """Naive forecaster at module level so worker processes can unpickle it."""
+    series = bundle.usdclp_series
+    last = float(series.iloc[-1])
+    std = float(series.diff().tail(30).std())
+    points = [
+        ForecastPoint(
+            date=series.index[-1] + timedelta(days=i + 1),
+            mean=last,
+            ci80_low=last - 1.28 * std,
+            ci80_high=last + 1.28 * std,
+            ci95_low=last - 1.96 * std,
+            ci95_high=last + 1.96 * std,
+            std_dev=std,
+        )
+        for i in range(horizon)
+    ]
+    return ForecastPackage(
+        series=points,
+        methodology="last value",
+        error_metrics={},
+        residual_vol=std,
+    )
+
+
+@pytest.fixture
+def series() -> pd.Series:
+    np.random.seed(3)
+    dates = pd.date_range("2023-01-01", periods=400, freq="D")
+    return pd.Series(900 + np.cumsum(np.random.normal(0, 3, 400)), index=dates)
+
+
+def _validator(tmp_path, forecaster=_last_value_forecaster, **kwargs) -> WalkForwardValidator:
+    return WalkForwardValidator(
+        forecaster_func=forecaster,
+        horizon_days=7,
+        initial_train_days=200,
+        test_days=7,
+        step_days=30,
+        mode=ValidationMode.EXPANDING,
+        storage_path=tmp_path,
+        **kwargs,
+    )
+
+
+@pytest.mark.unit
+class TestWalkForwardValidator:
+    """Tests for parallel and incremental walk-forward validation."""
+
+    def test_parallel_matches_sequential(self, tmp_path, series):
+        sequential = _validator(tmp_path).validate(series)
+        parallel = _validator(tmp_path, n_jobs=2).validate(series)
+
+        assert [m.fold for m in parallel.fold_metrics] == list(range(1, sequential.n_folds + 1))
+        assert [m.rmse for m in parallel.fold_metrics] == pytest.approx(
+            [m.rmse for m in sequential.fold_metrics]
+        )
+        assert all(m.duration_seconds >= 0 for m in parallel.fold_metrics)
+
+    def test_unpicklable_forecaster_runs_sequentially(self, tmp_path, series):
+        report = _validator(
+            tmp_path, forecaster=lambda bundle, h: _last_value_forecaster(bundle, h), n_jobs=2
+        ).validate(series)
+
+        assert report.n_folds == 7
+
+    def test_incremental_runs_only_new_folds(self, tmp_path, series):
+        calls = []
+
+        def counting_forecaster(bundle, horizon):
+            calls.append(bundle.usdclp_series.index[-1])
+            return _last_value_forecaster(bundle, horizon)
+
+        validator = _validator(tmp_path, forecaster=counting_forecaster)
+        first = validator.validate(series.iloc[:340])
+        validator.save_report(first)
+        calls.clear()
+
+        incremental = validator.validate_incremental(series)
+        full = _validator(tmp_path).validate(series)
+
+        assert len(calls) == full.n_folds - first.n_folds
+        assert [m.fold for m in incremental.fold_metrics] == [m.fold for m in full.fold_metrics]
+        assert incremental.avg_rmse == pytest.approx(full.avg_rmse)
+        np.testing.assert_allclose(
+            incremental.fold_metrics[0].forecast_values,
+            full.fold_metrics[0].forecast_values,
+        )
+
+    def test_max_folds_keeps_latest_folds(self, tmp_path, series):
+        calls = []
+
+        def counting_forecaster(bundle, horizon):
+            calls.append(bundle.usdclp_series.index[-1])
+            return _last_value_forecaster(bundle, horizon)
+
+        validator = _validator(tmp_path, forecaster=counting_forecaster)
+        first = validator.validate(series.iloc[:340], max_folds=3)
+        validator.save_report(first)
+        calls.clear()
+
+        incremental = validator.validate_incremental(series, max_folds=3)
+
+        assert incremental.n_folds == 3
+        assert len(calls) == 2  # One fold reused, two new at the end of the series
+        assert calls[-1] == series.index[379]
+
+    def test_load_latest_report_without_saved_reports(self, tmp_path):
+        assert _validator(tmp_path).load_latest_report() is None
@@ -0,0 +1,154 @@
+"""
+Unit tests for the Parquet warehouse.
+
+Tests cover:
+- Single-file upsert semantics
+- Incremental delta writes
+- Compaction into year partitions
+- Reading legacy single files in incremental mode
+- Single-file writes to an already partitioned series
+- High-water mark lookups
+"""
+
+import pandas as pd
+import pytest
+
+from forex_core.config.base import Settings
+from forex_core.data.warehouse import Warehouse
+
+
+@pytest.fixture
+def settings(test_settings: Settings, tmp_path) -> Settings:
+    """Settings with the warehouse under tmp_path."""
+    return test_settings.model_copy(update={"warehouse_dir": tmp_path / "warehouse"})
+
+
+def _series(start: str, values) -> pd.Series:
+    return pd.Series(values, index=pd.date_range(start, periods=len(values), freq="D"), dtype=float)
+
+
+@pytest.mark.unit
+class TestSingleFileWarehouse:
+    """Tests for the default single-file layout."""
+
+    def test_upsert_keeps_latest(self, settings: Settings):
+        warehouse = Warehouse(settings, incremental=False)
+        warehouse.upsert_series("test", _series("2025-01-01", [100, 101]))
+        result = warehouse.upsert_series("test", _series("2025-01-02", [101.5, 102]))
+
+        assert len(result) == 3
+        assert result.iloc[1] == 101.5
+        assert warehouse._path("test").exists()
+
+
+@pytest.mark.unit
+class TestIncrementalWarehouse:
+    """Tests for the partitioned append-only layout."""
+
+    def test_only_changed_rows_are_written(self, settings: Settings):
+        warehouse = Warehouse(settings, incremental=True)
+        warehouse.upsert_series("test", _series("2025-01-01", [100, 101, 102]))
+        result = warehouse.upsert_series("test", _series("2025-01-02", [101, 102.5, 103]))
+
+        deltas = warehouse._delta_files("test")
+        assert len(deltas) == 2
+        assert len(pd.read_parquet(deltas[-1])) == 2  # revised 01-03, new 01-04
+        assert result.tolist() == [100, 101, 102.5, 103]
+
+    def test_unchanged_upsert_writes_nothing(self, settings: Settings):
+        warehouse = Warehouse(settings, incremental=True)
+        warehouse.upsert_series("test", _series("2025-01-01", [100, 101]))
+        warehouse.upsert_series("test", _series("2025-01-01", [100, 101]))
+
+        assert len(warehouse._delta_files("test")) == 1
+
+    def test_compaction_matches_merged_view(self, settings: Settings):
+        warehouse = Warehouse(settings, incremental=True)
+        warehouse.upsert_series("test", _series("2024-12-30", [1, 2, 3, 4]))
+        warehouse.upsert_series("test", _series("2025-01-02", [5, 6]))
+        before = warehouse.load_series("test")
+
+        assert warehouse.compact("test") == 1
+
+        assert warehouse._delta_files("test") == []
+        assert [p.name for p in warehouse._partition_files("test")] == [
+            "year=2024.parquet",
+            "year=2025.parquet",
+        ]
+        pd.testing.assert_series_equal(warehouse.load_series("test"), before, check_freq=False)
+
+    def test_auto_compaction_threshold(self, settings: Settings):
+        settings = settings.model_copy(update={"warehouse_compact_threshold": 3})
+        warehouse = Warehouse(settings, incremental=True)
+        for day in range(5):
+            warehouse.upsert_series("test", _series(f"2025-01-{day + 1:02d}", [float(day)]))
+
+        assert len(warehouse._delta_files("test")) < 3
+        assert len(warehouse.load_series("test")) == 5
+
+    def test_reads_and_migrates_legacy_file(self, settings: Settings):
+        Warehouse(settings, incremental=False).upsert_series(
+            "test", _series("2025-01-01", [100, 101])
+        )
+        warehouse = Warehouse(settings, incremental=True)
+        warehouse.upsert_series("test", _series("2025-01-03", [102]))
+
+        assert warehouse.load_series("test").tolist() == [100, 101, 102]
+
+        warehouse.compact("test")
+        assert not warehouse._path("test").exists()
+        assert warehouse.load_series("test").tolist() == [100, 101, 102]
+        assert warehouse.list_series() == ["test"]
+
+    def test_single_file_writes_after_compaction_keep_history(self, settings: Settings):
+        incremental = Warehouse(settings, incremental=True)
+        incremental.upsert_series("test", _series("2025-01-01", [100, 101, 102]))
+        incremental.compact("test")
+
+        single_file = Warehouse(settings, incremental=False)
+        result = single_file.upsert_series("test", _series("2025-01-03", [102.5, 103]))
+
+        assert result.tolist() == [100, 101, 102.5, 103]
+        assert single_file.load_series("test").tolist() == [100, 101, 102.5, 103]
+        assert not single_file._path("test").exists()
+
+    def test_leftover_single_file_is_migrated_first(self, settings: Settings):
+        incremental = Warehouse(settings, incremental=True)
+        incremental.upsert_series("test", _series("2025-01-01", [100, 999.0]))
+        incremental.compact("test")
+        # Written by an older single-file writer after the compaction
+        _series("2025-01-02", [999.5]).to_frame(name="value").to_parquet(incremental._path("test"))
+
+        result = Warehouse(settings, incremental=False).upsert_series(
+            "test", _series("2025-01-03", [101])
+        )
+
+        assert result.tolist() == [100, 999.5, 101]
+        assert not incremental._path("test").exists()
+
+    def test_delete_removes_partitions(self, settings: Settings):
+        warehouse = Warehouse(settings, incremental=True)
+        warehouse.upsert_series("test", _series("2025-01-01", [1.0]))
+
+        assert warehouse.delete_series("test")
+        assert warehouse.load_series("test") is None
+
+
+@pytest.mark.unit
+class TestTimeRange:
+    """Tests for index-only high-water mark lookups."""
+
+    @pytest.mark.parametrize("incremental", [False, True])
+    def test_time_range(self, settings: Settings, incremental: bool):
+        warehouse = Warehouse(settings, incremental=incremental)
+        assert warehouse.time_range("test") is None
+        assert warehouse.last_timestamp("test") is None
+
+        warehouse.upsert_series("test", _series("2025-01-01", [1, 2]))
+        warehouse.upsert_series("test", _series("2025-01-05", [3]))
+
+        assert warehouse.time_range("test") == (
+            pd.Timestamp("2025-01-01"),
+            pd.Timestamp("2025-01-05"),
+        )
+        assert warehouse.last_timestamp("test") == pd.Timestamp("2025-01-05")
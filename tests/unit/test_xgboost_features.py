@@ -0,0 +1,72 @@
+"""
+Unit tests for incremental XGBoost feature computation.
+
+Tests cover:
+- Tail-only features matching the full-history computation
+- EWM state advancing across several new rows
+- Fallback to the full path when history is revised
+- State round-trip through model metadata
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from forex_core.models.xgboost_forecaster import (
+    EWMFeatureState,
+    XGBoostConfig,
+    XGBoostForecaster,
+)
+
+
+def _data(days: int) -> pd.DataFrame:
+    rng = np.random.default_rng(5)
+    index = pd.date_range("2023-01-01", periods=500, freq="D")
+    close = 900 + np.cumsum(rng.normal(0, 3, 500))
+    data = pd.DataFrame({
+        "close": close,
+        "high": close + rng.uniform(0, 2, 500),
+        "low": close - rng.uniform(0, 2, 500),
+        "copper_price": 4 + np.cumsum(rng.normal(0, 0.01, 500)),
+    }, index=index)
+    return data.iloc[:days]
+
+
+def _forecaster(history: pd.DataFrame) -> XGBoostForecaster:
+    forecaster = XGBoostForecaster(XGBoostConfig(horizon_days=7))
+    forecaster.ewm_state = EWMFeatureState.from_series(history["close"])
+    return forecaster
+
+
+@pytest.mark.unit
+class TestIncrementalFeatures:
+    """Tests for EWMFeatureState and XGBoostForecaster._latest_features."""
+
+    @pytest.mark.parametrize("new_rows", [0, 1, 5])
+    def test_tail_features_match_full_history(self, new_rows):
+        forecaster = _forecaster(_data(400))
+        data = _data(400 + new_rows)
+
+        latest = forecaster._latest_features(data, "close")
+        expected = XGBoostForecaster._compute_features(data, "close").iloc[[-1]]
+
+        pd.testing.assert_frame_equal(latest, expected[latest.columns], rtol=1e-9)
+        assert forecaster.ewm_state.timestamp == data.index[-1]
+
+    def test_revised_history_falls_back_to_full_path(self):
+        forecaster = _forecaster(_data(400))
+        revised = _data(401)
+        revised.iloc[399, 0] += 1.0
+
+        assert forecaster.ewm_state.advance(revised["close"]) is None
+
+        latest = forecaster._latest_features(revised, "close")
+        expected = XGBoostForecaster._compute_features(revised, "close").iloc[[-1]]
+        pd.testing.assert_frame_equal(latest, expected, rtol=1e-9)
+
+    def test_state_round_trips_through_dict(self):
+        state = EWMFeatureState.from_series(_data(400)["close"])
+
+        restored = EWMFeatureState.from_dict(state.to_dict())
+
+        assert restored == state